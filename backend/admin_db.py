@@ -1,7 +1,8 @@
 """
-광고/관리자/분석 SQLite DB — 8개 테이블 + CRUD 함수.
+광고/관리자/분석 SQLite DB — 9개 테이블 + CRUD 함수.
 
-테이블: ads, ad_events, ad_zones, ad_bookings, page_views, search_logs, user_events, daily_stats
+테이블: ads, ad_events, ad_zones, ad_bookings, page_views, search_logs, user_events, daily_stats,
+        phase_timings
 """
 from __future__ import annotations
 
@@ -81,6 +82,20 @@ CREATE TABLE IF NOT EXISTS user_events (
 );
 CREATE INDEX IF NOT EXISTS idx_ue_date ON user_events(created_at);
 
+CREATE TABLE IF NOT EXISTS phase_timings (
+    timing_id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind             TEXT NOT NULL,
+    phase            TEXT NOT NULL,
+    wall_ms          REAL NOT NULL DEFAULT 0,
+    api_calls        INTEGER NOT NULL DEFAULT 0,
+    cache_hits       INTEGER NOT NULL DEFAULT 0,
+    http_fetches     INTEGER NOT NULL DEFAULT 0,
+    bytes_downloaded INTEGER NOT NULL DEFAULT 0,
+    db_write_ms      REAL NOT NULL DEFAULT 0,
+    created_at       TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS idx_pt_kind_date ON phase_timings(kind, created_at);
+
 CREATE TABLE IF NOT EXISTS daily_stats (
     stat_date       TEXT PRIMARY KEY,
     page_views      INTEGER NOT NULL DEFAULT 0,
@@ -192,7 +207,7 @@ def _update_zone_defaults(conn: sqlite3.Connection) -> None:
 
 
 def init_admin_db(conn: sqlite3.Connection) -> None:
-    """8개 테이블 + 인덱스 생성 + 기본 영역 시드."""
+    """9개 테이블 + 인덱스 생성 + 기본 영역 시드."""
     conn.executescript(_SCHEMA_SQL)
     _init_ad_zones_defaults(conn)
     _update_zone_defaults(conn)
@@ -745,6 +760,24 @@ def log_event(
     conn.commit()
 
 
+def log_phase_timings(conn: sqlite3.Connection, kind: str, timings: Dict[str, Any]) -> None:
+    """PhaseTimings.as_dict() 결과를 단계별 행으로 기록 (kind: search | blog_analysis)."""
+    rows = [
+        (kind, phase, p.get("wall_ms", 0), p.get("api_calls", 0), p.get("cache_hits", 0),
+         p.get("http_fetches", 0), p.get("bytes_downloaded", 0), p.get("db_write_ms", 0))
+        for phase, p in (timings.get("phases") or {}).items()
+    ]
+    if not rows:
+        return
+    conn.executemany(
+        """INSERT INTO phase_timings
+           (kind, phase, wall_ms, api_calls, cache_hits, http_fetches, bytes_downloaded, db_write_ms)
+           VALUES (?,?,?,?,?,?,?,?)""",
+        rows,
+    )
+    conn.commit()
+
+
 # ────────────────────────────────────────────
 # 통계 조회
 # ────────────────────────────────────────────
@@ -880,6 +913,45 @@ def get_user_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
     }
 
 
+def _percentile(sorted_vals: List[float], pct: float) -> float:
+    """nearest-rank 백분위 (정렬된 리스트 전제)."""
+    if not sorted_vals:
+        return 0.0
+    idx = max(0, math.ceil(pct / 100.0 * len(sorted_vals)) - 1)
+    return sorted_vals[idx]
+
+
+def get_phase_timing_stats(conn: sqlite3.Connection, kind: str = "search", days: int = 7) -> Dict[str, Any]:
+    """단계별 p50/p95 (wall_ms, api_calls, cache_hits, http_fetches, bytes_downloaded, db_write_ms)."""
+    start = (date.today() - timedelta(days=days)).isoformat()
+    rows = conn.execute(
+        """SELECT phase, wall_ms, api_calls, cache_hits, http_fetches, bytes_downloaded, db_write_ms
+           FROM phase_timings WHERE kind = ? AND created_at >= ?
+           ORDER BY timing_id""",
+        (kind, start),
+    ).fetchall()
+
+    fields = ("wall_ms", "api_calls", "cache_hits", "http_fetches", "bytes_downloaded", "db_write_ms")
+    by_phase: Dict[str, Dict[str, List[float]]] = {}
+    for r in rows:
+        bucket = by_phase.setdefault(r["phase"], {f: [] for f in fields})
+        for f in fields:
+            bucket[f].append(r[f] or 0)
+
+    phases = []
+    for phase, bucket in by_phase.items():
+        entry: Dict[str, Any] = {"phase": phase, "count": len(bucket["wall_ms"])}
+        for f in fields:
+            vals = sorted(bucket[f])
+            entry[f] = {
+                "p50": round(_percentile(vals, 50), 1),
+                "p95": round(_percentile(vals, 95), 1),
+            }
+        phases.append(entry)
+
+    return {"kind": kind, "days": days, "phases": phases}
+
+
 # ────────────────────────────────────────────
 # 일별 집계
 # ────────────────────────────────────────────
@@ -921,5 +993,7 @@ def cleanup_old_analytics(conn: sqlite3.Connection, keep_days: int = 90) -> Dict
     pv = conn.execute("DELETE FROM page_views WHERE created_at < ?", (cutoff,)).rowcount
     sl = conn.execute("DELETE FROM search_logs WHERE created_at < ?", (cutoff,)).rowcount
     ue = conn.execute("DELETE FROM user_events WHERE created_at < ?", (cutoff,)).rowcount
+    pt = conn.execute("DELETE FROM phase_timings WHERE created_at < ?", (cutoff,)).rowcount
     conn.commit()
-    return {"page_views_deleted": pv, "search_logs_deleted": sl, "user_events_deleted": ue}
+    return {"page_views_deleted": pv, "search_logs_deleted": sl, "user_events_deleted": ue,
+            "phase_timings_deleted": pt}
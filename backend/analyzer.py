@@ -1,14 +1,21 @@
 from __future__ import annotations
 import concurrent.futures
 import json
-import re
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from backend.db import insert_exposure_fact, upsert_blogger
+from backend.cancellation import AnalysisCancelled, CancelToken, checkpoint
+from backend.deadline import MANDATORY_RESERVE_MS, SIGNAL_RSS_TAIL, Deadline, allows
+from backend.db import insert_exposure_check, insert_exposure_fact, upsert_blogger, upsert_blogger_store_signals
+from backend.dup_index import cross_blog_duplicates, index_posts
 from backend.keywords import StoreProfile, build_exposure_keywords, build_seed_queries, build_broad_queries, build_region_power_queries, TOPIC_SEED_MAP, is_topic_mode
 from backend.models import BlogPostItem, CandidateBlogger
 from backend.naver_client import NaverBlogSearchClient
+from backend.negative_cache import KIND_RSS, get_negative_cache
+from backend import region_pool
+from backend.search_results import IndexedSearchResult, canonical_blogger_id_from_item, index_items  # noqa: F401 — canonical_blogger_id_from_item 기존 import 경로 유지
+from backend.timings import PhaseTimings, db_write, record_cache_hit, submit_in_context
 from backend.scoring import (
     calc_food_bias, calc_sponsor_signal, base_score, strength_points, compute_authority_grade,
     compute_originality_v7, compute_diversity_smoothed, compute_topic_focus, compute_topic_continuity,
@@ -18,7 +25,7 @@ from backend.scoring import (
 from backend.blog_analyzer import (
     fetch_rss, analyze_activity, analyze_quality, analyze_content,
     fetch_blog_profile, compute_image_video_ratio, compute_estimated_tier,
-    compute_tfidf_topic_similarity,
+    compute_tfidf_topic_similarity, compute_tfidf_topic_similarity_batch,
 )
 
 
@@ -88,35 +95,15 @@ def detect_self_blog(blogger: CandidateBlogger, store_name: str, category_text:
     return "normal"
 
 
-_SYSTEM_PATHS = frozenset({
-    "postview", "postlist", "bloglist", "prologue",
-    "postview.naver", "postlist.naver",
-    "postview.nhn", "postlist.nhn",
-})
-
-
-def canonical_blogger_id_from_item(item: BlogPostItem) -> Optional[str]:
-    urls = [item.bloggerlink, item.link]
-    for u in urls:
-        if not u:
-            continue
-        # 1순위: blogId 쿼리 파라미터 (PostView.naver?blogId=abc 대응)
-        m = re.search(r"(?:blogId|blogid)=([A-Za-z0-9._-]+)", u)
-        if m:
-            return m.group(1).lower()
-        # 2순위: blog.naver.com/{id} 경로 기반
-        m = re.search(r"(?:m\.)?blog\.naver\.com/([A-Za-z0-9._-]+)", u)
-        if m:
-            bid = m.group(1).lower()
-            if bid not in _SYSTEM_PATHS:
-                return bid
-    return None
-
-
 def blog_url_from_id(blogger_id: str) -> str:
     return f"https://blog.naver.com/{blogger_id}"
 
 
+def search_cache_key(query: str, display: int = 30, sort: str = "sim") -> str:
+    """BloggerAnalyzer.cache 키 (일괄 분석 prefetch와 공유)."""
+    return f"blog::{query}::display={display}::sort={sort}"
+
+
 def _build_match_keywords(category_text: str, topic: str) -> list[str]:
     """검색 키워드/주제에서 포스트 매칭용 키워드 리스트 추출.
 
@@ -158,12 +145,36 @@ class BloggerAnalyzer:
         store_id: int,
         progress_cb: Optional[ProgressCb] = None,
         cache: Optional[Dict[str, List[BlogPostItem]]] = None,
+        sparse_exposures: bool = True,
+        cancel_token: Optional[CancelToken] = None,
+        fetch_pool: Optional[concurrent.futures.Executor] = None,
+        rss_cache: Optional[Dict[str, list]] = None,
+        profile_cache: Optional[Dict[str, Dict]] = None,
+        use_region_pool: bool = False,
     ) -> None:
         self.client = client
         self.profile = profile
         self.store_id = store_id
         self.progress_cb = progress_cb or (lambda _: None)
         self.cache = cache if cache is not None else {}
+        # True: 순위 적중만 exposures에 저장 + 미노출은 exposure_checks 코호트로 기록
+        # False: 블로거×키워드 전체를 exposures에 저장 (기존 밀집 저장)
+        self.sparse_exposures = sparse_exposures
+
+        # 단계별 계측 (wall/API/캐시/HTTP/바이트/DB 쓰기)
+        self.timings = PhaseTimings()
+        # SSE 연결 종료 시 다음 체크포인트에서 AnalysisCancelled
+        self.cancel_token = cancel_token
+        # analyze(deadline_ms=...)에서 설정 — None이면 무제한
+        self.deadline: Optional[Deadline] = None
+        # 일괄 분석(batch.py): 매장 간 공유 스레드풀 + blogger_id별 RSS/프로필 결과
+        self.fetch_pool = fetch_pool
+        self.rss_cache = rss_cache
+        self.profile_cache = profile_cache
+        # 지역 공유 후보 풀(region_candidate_pools) 사용 — region_power/broad 검색 대신 풀에서 병합
+        self.use_region_pool = use_region_pool
+        # 이번 분석에서 사용한 풀: pool_key → (풀 블로거 ID, 풀에 이미 있던 RSS 블로거 ID)
+        self._region_pools: Dict[str, Tuple[List[str], set]] = {}
 
         # 호출 가드(검증용)
         self.exposure_api_calls = 0
@@ -172,45 +183,64 @@ class BloggerAnalyzer:
     def _emit(self, stage: str, current: int, total: int, message: str) -> None:
         self.progress_cb({"stage": stage, "current": current, "total": total, "message": message})
 
-    def _search_cached(self, query: str, display: int = 30, sort: str = "sim") -> List[BlogPostItem]:
-        key = f"blog::{query}::display={display}::sort={sort}"
+    @contextmanager
+    def _executor(self, max_workers: int) -> Iterator[concurrent.futures.Executor]:
+        """공유 풀이 있으면 그대로 사용(종료하지 않음), 없으면 호출마다 새 풀."""
+        if self.fetch_pool is not None:
+            yield self.fetch_pool
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield pool
+
+    def _search_cached(self, query: str, display: int = 30, sort: str = "sim") -> IndexedSearchResult:
+        key = search_cache_key(query, display, sort)
         if key in self.cache:
+            record_cache_hit()
+            self.cache[key] = index_items(self.cache[key])
             return self.cache[key]
-        items = self.client.search_blog(query=query, display=display, sort=sort)
+        checkpoint(self.cancel_token)
+        items = index_items(self.client.search_blog(query=query, display=display, sort=sort))
         self.cache[key] = items
         return items
 
-    def _search_batch(self, queries: List[str], display: int = 30, sort: str = "sim") -> Dict[str, List[BlogPostItem]]:
+    def _search_batch(self, queries: List[str], display: int = 30, sort: str = "sim") -> Dict[str, IndexedSearchResult]:
         """
         여러 쿼리를 ThreadPoolExecutor로 병렬 실행.
-        캐시에 있는 쿼리는 API 호출 스킵.
+        캐시에 있는 쿼리는 API 호출 스킵. 결과는 순위별 blogger_id 인덱스 포함 (IndexedSearchResult).
+        취소 시 대기 중인 쿼리는 호출하지 않고, 완료된 결과만 캐시에 남긴 뒤 AnalysisCancelled.
         """
-        results: Dict[str, List[BlogPostItem]] = {}
+        results: Dict[str, IndexedSearchResult] = {}
         uncached: List[str] = []
 
         for q in queries:
-            key = f"blog::{q}::display={display}::sort={sort}"
+            key = search_cache_key(q, display, sort)
             if key in self.cache:
-                results[q] = self.cache[key]
+                record_cache_hit()
+                results[q] = self.cache[key] = index_items(self.cache[key])
             else:
                 uncached.append(q)
 
         if uncached:
             def _fetch(query: str) -> tuple[str, List[BlogPostItem]]:
+                checkpoint(self.cancel_token)
                 items = self.client.search_blog(query=query, display=display, sort=sort)
                 return query, items
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
-                futures = {pool.submit(_fetch, q): q for q in uncached}
+            with self._executor(5) as pool:
+                futures = {submit_in_context(pool, _fetch, q): q for q in uncached}
                 for fut in concurrent.futures.as_completed(futures):
                     q_key = futures[fut]
                     try:
                         query, items = fut.result()
+                    except AnalysisCancelled:
+                        continue
                     except Exception:
                         query, items = q_key, []
-                    key = f"blog::{query}::display={display}::sort={sort}"
+                    items = index_items(items)
+                    key = search_cache_key(query, display, sort)
                     self.cache[key] = items
                     results[query] = items
+            checkpoint(self.cancel_token)
 
         return results
 
@@ -226,12 +256,9 @@ class BloggerAnalyzer:
         self.seed_api_calls += len(queries)
 
         for q in queries:
-            items = batch_results.get(q, [])
+            items = index_items(batch_results.get(q))
             items = items[:20]  # 캐시 일관성을 위해 display=30 검색, 후보는 상위 20개만
-            for rank0, it in enumerate(items):
-                bid = canonical_blogger_id_from_item(it)
-                if not bid:
-                    continue
+            for rank, bid, it in items.ranked():
                 if bid not in bloggers:
                     bloggers[bid] = CandidateBlogger(
                         blogger_id=bid,
@@ -242,7 +269,7 @@ class BloggerAnalyzer:
                         local_hits=0,
                     )
                 b = bloggers[bid]
-                b.ranks.append(rank0 + 1)
+                b.ranks.append(rank)
                 b.queries_hit.add(q)
 
                 # 중복 포스트 제거: link 기준
@@ -256,27 +283,47 @@ class BloggerAnalyzer:
         self._emit("search", 2, 2, "키워드 후보 수집 완료")
         return bloggers
 
-    def collect_region_power_candidates(self, existing: Dict[str, CandidateBlogger]) -> Dict[str, CandidateBlogger]:
-        """지역 랭킹 파워 블로거 수집.
-        인기 카테고리 검색에서 상위 10위 이내 블로거만 수집 (높은 블로그 지수).
-        """
-        queries = build_region_power_queries(self.profile)
-        bloggers = dict(existing)
+    def _phase_postings(self, phase: str, queries: List[str], conn=None) -> region_pool.Postings:
+        """region_power/broad 쿼리별 상위 top-k 포스팅.
 
-        region = self.profile.region_text.strip()
-        addr_tokens = self.profile.address_tokens()
+        use_region_pool이고 conn이 있으면 지역 공유 풀에서 가져오고(검색 API 미호출),
+        풀이 없으면 검색 후 풀에 저장한다. 풀의 RSS는 rss_cache로 넘겨 tier 단계에서 재사용.
+        """
+        top_k = region_pool.POOL_TOP_K[phase]
+        key = region_pool.pool_key(phase, queries) if (self.use_region_pool and conn is not None) else None
+
+        if key is not None:
+            loaded = region_pool.load_pool(conn, key)
+            if loaded is not None:
+                postings, pool_rss = loaded
+                if self.rss_cache is None:
+                    self.rss_cache = {}
+                for bid, posts in pool_rss.items():
+                    self.rss_cache.setdefault(bid, posts)
+                self._region_pools[key] = (region_pool.pool_blogger_ids(postings), set(pool_rss))
+                for _ in queries:
+                    record_cache_hit()
+                return postings
 
-        self._emit("region_power", 1, 2, f"지역 랭킹 파워 블로거 수집 중 ({len(queries)}개 키워드)...")
         batch_results = self._search_batch(queries, display=30)
         self.seed_api_calls += len(queries)
+        postings = {q: index_items(batch_results.get(q))[:top_k] for q in queries}
+
+        if key is not None:
+            with db_write():
+                region_pool.save_pool(conn, key, self.profile.region_text.strip(), phase, queries, postings)
+            self._region_pools[key] = (region_pool.pool_blogger_ids(postings), set())
+        return postings
+
+    def _merge_postings(
+        self, bloggers: Dict[str, CandidateBlogger], queries: List[str], postings: region_pool.Postings,
+    ) -> None:
+        """쿼리별 포스팅을 후보에 병합 (local_hits는 매장 주소 토큰 기준으로 여기서 계산)."""
+        region = self.profile.region_text.strip()
+        addr_tokens = self.profile.address_tokens()
 
         for q in queries:
-            items = batch_results.get(q, [])
-            # 상위 10위 이내만 수집 (높은 블로그 지수)
-            for rank0, it in enumerate(items[:10]):
-                bid = canonical_blogger_id_from_item(it)
-                if not bid:
-                    continue
+            for rank, bid, it in index_items(postings.get(q)).ranked():
                 if bid not in bloggers:
                     bloggers[bid] = CandidateBlogger(
                         blogger_id=bid,
@@ -287,7 +334,7 @@ class BloggerAnalyzer:
                         local_hits=0,
                     )
                 b = bloggers[bid]
-                b.ranks.append(rank0 + 1)
+                b.ranks.append(rank)
                 b.queries_hit.add(q)
 
                 # 중복 포스트 제거: link 기준
@@ -298,6 +345,20 @@ class BloggerAnalyzer:
                     if region in text or any(t in text for t in addr_tokens):
                         b.local_hits += 1
 
+    def collect_region_power_candidates(
+        self, existing: Dict[str, CandidateBlogger], conn=None,
+    ) -> Dict[str, CandidateBlogger]:
+        """지역 랭킹 파워 블로거 수집.
+        인기 카테고리 검색에서 상위 10위 이내 블로거만 수집 (높은 블로그 지수).
+        conn + use_region_pool이면 지역 공유 풀에서 병합.
+        """
+        queries = build_region_power_queries(self.profile)
+        bloggers = dict(existing)
+
+        self._emit("region_power", 1, 2, f"지역 랭킹 파워 블로거 수집 중 ({len(queries)}개 키워드)...")
+        postings = self._phase_postings(region_pool.PHASE_REGION_POWER, queries, conn)
+        self._merge_postings(bloggers, queries, postings)
+
         # region_power 쿼리 출현 횟수 계산
         rp_set = set(queries)
         for b in bloggers.values():
@@ -315,64 +376,28 @@ class BloggerAnalyzer:
         date_results = self._search_batch(cross_queries, display=20, sort="date")
         self.seed_api_calls += len(cross_queries)
 
-        # sim 결과에서 이미 수집된 블로거 ID 목록
+        # sim 결과에서 이미 수집된 블로거가 date 결과에도 있는지 (rank_of: blogger_id 인덱스 조회)
+        date_indexed = [index_items(date_results.get(q)) for q in cross_queries]
         for b in bloggers.values():
-            cross_count = 0
-            for q in cross_queries:
-                date_items = date_results.get(q, [])
-                date_ids = set()
-                for it in date_items:
-                    bid = canonical_blogger_id_from_item(it)
-                    if bid:
-                        date_ids.add(bid)
-                if b.blogger_id in date_ids:
-                    cross_count += 1
+            cross_count = sum(1 for res in date_indexed if res.rank_of(b.blogger_id) is not None)
             b.popularity_cross_score = cross_count / max(1, len(cross_queries))
 
         self._emit("popularity_cross", 2, 2, "인기순 교차검색 완료")
 
-    def collect_broad_candidates(self, existing: Dict[str, CandidateBlogger]) -> Dict[str, CandidateBlogger]:
+    def collect_broad_candidates(
+        self, existing: Dict[str, CandidateBlogger], conn=None,
+    ) -> Dict[str, CandidateBlogger]:
         """
         카테고리 무관 지역 기반 확장 쿼리로 상위노출 가능 블로거를 추가 수집.
-        기존 후보와 합쳐서 반환. 상위 10위 이내만 수집(블로그 지수 높은 사람).
+        기존 후보와 합쳐서 반환. 상위 15위 이내만 수집(블로그 지수 높은 사람).
+        conn + use_region_pool이면 지역 공유 풀에서 병합.
         """
         queries = build_broad_queries(self.profile)
         bloggers = dict(existing)
 
-        region = self.profile.region_text.strip()
-        addr_tokens = self.profile.address_tokens()
-
         self._emit("broad_search", 1, 2, f"확장 후보 수집 중 ({len(queries)}개 키워드)...")
-        batch_results = self._search_batch(queries, display=30)
-        self.seed_api_calls += len(queries)
-
-        for q in queries:
-            items = batch_results.get(q, [])
-            # 상위 15위 이내만 수집 (블로그 지수 높은 사람만)
-            for rank0, it in enumerate(items[:15]):
-                bid = canonical_blogger_id_from_item(it)
-                if not bid:
-                    continue
-                if bid not in bloggers:
-                    bloggers[bid] = CandidateBlogger(
-                        blogger_id=bid,
-                        blog_url=blog_url_from_id(bid),
-                        ranks=[],
-                        queries_hit=set(),
-                        posts=[],
-                        local_hits=0,
-                    )
-                b = bloggers[bid]
-                b.ranks.append(rank0 + 1)
-                b.queries_hit.add(q)
-
-                # 중복 포스트 제거: link 기준
-                existing_links = {p.link for p in b.posts}
-                if it.link not in existing_links:
-                    b.posts.append(it)
-                    text = f"{it.title} {it.description}"
-                    if region in text or any(t in text for t in addr_tokens):
-                        b.local_hits += 1
+        postings = self._phase_postings(region_pool.PHASE_BROAD, queries, conn)
+        self._merge_postings(bloggers, queries, postings)
 
         # broad 쿼리 출현 횟수 계산 (블로그 지수 프록시)
         broad_set = set(queries)
@@ -382,6 +407,18 @@ class BloggerAnalyzer:
         self._emit("broad_search", 2, 2, "확장 후보 수집 완료")
         return bloggers
 
+    def _update_region_pool_rss(self, conn) -> None:
+        """tier 단계에서 새로 수집한 풀 블로거 RSS를 풀에 기록 (다음 매장이 재사용)."""
+        if not self._region_pools or self.rss_cache is None:
+            return
+        for key, (bids, had_rss) in self._region_pools.items():
+            fresh = [bid for bid in bids if bid in self.rss_cache and bid not in had_rss]
+            if not fresh:
+                continue
+            rss_map = {bid: self.rss_cache[bid] for bid in bids if bid in self.rss_cache}
+            with db_write():
+                region_pool.update_pool_rss(conn, key, rss_map)
+
     def compute_base_scores(self, bloggers: Dict[str, CandidateBlogger]) -> List[CandidateBlogger]:
         region = self.profile.region_text.strip()
         addr_tokens = self.profile.address_tokens()
@@ -420,62 +457,101 @@ class BloggerAnalyzer:
         return out
 
     def _parallel_fetch_rss(self, blogger_ids: List[str]) -> Dict[str, list]:
-        """RSS 피드 병렬 fetch (max_workers=10, API 쿼터 미사용)."""
+        """RSS 피드 병렬 fetch (max_workers=10, API 쿼터 미사용). rss_cache에 있으면 재사용.
+
+        음성 캐시(없는/비공개/응답 없는 블로그)에 있는 블로거는 요청 없이 빈 목록.
+        """
         rss_map: Dict[str, list] = {}
+        if self.rss_cache is not None:
+            rss_map.update({bid: self.rss_cache[bid] for bid in blogger_ids if bid in self.rss_cache})
+            blogger_ids = [bid for bid in blogger_ids if bid not in rss_map]
+        negative = get_negative_cache().lookup_many(KIND_RSS, blogger_ids)
+        if negative:
+            for bid in negative:
+                rss_map[bid] = []
+                record_cache_hit()
+            blogger_ids = [bid for bid in blogger_ids if bid not in negative]
 
         def _fetch_one(bid: str):
+            checkpoint(self.cancel_token)
             posts = fetch_rss(bid, timeout=5.0)
             return bid, posts
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as pool:
-            futures = {pool.submit(_fetch_one, bid): bid for bid in blogger_ids}
+        with self._executor(10) as pool:
+            futures = {submit_in_context(pool, _fetch_one, bid): bid for bid in blogger_ids}
             for fut in concurrent.futures.as_completed(futures):
                 bid_key = futures[fut]
                 try:
                     bid, posts = fut.result()
                     rss_map[bid] = posts
+                except AnalysisCancelled:
+                    continue
                 except Exception:
                     rss_map[bid_key] = []
+                if self.rss_cache is not None and bid_key in rss_map:
+                    self.rss_cache[bid_key] = rss_map[bid_key]
+        checkpoint(self.cancel_token)
 
         return rss_map
 
     def _parallel_fetch_profiles(self, blogger_ids: List[str], rss_map: Dict[str, list]) -> Dict[str, Dict]:
-        """블로그 프로필 병렬 fetch (이웃 수 등)."""
+        """블로그 프로필 병렬 fetch (이웃 수 등). profile_cache에 있으면 재사용."""
         profile_map: Dict[str, Dict] = {}
+        if self.profile_cache is not None:
+            profile_map.update({bid: self.profile_cache[bid] for bid in blogger_ids if bid in self.profile_cache})
+            blogger_ids = [bid for bid in blogger_ids if bid not in profile_map]
 
         def _fetch_one(bid: str):
-            return bid, fetch_blog_profile(bid, rss_map.get(bid, []), timeout=4.0)
+            checkpoint(self.cancel_token)
+            return bid, fetch_blog_profile(bid, rss_map.get(bid, []), timeout=4.0,
+                                           cancel_token=self.cancel_token, deadline=self.deadline)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as pool:
-            futures = {pool.submit(_fetch_one, bid): bid for bid in blogger_ids}
+        with self._executor(10) as pool:
+            futures = {submit_in_context(pool, _fetch_one, bid): bid for bid in blogger_ids}
             for fut in concurrent.futures.as_completed(futures):
                 bid_key = futures[fut]
                 try:
                     bid, profile = fut.result()
                     profile_map[bid] = profile
+                except AnalysisCancelled:
+                    continue
                 except Exception:
                     profile_map[bid_key] = {"neighbor_count": 0, "blog_start_date": None}
+                if self.profile_cache is not None and bid_key in profile_map:
+                    self.profile_cache[bid_key] = profile_map[bid_key]
+        checkpoint(self.cancel_token)
 
         return profile_map
 
-    def compute_tier_scores(self, bloggers: List[CandidateBlogger]) -> List[CandidateBlogger]:
+    def compute_tier_scores(self, bloggers: List[CandidateBlogger], conn=None) -> List[CandidateBlogger]:
         """RSS 기반 블로그 권위 분석.
 
         상위 80명만 RSS 분석 (base_score 순, 나머지는 tier=0).
         v7.1: 프로필 수집(이웃 수), 미디어 비율, estimated_tier, exposure_power 추가.
+        conn이 있으면 후보 RSS를 블로거 간 중복 인덱스에 저장하고 GameDefense에 교차 중복률 반영.
         """
         self._emit("tier_analysis", 1, 4, "블로그 권위 분석 중 (RSS 수집)...")
 
-        # 상위 80명만 RSS 분석
+        # 상위 80명만 RSS 분석 (데드라인 부족 시 하위 40명 생략)
         top_candidates = bloggers[:80]
+        if len(top_candidates) > 40 and not allows(self.deadline, SIGNAL_RSS_TAIL):
+            top_candidates = bloggers[:40]
         top_ids = [b.blogger_id for b in top_candidates]
 
         self._emit("tier_analysis", 2, 4, f"RSS 피드 병렬 수집 중 ({len(top_ids)}명)...")
-        rss_map = self._parallel_fetch_rss(top_ids)
+        with self.timings.phase("tier_rss"):
+            rss_map = self._parallel_fetch_rss(top_ids)
 
         # v7.1: 프로필 병렬 수집 (이웃 수 + 개설일)
         self._emit("tier_analysis", 3, 4, f"블로그 프로필 수집 중 ({len(top_ids)}명)...")
-        profile_map = self._parallel_fetch_profiles(top_ids, rss_map)
+        with self.timings.phase("tier_profile"):
+            profile_map = self._parallel_fetch_profiles(top_ids, rss_map)
+
+        # 풀/캐시에서 온 RSS도 인덱스에 있어야 이번 후보끼리 같은 원고를 찾음
+        if conn is not None:
+            with db_write():
+                for bid, posts in rss_map.items():
+                    index_posts(conn, bid, posts)
 
         from backend.scoring import (
             _posting_intensity, _originality_steep, compute_authority_grade,
@@ -488,10 +564,14 @@ class BloggerAnalyzer:
             getattr(self.profile, 'topic', None) or "",
         )
 
+        # v7.1: TF-IDF 토픽 유사도 — 후보 전체를 한 번에 (매장별 저장 → 리포트 GoldenScore)
+        tfidf_map = compute_tfidf_topic_similarity_batch(rss_map, match_keywords)
+
         now = datetime.now()
 
         for b in bloggers:
             posts = rss_map.get(b.blogger_id, [])
+            b.tfidf_sim = tfidf_map.get(b.blogger_id, 0.0)
             profile = profile_map.get(b.blogger_id, {"neighbor_count": 0, "blog_start_date": None})
             rss_success = len(posts) > 0
 
@@ -526,8 +606,9 @@ class BloggerAnalyzer:
                 b.rss_diversity_smoothed = compute_diversity_smoothed(posts)
                 b.topic_focus = compute_topic_focus(posts, match_keywords)
                 b.topic_continuity = compute_topic_continuity(posts, match_keywords)
+                cross_rate = cross_blog_duplicates(conn, b.blogger_id, posts).rate if conn is not None else 0.0
                 b.game_defense = compute_game_defense(
-                    posts, {"interval_avg": act.avg_interval_days}
+                    posts, {"interval_avg": act.avg_interval_days, "cross_blog_dup_rate": cross_rate}
                 )
 
                 # v7.1: 미디어 비율
@@ -646,14 +727,9 @@ class BloggerAnalyzer:
         self.exposure_api_calls += len(keywords)
 
         for kw in keywords:
-            items = batch_results.get(kw, [])
             mp: Dict[str, tuple] = {}
-            for rank0, it in enumerate(items):
-                bid = canonical_blogger_id_from_item(it)
-                if not bid:
-                    continue
-                r = rank0 + 1
-                if bid not in mp or r < mp[bid][0]:
+            for r, bid, it in index_items(batch_results.get(kw)).ranked():
+                if bid not in mp:  # 순위 순서로 순회 → 첫 항목이 best rank
                     mp[bid] = (r, it.link, it.title)
             mapping[kw] = mp
 
@@ -670,6 +746,7 @@ class BloggerAnalyzer:
         """
         bloggers upsert + exposures 팩트 누적 저장(일별 유니크)
         exposure_map 값은 (rank, post_link, post_title) 튜플
+        sparse_exposures=True면 순위 적중만 저장 (미노출은 exposure_checks)
         """
         for b in bloggers:
             # 샘플은 최근 15개 정도만 저장
@@ -724,14 +801,28 @@ class BloggerAnalyzer:
                 ranking_percentile=getattr(b, 'ranking_percentile', 100.0),
                 blog_power=getattr(b, 'blog_power', 0.0),
             )
+        # 매장 키워드에 의존하는 신호는 (매장, 블로거)별로 저장
+        upsert_blogger_store_signals(conn, self.store_id, [(b.blogger_id, b.tfidf_sim) for b in bloggers])
 
         # exposures 저장(팩트)
+        blogger_ids = [b.blogger_id for b in bloggers]
         for kw in exposure_keywords:
             mp = exposure_map.get(kw, {})
+            if self.sparse_exposures:
+                # 희소 저장: 미노출(rank=None) 행은 만들지 않고 코호트로만 기록
+                insert_exposure_check(
+                    conn,
+                    store_id=self.store_id,
+                    keyword=kw,
+                    checked_blogger_ids=blogger_ids,
+                    exposed_blogger_ids=[bid for bid in blogger_ids if bid in mp],
+                )
             for b in bloggers:
                 entry = mp.get(b.blogger_id)
                 if entry is not None:
                     rank, post_link, post_title = entry
+                elif self.sparse_exposures:
+                    continue
                 else:
                     rank, post_link, post_title = None, None, None
                 sp = strength_points(rank)
@@ -750,42 +841,65 @@ class BloggerAnalyzer:
                     post_title=post_title,
                 )
 
-    def analyze(self, conn, top_n: int = 50) -> Tuple[int, int, List[str]]:
+    def analyze(self, conn, top_n: int = 50, deadline_ms: Optional[int] = None) -> Tuple[int, int, List[str]]:
         """
         전체 실행:
         Phase 1:   seed(7) → collect_candidates
         Phase 1.5: popularity_cross(3) → collect_popularity_cross [v7.0 신규, +3 API]
-        Phase 2:   region_power(3)
-        Phase 3:   broad(5)
+        Phase 2:   region_power(3) — use_region_pool이면 지역 공유 풀 (풀 히트 시 API 0)
+        Phase 3:   broad(5) — 동일
         Phase 4:   base_scores + tier_scores (v7 메트릭 포함)
         Phase 5:   exposure(10)
         Phase 6:   save_to_db
         반환: (seed_calls, exposure_calls, exposure_keywords)
+        단계별 비용은 self.timings에 누적 (tier_rss/tier_profile은 compute_tier_scores 내부)
+        cancel_token이 취소되면 단계 경계/병렬 작업 사이에서 AnalysisCancelled (DB 저장 전)
+        deadline_ms가 있으면 노출 검증/저장 예약 시간을 남기고 선택적 신호를 생략 (self.deadline.degraded)
         """
+        t = self.timings
+        cancel = self.cancel_token
+        self.deadline = Deadline(deadline_ms, reserve_ms=MANDATORY_RESERVE_MS)
+
         # Phase 1: 카테고리 특화 후보 수집
-        bloggers_dict = self.collect_candidates()
+        with t.phase("seed"):
+            bloggers_dict = self.collect_candidates()
 
+        checkpoint(cancel)
         # Phase 1.5: 인기순 교차검색 (DIA 추정, v7.0)
-        self.collect_popularity_cross(bloggers_dict)
+        with t.phase("popularity_cross"):
+            self.collect_popularity_cross(bloggers_dict)
 
+        checkpoint(cancel)
         # Phase 2: 지역 랭킹 파워 블로거 수집 (인기 카테고리 상위노출자)
-        bloggers_dict = self.collect_region_power_candidates(bloggers_dict)
+        with t.phase("region_power"):
+            bloggers_dict = self.collect_region_power_candidates(bloggers_dict, conn)
 
+        checkpoint(cancel)
         # Phase 3: 카테고리 무관 확장 후보 수집 (블로그 지수 높은 사람)
-        bloggers_dict = self.collect_broad_candidates(bloggers_dict)
+        with t.phase("broad"):
+            bloggers_dict = self.collect_broad_candidates(bloggers_dict, conn)
 
-        ranked = self.compute_base_scores(bloggers_dict)
+        checkpoint(cancel)
+        with t.phase("base_scores"):
+            ranked = self.compute_base_scores(bloggers_dict)
 
+        checkpoint(cancel)
         # Phase 4: RSS 기반 순수체급 분석 (API 호출 없음, v7 메트릭 포함)
-        ranked = self.compute_tier_scores(ranked)
+        with t.phase("tier_scoring"):
+            ranked = self.compute_tier_scores(ranked, conn)
+            self._update_region_pool_rss(conn)
 
+        checkpoint(cancel)
         # Phase 5: 노출 검증
-        exposure_keywords = build_exposure_keywords(self.profile)
-        exposure_map = self.exposure_mapping(exposure_keywords)
+        with t.phase("exposure"):
+            exposure_keywords = build_exposure_keywords(self.profile)
+            exposure_map = self.exposure_mapping(exposure_keywords)
 
+        checkpoint(cancel)
         # Phase 6: DB 저장
-        store_subset = ranked[: min(len(ranked), 150)]
-        self.save_to_db(conn, store_subset, exposure_keywords, exposure_map)
+        with t.phase("save"), db_write():
+            store_subset = ranked[: min(len(ranked), 150)]
+            self.save_to_db(conn, store_subset, exposure_keywords, exposure_map)
 
         # 호출 가드: 노출검증은 반드시 10회
         if len(exposure_keywords) != 10:
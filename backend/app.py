@@ -17,7 +17,6 @@ from fastapi.responses import StreamingResponse, JSONResponse, FileResponse, Res
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import httpx
-import uvicorn
 
 # .env 로드
 load_dotenv(Path(__file__).parent / ".env")
@@ -25,7 +24,7 @@ load_dotenv(Path(__file__).parent / ".env")
 from backend.db import (
     conn_ctx, init_db, upsert_store, create_campaign, insert_blog_analysis,
     save_search_snapshot, get_latest_search_snapshot,
-    get_latest_blog_analysis, cleanup_expired_cache,
+    get_latest_blog_analysis, cleanup_expired_cache, get_profile_source_stats,
     # PRD 신규
     upsert_influencer_profile, get_influencer_profile, get_influencer_by_blog_id,
     update_influencer_fields, list_influencer_profiles, count_influencer_profiles,
@@ -40,8 +39,14 @@ from backend.naver_client import get_env_client
 from backend.analyzer import BloggerAnalyzer
 from backend.maintenance import cleanup_all
 from backend.reporting import get_top20_and_pool40
-from backend.guide_generator import generate_guide, generate_keyword_recommendation, get_supported_categories
-from backend.blog_analyzer import analyze_blog, extract_blogger_id
+from backend.blog_analyzer import analyze_blog, extract_blogger_id, plan_profile_sources
+from backend.batch import run_batch
+from backend.blog_batch import MAX_BLOGS, load_store_profile, run_blog_batch
+from backend.fetch_scheduler import scheduler as fetch_scheduler
+from backend.region_pool import refresh_region_pools
+from backend.influencer_refresh import influencer_scores, refresh_influencers, refresh_lag_stats
+from backend.dup_index import template_clusters
+from backend.cancellation import AnalysisCancelled, CancelToken
 from backend.admin_db import (
     init_admin_db, create_ad as db_create_ad, update_ad as db_update_ad,
     delete_ad as db_delete_ad, get_ad as db_get_ad, list_ads as db_list_ads,
@@ -50,7 +55,7 @@ from backend.admin_db import (
     get_ad_report as db_get_ad_report, log_page_view, log_search,
     log_event, get_today_stats, get_hourly_stats, get_range_stats,
     get_popular_searches, get_recent_searches, get_recent_events,
-    get_user_stats, refresh_daily_stats,
+    get_user_stats, refresh_daily_stats, log_phase_timings, get_phase_timing_stats,
     list_zones as db_list_zones, update_zone as db_update_zone,
     get_zone_inventory as db_get_zone_inventory,
     create_booking as db_create_booking, update_booking_status as db_update_booking_status,
@@ -163,6 +168,14 @@ async def health_check():
 # ============================
 # SSE 스트리밍 분석 (GET - EventSource 호환)
 # ============================
+def _cancel_background(task: "asyncio.Future", cancel_token: CancelToken) -> None:
+    """SSE 종료 시 아직 실행 중인 executor 작업에 취소 신호 (결과 예외는 소비해 경고 방지)."""
+    if task.done():
+        return
+    cancel_token.cancel()
+    task.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
 @app.get("/api/search/stream")
 async def search_stream(
     request: Request,
@@ -175,8 +188,9 @@ async def search_stream(
     address_text: Optional[str] = Query(None),
     memo: Optional[str] = Query(None),
     force_refresh: bool = Query(False),
+    deadline_ms: Optional[int] = Query(None, ge=1000),
 ):
-    """프론트엔드 EventSource 호환 GET SSE 엔드포인트"""
+    """프론트엔드 EventSource 호환 GET SSE 엔드포인트 (deadline_ms: 시간 예산, 초과 예상 시 선택적 신호 생략)"""
     region = (region or "").strip()
     # keyword > legacy category > "" (하위 호환)
     effective_category = (keyword or category or "").strip()
@@ -193,35 +207,43 @@ async def search_stream(
             _record_usage(conn, user, "search")
 
     queue: asyncio.Queue[dict] = asyncio.Queue()
+    cancel_token = CancelToken()
 
     def progress_cb(msg: dict):
         queue.put_nowait(msg)
 
     task = asyncio.get_event_loop().run_in_executor(
-        None, _sync_analyze, region, effective_category, topic_val, place_url, store_name, address_text, memo, progress_cb, force_refresh
+        None, _sync_analyze, region, effective_category, topic_val, place_url, store_name, address_text, memo, progress_cb, force_refresh,
+        cancel_token, deadline_ms,
     )
 
     async def event_gen():
-        while True:
-            try:
-                msg = await asyncio.wait_for(queue.get(), timeout=0.5)
-                yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
-                if msg.get("stage") == "done":
-                    break
-            except asyncio.TimeoutError:
-                if task.done():
-                    # 큐에 남은 것 모두 처리
-                    while not queue.empty():
-                        msg = queue.get_nowait()
-                        yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
-                    break
-                yield f"event: progress\ndata: {json.dumps({'stage': 'waiting', 'current': 0, 'total': 0, 'message': '처리 중...'}, ensure_ascii=False)}\n\n"
-
         try:
-            result = await task
-            yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
-        except Exception as e:
-            yield f"event: result\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+            while True:
+                try:
+                    msg = await asyncio.wait_for(queue.get(), timeout=0.5)
+                    yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
+                    if msg.get("stage") == "done":
+                        break
+                except asyncio.TimeoutError:
+                    if task.done():
+                        # 큐에 남은 것 모두 처리
+                        while not queue.empty():
+                            msg = queue.get_nowait()
+                            yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
+                        break
+                    if await request.is_disconnected():
+                        return
+                    yield f"event: progress\ndata: {json.dumps({'stage': 'waiting', 'current': 0, 'total': 0, 'message': '처리 중...'}, ensure_ascii=False)}\n\n"
+
+            try:
+                result = await task
+                yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
+            except Exception as e:
+                yield f"event: result\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+        finally:
+            # 클라이언트 연결 종료(또는 제너레이터 조기 종료) → 실행 중인 분석 취소
+            _cancel_background(task, cancel_token)
 
     return StreamingResponse(
         event_gen(),
@@ -234,7 +256,8 @@ async def search_stream(
     )
 
 
-def _sync_analyze(region_text, category_text, topic_val, place_url, store_name, address_text, memo, progress_cb, force_refresh=False):
+def _sync_analyze(region_text, category_text, topic_val, place_url, store_name, address_text, memo, progress_cb, force_refresh=False,
+                  cancel_token: Optional[CancelToken] = None, deadline_ms: Optional[int] = None):
     import logging
     _logger = logging.getLogger("naverblog.search")
     _logger.info(
@@ -283,8 +306,15 @@ def _sync_analyze(region_text, category_text, topic_val, place_url, store_name,
         )
 
         client = get_env_client()  # → CachedNaverBlogSearchClient (Layer 2 자동 적용)
-        analyzer = BloggerAnalyzer(client=client, profile=profile, store_id=store_id, progress_cb=progress_cb)
-        seed_calls, exposure_calls, keywords = analyzer.analyze(conn, top_n=50)
+        analyzer = BloggerAnalyzer(client=client, profile=profile, store_id=store_id, progress_cb=progress_cb,
+                                   cancel_token=cancel_token, use_region_pool=True)
+        try:
+            seed_calls, exposure_calls, keywords = analyzer.analyze(conn, top_n=50, deadline_ms=deadline_ms)
+        except AnalysisCancelled:
+            # 완료된 검색 결과는 api_cache에 남아 재검색 시 재사용
+            _logger.info("[취소] 클라이언트 연결 종료 store_id=%d, cache_stats=%s",
+                         store_id, getattr(client, "cache_stats", None))
+            raise
 
         cleanup_all(conn, keep_days=180)
 
@@ -301,6 +331,8 @@ def _sync_analyze(region_text, category_text, topic_val, place_url, store_name,
             "exposure_calls": exposure_calls,
             "exposure_keywords": keywords,
             "from_cache": False,
+            "timings": analyzer.timings.as_dict(),
+            "degraded": analyzer.deadline.degraded,
         }
         # API 캐시 통계 추가 + 로깅
         cache_stats = getattr(client, "cache_stats", None)
@@ -319,12 +351,19 @@ def _sync_analyze(region_text, category_text, topic_val, place_url, store_name,
             **result,
         }
 
-        # Layer 3: 스냅샷 저장
+        # Layer 3: 스냅샷 저장 (데드라인으로 신호가 생략된 불완전 결과는 캐시하지 않음)
+        if not merged_meta["degraded"]:
+            try:
+                total_api = seed_calls + exposure_calls
+                save_search_snapshot(conn, store_id, json.dumps(full_result, ensure_ascii=False), total_api)
+            except Exception as e:
+                _logger.debug("스냅샷 저장 실패: %s", e)
+
+        # 단계별 계측 기록
         try:
-            total_api = seed_calls + exposure_calls
-            save_search_snapshot(conn, store_id, json.dumps(full_result, ensure_ascii=False), total_api)
+            log_phase_timings(conn, "search", merged_meta["timings"])
         except Exception as e:
-            _logger.debug("스냅샷 저장 실패: %s", e)
+            _logger.debug("단계 계측 기록 실패: %s", e)
 
         # 검색 로그 자동 기록
         try:
@@ -572,8 +611,11 @@ def get_store_keywords(store_id: int):
 # ============================
 # 가이드 자동 생성
 # ============================
+# guide_generator(업종 템플릿 표)는 가이드 API 첫 호출 때 로드 — 워커 시작 시간 단축
 @app.get("/api/stores/{store_id}/guide")
 def get_store_guide(store_id: int, sub_category: str = Query("", description="세부 업종 (선택)")):
+    from backend.guide_generator import generate_guide
+
     with conn_ctx() as conn:
         row = conn.execute(
             "SELECT region_text, category_text, store_name, address_text, topic FROM stores WHERE store_id=?",
@@ -631,6 +673,8 @@ def get_guide_keywords(
     sub: str = Query("", description="세부 업종"),
 ):
     """3계층 키워드 추천만 반환 (매장 연계 없이 독립 사용)"""
+    from backend.guide_generator import generate_keyword_recommendation
+
     result = generate_keyword_recommendation(
         region=region,
         category=category,
@@ -642,6 +686,8 @@ def get_guide_keywords(
 @app.get("/api/guide/categories")
 def get_guide_categories():
     """지원 업종 목록 반환"""
+    from backend.guide_generator import get_supported_categories
+
     return {"categories": get_supported_categories()}
 
 
@@ -729,8 +775,15 @@ async def blog_analysis_stream(
     blog_url: str = Query(...),
     store_id: Optional[int] = Query(None),
     force_refresh: bool = Query(False),
+    deadline_ms: Optional[int] = Query(None, ge=1000),
 ):
-    """블로그 개별 분석 — SSE 스트리밍"""
+    """블로그 개별 분석 — SSE 스트리밍
+
+    event: progress — 단계 진행 메시지
+    event: section  — 부분 결과 {"section": 이름, "data": 최종 결과의 같은 키와 동일한 데이터}
+                      (rss → activity/content → exposure_keyword… / exposure / quality / profile → score)
+    event: result   — 최종 결과 전체 (캐시 적중 시 section 없이 result만)
+    """
     blog_url_val = (blog_url or "").strip()
     if not blog_url_val:
         raise HTTPException(400, "블로그 URL 또는 ID를 입력해주세요.")
@@ -747,35 +800,47 @@ async def blog_analysis_stream(
                 raise HTTPException(429, "일일 무료 블로그 분석 횟수를 초과했습니다. 프로 플랜으로 업그레이드해주세요.")
             _record_usage(conn, user, "blog_analysis")
 
-    queue: asyncio.Queue[dict] = asyncio.Queue()
+    # (이벤트 이름, 데이터) — 분석 워커 스레드에서 넣으므로 call_soon_threadsafe
+    queue: asyncio.Queue[tuple] = asyncio.Queue()
+    cancel_token = CancelToken()
+    loop = asyncio.get_event_loop()
 
     def progress_cb(msg: dict):
-        queue.put_nowait(msg)
+        loop.call_soon_threadsafe(queue.put_nowait, ("progress", msg))
 
-    task = asyncio.get_event_loop().run_in_executor(
-        None, _sync_blog_analysis, blog_url_val, store_id, progress_cb, force_refresh
+    def section_cb(name: str, data: dict):
+        loop.call_soon_threadsafe(queue.put_nowait, ("section", {"section": name, "data": data}))
+
+    task = loop.run_in_executor(
+        None, _sync_blog_analysis, blog_url_val, store_id, progress_cb, force_refresh, cancel_token, deadline_ms,
+        section_cb,
     )
 
     async def event_gen():
-        while True:
-            try:
-                msg = await asyncio.wait_for(queue.get(), timeout=0.5)
-                yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
-                if msg.get("stage") == "done":
-                    break
-            except asyncio.TimeoutError:
-                if task.done():
-                    while not queue.empty():
-                        msg = queue.get_nowait()
-                        yield f"event: progress\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
-                    break
-                yield f"event: progress\ndata: {json.dumps({'stage': 'waiting', 'current': 0, 'total': 0, 'message': '분석 중...'}, ensure_ascii=False)}\n\n"
-
         try:
-            result = await task
-            yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
-        except Exception as e:
-            yield f"event: result\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+            while True:
+                try:
+                    event, msg = await asyncio.wait_for(queue.get(), timeout=0.5)
+                    yield f"event: {event}\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
+                    if event == "progress" and msg.get("stage") == "done":
+                        break
+                except asyncio.TimeoutError:
+                    if task.done():
+                        while not queue.empty():
+                            event, msg = queue.get_nowait()
+                            yield f"event: {event}\ndata: {json.dumps(msg, ensure_ascii=False)}\n\n"
+                        break
+                    if await request.is_disconnected():
+                        return
+                    yield f"event: progress\ndata: {json.dumps({'stage': 'waiting', 'current': 0, 'total': 0, 'message': '분석 중...'}, ensure_ascii=False)}\n\n"
+
+            try:
+                result = await task
+                yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
+            except Exception as e:
+                yield f"event: result\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n"
+        finally:
+            _cancel_background(task, cancel_token)
 
     return StreamingResponse(
         event_gen(),
@@ -788,7 +853,9 @@ async def blog_analysis_stream(
     )
 
 
-def _sync_blog_analysis(blog_url_val: str, store_id: Optional[int], progress_cb, force_refresh: bool = False):
+def _sync_blog_analysis(blog_url_val: str, store_id: Optional[int], progress_cb, force_refresh: bool = False,
+                        cancel_token: Optional[CancelToken] = None, deadline_ms: Optional[int] = None,
+                        section_cb=None):
     bid = extract_blogger_id(blog_url_val)
 
     # 블로그 분석 캐시 확인 (force_refresh가 아닌 경우)
@@ -806,43 +873,36 @@ def _sync_blog_analysis(blog_url_val: str, store_id: Optional[int], progress_cb,
             pass  # 캐시 실패 시 라이브 분석
 
     client = get_env_client()
-    store_profile = None
-
-    if store_id:
-        with conn_ctx() as conn:
-            row = conn.execute(
-                "SELECT region_text, category_text, store_name, address_text, place_url, topic FROM stores WHERE store_id=?",
-                (store_id,),
-            ).fetchone()
-            if row:
-                store_profile = StoreProfile(
-                    region_text=row["region_text"],
-                    category_text=row["category_text"],
-                    topic=row["topic"],
-                    store_name=row["store_name"],
-                    address_text=row["address_text"],
-                    place_url=row["place_url"],
-                )
+    with conn_ctx() as conn:
+        store_profile = load_store_profile(conn, store_id)
 
     result = analyze_blog(
         blog_url_or_id=blog_url_val,
         client=client,
         store_profile=store_profile,
         progress_cb=progress_cb,
+        cancel_token=cancel_token,
+        deadline_ms=deadline_ms,
+        section_cb=section_cb,
     )
 
-    # DB에 분석 이력 저장
+    # DB에 분석 이력 저장 (이력 = 48시간 캐시이므로 데드라인으로 신호가 생략된 결과는 제외)
     with conn_ctx() as conn:
-        insert_blog_analysis(
-            conn,
-            blogger_id=result["blogger_id"],
-            blog_url=result["blog_url"],
-            analysis_mode=result["analysis_mode"],
-            store_id=store_id,
-            blog_score=result["blog_score"]["total"],
-            grade=result["blog_score"]["grade"],
-            result_json=json.dumps(result, ensure_ascii=False),
-        )
+        if not result["meta"]["degraded"]:
+            insert_blog_analysis(
+                conn,
+                blogger_id=result["blogger_id"],
+                blog_url=result["blog_url"],
+                analysis_mode=result["analysis_mode"],
+                store_id=store_id,
+                blog_score=result["blog_score"]["total"],
+                grade=result["blog_score"]["grade"],
+                result_json=json.dumps(result, ensure_ascii=False),
+            )
+        try:
+            log_phase_timings(conn, "blog_analysis", result.get("meta", {}).get("timings", {}))
+        except Exception:
+            pass
 
     result["from_cache"] = False
     # API 캐시 통계 추가
@@ -909,26 +969,13 @@ async def influencer_register(request: Request, user: dict = Depends(get_current
 
     # 분석 결과를 influencer_profiles에 저장
     bs = result.get("blog_score", {})
-    base_bd = bs.get("base_breakdown", {})
     with conn_ctx() as conn:
         upsert_influencer_profile(
             conn,
             user_mongo_id=user["id"],
             blog_id=bid,
             blog_url=f"https://blog.naver.com/{bid}",
-            golden_score=bs.get("total", 0),
-            grade=bs.get("grade", "F"),
-            grade_label=bs.get("grade_label", ""),
-            base_score=bs.get("base_score", 0),
-            bp_score=base_bd.get("BlogPower", 0),
-            ep_score=base_bd.get("ExposurePower", 0),
-            ca_score=base_bd.get("ContentAuthority", 0),
-            rq_score=base_bd.get("RSSQuality", 0),
-            fr_score=base_bd.get("Freshness", 0),
-            sp_score=base_bd.get("SearchPresence", 0),
-            total_posts=result.get("profile", {}).get("total_posts", 0),
-            total_visitors=result.get("profile", {}).get("total_visitors", 0),
-            total_subscribers=result.get("profile", {}).get("total_subscribers", 0),
+            **influencer_scores(result),
             desired_rate=body.get("desired_rate", 0),
             bio=body.get("bio", ""),
             specialties=json.dumps(body.get("specialties", []), ensure_ascii=False),
@@ -1125,6 +1172,8 @@ async def complete_match_api(match_id: int, user: dict = Depends(get_current_use
 @app.get("/api/matches/{match_id}/guide")
 async def match_guide_api(match_id: int, user: dict = Depends(get_current_user)):
     """매칭 가이드라인 조회 (guide_generator 활용)."""
+    from backend.guide_generator import generate_guide
+
     with conn_ctx() as conn:
         m = get_match(conn, match_id)
         if not m:
@@ -1865,6 +1914,173 @@ async def admin_analytics_users(_=Depends(require_admin)):
         return get_user_stats(conn)
 
 
+@app.get("/admin/analytics/timings")
+async def admin_analytics_timings(
+    kind: str = Query("search"), days: int = Query(7), _=Depends(require_admin),
+):
+    """단계별 소요 시간/비용 p50·p95 (kind: search | blog_analysis)"""
+    with conn_ctx() as conn:
+        return get_phase_timing_stats(conn, kind, days)
+
+
+@app.get("/admin/analytics/hosts")
+async def admin_analytics_hosts(_=Depends(require_admin)):
+    """외부 호스트별 요청 스케줄러 상태 (동시 요청/누적 요청/오류/백오프 남은 시간)"""
+    return fetch_scheduler.stats()
+
+
+@app.get("/admin/analytics/profile-sources")
+async def admin_analytics_profile_sources(_=Depends(require_admin)):
+    """프로필 스크래핑 소스별 성공률/기여율/평균 지연 + 현재 소스 계획"""
+    with conn_ctx() as conn:
+        stats = get_profile_source_stats(conn)
+    plan = plan_profile_sources(stats, rng=lambda: 1.0)
+    return {"stats": stats, "plan": plan}
+
+
+@app.get("/admin/analytics/influencer-refresh")
+async def admin_analytics_influencer_refresh(days: int = Query(7), _=Depends(require_admin)):
+    """인플루언서 점수 재분석 지연 — 현재 점수 경과 시간 / 재분석 시점 지연 p50·p90·p99 + 시간당 할당량 사용"""
+    with conn_ctx() as conn:
+        return refresh_lag_stats(conn, days=days)
+
+
+@app.get("/admin/analytics/template-clusters")
+async def admin_analytics_template_clusters(
+    min_bloggers: int = Query(5), limit: int = Query(20), _=Depends(require_admin),
+):
+    """블로거 간 근사 중복 묶음 — 같은 원고(SimHash 해밍 거리 ≤ 3)를 올린 블로거 수 많은 순 (템플릿 팜 의심)"""
+    with conn_ctx() as conn:
+        return {"clusters": template_clusters(conn, min_bloggers=min_bloggers, limit=limit)}
+
+
+# ============================
+# 다매장 일괄 분석 (require_admin)
+# ============================
+
+@app.post("/admin/batch/analyze")
+async def admin_batch_analyze(request: Request, _=Depends(require_admin)):
+    """대행사 온보딩 — 매장 목록을 공유 캐시/스레드풀로 일괄 분석.
+
+    body: {"stores": [{"region", "keyword", "topic", "store_name", "address_text", "place_url"}, ...],
+           "deadline_ms": 매장별 시간 예산(선택), "workers": 공유 풀 크기(선택)}
+    """
+    body = await request.json()
+    stores = body.get("stores") or []
+    if not isinstance(stores, list) or not stores:
+        raise HTTPException(400, "stores 목록이 필요합니다.")
+    if len(stores) > 100:
+        raise HTTPException(400, "한 번에 최대 100개 매장까지 분석할 수 있습니다.")
+    workers = max(1, min(int(body.get("workers") or 10), 20))
+    return await asyncio.get_event_loop().run_in_executor(
+        None, lambda: run_batch(stores, max_workers=workers, deadline_ms=body.get("deadline_ms")),
+    )
+
+
+def _body_int(body: dict, key: str, minimum: int, maximum: Optional[int] = None) -> Optional[int]:
+    """JSON 본문 정수 필드 — 없으면 None, 정수가 아니거나 범위 밖이면 400."""
+    value = body.get(key)
+    if value is None or value == "":
+        return None
+    try:
+        n: Optional[int] = int(value)
+    except (TypeError, ValueError, OverflowError):
+        n = None
+    if isinstance(value, bool) or (isinstance(value, float) and value != n):
+        n = None
+    if n is None or n < minimum or (maximum is not None and n > maximum):
+        rng = f"{minimum}~{maximum}" if maximum is not None else f"{minimum} 이상"
+        raise HTTPException(400, f"{key} 값은 {rng}의 정수여야 합니다.")
+    return n
+
+
+@app.post("/admin/blog-analysis/bulk")
+async def admin_blog_analysis_bulk(request: Request, _=Depends(require_admin)):
+    """블로그 목록 일괄 분석 — 블로거 하나가 끝날 때마다 NDJSON 한 줄 스트리밍.
+
+    body: {"blogs": [URL 또는 ID, ...], "store_id": 매장 연계(선택), "deadline_ms": 블로거별 시간 예산(선택, ≥1000),
+           "workers": 동시 분석 수(선택, 1~10), "force_refresh": 48시간 이력 무시(선택)}
+    잘못된 workers/store_id/deadline_ms는 분석 시작 전 400, 없는 매장은 404.
+    줄 형식: {"type": "progress"|"result"|"error", ...} → 마지막 줄 {"type": "summary", ...}
+    """
+    body = await request.json()
+    blogs = body.get("blogs") or []
+    if not isinstance(blogs, list) or not blogs:
+        raise HTTPException(400, "blogs 목록이 필요합니다.")
+    if len(blogs) > MAX_BLOGS:
+        raise HTTPException(400, f"한 번에 최대 {MAX_BLOGS}개 블로그까지 분석할 수 있습니다.")
+    # 실행 전 검증 — deadline_ms는 개별 분석 엔드포인트와 같은 하한 (너무 짧으면 전부 degraded → 저장 안 됨)
+    workers = _body_int(body, "workers", 1, 10) or 4
+    store_id = _body_int(body, "store_id", 1)
+    deadline_ms = _body_int(body, "deadline_ms", 1000)
+    if store_id is not None:
+        with conn_ctx() as conn:
+            if load_store_profile(conn, store_id) is None:
+                raise HTTPException(404, "매장을 찾을 수 없습니다.")
+
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    cancel_token = CancelToken()
+    loop = asyncio.get_event_loop()
+
+    def _put(msg: dict) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, msg)
+
+    def _run():
+        return run_blog_batch(
+            [str(b) for b in blogs],
+            store_id=store_id,
+            on_item=_put,
+            progress_cb=lambda msg: _put({"type": "progress", **msg}),
+            max_workers=workers,
+            deadline_ms=deadline_ms,
+            force_refresh=bool(body.get("force_refresh")),
+            cancel_token=cancel_token,
+        )
+
+    task = loop.run_in_executor(None, _run)
+
+    async def ndjson_gen():
+        try:
+            while not (task.done() and queue.empty()):
+                try:
+                    msg = await asyncio.wait_for(queue.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    continue
+                yield json.dumps(msg, ensure_ascii=False) + "\n"
+            try:
+                summary = await task
+                yield json.dumps({"type": "summary", **summary}, ensure_ascii=False) + "\n"
+            except Exception as e:
+                yield json.dumps({"type": "summary", "error": str(e)}, ensure_ascii=False) + "\n"
+        finally:
+            _cancel_background(task, cancel_token)
+
+    return StreamingResponse(
+        ndjson_gen(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/admin/region-pools/refresh")
+async def admin_region_pools_refresh(
+    within_hours: int = Query(6, ge=1, le=24), limit: int = Query(20, ge=1, le=100), _=Depends(require_admin),
+):
+    """지역 공유 후보 풀 정기 갱신 — 곧 만료되는 사용 중 풀을 재검색 + RSS 재수집 (cron에서 호출)"""
+    def _run():
+        with conn_ctx() as conn:
+            return refresh_region_pools(conn, within_hours=within_hours, limit=limit)
+    return await asyncio.get_event_loop().run_in_executor(None, _run)
+
+
+@app.post("/admin/influencer/refresh")
+async def admin_influencer_refresh(quota: Optional[int] = Query(None, ge=0, le=200), _=Depends(require_admin)):
+    """인플루언서 점수 정기 재분석 — 오래된/노출 많은/최근 매칭된 프로필부터 시간당 할당량 내 (cron에서 호출)"""
+    return await asyncio.get_event_loop().run_in_executor(None, lambda: refresh_influencers(quota=quota))
+
+
 # ============================
 # 분석 수집 — 방문자용 (인증 불필요)
 # ============================
@@ -1903,5 +2119,6 @@ async def track_event(request: Request):
 
 
 if __name__ == "__main__":
+    import uvicorn
     port = int(os.environ.get("PORT", 8001))
     uvicorn.run("backend.app:app", host="0.0.0.0", port=port, reload=True)
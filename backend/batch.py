@@ -0,0 +1,264 @@
+"""
+다매장 일괄 분석 — 대행사 온보딩(20~50개 매장)용.
+
+매장마다 _sync_analyze를 따로 돌리면 클라이언트/캐시 dict/스레드풀이 매장별로 생기고
+같은 지역의 region_power/broad 쿼리와 후보 RSS/프로필을 매번 다시 가져온다.
+여기서는 하나의 스케줄러(공유 스레드풀)와 공유 캐시로 처리:
+  1. 전체 매장 쿼리 계획의 합집합 → 중복 제거 후 한 번에 prefetch
+  2. 매장별 BloggerAnalyzer는 공유 검색 캐시 / RSS / 프로필 결과를 재사용
+  3. 결과는 매장별로 기존과 동일하게 exposures + search_snapshots에 저장
+
+CLI:
+    python -m backend.batch stores.json [--deadline-ms 60000] [--workers 10]
+    stores.json = [{"region": "강남", "keyword": "카페", "store_name": "..."}, ...]
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.admin_db import init_admin_db
+from backend.analyzer import BloggerAnalyzer, search_cache_key
+from backend.db import DB_PATH, conn_ctx, create_campaign, init_db, save_search_snapshot, upsert_store
+from backend.keywords import (
+    TOPIC_FOOD_SET, StoreProfile,
+    build_broad_queries, build_exposure_keywords, build_region_power_queries, build_seed_queries,
+)
+from backend.maintenance import cleanup_all
+from backend.models import BlogPostItem
+from backend.naver_client import NaverBlogSearchClient, get_env_client
+from backend.search_results import index_items
+from backend.reporting import get_top20_and_pool40
+from backend.timings import submit_in_context
+
+logger = logging.getLogger(__name__)
+
+ProgressCb = Callable[[dict], None]
+
+# (query, display, sort)
+QuerySpec = Tuple[str, int, str]
+
+
+def profile_from_dict(data: Dict[str, Any]) -> StoreProfile:
+    """요청/파일의 매장 dict → StoreProfile (keyword > legacy category, /api/search/stream과 동일)."""
+    region = (data.get("region") or data.get("region_text") or "").strip()
+    if not region:
+        raise ValueError("region is required")
+    return StoreProfile(
+        region_text=region,
+        category_text=(data.get("keyword") or data.get("category") or data.get("category_text") or "").strip(),
+        topic=(data.get("topic") or "").strip() or None,
+        place_url=data.get("place_url"),
+        store_name=data.get("store_name"),
+        address_text=data.get("address_text"),
+    )
+
+
+def build_query_plan(profiles: List[StoreProfile]) -> Tuple[List[QuerySpec], int]:
+    """매장별 검색 계획(seed/교차/region_power/broad/노출)의 합집합.
+
+    반환: (중복 제거된 쿼리 목록, 중복 포함 총 쿼리 수)
+    """
+    unique: Dict[QuerySpec, None] = {}
+    total = 0
+    for profile in profiles:
+        seed = build_seed_queries(profile)
+        specs: List[QuerySpec] = [(q, 30, "sim") for q in seed]
+        specs += [(q, 20, "date") for q in seed[:3]]
+        specs += [(q, 30, "sim") for q in build_region_power_queries(profile)]
+        specs += [(q, 30, "sim") for q in build_broad_queries(profile)]
+        specs += [(q, 30, "sim") for q in build_exposure_keywords(profile)]
+        total += len(specs)
+        for spec in specs:
+            unique.setdefault(spec, None)
+    return list(unique), total
+
+
+def _prefetch(
+    client: NaverBlogSearchClient,
+    plan: List[QuerySpec],
+    cache: Dict[str, List[BlogPostItem]],
+    pool: concurrent.futures.Executor,
+) -> int:
+    """쿼리 계획을 공유 풀로 미리 검색해 cache를 채움. 실패한 쿼리는 매장 분석 때 재시도."""
+    def _fetch(spec: QuerySpec):
+        q, display, sort = spec
+        return spec, client.search_blog(query=q, display=display, sort=sort)
+
+    fetched = 0
+    futures = [submit_in_context(pool, _fetch, spec) for spec in plan if search_cache_key(*spec) not in cache]
+    for fut in concurrent.futures.as_completed(futures):
+        try:
+            (q, display, sort), items = fut.result()
+        except Exception as e:
+            logger.warning("batch prefetch failed: %s", e)
+            continue
+        cache[search_cache_key(q, display, sort)] = index_items(items)
+        fetched += 1
+    return fetched
+
+
+def _analyze_store(
+    profile: StoreProfile,
+    client: NaverBlogSearchClient,
+    pool: concurrent.futures.Executor,
+    cache: Dict[str, List[BlogPostItem]],
+    rss_cache: Dict[str, list],
+    profile_cache: Dict[str, Dict],
+    memo: Optional[str],
+    deadline_ms: Optional[int],
+    db_path: Path,
+) -> Dict[str, Any]:
+    """매장 1개 분석 + exposures/search_snapshots 저장 (_sync_analyze의 라이브 경로와 동일)."""
+    started = time.perf_counter()
+    with conn_ctx(db_path) as conn:
+        store_id = upsert_store(
+            conn,
+            region_text=profile.region_text,
+            category_text=profile.category_text,
+            place_url=profile.place_url,
+            store_name=profile.store_name,
+            address_text=profile.address_text,
+            topic=profile.topic,
+        )
+        campaign_id = create_campaign(conn, store_id, memo=memo)
+
+        analyzer = BloggerAnalyzer(
+            client=client, profile=profile, store_id=store_id,
+            cache=cache, fetch_pool=pool, rss_cache=rss_cache, profile_cache=profile_cache,
+            use_region_pool=True,
+        )
+        seed_calls, exposure_calls, keywords = analyzer.analyze(conn, top_n=50, deadline_ms=deadline_ms)
+
+        effective_cat_for_food = profile.category_text
+        if not profile.category_text and profile.topic and profile.topic in TOPIC_FOOD_SET:
+            effective_cat_for_food = "맛집"
+        result = get_top20_and_pool40(conn, store_id=store_id, days=30, category_text=effective_cat_for_food)
+
+        merged_meta = {
+            "store_id": store_id,
+            "campaign_id": campaign_id,
+            "seed_calls": seed_calls,
+            "exposure_calls": exposure_calls,
+            "exposure_keywords": keywords,
+            "from_cache": False,
+            "timings": analyzer.timings.as_dict(),
+            "degraded": analyzer.deadline.degraded,
+            "batch": True,
+        }
+        merged_meta.update(result.pop("meta", {}))
+        full_result = {"meta": merged_meta, **result}
+
+        if not merged_meta["degraded"]:
+            save_search_snapshot(conn, store_id, json.dumps(full_result, ensure_ascii=False),
+                                 seed_calls + exposure_calls)
+
+    return {
+        "store_id": store_id,
+        "store_name": profile.store_name,
+        "region": profile.region_text,
+        "top20_count": len(result.get("top20", [])),
+        "degraded": merged_meta["degraded"],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }
+
+
+def run_batch(
+    stores: List[Dict[str, Any]],
+    client: Optional[NaverBlogSearchClient] = None,
+    progress_cb: Optional[ProgressCb] = None,
+    max_workers: int = 10,
+    deadline_ms: Optional[int] = None,
+    memo: Optional[str] = "batch",
+    db_path: Path = DB_PATH,
+) -> Dict[str, Any]:
+    """매장 목록 일괄 분석. 매장별 실패는 errors에 기록하고 계속 진행.
+
+    반환: {"stores", "errors", "queries_total", "queries_unique", "prefetched",
+           "rss_fetched", "profiles_fetched", "elapsed_sec", "stores_per_minute"}
+    """
+    emit = progress_cb or (lambda _: None)
+    client = client or get_env_client()
+    started = time.perf_counter()
+
+    profiles: List[Tuple[int, StoreProfile]] = []
+    errors: List[Dict[str, Any]] = []
+    for i, data in enumerate(stores):
+        try:
+            profiles.append((i, profile_from_dict(data)))
+        except ValueError as e:
+            errors.append({"index": i, "error": str(e)})
+
+    plan, queries_total = build_query_plan([p for _, p in profiles])
+    cache: Dict[str, List[BlogPostItem]] = {}
+    rss_cache: Dict[str, list] = {}
+    profile_cache: Dict[str, Dict] = {}
+    results: List[Dict[str, Any]] = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        emit({"stage": "batch_prefetch", "current": 0, "total": len(plan),
+              "message": f"쿼리 {queries_total}개 → 중복 제거 {len(plan)}개 검색 중..."})
+        prefetched = _prefetch(client, plan, cache, pool)
+
+        for n, (i, profile) in enumerate(profiles, start=1):
+            emit({"stage": "batch_store", "current": n, "total": len(profiles),
+                  "message": f"{profile.store_name or profile.region_text} 분석 중..."})
+            try:
+                entry = _analyze_store(profile, client, pool, cache, rss_cache, profile_cache,
+                                       memo, deadline_ms, db_path)
+                entry["index"] = i
+                results.append(entry)
+            except Exception as e:
+                logger.exception("batch store %d failed", i)
+                errors.append({"index": i, "store_name": profile.store_name, "error": str(e)})
+
+    with conn_ctx(db_path) as conn:
+        cleanup_all(conn, keep_days=180)
+
+    elapsed = time.perf_counter() - started
+    emit({"stage": "done", "current": 1, "total": 1, "message": f"일괄 분석 완료 ({len(results)}개 매장)"})
+    return {
+        "stores": results,
+        "errors": errors,
+        "queries_total": queries_total,
+        "queries_unique": len(plan),
+        "prefetched": prefetched,
+        "rss_fetched": len(rss_cache),
+        "profiles_fetched": len(profile_cache),
+        "elapsed_sec": round(elapsed, 1),
+        "stores_per_minute": round(len(results) / max(elapsed / 60.0, 1e-9), 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="다매장 일괄 분석")
+    parser.add_argument("stores_file", help="매장 목록 JSON 파일 (list of dict)")
+    parser.add_argument("--deadline-ms", type=int, default=None, help="매장별 시간 예산")
+    parser.add_argument("--workers", type=int, default=10, help="공유 스레드풀 크기")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    with open(args.stores_file, encoding="utf-8") as f:
+        stores = json.load(f)
+    with conn_ctx() as conn:
+        init_db(conn)
+        init_admin_db(conn)
+
+    summary = run_batch(
+        stores,
+        progress_cb=lambda msg: print(f"[{msg['stage']}] {msg['message']}", file=sys.stderr),
+        max_workers=args.workers,
+        deadline_ms=args.deadline_ms,
+    )
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0 if not summary["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
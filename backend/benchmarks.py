@@ -0,0 +1,694 @@
+"""
+성능 벤치마크 — 분석 파이프라인 핫스팟의 CPU 시간 / 피크 메모리 측정.
+
+    python -m backend.benchmarks rss [--items 2000] [--repeat 5]
+    python -m backend.benchmarks profile [--repeat 50]
+    python -m backend.benchmarks metrics [--posts 30] [--repeat 10]
+    python -m backend.benchmarks simhash [--bloggers 80] [--posts 20] [--repeat 3]
+    python -m backend.benchmarks golden [--rows 200] [--repeat 20]
+    python -m backend.benchmarks suite [--bloggers 40] [--posts 30] [--repeat 5] [--case NAME]
+                                       [--save-baseline | --check] [--tolerance 2.0]
+
+rss: 대형 피드(기본 2,000개 item, 이미지·영상 포함 HTML description)를
+     기존 방식(ElementTree.fromstring 전체 트리 + description 정규식 3회)과
+     스트리밍 파서(_parse_rss, RSS_MAX_ITEMS 상한)로 비교.
+profile: 모바일 프로필 / Blogdex 고정 페이지(fixture)를 기존 필드별 정규식 스캔과
+     parse_mobile_profile / parse_blogdex_page(1회 스캔)로 비교.
+metrics: 블로거 1명분 RSS 지표 함수 묶음(analyze_blog 점수 계산 경로)을 함수마다 새 포스트 객체로
+     호출(특성 캐시 미공유 = 도입 전 재토큰화/재파싱/SimHash 재계산)하는 경우와 같은 포스트 목록을
+     공유(post_features 캐시)하는 경우로 비교. 두 경우 모두 반복마다 새 객체에서 시작.
+simhash: 검색 1회분 description(블로거 80명 × 20개)의 SimHash를
+     기존 방식(3-gram마다 md5 hexdigest + 64비트 루프)과 compute_simhash_batch로 비교.
+     batch는 토큰 해시 캐시를 비운 첫 실행(cold)과 캐시가 찬 상태(warm)를 따로 측정.
+golden: 매장 리포트(get_top20_and_pool40) 1회분 행(기본 200개)의 GoldenScore v7.2를
+     행마다 golden_score_v72를 호출하는 경우와 golden_score_v72_batch(열 단위)로 비교.
+suite: 합성 블로거 코퍼스(make_corpus, seed 고정)로 scoring / blog_analyzer 지표 함수마다
+     CPU 시간(최솟값), 처리량(ops/sec), 피크 메모리를 측정해 benchmarks_baseline.json과 비교.
+     --check는 cpu_ms/peak_kb가 기준선 × tolerance를 넘는 케이스가 있으면 종료 코드 1.
+     기준선은 측정한 머신 기준이므로 실행 머신이 바뀌거나 의도한 변경 후에는 --save-baseline으로 갱신.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from xml.etree import ElementTree
+
+from backend.blog_analyzer import (
+    RSS_MAX_ITEMS, _parse_rss, analyze_activity, analyze_content, analyze_quality, compute_tfidf_topic_similarity,
+    compute_tfidf_topic_similarity_batch, extract_full_reverse_keywords, parse_blogdex_page, parse_mobile_profile,
+)
+from backend.models import RSSPost
+from backend import scoring
+from backend.scoring import (
+    compute_content_authority_v72, compute_diversity_smoothed, compute_freshness_v72, compute_game_defense,
+    compute_originality_v7, compute_search_presence_v72, compute_simhash_batch, golden_score_v72,
+    golden_score_v72_batch,
+)
+
+
+def make_rss_feed(n_items: int) -> bytes:
+    """벤치마크용 합성 RSS (item마다 이미지 3개 + 유튜브 iframe 1개 + 본문 ~1KB)."""
+    body = "오늘 다녀온 곳 후기입니다. " * 40
+    items = []
+    for i in range(n_items):
+        desc = (
+            f"<p>{body}</p><img src='https://blogthumb.pstatic.net/{i}/a.jpg'>"
+            f"<img src='b.jpg'><img src='c.jpg'>"
+            f"<iframe src='https://www.youtube.com/embed/{i}'></iframe>"
+        )
+        items.append(
+            f"<item><title>포스트 {i}</title>"
+            f"<link>https://blog.naver.com/bench/{i}</link>"
+            f"<pubDate>Mon, 05 Jan 2026 10:00:00 +0900</pubDate>"
+            f"<category>일상</category>"
+            f"<description><![CDATA[{desc}]]></description></item>"
+        )
+    return ("<rss><channel><title>bench</title>" + "".join(items) + "</channel></rss>").encode("utf-8")
+
+
+def _legacy_scan_description(raw_html: str) -> tuple:
+    """_scan_description 도입 전 방식: (태그 제거 텍스트, 이미지 수, 영상 수) 정규식 3회."""
+    img = len(re.findall(r"<img\b", raw_html, re.IGNORECASE))
+    vid = len(re.findall(r"<(?:iframe|video)\b|youtube\.com|youtu\.be", raw_html, re.IGNORECASE))
+    return re.sub(r"<[^>]+>", "", raw_html).strip(), img, vid
+
+
+def _legacy_parse_rss(content: bytes) -> List[RSSPost]:
+    """스트리밍 파서 도입 전 방식 (비교 기준)."""
+    root = ElementTree.fromstring(content)
+    posts: List[RSSPost] = []
+    for item in root.iter("item"):
+        def _t(tag: str) -> Optional[str]:
+            child = item.find(tag)
+            return child.text.strip() if child is not None and child.text else None
+
+        title, link, desc = _t("title"), _t("link"), _t("description")
+        if title and link:
+            text, img, vid = _legacy_scan_description(desc or "")
+            posts.append(RSSPost(
+                title=re.sub(r"<[^>]+>", "", title).strip(),
+                link=link,
+                pub_date=_t("pubDate"),
+                description=text,
+                category=_t("category"),
+                image_count=img,
+                video_count=vid,
+            ))
+    return posts
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> Dict[str, float]:
+    """fn 반복 실행 → CPU 시간(최솟값, ms) + 피크 메모리(KB)."""
+    cpu_ms = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        cpu_ms.append((time.process_time() - start) * 1000.0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"cpu_ms": round(min(cpu_ms), 2), "peak_kb": round(peak / 1024.0, 1)}
+
+
+def bench_rss(n_items: int = 2000, repeat: int = 5) -> Dict[str, Any]:
+    feed = make_rss_feed(n_items)
+    chunk = 16 * 1024
+
+    def _streaming():
+        return _parse_rss((feed[i:i + chunk] for i in range(0, len(feed), chunk)), "bench", RSS_MAX_ITEMS)
+
+    return {
+        "feed_kb": round(len(feed) / 1024.0, 1),
+        "items": n_items,
+        "max_items": RSS_MAX_ITEMS,
+        "legacy": measure(lambda: _legacy_parse_rss(feed), repeat),
+        "streaming": measure(_streaming, repeat),
+    }
+
+
+def make_mobile_profile_page(filler_kb: int = 300) -> str:
+    """모바일 프로필 fixture — 마크업/스크립트 뒤에 상태 JSON (실제 페이지처럼 필드가 문서 후반부)."""
+    filler = "<div class='post_item'><span>게시물 미리보기</span></div>\n" * (filler_kb * 1024 // 56)
+    state = (
+        '{"blogInfo":{"blogId":"bench","countPost":1520,"postCount":1532,'
+        '"totalVisitorCount":2841234,"subscriberCount":5120,"buddyCount":5100,'
+        '"blogDirectoryOpenDate":"20150311"}}'
+    )
+    return f"<html><body>{filler}<script>window.__INITIAL_STATE__={state};</script></body></html>"
+
+
+def make_blogdex_page(filler_kb: int = 200) -> str:
+    """Blogdex fixture — 등급/랭킹/통계 블록이 페이지 후반부."""
+    filler = "<p>블로그 지수 안내 문구입니다.</p>\n" * (filler_kb * 1024 // 40)
+    return (
+        f"<html><body>{filler}"
+        "<div>준최5</div><div>주제 랭킹 <b>1,204등</b> 상위 3.2%</div>"
+        "<div>전체 랭킹 <b>45,120등</b> 상위 8.7%</div>"
+        "<ul><li>총 포스팅 1,532</li><li>총 방문자 2,841,234</li><li>총 구독자 5,120</li>"
+        "<li>블로그 생성일 2015-03-11</li></ul></body></html>"
+    )
+
+
+def _legacy_parse_mobile(text: str) -> Dict[str, Any]:
+    """단일 스캔 추출기 도입 전 방식 — 필드마다 re.search (비교 기준)."""
+    mob: Dict[str, Any] = {"total_posts": 0, "total_visitors": 0, "total_subscribers": 0,
+                           "neighbor_count": 0, "blog_age_years": 0.0, "blog_start_date": None}
+    for field in ["postCount", "countPost"]:
+        m = re.search(rf'"{field}"\s*:\s*(\d+)', text)
+        if m:
+            mob["total_posts"] = max(mob["total_posts"], int(m.group(1)))
+            break
+    m = re.search(r'"totalVisitorCount"\s*:\s*(\d+)', text)
+    if m:
+        mob["total_visitors"] = int(m.group(1))
+    for field in ["subscriberCount", "buddyCount"]:
+        m = re.search(rf'"{field}"\s*:\s*(\d+)', text)
+        if m:
+            val = int(m.group(1))
+            mob["total_subscribers"] = max(mob["total_subscribers"], val)
+            mob["neighbor_count"] = max(mob["neighbor_count"], val)
+            break
+    m = re.search(r'"blogDirectoryOpenDate"\s*:\s*"(\d{4})(\d{2})(\d{2})"', text)
+    if m:
+        try:
+            created = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            mob["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
+            mob["blog_start_date"] = created
+        except (ValueError, TypeError):
+            pass
+    if not mob["neighbor_count"]:
+        m = re.search(r'"?buddyCnt"?\s*[:=]\s*(\d+)', text)
+        if m:
+            mob["neighbor_count"] = int(m.group(1))
+            mob["total_subscribers"] = max(mob["total_subscribers"], int(m.group(1)))
+    if not mob["total_posts"]:
+        m = re.search(r'게시글\s*([\d,]+)', text)
+        if m:
+            mob["total_posts"] = int(m.group(1).replace(",", ""))
+    if not mob["total_subscribers"]:
+        m = re.search(r'이웃\s*([\d,]+)', text)
+        if m:
+            val = int(m.group(1).replace(",", ""))
+            mob["total_subscribers"] = val
+            mob["neighbor_count"] = val
+    return mob
+
+
+def _legacy_parse_blogdex(text: str) -> Dict[str, Any]:
+    """단일 스캔 추출기 도입 전 방식 — 등급 16회 in 검사 + 필드별 re.search (비교 기준)."""
+    result: Dict[str, Any] = {}
+    grades = [
+        "최적4+", "최적3+", "최적2+", "최적1+",
+        "최적4", "최적3", "최적2", "최적1",
+        "준최7", "준최6", "준최5", "준최4", "준최3", "준최2", "준최1",
+        "일반",
+    ]
+    for g in grades:
+        if g in text:
+            result["blogdex_grade"] = g
+            break
+    m = re.search(r'주제\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%', text)
+    if m:
+        result["ranking_percentile"] = float(m.group(2))
+    m = re.search(r'전체\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%', text)
+    if m:
+        pct = float(m.group(2))
+        if "ranking_percentile" not in result or pct < result["ranking_percentile"]:
+            result["ranking_percentile"] = pct
+    m = re.search(r'총\s*포스팅\s*([\d,]+)', text)
+    if m:
+        result["total_posts"] = int(m.group(1).replace(",", ""))
+    m = re.search(r'총\s*방문자\s*([\d,]+)', text)
+    if m:
+        result["total_visitors"] = int(m.group(1).replace(",", ""))
+    m = re.search(r'총\s*구독자\s*([\d,]+)', text)
+    if m:
+        result["total_subscribers"] = int(m.group(1).replace(",", ""))
+    m = re.search(r'블로그\s*생성일\s*(\d{4})-(\d{2})-(\d{2})', text)
+    if m:
+        try:
+            created = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            result["blog_created_date"] = created
+            result["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
+        except (ValueError, TypeError):
+            pass
+    return result
+
+
+def bench_profile(repeat: int = 50) -> Dict[str, Any]:
+    mobile = make_mobile_profile_page()
+    blogdex = make_blogdex_page()
+    return {
+        "mobile_kb": round(len(mobile.encode("utf-8")) / 1024.0, 1),
+        "blogdex_kb": round(len(blogdex.encode("utf-8")) / 1024.0, 1),
+        "mobile": {
+            "legacy": measure(lambda: _legacy_parse_mobile(mobile), repeat),
+            "single_pass": measure(lambda: parse_mobile_profile(mobile), repeat),
+        },
+        "blogdex": {
+            "legacy": measure(lambda: _legacy_parse_blogdex(blogdex), repeat),
+            "single_pass": measure(lambda: parse_blogdex_page(blogdex), repeat),
+        },
+    }
+
+
+def make_blog_posts(n_posts: int = 30) -> List[RSSPost]:
+    """블로거 1명분 합성 RSS 포스트 (RSS description ~350자 잘림 수준)."""
+    places = ["성수동", "연남동", "을지로", "망원동", "서촌", "판교"]
+    topics = ["카페", "브런치", "파스타", "디저트", "베이커리", "와인바"]
+    body = "주말에 다녀온 곳을 정리해 봤어요 분위기 좋고 메뉴도 다양해서 또 가고 싶은 곳입니다 "
+    now = datetime.now()
+    return [
+        RSSPost(
+            title=f"{places[i % 6]} {topics[(i * 5) % 6]} 추천 솔직 후기 {i}번째 방문",
+            link=f"https://blog.naver.com/bench/{i}",
+            pub_date=(now - timedelta(days=i * 2)).strftime("%a, %d %b %Y 10:00:00 +0900"),
+            description=(f"{places[i % 6]} {topics[i % 6]} " + body * 5)[:350],
+            category="맛집",
+            image_count=i % 7,
+        )
+        for i in range(n_posts)
+    ]
+
+
+# analyze_blog 점수 계산 경로에서 RSS 포스트를 받는 지표 함수들
+_METRIC_FNS: List[Callable[[List[RSSPost]], Any]] = [
+    analyze_activity,
+    lambda ps: analyze_content(ps, is_food_cat=True, store_category="카페"),
+    analyze_quality,
+    lambda ps: extract_full_reverse_keywords(ps, max_posts=15),
+    lambda ps: compute_tfidf_topic_similarity(ps, ["카페", "디저트"]),
+    compute_originality_v7,
+    compute_diversity_smoothed,
+    lambda ps: compute_game_defense(ps, {"interval_avg": 2.0}),
+    compute_content_authority_v72,
+    compute_search_presence_v72,
+    lambda ps: compute_freshness_v72(1, ps),
+]
+
+
+def bench_metrics(n_posts: int = 30, repeat: int = 10) -> Dict[str, Any]:
+    posts = make_blog_posts(n_posts)
+
+    def _fresh() -> List[RSSPost]:
+        return [dataclasses.replace(p) for p in posts]
+
+    def _per_function():
+        for fn in _METRIC_FNS:
+            fn(_fresh())
+
+    def _shared():
+        shared = _fresh()
+        for fn in _METRIC_FNS:
+            fn(shared)
+
+    return {
+        "posts": n_posts,
+        "functions": len(_METRIC_FNS),
+        "per_function": measure(_per_function, repeat),
+        "shared_features": measure(_shared, repeat),
+    }
+
+
+def _legacy_compute_simhash(text: str) -> int:
+    """compute_simhash_batch 도입 전 방식 (비교 기준)."""
+    if not text:
+        return 0
+    tokens = [text[i:i+3] for i in range(max(1, len(text) - 2))]
+    v = [0] * 64
+    for token in tokens:
+        h = int(hashlib.md5(token.encode("utf-8", errors="replace")).hexdigest(), 16)
+        for i in range(64):
+            if h & (1 << i):
+                v[i] += 1
+            else:
+                v[i] -= 1
+    fingerprint = 0
+    for i in range(64):
+        if v[i] > 0:
+            fingerprint |= (1 << i)
+    return fingerprint
+
+
+def make_search_descriptions(n_bloggers: int = 80, n_posts: int = 20) -> List[str]:
+    """검색 1회분 후보 블로거들의 RSS description (블로거마다 문구가 조금씩 다름)."""
+    texts = []
+    for b in range(n_bloggers):
+        for p in make_blog_posts(n_posts):
+            texts.append(f"블로거{b} " + p.description.replace("주말", f"{b % 7}번째 주말"))
+    return texts
+
+
+def bench_simhash(n_bloggers: int = 80, n_posts: int = 20, repeat: int = 3) -> Dict[str, Any]:
+    texts = make_search_descriptions(n_bloggers, n_posts)
+
+    def _cold():
+        scoring._SIMHASH_TOKEN_CACHE.clear()
+        return compute_simhash_batch(texts)
+
+    return {
+        "texts": len(texts),
+        "avg_chars": round(sum(len(t) for t in texts) / max(1, len(texts)), 1),
+        "legacy": measure(lambda: [_legacy_compute_simhash(t) for t in texts], repeat),
+        "batch_cold": measure(_cold, repeat),
+        "batch_warm": measure(lambda: compute_simhash_batch(texts), repeat),
+        "identical": compute_simhash_batch(texts) == [_legacy_compute_simhash(t) for t in texts],
+    }
+
+
+def make_report_rows(n_rows: int = 200, seed: int = 72) -> List[Dict[str, Any]]:
+    """리포트 집계 행과 같은 형태의 golden_score_v72 인자 (ranks/RSS 없음, CA/SP 사전 계산)."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n_rows):
+        exposed = rng.randint(0, 10)
+        rows.append(dict(
+            queries_hit_count=exposed, total_query_count=10, popularity_cross_score=rng.choice([0.0, rng.random()]),
+            broad_query_hits=rng.randint(0, 2), region_power_hits=rng.randint(0, 3),
+            content_authority_precomputed=rng.uniform(0, 22), richness_avg_len=rng.uniform(0, 3500),
+            rss_originality_v7=rng.uniform(0, 8), rss_diversity_smoothed=rng.random(),
+            image_ratio=rng.random(), video_ratio=rng.random() * 0.2,
+            days_since_last_post=rng.choice([None, rng.randint(0, 200)]),
+            search_presence_precomputed=rng.uniform(0, 16), game_defense=rng.choice([0.0, -3.0]),
+            quality_floor=rng.choice([0.0, 2.0]), has_category=True,
+            keyword_match_ratio=rng.random(), exposure_ratio=exposed / 10, queries_hit_ratio=rng.random(),
+            topic_focus=rng.random(), topic_continuity=rng.random(), tfidf_sim=rng.random(),
+            cat_strength=exposed * 3, cat_exposed=exposed, total_keywords=10, weighted_strength=exposed * 3.5,
+            sponsor_signal_rate=rng.random() * 0.6, avg_image_count=rng.uniform(0, 12),
+            total_posts=rng.randint(0, 4000), total_visitors=rng.randint(0, 2000000),
+            total_subscribers=rng.randint(0, 4000), ranking_percentile=rng.uniform(0, 100),
+            blog_age_years=rng.uniform(0, 12),
+        ))
+    return rows
+
+
+def bench_golden(n_rows: int = 200, repeat: int = 20) -> Dict[str, Any]:
+    rows = make_report_rows(n_rows)
+    columns = {k: [r[k] for r in rows] for k in rows[0]}
+    return {
+        "rows": n_rows,
+        "per_row": measure(lambda: [golden_score_v72(**r) for r in rows], repeat),
+        "batch": measure(lambda: golden_score_v72_batch(columns), repeat),
+        "identical": golden_score_v72_batch(columns) == [golden_score_v72(**r) for r in rows],
+    }
+
+
+
+# ---- 지표 함수 회귀 스위트 (suite) ----
+
+SUITE_BASELINE_PATH = Path(__file__).resolve().parent / "benchmarks_baseline.json"
+# 기준선 대비 이 배율을 넘으면 회귀 (CPU 시간은 머신 부하에 따라 흔들려 넉넉하게)
+SUITE_TOLERANCE = 2.0
+# 1ms 미만 케이스의 잡음/작은 할당 차이는 무시
+_SUITE_SLACK_MS = 0.5
+_SUITE_SLACK_KB = 32.0
+
+_CORPUS_PLACES = ["성수동", "연남동", "을지로", "망원동", "서촌", "판교", "해운대", "전주", "제주", "송리단길"]
+_CORPUS_TOPICS = ["카페", "브런치", "파스타", "디저트", "베이커리", "와인바", "육아", "여행", "헬스", "인테리어"]
+_CORPUS_SENTENCES = [
+    "주말에 다녀온 곳을 정리해 봤어요",
+    "분위기 좋고 메뉴도 다양해서 또 가고 싶은 곳입니다",
+    "주차는 건물 뒤편 공영주차장을 이용하면 편해요",
+    "웨이팅이 있어서 오픈 시간에 맞춰 가는 걸 추천드려요",
+    "가격은 조금 있는 편이지만 양이 넉넉했어요",
+    "사진 찍기 좋은 창가 자리가 인기가 많더라고요",
+    "직원분들이 친절하게 설명해 주셔서 좋았습니다",
+    "근처에 산책로가 있어서 식후에 걷기 좋아요",
+]
+_CORPUS_SPONSOR = "본 포스팅은 업체로부터 제품을 제공받아 작성되었습니다"
+_CORPUS_DATE_FORMATS = ("%a, %d %b %Y %H:%M:%S +0900", "%Y-%m-%dT%H:%M:%S")
+
+
+def make_corpus(n_bloggers: int = 40, n_posts: int = 30, seed: int = 50) -> List[List[RSSPost]]:
+    """블로거 n_bloggers명 × 포스트 n_posts개 합성 RSS (seed가 같으면 같은 코퍼스, 날짜만 실행 시점 기준).
+
+    블로거마다 주제 수(집중/분산), 게시 간격, 본문 길이, 이미지 수, 협찬 문구 비율,
+    원고 재사용(근사 중복) 비율을 다르게 뽑아 지표 함수의 분기를 고루 지나게 한다.
+    """
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    corpus: List[List[RSSPost]] = []
+    for b in range(n_bloggers):
+        topics = rng.sample(_CORPUS_TOPICS, rng.randint(1, 6))
+        places = rng.sample(_CORPUS_PLACES, rng.randint(1, 4))
+        interval = rng.choice([0.5, 1.0, 2.0, 4.0, 10.0])
+        desc_len = rng.randint(60, 600)
+        images = rng.randint(0, 15)
+        sponsor_rate = rng.choice([0.0, 0.0, 0.2, 0.6])
+        reuse_rate = rng.choice([0.0, 0.0, 0.3])
+        # 블로거 3명 중 1명은 ISO 형식 pubDate (RFC 822 외 파싱 경로)
+        date_fmt = _CORPUS_DATE_FORMATS[1] if b % 3 == 2 else _CORPUS_DATE_FORMATS[0]
+        template = ""
+        posts: List[RSSPost] = []
+        for i in range(n_posts):
+            place, topic = rng.choice(places), rng.choice(topics)
+            if template and rng.random() < reuse_rate:
+                desc = template
+            else:
+                words = [place, topic] + [rng.choice(_CORPUS_SENTENCES) for _ in range(desc_len // 25 + 1)]
+                if rng.random() < sponsor_rate:
+                    words.append(_CORPUS_SPONSOR)
+                desc = " ".join(words)[:desc_len]
+                template = template or desc
+            posted = now - timedelta(days=interval * i + rng.random() * interval, hours=rng.randint(0, 12))
+            posts.append(RSSPost(
+                title=f"{place} {topic} {rng.choice(['추천', '솔직 후기', '내돈내산', '방문기', '총정리'])} {i + 1}",
+                link=f"https://blog.naver.com/suite{b}/{i}",
+                pub_date=posted.strftime(date_fmt),
+                description=desc,
+                category=topic,
+                image_count=max(0, images + rng.randint(-3, 3)),
+            ))
+        corpus.append(posts)
+    return corpus
+
+
+def _per_blogger(fn: Callable[[List[RSSPost]], Any]) -> Callable[[List[List[RSSPost]]], int]:
+    def run(corpus: List[List[RSSPost]]) -> int:
+        for posts in corpus:
+            fn(posts)
+        return len(corpus)
+    return run
+
+
+def _simhash_batch_case(corpus: List[List[RSSPost]]) -> int:
+    return len(compute_simhash_batch([p.description or "" for posts in corpus for p in posts]))
+
+
+def _golden_full_case(corpus: List[List[RSSPost]]) -> int:
+    # 매장 분석 tier 단계처럼 RSS 포스트로 CA/SP/Freshness를 직접 계산하는 경로
+    for i, posts in enumerate(corpus):
+        golden_score_v72(
+            queries_hit_count=i % 8, total_query_count=10, ranks=[1 + (i % 5), 7, 18][: 1 + i % 3],
+            broad_query_hits=i % 2, region_power_hits=i % 3, rss_posts=posts,
+            richness_avg_len=1800.0, rss_originality_v7=compute_originality_v7(posts),
+            rss_diversity_smoothed=compute_diversity_smoothed(posts), image_ratio=0.6,
+            days_since_last_post=i % 20, has_category=True, keyword_match_ratio=0.4,
+            exposure_ratio=(i % 8) / 10, queries_hit_ratio=0.5, cat_strength=(i % 8) * 3,
+            cat_exposed=i % 8, total_keywords=10, weighted_strength=(i % 8) * 3.5,
+            total_posts=500 + i * 40, total_visitors=10000 * i, total_subscribers=30 * i,
+            ranking_percentile=float(100 - i % 100), blog_age_years=1.0 + i % 9,
+        )
+    return len(corpus)
+
+
+_REPORT_COLUMNS: Dict[int, Dict[str, List[Any]]] = {}
+
+
+def _golden_batch_case(corpus: List[List[RSSPost]]) -> int:
+    # 리포트 1회분 행 — 블로거 수 × 5행 (행 생성은 첫 호출에서만)
+    n_rows = len(corpus) * 5
+    columns = _REPORT_COLUMNS.get(n_rows)
+    if columns is None:
+        rows = make_report_rows(n_rows)
+        columns = _REPORT_COLUMNS[n_rows] = {k: [r[k] for r in rows] for k in rows[0]}
+    return len(golden_score_v72_batch(columns))
+
+
+_SUITE_MATCH_KEYWORDS = ["카페", "디저트", "브런치"]
+
+# 케이스 이름 → corpus를 받아 처리한 단위 수(ops)를 반환하는 함수. 이름은 기준선 JSON의 키.
+SUITE_CASES: Dict[str, Callable[[List[List[RSSPost]]], int]] = {
+    "simhash_batch": _simhash_batch_case,
+    "near_duplicate_rate": _per_blogger(scoring.compute_near_duplicate_rate),
+    "originality_v7": _per_blogger(compute_originality_v7),
+    "diversity_smoothed": _per_blogger(compute_diversity_smoothed),
+    "topic_focus": _per_blogger(lambda ps: scoring.compute_topic_focus(ps, _SUITE_MATCH_KEYWORDS)),
+    "topic_continuity": _per_blogger(lambda ps: scoring.compute_topic_continuity(ps, _SUITE_MATCH_KEYWORDS)),
+    "game_defense": _per_blogger(lambda ps: compute_game_defense(ps, {"interval_avg": 2.0})),
+    "content_authority_v72": _per_blogger(compute_content_authority_v72),
+    "search_presence_v72": _per_blogger(compute_search_presence_v72),
+    "freshness_v72": _per_blogger(lambda ps: compute_freshness_v72(1, ps)),
+    "analyze_activity": _per_blogger(analyze_activity),
+    "analyze_content": _per_blogger(lambda ps: analyze_content(ps, is_food_cat=True, store_category="카페")),
+    "analyze_quality": _per_blogger(analyze_quality),
+    "reverse_keywords": _per_blogger(lambda ps: extract_full_reverse_keywords(ps, max_posts=15)),
+    "tfidf_topic_similarity": _per_blogger(lambda ps: compute_tfidf_topic_similarity(ps, _SUITE_MATCH_KEYWORDS)),
+    "tfidf_topic_similarity_batch": lambda corpus: len(compute_tfidf_topic_similarity_batch(
+        {str(i): ps for i, ps in enumerate(corpus)}, _SUITE_MATCH_KEYWORDS)),
+    "golden_score_v72": _golden_full_case,
+    "golden_score_v72_batch": _golden_batch_case,
+}
+
+
+def _measure_case(case: Callable[[List[List[RSSPost]]], int], corpus: List[List[RSSPost]],
+                  repeat: int) -> Dict[str, float]:
+    """케이스 1개: 반복마다 새 포스트 객체(특성 캐시 없음)로 실행 → CPU 최솟값, 처리량, 피크 메모리.
+
+    객체 복사는 시간 측정 밖에서 한다. SimHash 토큰 해시 캐시는 반복 중 채워진 상태
+    (워커 정상 상태)로 측정된다.
+    """
+    def _fresh() -> List[List[RSSPost]]:
+        return [[dataclasses.replace(p) for p in posts] for posts in corpus]
+
+    cpu_ms = []
+    ops = 0
+    for _ in range(max(1, repeat)):
+        batch = _fresh()
+        start = time.process_time()
+        ops = case(batch)
+        cpu_ms.append((time.process_time() - start) * 1000.0)
+    batch = _fresh()
+    tracemalloc.start()
+    try:
+        case(batch)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best = min(cpu_ms)
+    return {
+        "ops": ops,
+        "cpu_ms": round(best, 2),
+        "ops_per_sec": round(ops / max(best / 1000.0, 1e-6), 1),
+        "peak_kb": round(peak / 1024.0, 1),
+    }
+
+
+def run_suite(n_bloggers: int = 40, n_posts: int = 30, repeat: int = 5, seed: int = 50,
+              cases: Optional[List[str]] = None) -> Dict[str, Any]:
+    """합성 코퍼스로 SUITE_CASES(또는 cases만) 측정 → {"config": ..., "cases": {이름: 측정값}}."""
+    unknown = [c for c in cases or () if c not in SUITE_CASES]
+    if unknown:
+        raise ValueError(f"알 수 없는 케이스: {unknown}")
+    corpus = make_corpus(n_bloggers, n_posts, seed)
+    return {
+        "config": {
+            "bloggers": n_bloggers, "posts": n_posts, "seed": seed, "repeat": repeat,
+            "python": ".".join(map(str, sys.version_info[:2])),
+        },
+        "cases": {name: _measure_case(SUITE_CASES[name], corpus, repeat) for name in cases or SUITE_CASES},
+    }
+
+
+def compare_suite(result: Dict[str, Any], baseline: Dict[str, Any],
+                  tolerance: float = SUITE_TOLERANCE) -> Dict[str, Any]:
+    """run_suite 결과를 기준선과 비교. cpu_ms/peak_kb가 기준선 × tolerance(+절대 여유)를 넘으면 회귀.
+
+    코퍼스 설정(bloggers/posts/seed)이 다르면 비교하지 않는다 (comparable=False).
+    """
+    keys = ("bloggers", "posts", "seed")
+    comparable = all(result["config"].get(k) == baseline.get("config", {}).get(k) for k in keys)
+    regressions: List[Dict[str, Any]] = []
+    if comparable:
+        for name, cur in result["cases"].items():
+            base = baseline.get("cases", {}).get(name)
+            if not base:
+                continue
+            for metric, slack in (("cpu_ms", _SUITE_SLACK_MS), ("peak_kb", _SUITE_SLACK_KB)):
+                if cur[metric] > base[metric] * tolerance + slack:
+                    regressions.append({
+                        "case": name, "metric": metric, "baseline": base[metric], "current": cur[metric],
+                        "ratio": round(cur[metric] / max(base[metric], 1e-9), 2),
+                    })
+    return {
+        "comparable": comparable,
+        "tolerance": tolerance,
+        "regressions": regressions,
+        "new_cases": sorted(set(result["cases"]) - set(baseline.get("cases", {}))),
+        "ok": comparable and not regressions,
+    }
+
+
+def load_baseline(path: Path = SUITE_BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(result: Dict[str, Any], path: Path = SUITE_BASELINE_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="분석 파이프라인 벤치마크")
+    sub = parser.add_subparsers(dest="target", required=True)
+    p_rss = sub.add_parser("rss", help="RSS 파서: 전체 트리 vs 스트리밍")
+    p_rss.add_argument("--items", type=int, default=2000)
+    p_rss.add_argument("--repeat", type=int, default=5)
+    p_prof = sub.add_parser("profile", help="프로필 페이지 추출: 필드별 정규식 vs 1회 스캔")
+    p_prof.add_argument("--repeat", type=int, default=50)
+    p_met = sub.add_parser("metrics", help="블로거 1명 지표 계산: 함수별 재계산 vs 포스트 특성 캐시 공유")
+    p_met.add_argument("--posts", type=int, default=30)
+    p_met.add_argument("--repeat", type=int, default=10)
+    p_sim = sub.add_parser("simhash", help="SimHash: 토큰별 64비트 루프 vs 배치(토큰 해시 캐시 + 비트 열 집계)")
+    p_sim.add_argument("--bloggers", type=int, default=80)
+    p_sim.add_argument("--posts", type=int, default=20)
+    p_sim.add_argument("--repeat", type=int, default=3)
+    p_gold = sub.add_parser("golden", help="GoldenScore v7.2: 행별 호출 vs 열 단위 일괄 계산")
+    p_gold.add_argument("--rows", type=int, default=200)
+    p_gold.add_argument("--repeat", type=int, default=20)
+    p_suite = sub.add_parser("suite", help="지표 함수 전체: 합성 코퍼스 처리량/메모리 + 기준선 비교")
+    p_suite.add_argument("--bloggers", type=int, default=40)
+    p_suite.add_argument("--posts", type=int, default=30)
+    p_suite.add_argument("--repeat", type=int, default=5)
+    p_suite.add_argument("--seed", type=int, default=50)
+    p_suite.add_argument("--case", action="append", dest="cases", help="이 케이스만 측정 (여러 번 지정 가능)")
+    p_suite.add_argument("--baseline", type=Path, default=SUITE_BASELINE_PATH)
+    p_suite.add_argument("--tolerance", type=float, default=SUITE_TOLERANCE)
+    p_suite.add_argument("--save-baseline", action="store_true", help="결과를 기준선 파일로 저장")
+    p_suite.add_argument("--check", action="store_true", help="기준선 대비 회귀(또는 비교 불가) 시 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    if args.target == "rss":
+        result = bench_rss(args.items, args.repeat)
+    elif args.target == "profile":
+        result = bench_profile(args.repeat)
+    elif args.target == "metrics":
+        result = bench_metrics(args.posts, args.repeat)
+    elif args.target == "simhash":
+        result = bench_simhash(args.bloggers, args.posts, args.repeat)
+    elif args.target == "golden":
+        result = bench_golden(args.rows, args.repeat)
+    elif args.target == "suite":
+        result = run_suite(args.bloggers, args.posts, args.repeat, args.seed, args.cases)
+        if args.save_baseline:
+            save_baseline(result, args.baseline)
+        else:
+            baseline = load_baseline(args.baseline)
+            if baseline is not None:
+                result["comparison"] = compare_suite(result, baseline, args.tolerance)
+            if args.check and not result.get("comparison", {}).get("ok", False):
+                print(json.dumps(result, ensure_ascii=False, indent=2))
+                return 1
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
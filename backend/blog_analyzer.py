@@ -9,17 +9,28 @@ RSS 피드 + 네이버 검색 API로 특정 블로거를 종합 분석.
 from __future__ import annotations
 
 import concurrent.futures
+import json
 import logging
 import math
+import random
 import re
 import statistics
+import threading
+import time
 from collections import Counter
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from xml.etree import ElementTree
 
 import requests
 
+from backend.cancellation import CancelToken, checkpoint
+from backend.deadline import (
+    SIGNAL_BLOGDEX, SIGNAL_DESKTOP_PROFILE, SIGNAL_POST_SAMPLE, Deadline, allows,
+)
+from backend.fetch_scheduler import polite_get
 from backend.keywords import StoreProfile, build_exposure_keywords
 from backend.models import (
     ActivityMetrics,
@@ -31,6 +42,13 @@ from backend.models import (
     SuitabilityMetrics,
 )
 from backend.naver_client import NaverBlogSearchClient
+from backend.negative_cache import (
+    KIND_PROFILE, KIND_RSS, NEG_NOT_FOUND, NEG_PARSE_ERROR, NEG_PRIVATE, NEG_TIMEOUT, get_negative_cache,
+)
+from backend.post_features import features
+from backend.search_results import index_items
+from backend.stage_graph import StageGraph
+from backend.timings import PhaseTimings, db_write, record_cache_hit, record_http_fetch, submit_in_context
 from backend.scoring import (
     FOOD_WORDS,
     SPONSOR_WORDS,
@@ -38,13 +56,15 @@ from backend.scoring import (
     keyword_weight_for_suffix,
     strength_points,
     blog_analysis_score,
-    compute_simhash,
+    compute_blog_power,
     hamming_distance,
 )
 
 logger = logging.getLogger(__name__)
 
 ProgressCb = Callable[[dict], None]
+# 부분 결과 콜백: (섹션 이름, 최종 결과의 같은 키와 동일한 형태의 데이터)
+SectionCb = Callable[[str, Dict[str, Any]], None]
 
 # RSS에서 무시할 공통 불용어
 _STOPWORDS = frozenset({
@@ -100,43 +120,206 @@ def extract_blogger_id(url_or_id: str) -> Optional[str]:
     return None
 
 
-def fetch_rss(blogger_id: str, timeout: float = 5.0) -> List[RSSPost]:
-    """네이버 블로그 RSS 피드에서 포스트 목록 수집."""
+def _http_get(url: str, timeout: float, headers: Dict[str, str], stream: bool = False) -> requests.Response:
+    """스크래핑용 GET — 호스트별 스케줄러(동시성/간격/백오프) 경유 + 계측 단계에 fetch 수/바이트 기록.
+
+    stream=True면 본문을 읽지 않고 반환 (호출자가 읽은 만큼 record_http_fetch 후 close — 그때까지 호스트 슬롯 점유).
+    호스트 백오프 중이면 HostBackoffError(RequestException)로 즉시 실패.
+    """
+    resp = polite_get(url, timeout=timeout, headers=headers, stream=stream)
+    if not stream:
+        record_http_fetch(len(resp.content or b""))
+    return resp
+
+
+# RSS 파싱 상한: 하위 지표는 최근 10~30개만 사용 (네이버 RSS 기본 50개와 동일 → 일반 피드 결과 불변)
+RSS_MAX_ITEMS = 50
+_RSS_CHUNK_BYTES = 16 * 1024
+
+# RSS 캐시: 마지막 검증 후 이 시간 이내면 HTTP 없이 반환, 이후엔 조건부 GET (304면 재파싱 생략)
+RSS_FRESH_SECONDS = 1800
+
+# 같은 블로거 RSS 동시 요청 합치기 (매장 분석/개별 분석/풀 갱신이 겹칠 때 1회만 다운로드)
+_rss_inflight: Dict[str, concurrent.futures.Future] = {}
+_rss_inflight_lock = threading.Lock()
+
+_RSS_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; BlogAnalyzer/1.0)"}
+
+# 블로거 자체의 문제로 보는 응답 (429/5xx는 호스트 문제 → 음성 캐시 대상 아님)
+_RSS_NEGATIVE_STATUS = {404: NEG_NOT_FOUND, 410: NEG_NOT_FOUND, 403: NEG_PRIVATE}
+
+
+def fetch_rss(
+    blogger_id: str,
+    timeout: float = 5.0,
+    db_path: Optional[Path] = None,
+    max_items: int = RSS_MAX_ITEMS,
+) -> List[RSSPost]:
+    """네이버 블로그 RSS 피드에서 포스트 목록 수집 — 캐시 + 동시 요청 합치기.
+
+    이미 같은 blogger_id를 가져오는 중이면 그 결과를 기다려 공유한다.
+    피드는 스트리밍 파싱하며 max_items개 이후는 다운로드/파싱하지 않는다.
+    """
+    with _rss_inflight_lock:
+        fut = _rss_inflight.get(blogger_id)
+        owner = fut is None
+        if owner:
+            fut = concurrent.futures.Future()
+            _rss_inflight[blogger_id] = fut
+
+    if not owner:
+        try:
+            return list(fut.result(timeout=timeout * 2 + 1))
+        except Exception:
+            return []
+
+    try:
+        posts = _fetch_rss_cached(blogger_id, timeout, db_path, max_items)
+        fut.set_result(posts)
+        return posts
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _rss_inflight_lock:
+            _rss_inflight.pop(blogger_id, None)
+
+
+def _fetch_rss_cached(
+    blogger_id: str, timeout: float, db_path: Optional[Path], max_items: int,
+) -> List[RSSPost]:
+    """rss_feeds 캐시 확인 → 신선하면 반환, 아니면 ETag/Last-Modified 조건부 GET.
+
+    다운로드 실패 시 만료 전 캐시가 있으면 그 포스트를 반환한다.
+    돌려줄 캐시도 없으면 실패 사유(404/403/타임아웃/파싱 오류)를 음성 캐시에 기록한다.
+    """
+    from backend.db import DB_PATH, conn_ctx, get_cached_rss, set_cached_rss, touch_cached_rss
+    from backend.dup_index import index_posts
+
+    path = db_path or DB_PATH
+    cached = None
+    try:
+        with conn_ctx(path) as conn:
+            cached = get_cached_rss(conn, blogger_id)
+    except Exception as e:
+        logger.debug("RSS 캐시 조회 실패: %s", e)
+
+    cached_posts: List[RSSPost] = []
+    if cached:
+        try:
+            cached_posts = [RSSPost(**p) for p in json.loads(cached["posts_json"])]
+        except (ValueError, TypeError):
+            cached = None
+    if cached and cached["age_seconds"] < RSS_FRESH_SECONDS:
+        record_cache_hit()
+        return cached_posts[:max_items]
+
+    # 음성 캐시 (없는/비공개/응답 없는 블로그) — 돌려줄 캐시가 없을 때만 요청 생략
+    negative = get_negative_cache(path)
+    if not cached_posts and negative.lookup(KIND_RSS, blogger_id):
+        record_cache_hit()
+        return []
+
+    headers = dict(_RSS_HEADERS)
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    def _failed(reason: Optional[str]) -> List[RSSPost]:
+        if reason and not cached_posts:
+            negative.record(KIND_RSS, blogger_id, reason)
+        return cached_posts[:max_items]
+
     url = f"https://rss.blog.naver.com/{blogger_id}.xml"
     try:
-        resp = requests.get(url, timeout=timeout, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; BlogAnalyzer/1.0)"
-        })
+        resp = _http_get(url, timeout=timeout, headers=headers, stream=True)
+    except requests.RequestException as e:
+        logger.warning("RSS fetch failed for %s: %s", blogger_id, e)
+        return _failed(NEG_TIMEOUT if isinstance(e, requests.Timeout) else None)
+
+    try:
+        if resp.status_code == 304 and cached:
+            record_http_fetch(0)
+            try:
+                with db_write(), conn_ctx(path) as conn:
+                    touch_cached_rss(conn, blogger_id)
+                    index_posts(conn, blogger_id, cached_posts)  # 블로거 간 중복 인덱스 보관 기한 연장
+            except Exception as e:
+                logger.debug("RSS 캐시 갱신 실패: %s", e)
+            return cached_posts[:max_items]
+        if resp.status_code in _RSS_NEGATIVE_STATUS:
+            logger.warning("RSS fetch failed for %s: HTTP %s", blogger_id, resp.status_code)
+            return _failed(_RSS_NEGATIVE_STATUS[resp.status_code])
         resp.raise_for_status()
+
+        consumed = [0]
+
+        def _chunks() -> Iterator[bytes]:
+            for chunk in resp.iter_content(chunk_size=_RSS_CHUNK_BYTES):
+                consumed[0] += len(chunk)
+                yield chunk
+
+        posts = _parse_rss(_chunks(), blogger_id, max_items)
+        record_http_fetch(consumed[0])
     except requests.RequestException as e:
         logger.warning("RSS fetch failed for %s: %s", blogger_id, e)
-        return []
+        return _failed(NEG_TIMEOUT if isinstance(e, requests.Timeout) else None)
+    finally:
+        resp.close()
+
+    if posts is None:
+        return _failed(NEG_PARSE_ERROR)
+    negative.clear(KIND_RSS, blogger_id)
 
     try:
-        root = ElementTree.fromstring(resp.content)
-    except ElementTree.ParseError as e:
-        logger.warning("RSS parse failed for %s: %s", blogger_id, e)
-        return []
+        with db_write(), conn_ctx(path) as conn:
+            set_cached_rss(
+                conn, blogger_id,
+                resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                json.dumps([asdict(p) for p in posts], ensure_ascii=False),
+            )
+            index_posts(conn, blogger_id, posts)
+    except Exception as e:
+        logger.debug("RSS 캐시 저장 실패: %s", e)
+    return posts
 
+
+def _parse_rss(chunks: Iterable[bytes], blogger_id: str, max_items: int = RSS_MAX_ITEMS) -> Optional[List[RSSPost]]:
+    """RSS XML 스트리밍 파싱 → RSSPost 목록 (max_items개에서 중단). 파싱 실패 시 None.
+
+    </item>마다 필드를 꺼내고 요소를 비워 전체 트리를 메모리에 올리지 않는다.
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
     posts: List[RSSPost] = []
-    for item in root.iter("item"):
-        title = _get_text(item, "title")
-        link = _get_text(item, "link")
-        pub_date = _get_text(item, "pubDate")
-        desc = _get_text(item, "description")
-        category = _get_text(item, "category")
-        if title and link:
-            # 이미지/영상 카운트 (HTML 스트리핑 전)
-            img_cnt, vid_cnt = _count_media_in_html(desc) if desc else (0, 0)
-            posts.append(RSSPost(
-                title=_strip_html(title),
-                link=link,
-                pub_date=pub_date,
-                description=_strip_html(desc) if desc else "",
-                category=category,
-                image_count=img_cnt,
-                video_count=vid_cnt,
-            ))
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag != "item":
+                    continue
+                title = _get_text(elem, "title")
+                link = _get_text(elem, "link")
+                if title and link:
+                    desc = _get_text(elem, "description")
+                    # 이미지/영상 카운트 + 태그 제거 (description 1회 스캔)
+                    text, img_cnt, vid_cnt = _scan_description(desc) if desc else ("", 0, 0)
+                    posts.append(RSSPost(
+                        title=_strip_html(title),
+                        link=link,
+                        pub_date=_get_text(elem, "pubDate"),
+                        description=text,
+                        category=_get_text(elem, "category"),
+                        image_count=img_cnt,
+                        video_count=vid_cnt,
+                    ))
+                elem.clear()
+                if len(posts) >= max_items:
+                    return posts
+        parser.close()
+    except ElementTree.ParseError as e:
+        logger.warning("RSS parse failed for %s: %s", blogger_id, e)
+        return None
     return posts
 
 
@@ -145,11 +328,45 @@ def _get_text(elem, tag: str) -> Optional[str]:
     return child.text.strip() if child is not None and child.text else None
 
 
-def _count_media_in_html(raw_html: str) -> tuple:
-    """HTML에서 이미지/영상 수 카운트 (태그 스트리핑 전에 호출)."""
-    img_count = len(re.findall(r"<img\b", raw_html, re.IGNORECASE))
-    video_count = len(re.findall(r"<(?:iframe|video)\b|youtube\.com|youtu\.be", raw_html, re.IGNORECASE))
-    return img_count, video_count
+# 태그 또는 본문 내 유튜브 링크 — description 1회 스캔용
+_DESC_TOKEN_RE = re.compile(r"<[^>]+>|youtube\.com|youtu\.be", re.IGNORECASE)
+_MEDIA_TAG_RE = re.compile(r"<(img|iframe|video)\b", re.IGNORECASE)
+_YOUTUBE_RE = re.compile(r"youtube\.com|youtu\.be", re.IGNORECASE)
+
+
+def _scan_description(raw_html: str) -> Tuple[str, int, int]:
+    """description HTML 1회 스캔 → (태그 제거 텍스트, 이미지 수, 영상 수).
+
+    영상 = <iframe>/<video> 태그 + youtube.com/youtu.be 출현 (태그 속성 포함).
+    이미지/영상 태그는 '>'로 닫히지 않았어도 센다 (잘린 description의 마지막 태그).
+    """
+    parts: List[str] = []
+    img_count = video_count = 0
+    pos = 0
+    for m in _DESC_TOKEN_RE.finditer(raw_html):
+        tok = m.group()
+        if tok[0] == "<":
+            parts.append(raw_html[pos:m.start()])
+            pos = m.end()
+            # "<<img ...>"처럼 토큰 안에 '<'가 여러 번 올 수 있어 match 대신 finditer
+            for media in _MEDIA_TAG_RE.finditer(tok):
+                if media.group(1).lower() == "img":
+                    img_count += 1
+                else:
+                    video_count += 1
+            video_count += len(_YOUTUBE_RE.findall(tok))
+        else:
+            video_count += 1
+    # 닫히지 않은 태그는 토큰으로 잡히지 않는다 — '>'가 더 없는 마지막 구간에만 올 수 있으므로
+    # (RSS description ~350자 잘림: '점심 <img src="a.jpg" alt="') 남은 부분에서 계수
+    tail = raw_html[pos:]
+    for media in _MEDIA_TAG_RE.finditer(tail):
+        if media.group(1).lower() == "img":
+            img_count += 1
+        else:
+            video_count += 1
+    parts.append(tail)
+    return "".join(parts).strip(), img_count, video_count
 
 
 def _strip_html(text: str) -> str:
@@ -157,39 +374,33 @@ def _strip_html(text: str) -> str:
     return re.sub(r"<[^>]+>", "", text).strip()
 
 
-def _parse_rss_date(date_str: Optional[str]) -> Optional[datetime]:
-    """RSS pubDate 파싱 (RFC 822 형식)."""
-    if not date_str:
-        return None
-    # RFC 822: "Sun, 15 Feb 2026 09:00:00 +0900"
-    for fmt in (
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
-    ):
-        try:
-            return datetime.strptime(date_str.strip(), fmt).replace(tzinfo=None)
-        except (ValueError, TypeError):
-            continue
-    return None
-
-
 # ===========================
 # 프로필 / 미디어 / 등급 추정
 # ===========================
 
-def fetch_blog_profile(blogger_id: str, rss_posts: List[RSSPost] = None, timeout: float = 8.0) -> Dict[str, Any]:
+def fetch_blog_profile(
+    blogger_id: str,
+    rss_posts: List[RSSPost] = None,
+    timeout: float = 8.0,
+    cancel_token: Optional[CancelToken] = None,
+    deadline: Optional[Deadline] = None,
+    db_path: Optional[Path] = None,
+) -> Dict[str, Any]:
     """네이버 블로그 프로필 확장 수집 (v7.2 BlogPower용) — 캐시 래핑.
 
     DB에 7일 TTL 캐시가 있으면 즉시 반환, 없으면 스크래핑 후 캐시 저장.
+    스크래핑 중 취소되면 AnalysisCancelled (불완전한 프로필은 캐시하지 않음).
+    데드라인으로 소스를 생략한 프로필도 캐시하지 않는다.
+    소스별 성공/지연/기여 통계는 profile_source_stats에 누적 (적응형 소스 계획).
+    모든 소스가 빈 결과면 사유를 음성 캐시에 기록하고, 음성 항목이 있는 동안은
+    스크래핑 없이 RSS 폴백만 채운 기본 프로필을 반환한다.
     """
-    from backend.db import conn_ctx, get_cached_profile, set_cached_profile
+    from backend.db import DB_PATH, conn_ctx, get_cached_profile, record_profile_source_stats, set_cached_profile
 
+    path = db_path or DB_PATH
     # 캐시 확인
     try:
-        with conn_ctx() as conn:
+        with conn_ctx(path) as conn:
             cached = get_cached_profile(conn, blogger_id)
             if cached:
                 # blog_start_date를 datetime으로 복원
@@ -202,232 +413,491 @@ def fetch_blog_profile(blogger_id: str, rss_posts: List[RSSPost] = None, timeout
     except Exception as e:
         logger.debug("프로필 캐시 조회 실패: %s", e)
 
+    # 음성 캐시 (없는/비공개/응답 없는 블로그)
+    negative = get_negative_cache(path)
+    if negative.lookup(KIND_PROFILE, blogger_id):
+        record_cache_hit()
+        return _empty_profile(rss_posts)
+
     # 스크래핑
-    result = _fetch_blog_profile_impl(blogger_id, rss_posts, timeout)
+    result = _fetch_blog_profile_impl(blogger_id, rss_posts, timeout, cancel_token, deadline)
+    sources = result.pop("sources", {})
+    degraded = result.pop("degraded", None)
+    reason = result.pop("negative", None)
+    if reason:
+        negative.record(KIND_PROFILE, blogger_id, reason)
+
+    # 소스 통계 + 캐시 저장
+    try:
+        with db_write(), conn_ctx(path) as conn:
+            if sources:
+                record_profile_source_stats(conn, sources)
+            if not degraded and not reason:
+                set_cached_profile(conn, blogger_id, result)
+    except Exception as e:
+        logger.debug("프로필 캐시 저장 실패: %s", e)
+
+    return result
 
-    # 캐시 저장
+
+# 프로필 소스 (profile_source_stats 키)
+SRC_MOBILE = "mobile"        # m.blog.naver.com — 포스트/방문자/구독자/이웃/개설일
+SRC_PTL = "ptl"              # PostTitleListAsync 1페이지 — 최근 포스팅일
+SRC_BLOGDEX = "blogdex"      # blogdex.space — 랭킹 백분위 + 통계 폴백
+SRC_PTL_LAST = "ptl_last"    # PostTitleListAsync 마지막 페이지 — 개설일 추정
+SRC_DESKTOP = "desktop"      # blog.naver.com 메인 — 이웃 수 폴백
+
+# 통계 기반 계획: 시도 수가 충분한데 기여율이 낮은 소스는 생략, Blogdex는 기여율이 높을 때만 1차 병렬
+SOURCE_MIN_ATTEMPTS = 30
+SOURCE_MIN_YIELD = 0.15
+BLOGDEX_PARALLEL_YIELD = 0.5
+# 생략된 소스도 가끔 시도해 통계가 회복될 수 있게 함
+SOURCE_EXPLORE_RATE = 0.05
+# 통계 스냅샷 재조회 주기
+_SOURCE_STATS_TTL_SEC = 300
+
+_source_stats_snapshot: Dict[str, Any] = {"at": 0.0, "stats": {}}
+_source_stats_lock = threading.Lock()
+
+# compute_blog_power 입력 중 프로필 소스가 채우는 필드의 기본값 (기본값 == 미수집)
+_PROFILE_DEFAULTS: Dict[str, Any] = {
+    "total_posts": 0,
+    "total_visitors": 0,
+    "total_subscribers": 0,
+    "neighbor_count": 0,
+    "blog_age_years": 0.0,
+    "last_post_days_ago": 999,
+    "ranking_percentile": 100.0,
+}
+
+
+def _profile_source_stats() -> Dict[str, Dict[str, float]]:
+    """profile_source_stats 스냅샷 (5분 캐시, 조회 실패 시 빈 통계 = 기본 계획)."""
+    from backend.db import conn_ctx, get_profile_source_stats
+
+    now = time.monotonic()
+    with _source_stats_lock:
+        if now - _source_stats_snapshot["at"] < _SOURCE_STATS_TTL_SEC:
+            return _source_stats_snapshot["stats"]
     try:
         with conn_ctx() as conn:
-            set_cached_profile(conn, blogger_id, result)
+            stats = get_profile_source_stats(conn)
     except Exception as e:
-        logger.debug("프로필 캐시 저장 실패: %s", e)
+        logger.debug("프로필 소스 통계 조회 실패: %s", e)
+        stats = {}
+    with _source_stats_lock:
+        _source_stats_snapshot.update(at=now, stats=stats)
+    return stats
+
+
+def plan_profile_sources(
+    stats: Dict[str, Dict[str, float]],
+    rng: Callable[[], float] = random.random,
+) -> Dict[str, Any]:
+    """소스별 통계 → 프로필 수집 계획.
+
+    반환: {"blogdex_parallel": bool, "fallbacks": [필요 시 순차 실행할 소스 (기여율/지연 높은 순)],
+           "skipped": [통계상 생략한 소스]}
+    통계가 부족한 소스는 기존 동작(Blogdex 1차 병렬, 폴백 모두 허용)을 유지한다.
+    """
+    def _yield(src: str) -> Optional[float]:
+        s = stats.get(src)
+        if not s or s["attempts"] < SOURCE_MIN_ATTEMPTS:
+            return None
+        return s["yield_rate"]
+
+    skipped = [
+        src for src in (SRC_BLOGDEX, SRC_PTL_LAST, SRC_DESKTOP)
+        if _yield(src) is not None and _yield(src) < SOURCE_MIN_YIELD and rng() >= SOURCE_EXPLORE_RATE
+    ]
+    blogdex_yield = _yield(SRC_BLOGDEX)
+    blogdex_parallel = SRC_BLOGDEX not in skipped and (blogdex_yield is None or blogdex_yield >= BLOGDEX_PARALLEL_YIELD)
+
+    candidates = [SRC_PTL_LAST, SRC_DESKTOP] + ([] if blogdex_parallel else [SRC_BLOGDEX])
+
+    def _value(src: str) -> float:
+        s = stats.get(src)
+        if not s or s["attempts"] < SOURCE_MIN_ATTEMPTS:
+            return float("inf")  # 통계 부족 → 기존 순서 유지 (정렬 안정성)
+        return s["yield_rate"] / max(s["avg_ms"], 1.0)
 
+    fallbacks = sorted((src for src in candidates if src not in skipped), key=_value, reverse=True)
+    return {"blogdex_parallel": blogdex_parallel, "fallbacks": fallbacks, "skipped": skipped}
+
+
+def _apply_rss_fallback(result: Dict[str, Any], rss_posts: Optional[List[RSSPost]]) -> None:
+    """RSS 폴백: 블로그 개설일 추정 (HTTP 없음)."""
+    if not result.get("blog_start_date") and rss_posts:
+        dates = [d for d in (features(p).pub_dt for p in rss_posts) if d]
+        if dates:
+            result["blog_start_date"] = min(dates)
+            if not result["blog_age_years"]:
+                result["blog_age_years"] = round((datetime.now() - min(dates)).days / 365.25, 1)
+
+
+def _empty_profile(rss_posts: Optional[List[RSSPost]]) -> Dict[str, Any]:
+    """스크래핑 없이 RSS로만 채운 프로필 (음성 캐시 적중 시)."""
+    result: Dict[str, Any] = dict(_PROFILE_DEFAULTS, blog_start_date=None)
+    rss_last = _rss_last_post_days(rss_posts)
+    if rss_last is not None:
+        result["last_post_days_ago"] = rss_last
+    _apply_rss_fallback(result, rss_posts)
     return result
 
 
-def _fetch_blog_profile_impl(blogger_id: str, rss_posts: List[RSSPost] = None, timeout: float = 4.0) -> Dict[str, Any]:
+def _rss_last_post_days(rss_posts: Optional[List[RSSPost]]) -> Optional[int]:
+    """RSS 최신 포스트 경과일 (RSS가 없거나 날짜 파싱 불가면 None)."""
+    dates = [d for d in (features(p).pub_dt for p in rss_posts or []) if d]
+    if not dates:
+        return None
+    return max(0, (datetime.now() - max(dates)).days)
+
+
+def _fetch_blog_profile_impl(
+    blogger_id: str,
+    rss_posts: List[RSSPost] = None,
+    timeout: float = 4.0,
+    cancel_token: Optional[CancelToken] = None,
+    deadline: Optional[Deadline] = None,
+    source_stats: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Any]:
     """네이버 블로그 프로필 확장 수집 (v7.2 BlogPower용) — 실제 구현.
 
-    데이터 소스 3개 (병렬) + 2개 (순차 의존):
-    1. PostTitleListAsync.naver: last_post_days_ago (독립)
-    2. 모바일 프로필 (m.blog.naver.com): total_posts, total_visitors, total_subscribers (독립)
-    3. Blogdex (독립)
-    → 이후 순차: 개설일 추정 (소스2 total_posts 필요), 데스크톱 폴백 (소스2 neighbor 필요)
+    적응형 소스 계획 (plan_profile_sources):
+    1차 병렬: 모바일 프로필 + PostTitleListAsync(RSS로 최근 포스팅일을 알면 생략)
+             + Blogdex(기여율 높을 때만)
+    2차 순차: 아직 비어 있는 필드를 채울 수 있는 소스만, 기여율/지연 높은 순
+             (Blogdex: 통계 폴백 또는 랭킹이 BlogPower를 바꿀 수 있을 때, 마지막 페이지: 개설일, 데스크톱: 이웃 수)
     → RSS 폴백 (HTTP 없음)
+    데드라인 부족 시 Blogdex / 데스크톱 폴백 생략 → result["degraded"]에 신호 이름
+    소스별 {"ok", "ms", "added"}는 result["sources"]로 반환 (fetch_blog_profile이 통계로 기록)
+    모든 소스가 빈 결과면 음성 캐시 사유를 result["negative"]로 반환
 
     Returns:
         dict with neighbor_count, blog_start_date, total_posts, total_visitors,
         total_subscribers, blog_age_years, last_post_days_ago, ranking_percentile
     """
-    import concurrent.futures
-
-    result: Dict[str, Any] = {
-        "neighbor_count": 0,
-        "blog_start_date": None,
-        "total_posts": 0,
-        "total_visitors": 0,
-        "total_subscribers": 0,
-        "blog_age_years": 0.0,
-        "last_post_days_ago": 999,
-        "ranking_percentile": 100.0,
-    }
+    from backend.scoring import blog_power_influence
+
+    result: Dict[str, Any] = dict(_PROFILE_DEFAULTS, blog_start_date=None)
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
         "Accept-Language": "ko-KR,ko;q=0.9",
     }
-
-    # === 독립 소스 3개를 병렬 실행 ===
-
-    def _fetch_ptl():
-        """소스 1: PostTitleListAsync — last_post_days_ago"""
-        ptl_result = {"last_post_days_ago": 999}
+    sources: Dict[str, Dict[str, Any]] = {}
+    plan = plan_profile_sources(source_stats if source_stats is not None else _profile_source_stats())
+
+    def _missing(field: str) -> bool:
+        if field == "blog_age_years" and result["blog_start_date"] is not None:
+            return False  # 개설일을 찾았으면 0.0년도 값
+        return result[field] == _PROFILE_DEFAULTS[field]
+
+    def _run(src: str, fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        data = fn()
+        sources[src] = {"ok": bool(data), "ms": round((time.perf_counter() - start) * 1000.0, 1), "added": []}
+        return data
+
+    def _found(data: Dict[str, Any], f: str) -> bool:
+        """소스가 f를 찾았는지 — 개설 ~18일 미만 블로그는 blog_age_years가 0.0이므로 개설일 유무로 판단."""
+        if f == "blog_age_years" and data.get("blog_start_date") is not None:
+            return data.get(f) is not None
+        return bool(data.get(f))
+
+    def _fill(src: str, data: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+        """비어 있는 필드만 채우고 기여 필드 기록 (개설일은 blog_age_years와 함께)."""
+        for f in fields:
+            if _found(data, f) and _missing(f):
+                result[f] = data[f]
+                sources[src]["added"].append(f)
+                if f == "blog_age_years":
+                    result["blog_start_date"] = data.get("blog_start_date")
+
+    # === 소스별 fetch (찾은 필드만 반환, 실패 시 빈 dict) ===
+
+    def _fetch_ptl() -> Dict[str, Any]:
+        """PostTitleListAsync 1페이지 — last_post_days_ago"""
         try:
             ptl_url = f"https://blog.naver.com/PostTitleListAsync.naver?blogId={blogger_id}&countPerPage=5&currentPage=1"
-            resp = requests.get(ptl_url, timeout=timeout, headers=headers)
+            resp = _http_get(ptl_url, timeout=timeout, headers=headers)
             if resp.status_code == 200:
-                raw = resp.text
-                for m_ad in re.finditer(r'"addDate"\s*:\s*"([^"]+)"', raw):
-                    date_str = m_ad.group(1).strip().rstrip(".")
-                    date_str_norm = re.sub(r'\.\s*', '-', date_str)
+                for m_ad in re.finditer(r'"addDate"\s*:\s*"([^"]+)"', resp.text):
+                    date_str_norm = re.sub(r'\.\s*', '-', m_ad.group(1).strip().rstrip("."))
                     try:
                         d = datetime.strptime(date_str_norm[:10], "%Y-%m-%d")
-                        days_ago = max(0, (datetime.now() - d).days)
-                        if ptl_result["last_post_days_ago"] == 999 or days_ago < ptl_result["last_post_days_ago"]:
-                            ptl_result["last_post_days_ago"] = days_ago
+                        return {"last_post_days_ago": max(0, (datetime.now() - d).days)}
                     except (ValueError, TypeError):
                         if "시간" in m_ad.group(1) or "분" in m_ad.group(1):
-                            ptl_result["last_post_days_ago"] = 0
-                        elif "일" in m_ad.group(1) and "전" in m_ad.group(1):
+                            return {"last_post_days_ago": 0}
+                        if "일" in m_ad.group(1) and "전" in m_ad.group(1):
                             dm = re.search(r"(\d+)일", m_ad.group(1))
                             if dm:
-                                ptl_result["last_post_days_ago"] = int(dm.group(1))
+                                return {"last_post_days_ago": int(dm.group(1))}
                     break
         except Exception as e:
             logger.debug("PostTitleListAsync failed for %s: %s", blogger_id, e)
-        return ptl_result
+        return {}
 
-    def _fetch_mobile():
-        """소스 2: 모바일 프로필 — posts, visitors, subscribers, age"""
-        mob = {"total_posts": 0, "total_visitors": 0, "total_subscribers": 0,
-               "neighbor_count": 0, "blog_age_years": 0.0, "blog_start_date": None}
+    mobile_probe: Dict[str, Optional[str]] = {}
+
+    def _fetch_mobile() -> Dict[str, Any]:
+        """모바일 프로필 — posts, visitors, subscribers, neighbors, age (응답 유형은 mobile_probe에)"""
         try:
-            mobile_url = f"https://m.blog.naver.com/{blogger_id}"
-            resp = requests.get(mobile_url, timeout=timeout, headers=headers)
+            resp = _http_get(f"https://m.blog.naver.com/{blogger_id}", timeout=timeout, headers=headers)
+            if resp.status_code in (404, 410):
+                mobile_probe["negative"] = NEG_NOT_FOUND
+            elif resp.status_code in (200, 403):
+                # 페이지는 열리지만 공개 지표가 없으면 비공개 블로그로 간주
+                mobile_probe["negative"] = NEG_PRIVATE
             if resp.status_code == 200:
-                text = resp.text
-                for field in ["postCount", "countPost"]:
-                    m = re.search(rf'"{field}"\s*:\s*(\d+)', text)
-                    if m:
-                        mob["total_posts"] = max(mob["total_posts"], int(m.group(1)))
-                        break
-                m = re.search(r'"totalVisitorCount"\s*:\s*(\d+)', text)
-                if m:
-                    mob["total_visitors"] = int(m.group(1))
-                for field in ["subscriberCount", "buddyCount"]:
-                    m = re.search(rf'"{field}"\s*:\s*(\d+)', text)
-                    if m:
-                        val = int(m.group(1))
-                        mob["total_subscribers"] = max(mob["total_subscribers"], val)
-                        mob["neighbor_count"] = max(mob["neighbor_count"], val)
-                        break
-                m = re.search(r'"blogDirectoryOpenDate"\s*:\s*"(\d{4})(\d{2})(\d{2})"', text)
-                if m:
-                    try:
-                        created = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
-                        mob["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
-                        mob["blog_start_date"] = created
-                    except (ValueError, TypeError):
-                        pass
-                if not mob["neighbor_count"]:
-                    m = re.search(r'"?buddyCnt"?\s*[:=]\s*(\d+)', text)
-                    if m:
-                        mob["neighbor_count"] = int(m.group(1))
-                        mob["total_subscribers"] = max(mob["total_subscribers"], int(m.group(1)))
-                if not mob["total_posts"]:
-                    m = re.search(r'게시글\s*([\d,]+)', text)
-                    if m:
-                        mob["total_posts"] = int(m.group(1).replace(",", ""))
-                if not mob["total_subscribers"]:
-                    m = re.search(r'이웃\s*([\d,]+)', text)
-                    if m:
-                        val = int(m.group(1).replace(",", ""))
-                        mob["total_subscribers"] = val
-                        mob["neighbor_count"] = val
+                parsed = parse_mobile_profile(resp.text)
+                # 못 찾은 필드(0/None)는 제외 — 단, 개설일이 있으면 0.0년(개설 ~18일 미만)도 값
+                return {k: v for k, v in parsed.items()
+                        if v or (k == "blog_age_years" and parsed.get("blog_start_date") is not None)}
+        except requests.Timeout as e:
+            mobile_probe["negative"] = NEG_TIMEOUT
+            logger.debug("Mobile profile fetch timed out for %s: %s", blogger_id, e)
         except Exception as e:
             logger.debug("Mobile profile fetch failed for %s: %s", blogger_id, e)
-        return mob
+        return {}
 
-    def _fetch_blogdex():
-        """소스 6: Blogdex — ranking_percentile + 폴백 통계"""
+    def _fetch_blogdex() -> Dict[str, Any]:
+        """Blogdex — ranking_percentile + 폴백 통계"""
         try:
-            return fetch_blogdex_data(blogger_id, timeout=timeout)
+            data = fetch_blogdex_data(blogger_id, timeout=timeout)
         except Exception as e:
             logger.debug("Blogdex fetch failed for %s: %s", blogger_id, e)
             return {}
+        if data.get("blog_created_date"):
+            data["blog_start_date"] = data["blog_created_date"]
+        return data
 
-    # 병렬 실행: 소스 1 + 2 + 6
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
-        fut_ptl = pool.submit(_fetch_ptl)
-        fut_mob = pool.submit(_fetch_mobile)
-        fut_bdx = pool.submit(_fetch_blogdex)
-
-        ptl_data = fut_ptl.result()
-        mob_data = fut_mob.result()
-        bdx_data = fut_bdx.result()
-
-    # 병렬 결과 병합
-    result["last_post_days_ago"] = ptl_data["last_post_days_ago"]
-
-    result["total_posts"] = mob_data["total_posts"]
-    result["total_visitors"] = mob_data["total_visitors"]
-    result["total_subscribers"] = mob_data["total_subscribers"]
-    result["neighbor_count"] = mob_data["neighbor_count"]
-    result["blog_age_years"] = mob_data["blog_age_years"]
-    result["blog_start_date"] = mob_data["blog_start_date"]
-
-    # === 순차 의존 소스 ===
-
-    # 3. 블로그 개설일 추정 (소스2의 total_posts 필요)
-    if not result["blog_age_years"] and result["total_posts"] >= 5:
+    def _fetch_ptl_last() -> Dict[str, Any]:
+        """PostTitleListAsync 마지막 페이지 — 가장 오래된 포스트로 개설일 추정"""
         try:
-            import math as _math
-            last_page = _math.ceil(result["total_posts"] / 5)
+            last_page = math.ceil(result["total_posts"] / 5)
             ptl_last_url = (
                 f"https://blog.naver.com/PostTitleListAsync.naver"
                 f"?blogId={blogger_id}&countPerPage=5&currentPage={last_page}"
             )
-            resp = requests.get(ptl_last_url, timeout=timeout, headers=headers)
+            resp = _http_get(ptl_last_url, timeout=timeout, headers=headers)
             if resp.status_code == 200:
                 all_dates = re.findall(r'"addDate"\s*:\s*"([^"]+)"', resp.text)
                 for ds in reversed(all_dates):
-                    ds_clean = ds.strip().rstrip(".")
-                    ds_norm = re.sub(r'\.\s*', '-', ds_clean)
+                    ds_norm = re.sub(r'\.\s*', '-', ds.strip().rstrip("."))
                     try:
                         oldest = datetime.strptime(ds_norm[:10], "%Y-%m-%d")
-                        result["blog_age_years"] = round(
-                            (datetime.now() - oldest).days / 365.25, 1
-                        )
-                        result["blog_start_date"] = oldest
-                        break
                     except (ValueError, TypeError):
                         continue
+                    return {"blog_age_years": round((datetime.now() - oldest).days / 365.25, 1),
+                            "blog_start_date": oldest}
         except Exception as e:
             logger.debug("PostTitleListAsync last page failed for %s: %s", blogger_id, e)
+        return {}
 
-    # 4. 데스크톱 블로그 메인 폴백 (소스2에서 이웃 수를 못 가져왔을 때만)
-    if not result["neighbor_count"]:
+    def _fetch_desktop() -> Dict[str, Any]:
+        """데스크톱 블로그 메인 — 이웃 수"""
         try:
-            url = f"https://blog.naver.com/{blogger_id}"
-            resp = requests.get(url, timeout=timeout, headers=headers)
+            resp = _http_get(f"https://blog.naver.com/{blogger_id}", timeout=timeout, headers=headers)
             if resp.status_code == 200:
                 text = resp.text
-                m = re.search(r'"?buddyCnt"?\s*[:=]\s*(\d+)', text)
+                m = _BUDDY_CNT_RE.search(text) or _NEIGHBOR_TEXT_RE.search(text)
                 if m:
-                    result["neighbor_count"] = int(m.group(1))
-                    result["total_subscribers"] = max(result["total_subscribers"], int(m.group(1)))
-                else:
-                    m = re.search(r'이웃\s*(\d[\d,]*)', text)
-                    if m:
-                        val = int(m.group(1).replace(",", ""))
-                        result["neighbor_count"] = val
-                        result["total_subscribers"] = max(result["total_subscribers"], val)
+                    return {"neighbor_count": int(m.group(1).replace(",", ""))}
         except Exception as e:
             logger.debug("Desktop profile fetch failed for %s: %s", blogger_id, e)
+        return {}
+
+    def _merge_blogdex(data: Dict[str, Any]) -> None:
+        if data.get("ranking_percentile") and data["ranking_percentile"] < result["ranking_percentile"]:
+            result["ranking_percentile"] = data["ranking_percentile"]
+        if data.get("blogdex_grade"):
+            result["blogdex_grade"] = data["blogdex_grade"]
+        _fill(SRC_BLOGDEX, data, ("total_posts", "total_visitors", "total_subscribers", "blog_age_years"))
+
+    def _blogdex_needed() -> bool:
+        """통계 폴백이 필요하거나, 랭킹이 구독자 점수를 넘어 BlogPower를 바꿀 수 있을 때."""
+        sub_s, _ = blog_power_influence(result["total_subscribers"], result["ranking_percentile"])
+        return sub_s < 5 or any(_missing(f) for f in ("total_posts", "total_visitors", "blog_age_years"))
+
+    degraded: List[str] = []
+
+    # === 1차: 독립 소스 병렬 ===
+    rss_last = _rss_last_post_days(rss_posts)
+    if rss_last is not None:
+        result["last_post_days_ago"] = rss_last
+    wave = [(SRC_MOBILE, _fetch_mobile)]
+    if rss_last is None:
+        wave.append((SRC_PTL, _fetch_ptl))
+    if plan["blogdex_parallel"]:
+        if allows(deadline, SIGNAL_BLOGDEX):
+            wave.append((SRC_BLOGDEX, _fetch_blogdex))
+        else:
+            degraded.append(SIGNAL_BLOGDEX)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(wave)) as pool:
+        futures = {src: submit_in_context(pool, _run, src, fn) for src, fn in wave}
+        first = {src: fut.result() for src, fut in futures.items()}
+
+    checkpoint(cancel_token)
+
+    # 모바일 → PTL → Blogdex 순으로 병합 (모바일 값 우선)
+    mob = first.get(SRC_MOBILE, {})
+    _fill(SRC_MOBILE, mob, ("total_posts", "total_visitors", "total_subscribers", "neighbor_count", "blog_age_years"))
+    if SRC_PTL in first:
+        _fill(SRC_PTL, first[SRC_PTL], ("last_post_days_ago",))
+    if SRC_BLOGDEX in first:
+        _merge_blogdex(first[SRC_BLOGDEX])
+
+    # === 2차: 빈 필드를 채울 수 있는 소스만 순차 ===
+    for src in plan["fallbacks"]:
+        checkpoint(cancel_token)
+        if src == SRC_PTL_LAST and _missing("blog_age_years") and result["total_posts"] >= 5:
+            _fill(src, _run(src, _fetch_ptl_last), ("blog_age_years",))
+        elif src == SRC_BLOGDEX and _blogdex_needed():
+            if not allows(deadline, SIGNAL_BLOGDEX):
+                degraded.append(SIGNAL_BLOGDEX)
+                continue
+            _merge_blogdex(_run(src, _fetch_blogdex))
+        elif src == SRC_DESKTOP and _missing("neighbor_count"):
+            if not allows(deadline, SIGNAL_DESKTOP_PROFILE):
+                degraded.append(SIGNAL_DESKTOP_PROFILE)
+                continue
+            data = _run(src, _fetch_desktop)
+            _fill(src, data, ("neighbor_count",))
+            if data.get("neighbor_count"):
+                result["total_subscribers"] = max(result["total_subscribers"], data["neighbor_count"])
 
-    # 5. RSS 폴백: 블로그 개설일 추정 (HTTP 없음)
-    if not result.get("blog_start_date") and rss_posts:
-        dates = [_parse_rss_date(p.pub_date) for p in rss_posts]
-        dates = [d for d in dates if d]
-        if dates:
-            result["blog_start_date"] = min(dates)
-            if not result["blog_age_years"]:
-                result["blog_age_years"] = round((datetime.now() - min(dates)).days / 365.25, 1)
+    checkpoint(cancel_token)
+
+    # 모든 소스가 빈 결과 → 모바일 프로필 응답으로 음성 캐시 사유 판정 (기타 오류/백오프는 기록 안 함)
+    if not degraded and not any(s["ok"] for s in sources.values()):
+        result["negative"] = mobile_probe.get("negative")
 
-    # Blogdex 결과 병합
-    if bdx_data.get("ranking_percentile") and bdx_data["ranking_percentile"] < result["ranking_percentile"]:
-        result["ranking_percentile"] = bdx_data["ranking_percentile"]
-    if bdx_data.get("blogdex_grade"):
-        result["blogdex_grade"] = bdx_data["blogdex_grade"]
-    if bdx_data.get("total_posts") and not result["total_posts"]:
-        result["total_posts"] = bdx_data["total_posts"]
-    if bdx_data.get("total_visitors") and not result["total_visitors"]:
-        result["total_visitors"] = bdx_data["total_visitors"]
-    if bdx_data.get("total_subscribers") and not result["total_subscribers"]:
-        result["total_subscribers"] = bdx_data["total_subscribers"]
-    if bdx_data.get("blog_age_years") and not result["blog_age_years"]:
-        result["blog_age_years"] = bdx_data["blog_age_years"]
-        result["blog_start_date"] = bdx_data.get("blog_created_date")
+    _apply_rss_fallback(result, rss_posts)
 
+    # Blogdex 랭킹은 구독자 점수를 넘을 때만 기여로 집계
+    if SRC_BLOGDEX in sources:
+        sub_s, rk_s = blog_power_influence(result["total_subscribers"], result["ranking_percentile"])
+        if rk_s > sub_s:
+            sources[SRC_BLOGDEX]["added"].append("ranking_percentile")
+
+    if degraded:
+        result["degraded"] = degraded
+    result["sources"] = sources
+    return result
+
+
+# 모바일 프로필 임베디드 상태 필드 — 페이지 1회 스캔으로 모든 필드의 첫 출현 수집
+# (모든 분기가 '"'로 시작해야 정규식 엔진의 첫 글자 최적화가 적용됨 → buddyCnt는 별도 폴백)
+_MOBILE_FIELD_RE = re.compile(
+    r'"(postCount|countPost|totalVisitorCount|subscriberCount|buddyCount)"\s*:\s*(\d+)'
+    r'|"blogDirectoryOpenDate"\s*:\s*"(\d{8})"'
+)
+_BUDDY_CNT_RE = re.compile(r'"?buddyCnt"?\s*[:=]\s*(\d+)')
+# 상태 JSON에 없을 때만 쓰는 화면 텍스트 폴백
+_POST_COUNT_TEXT_RE = re.compile(r'게시글\s*([\d,]+)')
+_NEIGHBOR_TEXT_RE = re.compile(r'이웃\s*(\d[\d,]*)')
+
+
+def parse_mobile_profile(text: str) -> Dict[str, Any]:
+    """m.blog.naver.com 페이지 → total_posts/total_visitors/total_subscribers/neighbor_count/개설일.
+
+    필드 우선순위는 postCount > countPost, subscriberCount > buddyCount > buddyCnt,
+    상태 JSON에서 못 찾은 필드만 buddyCnt / "게시글" / "이웃" 텍스트로 폴백.
+    """
+    found: Dict[str, str] = {}
+    for m in _MOBILE_FIELD_RE.finditer(text):
+        if m.group(1):
+            found.setdefault(m.group(1), m.group(2))
+        else:
+            found.setdefault("blogDirectoryOpenDate", m.group(3))
+
+    mob: Dict[str, Any] = {"total_posts": 0, "total_visitors": 0, "total_subscribers": 0,
+                           "neighbor_count": 0, "blog_age_years": 0.0, "blog_start_date": None}
+    posts = found.get("postCount") or found.get("countPost")
+    if posts:
+        mob["total_posts"] = int(posts)
+    if found.get("totalVisitorCount"):
+        mob["total_visitors"] = int(found["totalVisitorCount"])
+    subs = found.get("subscriberCount") or found.get("buddyCount")
+    if subs:
+        mob["total_subscribers"] = mob["neighbor_count"] = int(subs)
+    open_date = found.get("blogDirectoryOpenDate")
+    if open_date:
+        try:
+            created = datetime(int(open_date[:4]), int(open_date[4:6]), int(open_date[6:]))
+            mob["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
+            mob["blog_start_date"] = created
+        except (ValueError, TypeError):
+            pass
+
+    # 상태 JSON에 없던 필드만 정규식 폴백
+    if not mob["neighbor_count"]:
+        m = _BUDDY_CNT_RE.search(text)
+        if m:
+            mob["neighbor_count"] = int(m.group(1))
+            mob["total_subscribers"] = max(mob["total_subscribers"], mob["neighbor_count"])
+    if not mob["total_posts"]:
+        m = _POST_COUNT_TEXT_RE.search(text)
+        if m:
+            mob["total_posts"] = int(m.group(1).replace(",", ""))
+    if not mob["total_subscribers"]:
+        m = _NEIGHBOR_TEXT_RE.search(text)
+        if m:
+            val = int(m.group(1).replace(",", ""))
+            mob["total_subscribers"] = val
+            mob["neighbor_count"] = val
+    return mob
+
+
+# Blogdex 등급 (우선순위 순)
+_BLOGDEX_GRADES = (
+    "최적4+", "최적3+", "최적2+", "최적1+",
+    "최적4", "최적3", "최적2", "최적1",
+    "준최7", "준최6", "준최5", "준최4", "준최3", "준최2", "준최1",
+    "일반",
+)
+_BLOGDEX_GRADE_RE = re.compile(r'최적[1-4]\+?|준최[1-7]|일반')
+_BLOGDEX_TOPIC_RANK_RE = re.compile(r'주제\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%')
+_BLOGDEX_TOTAL_RANK_RE = re.compile(r'전체\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%')
+_BLOGDEX_STAT_RE = re.compile(r'총\s*(포스팅|방문자|구독자)\s*([\d,]+)')
+_BLOGDEX_CREATED_RE = re.compile(r'블로그\s*생성일\s*(\d{4})-(\d{2})-(\d{2})')
+_BLOGDEX_STAT_FIELDS = {"포스팅": "total_posts", "방문자": "total_visitors", "구독자": "total_subscribers"}
+
+
+def parse_blogdex_page(text: str) -> Dict[str, Any]:
+    """Blogdex 페이지 → blogdex_grade/ranking_percentile/통계 (등급 16종·통계 3종은 각 1회 스캔)."""
+    result: Dict[str, Any] = {}
+
+    # 등급: 페이지에 나온 등급 중 우선순위가 가장 높은 것
+    seen = {m.group() for m in _BLOGDEX_GRADE_RE.finditer(text)}
+    for g in _BLOGDEX_GRADES:
+        if g in seen:
+            result["blogdex_grade"] = g
+            break
+
+    # 주제 랭킹 → 상위 N%, 전체 랭킹은 더 좋은 값이면 교체
+    m = _BLOGDEX_TOPIC_RANK_RE.search(text)
+    if m:
+        result["ranking_percentile"] = float(m.group(2))
+    m = _BLOGDEX_TOTAL_RANK_RE.search(text)
+    if m:
+        pct = float(m.group(2))
+        if "ranking_percentile" not in result or pct < result["ranking_percentile"]:
+            result["ranking_percentile"] = pct
+
+    # 기본 통계 (각 필드 첫 출현)
+    for m in _BLOGDEX_STAT_RE.finditer(text):
+        result.setdefault(_BLOGDEX_STAT_FIELDS[m.group(1)], int(m.group(2).replace(",", "")))
+    m = _BLOGDEX_CREATED_RE.search(text)
+    if m:
+        try:
+            created = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            result["blog_created_date"] = created
+            result["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
+        except (ValueError, TypeError):
+            pass
     return result
 
 
@@ -446,136 +916,144 @@ def fetch_blogdex_data(blogger_id: str, timeout: float = 4.0) -> Dict[str, Any]:
     }
     try:
         url = f"https://blogdex.space/blog-index/{blogger_id}"
-        resp = requests.get(url, timeout=timeout, headers=headers)
+        resp = _http_get(url, timeout=timeout, headers=headers)
         if resp.status_code != 200:
             return result
-        text = resp.text
-
-        # 등급 파싱
-        grades = [
-            "최적4+", "최적3+", "최적2+", "최적1+",
-            "최적4", "최적3", "최적2", "최적1",
-            "준최7", "준최6", "준최5", "준최4", "준최3", "준최2", "준최1",
-            "일반",
-        ]
-        for g in grades:
-            if g in text:
-                result["blogdex_grade"] = g
-                break
-
-        # 주제 랭킹 → 상위 N%
-        m = re.search(r'주제\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%', text)
-        if m:
-            result["ranking_percentile"] = float(m.group(2))
-        # 전체 랭킹 (더 좋은 값이면 교체)
-        m = re.search(r'전체\s*랭킹[\s\S]*?([\d,]+)등[\s\S]*?상위\s*([\d.]+)%', text)
-        if m:
-            pct = float(m.group(2))
-            if "ranking_percentile" not in result or pct < result["ranking_percentile"]:
-                result["ranking_percentile"] = pct
-
-        # 기본 통계
-        m = re.search(r'총\s*포스팅\s*([\d,]+)', text)
-        if m:
-            result["total_posts"] = int(m.group(1).replace(",", ""))
-        m = re.search(r'총\s*방문자\s*([\d,]+)', text)
-        if m:
-            result["total_visitors"] = int(m.group(1).replace(",", ""))
-        m = re.search(r'총\s*구독자\s*([\d,]+)', text)
-        if m:
-            result["total_subscribers"] = int(m.group(1).replace(",", ""))
-        m = re.search(r'블로그\s*생성일\s*(\d{4})-(\d{2})-(\d{2})', text)
-        if m:
-            try:
-                created = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
-                result["blog_created_date"] = created
-                result["blog_age_years"] = round((datetime.now() - created).days / 365.25, 1)
-            except (ValueError, TypeError):
-                pass
+        result.update(parse_blogdex_page(resp.text))
     except Exception as e:
         logger.debug("Blogdex request failed for %s: %s", blogger_id, e)
 
     return result
 
 
-def sample_actual_post_metrics(posts: List[RSSPost], max_samples: int = 3, timeout: float = 5.0) -> Dict[str, float]:
-    """실제 블로그 포스트 페이지 3개를 샘플링하여 진짜 이미지 수/글 길이 측정.
+# 포스트 페이지 실측 샘플 수 / 대기 예산 (샘플은 병렬 fetch → 예산은 페이지 1개 응답 시간 수준)
+POST_SAMPLE_SIZE = 3
+POST_SAMPLE_BUDGET_MS = 6000
+
+_POST_LINK_RE = re.compile(r'blog\.naver\.com/([^/]+)/(\d+)')
+_POST_BODY_MARKER = 'class="se-main-container"'
+_POST_BODY_END_RE = re.compile(r'class="post_relate|class="post_footer|class="outro_tag')
+_SE_IMAGE_MARKER = 'class="se-image-resource"'
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_IMG_TAG_RE = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+_UI_IMG_RE = re.compile(r'(?:storep|buddy|profile|icon|logo|banner|btn|menu|emoticon)', re.IGNORECASE)
+
+
+def parse_post_view(html: str) -> Dict[str, int]:
+    """PostView 페이지 → {"image_count", "content_length"}.
+
+    스마트에디터 글은 se-main-container 영역만 스캔 (본문 이미지 = se-image-resource, 글 길이 = 태그 제거 텍스트).
+    영역이 없는 구 에디터 글은 전체 페이지에서 UI 이미지를 뺀 <img> 수 / 텍스트 길이로 보수적 추정.
+    """
+    start = html.find(_POST_BODY_MARKER)
+    if start >= 0:
+        start += len(_POST_BODY_MARKER)
+        end_m = _POST_BODY_END_RE.search(html, start)
+        body = html[start:end_m.start() if end_m else len(html)]
+        return {
+            "image_count": body.count(_SE_IMAGE_MARKER),
+            "content_length": len(" ".join(_HTML_TAG_RE.sub(" ", body).split())),
+        }
+    content_imgs = sum(1 for tag in _IMG_TAG_RE.findall(html) if not _UI_IMG_RE.search(tag))
+    plain = " ".join(_HTML_TAG_RE.sub(" ", html).split())
+    return {"image_count": max(0, content_imgs - 5), "content_length": min(len(plain) // 4, 5000)}
+
+
+def sample_actual_post_metrics(
+    posts: List[RSSPost],
+    max_samples: int = POST_SAMPLE_SIZE,
+    timeout: float = 5.0,
+    cancel_token: Optional[CancelToken] = None,
+    deadline: Optional[Deadline] = None,
+    budget_ms: Optional[float] = POST_SAMPLE_BUDGET_MS,
+    db_path: Optional[Path] = None,
+) -> Dict[str, float]:
+    """실제 블로그 포스트 페이지를 샘플링하여 진짜 이미지 수/글 길이 측정.
 
     네이버 RSS description은 ~350자로 잘림 + 이미지 0-1개만 포함.
     실제 블로그 포스트는 이미지 5-15장, 글 1000-3000자가 일반적.
-    3개 포스트를 직접 가져와서 실측값을 반환.
+    최근 포스트 max_samples개의 실측값 평균을 반환.
+
+    (blogId, logNo)별 실측은 post_samples에 캐시 (30일) → 캐시에 없는 글만 병렬 fetch.
+    budget_ms(및 데드라인 잔여 시간) 안에 끝난 샘플만 평균에 쓰고, 늦은 요청은
+    백그라운드에서 마저 끝나 캐시에 저장된다.
 
     Returns:
         {"avg_image_count": float, "avg_content_length": float}
     """
+    from backend.db import DB_PATH, conn_ctx, get_post_samples, save_post_sample
+
+    empty = {"avg_image_count": 0.0, "avg_content_length": 0.0}
     if not posts:
-        return {"avg_image_count": 0.0, "avg_content_length": 0.0}
+        return empty
 
     # 최근 포스트 중 샘플 (네이버 블로그 링크만)
-    sample_links = []
+    # 네이버 블로그는 iframe 구조 → PostView.naver URL로 직접 접근
+    # link 형식: https://blog.naver.com/{id}/{logNo}?fromRss=...
+    keys: List[Tuple[str, str]] = []
     for p in posts:
-        link = getattr(p, "link", "") or ""
-        if "blog.naver.com" in link and len(sample_links) < max_samples:
-            sample_links.append(link)
-
-    if not sample_links:
-        return {"avg_image_count": 0.0, "avg_content_length": 0.0}
-
-    image_counts = []
-    content_lengths = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
+        m = _POST_LINK_RE.search(getattr(p, "link", "") or "")
+        if m and (m.group(1), m.group(2)) not in keys:
+            keys.append((m.group(1), m.group(2)))
+            if len(keys) >= max_samples:
+                break
+    if not keys:
+        return empty
 
-    for link in sample_links:
-        try:
-            # 네이버 블로그는 iframe 구조 → PostView.naver URL로 직접 접근
-            # link 형식: https://blog.naver.com/{id}/{logNo}?fromRss=...
-            m = re.search(r'blog\.naver\.com/([^/]+)/(\d+)', link)
-            if not m:
-                continue
-            blog_id, log_no = m.group(1), m.group(2)
+    path = db_path or DB_PATH
+    samples: Dict[Tuple[str, str], Dict[str, int]] = {}
+    try:
+        with conn_ctx(path) as conn:
+            samples.update(get_post_samples(conn, keys))
+    except Exception as e:
+        logger.debug("포스트 실측 캐시 조회 실패: %s", e)
+    if samples:
+        record_cache_hit()
+
+    missing = [k for k in keys if k not in samples]
+    checkpoint(cancel_token)
+    # 병렬 fetch → 비용은 페이지 1개 수준 (남은 예산이 부족하면 캐시된 샘플만으로 평균)
+    if missing and allows(deadline, SIGNAL_POST_SAMPLE):
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
+
+        def _fetch(key: Tuple[str, str]) -> Optional[Dict[str, int]]:
+            blog_id, log_no = key
             post_view_url = f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
-
-            resp = requests.get(post_view_url, timeout=timeout, headers=headers)
-            if resp.status_code != 200:
-                continue
-            html = resp.text
-
-            # 이미지 수: se-image 클래스 또는 <img> 태그 (UI 이미지 제외)
-            # se-image 블록은 네이버 블로그 에디터의 본문 이미지
-            se_images = len(re.findall(r'class="se-image-resource"', html))
-            if se_images > 0:
-                image_counts.append(se_images)
-            else:
-                # 구 에디터: 전체 <img> 중 UI 이미지 제외
-                all_imgs = re.findall(r'<img\b[^>]*>', html, re.IGNORECASE)
-                content_imgs = 0
-                for img_tag in all_imgs:
-                    if re.search(r'(?:storep|buddy|profile|icon|logo|banner|btn|menu|emoticon)', img_tag, re.IGNORECASE):
-                        continue
-                    content_imgs += 1
-                image_counts.append(max(0, content_imgs - 5))
-
-            # 글 길이: se-main-container 본문 텍스트
-            body_match = re.search(
-                r'class="se-main-container"(.*?)(?:class="post_relate|class="post_footer|class="outro_tag)',
-                html, re.DOTALL
+            try:
+                resp = _http_get(post_view_url, timeout=timeout, headers=headers)
+                if resp.status_code != 200:
+                    return None
+                sample = parse_post_view(resp.text)
+            except Exception as e:
+                logger.debug("Post sample fetch failed for %s/%s: %s", blog_id, log_no, e)
+                return None
+            try:
+                with db_write(), conn_ctx(path) as conn:
+                    save_post_sample(conn, blog_id, log_no, sample["image_count"], sample["content_length"])
+            except Exception as e:
+                logger.debug("포스트 실측 캐시 저장 실패: %s", e)
+            return sample
+
+        wait_ms = budget_ms if budget_ms is not None else float("inf")
+        if deadline is not None:
+            wait_ms = min(wait_ms, max(0.0, deadline.remaining_ms()))
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(missing))
+        try:
+            futures = {submit_in_context(pool, _fetch, k): k for k in missing}
+            done, _ = concurrent.futures.wait(
+                futures, timeout=None if wait_ms == float("inf") else wait_ms / 1000.0,
             )
-            if body_match:
-                body_text = re.sub(r'<[^>]+>', ' ', body_match.group(1))
-                body_text = re.sub(r'\s+', ' ', body_text).strip()
-                content_lengths.append(len(body_text))
-            else:
-                # 전체 페이지에서 추정 (보수적)
-                plain = re.sub(r'<[^>]+>', ' ', html)
-                plain = re.sub(r'\s+', ' ', plain).strip()
-                content_lengths.append(min(len(plain) // 4, 5000))
-
-        except Exception as e:
-            logger.debug("Post sample fetch failed for %s: %s", link, e)
-            continue
-
+        finally:
+            pool.shutdown(wait=False)
+        for fut in done:
+            if fut.result() is not None:
+                samples[futures[fut]] = fut.result()
+        checkpoint(cancel_token)
+
+    image_counts = [samples[k]["image_count"] for k in keys if k in samples]
+    content_lengths = [samples[k]["content_length"] for k in keys if k in samples]
     avg_img = round(sum(image_counts) / len(image_counts), 1) if image_counts else 0.0
     avg_len = round(sum(content_lengths) / len(content_lengths), 0) if content_lengths else 0.0
 
@@ -644,97 +1122,108 @@ def compute_estimated_tier(
         return "normal"
 
 
-def compute_tfidf_topic_similarity(
-    rss_posts: List[RSSPost],
-    match_keywords: List[str],
-    target_topic: str = "",
-) -> float:
-    """TF-IDF 기반 토픽 유사도 (0~1). 순수 Python 구현.
-
-    RSS 포스트 제목에서 한글 2-gram 추출 → TF-IDF 벡터화 → target 키워드와 코사인 유사도.
-    """
-    if not rss_posts or (not match_keywords and not target_topic):
-        return 0.0
-
-    # 문서 = 각 포스트 제목
-    docs = []
-    for p in rss_posts:
-        tokens = re.findall(r"[가-힣]{2,}", p.title)
-        docs.append(tokens)
-
-    if not docs:
-        return 0.0
-
-    # 타겟 토큰
-    target_tokens = []
+def _tfidf_target_tokens(match_keywords: List[str], target_topic: str = "") -> List[str]:
+    tokens: List[str] = []
     for kw in match_keywords:
-        target_tokens.extend(re.findall(r"[가-힣]{2,}", kw))
+        tokens.extend(re.findall(r"[가-힣]{2,}", kw))
     if target_topic:
-        target_tokens.extend(re.findall(r"[가-힣]{2,}", target_topic))
+        tokens.extend(re.findall(r"[가-힣]{2,}", target_topic))
+    return tokens
 
-    if not target_tokens:
-        return 0.0
 
-    # 어휘 구축
-    vocab: Dict[str, int] = {}
-    for doc in docs:
-        for w in doc:
-            if w not in vocab:
-                vocab[w] = len(vocab)
-    for w in target_tokens:
-        if w not in vocab:
-            vocab[w] = len(vocab)
-
-    vocab_size = len(vocab)
-    if vocab_size == 0:
-        return 0.0
+def _tfidf_cosine(docs: List[List[str]], target_tokens: List[str]) -> float:
+    """문서 평균 TF-IDF 벡터 ↔ 타겟 TF-IDF 벡터 코사인 (희소 벡터).
 
-    # DF 계산
-    df = [0] * vocab_size
+    등장한 항만 dict로 들고 어휘 순서(문서 첫 등장 순 → 타겟 전용 항)대로 합산하므로
+    어휘 크기만큼의 밀집 리스트로 계산한 값과 같다 (0 항은 합에 영향 없음).
+    """
+    # 문서별 TF + DF (삽입 순서 = 문서 첫 등장 순 = 어휘 순서)
+    tfs: List[Tuple[Dict[str, int], int]] = []
+    df: Dict[str, int] = {}
     for doc in docs:
-        seen = set()
+        tf: Dict[str, int] = {}
         for w in doc:
-            idx = vocab[w]
-            if idx not in seen:
-                df[idx] += 1
-                seen.add(idx)
+            tf[w] = tf.get(w, 0) + 1
+        for w in tf:
+            df[w] = df.get(w, 0) + 1
+        tfs.append((tf, max(1, len(doc))))
 
     n_docs = len(docs)
-    idf = [math.log((n_docs + 1) / (d + 1)) + 1 for d in df]
 
-    # 문서 평균 TF-IDF 벡터
-    avg_vec = [0.0] * vocab_size
-    for doc in docs:
-        tf_counter: Dict[int, int] = {}
-        for w in doc:
-            idx = vocab[w]
-            tf_counter[idx] = tf_counter.get(idx, 0) + 1
-        doc_len = max(1, len(doc))
-        for idx, cnt in tf_counter.items():
-            avg_vec[idx] += (cnt / doc_len) * idf[idx]
-    for i in range(vocab_size):
-        avg_vec[i] /= max(1, n_docs)
+    def _idf(w: str) -> float:
+        return math.log((n_docs + 1) / (df.get(w, 0) + 1)) + 1
+
+    idf = {w: _idf(w) for w in df}
+
+    # 문서 평균 TF-IDF 벡터 (삽입 순서 = df와 동일)
+    avg_vec: Dict[str, float] = {}
+    for tf, doc_len in tfs:
+        for w, cnt in tf.items():
+            avg_vec[w] = avg_vec.get(w, 0.0) + (cnt / doc_len) * idf[w]
+    denom = max(1, n_docs)
+    for w in avg_vec:
+        avg_vec[w] /= denom
 
     # 타겟 TF-IDF 벡터
-    target_vec = [0.0] * vocab_size
-    target_counter: Dict[int, int] = {}
-    for w in target_tokens:
-        idx = vocab[w]
-        target_counter[idx] = target_counter.get(idx, 0) + 1
     target_len = max(1, len(target_tokens))
-    for idx, cnt in target_counter.items():
-        target_vec[idx] = (cnt / target_len) * idf[idx]
+    target_vec = {
+        w: (cnt / target_len) * (idf[w] if w in idf else _idf(w))
+        for w, cnt in Counter(target_tokens).items()
+    }
 
-    # 코사인 유사도
-    dot = sum(a * b for a, b in zip(avg_vec, target_vec))
-    mag_a = math.sqrt(sum(x * x for x in avg_vec))
-    mag_b = math.sqrt(sum(x * x for x in target_vec))
+    # 코사인 유사도 (어휘 순서로 합산)
+    dot = sum(a * target_vec[w] for w, a in avg_vec.items() if w in target_vec)
+    mag_a = math.sqrt(sum(a * a for a in avg_vec.values()))
+    target_order = [w for w in avg_vec if w in target_vec] + [w for w in target_vec if w not in avg_vec]
+    mag_b = math.sqrt(sum(target_vec[w] * target_vec[w] for w in target_order))
     if mag_a == 0 or mag_b == 0:
         return 0.0
 
     return round(min(1.0, max(0.0, dot / (mag_a * mag_b))), 3)
 
 
+def compute_tfidf_topic_similarity(
+    rss_posts: List[RSSPost],
+    match_keywords: List[str],
+    target_topic: str = "",
+) -> float:
+    """TF-IDF 기반 토픽 유사도 (0~1). 순수 Python 구현.
+
+    RSS 포스트 제목에서 한글 2-gram 추출 → TF-IDF 벡터화 → target 키워드와 코사인 유사도.
+    """
+    if not rss_posts or (not match_keywords and not target_topic):
+        return 0.0
+
+    target_tokens = _tfidf_target_tokens(match_keywords, target_topic)
+    if not target_tokens:
+        return 0.0
+
+    # 문서 = 각 포스트 제목
+    return _tfidf_cosine([features(p).title_tokens for p in rss_posts], target_tokens)
+
+
+def compute_tfidf_topic_similarity_batch(
+    posts_by_blogger: Dict[str, List[RSSPost]],
+    match_keywords: List[str],
+    target_topic: str = "",
+) -> Dict[str, float]:
+    """블로거 여러 명의 TF-IDF 토픽 유사도 {blogger_id: 0~1} (블로거별 compute_tfidf_topic_similarity와 동일).
+
+    매장 분석 tier 단계에서 후보 전체를 한 번에 계산 — 타겟 토큰은 1회만 추출하고
+    IDF는 개별 분석과 같게 블로거 자신의 포스트 기준.
+    """
+    out = {bid: 0.0 for bid in posts_by_blogger}
+    if not match_keywords and not target_topic:
+        return out
+    target_tokens = _tfidf_target_tokens(match_keywords, target_topic)
+    if not target_tokens:
+        return out
+    for bid, posts in posts_by_blogger.items():
+        if posts:
+            out[bid] = _tfidf_cosine([features(p).title_tokens for p in posts], target_tokens)
+    return out
+
+
 # ===========================
 # 분석 함수들
 # ===========================
@@ -744,8 +1233,7 @@ def analyze_activity(posts: List[RSSPost]) -> ActivityMetrics:
     now = datetime.now()
     total = len(posts)
 
-    dates = [_parse_rss_date(p.pub_date) for p in posts]
-    dates = sorted([d for d in dates if d], reverse=True)
+    dates = sorted([d for d in (features(p).pub_dt for p in posts) if d], reverse=True)
 
     if not dates:
         return ActivityMetrics(
@@ -841,11 +1329,10 @@ def analyze_content(
             food_hits += 1
         if any(w in text for w in SPONSOR_WORDS):
             sponsor_hits += 1
-        desc_lengths.append(len(p.description or ""))
+        desc_lengths.append(features(p).desc_len)
 
         # 제목에서 키워드 추출
-        words = _extract_keywords_from_title(p.title)
-        all_words.extend(words)
+        all_words.extend(_post_keywords(p))
 
     n = max(1, len(posts))
     food_bias = food_hits / n
@@ -886,7 +1373,7 @@ def analyze_content(
     # 카테고리 적합도 (0~6)
     if store_category:
         cat_lower = store_category.lower()
-        cat_mentions = sum(1 for p in posts if cat_lower in p.title.lower())
+        cat_mentions = sum(1 for p in posts if cat_lower in features(p).title_lower)
         cat_fit = 6.0 * min(1.0, cat_mentions / max(1, len(posts)) * 3)
     else:
         # 독립 분석: 다양성 보너스
@@ -905,18 +1392,16 @@ def analyze_content(
     )
 
 
-def _extract_keywords_from_title(title: str) -> List[str]:
-    """제목에서 2글자 이상의 한글 명사/키워드 추출 (불용어 제거)."""
-    # 한글 2글자 이상 단어 추출
-    words = re.findall(r"[가-힣]{2,}", title)
-    return [w for w in words if w not in _STOPWORDS]
+def _post_keywords(post: RSSPost) -> List[str]:
+    """제목에서 2글자 이상의 한글 명사/키워드 추출 (불용어 제거, 토큰은 포스트별 특성 캐시)."""
+    return [w for w in features(post).title_tokens if w not in _STOPWORDS]
 
 
 def extract_search_keywords_from_posts(posts: List[RSSPost], max_keywords: int = 7) -> List[str]:
     """포스트 제목에서 검색용 키워드 추출 (독립 분석 모드용)."""
     counter: Counter = Counter()
     for p in posts:
-        words = _extract_keywords_from_title(p.title)
+        words = _post_keywords(p)
         # 2-gram 조합도 생성
         for w in words:
             counter[w] += 1
@@ -945,7 +1430,7 @@ def extract_full_reverse_keywords(posts: List[RSSPost], max_posts: int = 15) ->
     bigram_freq: Counter = Counter()
 
     for post in posts[:max_posts]:
-        words = _extract_keywords_from_title(post.title)
+        words = _post_keywords(post)
         for w in words:
             word_freq[w] += 1
         for i in range(len(words) - 1):
@@ -985,13 +1470,35 @@ def _has_sponsored_signal(title: str) -> bool:
     return any(sig in title for sig in _SPONSORED_TITLE_SIGNALS)
 
 
+def _exposure_detail(kw: str, found: Optional[Tuple[int, str, str]]) -> Optional[Dict[str, Any]]:
+    """노출된 키워드 1개 → exposure.details 항목 (미노출이면 None)."""
+    if not found:
+        return None
+    rank, post_link, post_title = found
+    return {
+        "keyword": kw,
+        "rank": rank,
+        "strength": strength_points(rank),
+        "is_page1": rank <= 10,
+        "post_link": post_link,
+        "post_title": _strip_html(post_title) if post_title else "",
+    }
+
+
 def analyze_exposure(
     blogger_id: str,
     keywords: List[str],
     client: NaverBlogSearchClient,
     progress_cb: Optional[ProgressCb] = None,
+    cancel_token: Optional[CancelToken] = None,
+    on_keyword: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> ExposureMetrics:
-    """검색 노출력 분석 (0~40점)."""
+    """검색 노출력 분석 (0~40점).
+
+    취소 시 대기 중인 키워드는 검색하지 않고 AnalysisCancelled (완료된 검색은 api_cache에 남음).
+    on_keyword: 키워드 검색이 끝날 때마다 (완료 순서) {"keyword", "rank"(미노출 None), "strength",
+    "is_page1", "post_link", "post_title", "done", "total"} — 노출된 키워드는 details 항목과 같은 값.
+    """
     if not keywords:
         return ExposureMetrics(
             keywords_checked=0, keywords_exposed=0, page1_count=0,
@@ -1004,36 +1511,28 @@ def analyze_exposure(
 
     # 병렬 검색
     def _search_kw(kw: str) -> Tuple[str, List]:
+        checkpoint(cancel_token)
         items = client.search_blog(query=kw, display=30)
         return kw, items
 
     mapping: Dict[str, Optional[Tuple[int, str, str]]] = {}
     with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
-        futures = {pool.submit(_search_kw, kw): kw for kw in keywords}
+        futures = {submit_in_context(pool, _search_kw, kw): kw for kw in keywords}
         for fut in concurrent.futures.as_completed(futures):
             kw = futures[fut]
             try:
                 keyword, items = fut.result()
-                found = None
-                for rank0, it in enumerate(items):
-                    # blogger_id 매칭
-                    item_url = it.bloggerlink or it.link or ""
-                    if blogger_id in item_url.lower():
-                        found = (rank0 + 1, it.link, it.title)
-                        break
-                    # blogId 쿼리 파라미터 체크
-                    m = re.search(r"(?:blogId|blogid)=([A-Za-z0-9._-]+)", item_url)
-                    if m and m.group(1).lower() == blogger_id:
-                        found = (rank0 + 1, it.link, it.title)
-                        break
-                    # blog.naver.com/{id} 체크
-                    m = re.search(r"blog\.naver\.com/([A-Za-z0-9._-]+)", item_url)
-                    if m and m.group(1).lower() == blogger_id:
-                        found = (rank0 + 1, it.link, it.title)
-                        break
-                mapping[keyword] = found
+                # 순위별 blogger_id 인덱스 조회 (캐시 히트면 URL 재파싱 없음)
+                mapping[keyword] = index_items(items).hit(blogger_id)
             except Exception:
                 mapping[kw] = None
+            if on_keyword is not None:
+                detail = _exposure_detail(kw, mapping[kw]) or {
+                    "keyword": kw, "rank": None, "strength": 0, "is_page1": False,
+                    "post_link": None, "post_title": None,
+                }
+                on_keyword({**detail, "done": len(mapping), "total": len(keywords)})
+    checkpoint(cancel_token)
 
     total_strength = 0
     total_weighted = 0.0
@@ -1041,25 +1540,14 @@ def analyze_exposure(
     page1_count = 0
 
     for kw in keywords:
-        found = mapping.get(kw)
-        if found:
-            rank, post_link, post_title = found
-            sp = strength_points(rank)
-            weight = keyword_weight_for_suffix(kw)
-            total_strength += sp
-            total_weighted += sp * weight
+        detail = _exposure_detail(kw, mapping.get(kw))
+        if detail:
+            total_strength += detail["strength"]
+            total_weighted += detail["strength"] * keyword_weight_for_suffix(kw)
             exposed_count += 1
-            clean_title = _strip_html(post_title) if post_title else ""
-            if rank <= 10:
+            if detail["is_page1"]:
                 page1_count += 1
-            details.append({
-                "keyword": kw,
-                "rank": rank,
-                "strength": sp,
-                "is_page1": rank <= 10,
-                "post_link": post_link,
-                "post_title": clean_title,
-            })
+            details.append(detail)
 
     # 점수 계산 (0~40): 노출 강도(25) + 키워드 커버리지(15)
     max_strength = len(keywords) * 3  # GoldenScore와 동일한 현실적 분모
@@ -1126,12 +1614,9 @@ def analyze_quality(posts: List[RSSPost]) -> QualityMetrics:
     if not posts:
         return QualityMetrics(originality=0.0, compliance=0.0, richness=0.0, score=0.0)
 
-    descriptions = [p.description or "" for p in posts]
-
     # 독창성 (0~8): SimHash 기반 근사 중복 감지 → 낮을수록 높은 점수
-    if len(descriptions) >= 2:
-        sample = descriptions[:20]
-        hashes = [compute_simhash(d) for d in sample]
+    if len(posts) >= 2:
+        hashes = [features(p).desc_simhash for p in posts[:20]]
         dup_pairs = 0
         total_pairs = 0
         for i in range(len(hashes)):
@@ -1148,7 +1633,7 @@ def analyze_quality(posts: List[RSSPost]) -> QualityMetrics:
     compliance = 0.0
 
     # 충실도 (0~7): description 평균 길이 기반
-    avg_len = statistics.mean(len(d) for d in descriptions) if descriptions else 0
+    avg_len = statistics.mean(features(p).desc_len for p in posts)
     if avg_len >= 200:
         richness = 7.0
     elif avg_len >= 100:
@@ -1257,11 +1742,100 @@ def generate_insights(
 # 메인 분석 함수
 # ===========================
 
+# 결과 섹션 직렬화 — 최종 결과와 SSE 부분 결과(section_cb)가 같은 함수를 쓴다
+def _activity_section(activity: ActivityMetrics) -> Dict[str, Any]:
+    return {
+        "total_posts": activity.total_posts,
+        "days_since_last_post": activity.days_since_last_post,
+        "avg_interval_days": activity.avg_interval_days,
+        "posting_trend": activity.posting_trend,
+    }
+
+
+def _content_section(content: ContentMetrics, posts: List[RSSPost]) -> Dict[str, Any]:
+    # 최근 포스트 (최대 10개)
+    recent_posts = []
+    for p in posts[:10]:
+        dt = features(p).pub_dt
+        recent_posts.append({
+            "title": p.title,
+            "date": dt.strftime("%Y-%m-%d") if dt else "",
+            "link": p.link,
+            "category": p.category or "",
+        })
+    return {
+        "food_bias_rate": content.food_bias_rate,
+        "sponsor_signal_rate": content.sponsor_signal_rate,
+        "topic_diversity": content.topic_diversity,
+        "dominant_topics": content.dominant_topics,
+        "recent_posts": recent_posts,
+    }
+
+
+def _exposure_section(exposure: ExposureMetrics) -> Dict[str, Any]:
+    return {
+        "keywords_checked": exposure.keywords_checked,
+        "keywords_exposed": exposure.keywords_exposed,
+        "page1_count": exposure.page1_count,
+        "strength_sum": exposure.strength_sum,
+        "details": exposure.details,
+    }
+
+
+def _quality_section(quality: QualityMetrics) -> Dict[str, Any]:
+    return {
+        "originality": quality.originality,
+        "compliance": quality.compliance,
+        "richness": quality.richness,
+        "score": quality.score,
+    }
+
+
+def _profile_section(profile: Dict[str, Any], activity: ActivityMetrics) -> Dict[str, Any]:
+    """프로필 스크래핑 결과 → BlogPower 입력 + BlogPower 점수 (blog_analysis_score와 같은 입력)."""
+    blog_start = profile.get("blog_start_date")
+    blog_years = profile.get("blog_age_years", 0.0)
+    if not blog_years and blog_start:
+        blog_years = round((datetime.now() - blog_start).days / 365.25, 1)
+    section = {
+        "neighbor_count": profile.get("neighbor_count", 0),
+        "blog_years": blog_years,
+        "total_posts": profile.get("total_posts", 0),
+        "total_visitors": profile.get("total_visitors", 0),
+        "total_subscribers": profile.get("total_subscribers", 0),
+        "ranking_percentile": profile.get("ranking_percentile", 100.0),
+    }
+    section["blog_power"] = compute_blog_power(
+        section["total_posts"], section["total_visitors"], section["total_subscribers"],
+        section["ranking_percentile"], blog_years,
+        last_post_days_ago=activity.days_since_last_post if activity.days_since_last_post is not None else 999,
+    )
+    return section
+
+
+# analyze_blog 단계 그래프 — 단계 완료 시 SSE 메시지 (+ 마지막 scoring)
+_STAGE_MESSAGES: Dict[str, str] = {
+    "rss": "RSS 피드 수집 완료",
+    "content": "콘텐츠 분석 완료",
+    "exposure": "검색 노출력 확인 완료",
+    "quality": "콘텐츠 품질 검사 완료",
+    "profile": "블로그 프로필 수집 완료",
+    "post_sample": "포스트 실측 완료",
+    "blog_power": "BlogPower 계산 완료",
+    "scoring": "BlogScore 계산 완료",
+}
+
+
 def analyze_blog(
     blog_url_or_id: str,
     client: NaverBlogSearchClient,
     store_profile: Optional[StoreProfile] = None,
     progress_cb: Optional[ProgressCb] = None,
+    timings: Optional[PhaseTimings] = None,
+    cancel_token: Optional[CancelToken] = None,
+    deadline_ms: Optional[int] = None,
+    section_cb: Optional[SectionCb] = None,
+    db_path: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     블로그 종합 분석 실행.
@@ -1270,12 +1844,23 @@ def analyze_blog(
         blog_url_or_id: 블로그 URL 또는 ID
         client: 네이버 검색 API 클라이언트
         store_profile: 매장 연계 시 프로필 (None이면 독립 분석)
-        progress_cb: SSE 진행 콜백
+        progress_cb: SSE 진행 콜백 (그래프 단계가 끝날 때마다, 워커 스레드에서도 호출됨)
+            current/total은 완료 단계 수로만 증가 — 단계 중간 안내는 total=0인 메시지 전용 이벤트
+        timings: 단계별 계측기 (None이면 내부 생성, 결과 meta.timings로 반환)
+        cancel_token: SSE 연결 종료 시 단계 사이에서 AnalysisCancelled
+        deadline_ms: 시간 예산 — 부족하면 선택적 신호 생략 (meta.degraded)
+        section_cb: 부분 결과 콜백 — 섹션이 준비되는 즉시 (워커 스레드에서도) 호출
+            "rss"(헤더) → "activity"/"content" → "exposure_keyword"(키워드별) / "exposure" / "quality"
+            / "profile"(BlogPower) → "score"(blog_score + insights). 데이터는 최종 결과의 같은 키와 동일
+        db_path: RSS/프로필/포스트 실측 캐시, 음성 캐시, 블로거 간 중복 인덱스 DB (None이면 DB_PATH)
 
     Returns:
-        분석 결과 딕셔너리
+        분석 결과 딕셔너리 (meta.latency: 실제 소요 wall_ms vs 순차 실행 기준 sequential_ms)
     """
     emit = progress_cb or (lambda _: None)
+    section = section_cb or (lambda _name, _data: None)
+    t = timings or PhaseTimings()
+    deadline = Deadline(deadline_ms)
 
     # 1. 블로거 ID 추출
     blogger_id = extract_blogger_id(blog_url_or_id)
@@ -1286,58 +1871,128 @@ def analyze_blog(
     analysis_mode = "store_linked" if store_profile else "standalone"
     is_food_cat = is_food_category(store_profile.category_text) if store_profile else False
 
-    # 2. RSS 피드 수집
-    emit({"stage": "rss", "current": 1, "total": 5, "message": "RSS 피드 수집 중..."})
-    posts = fetch_rss(blogger_id)
+    # 2~5. 단계 그래프: RSS → {콘텐츠, 노출(키워드 생성 + 검색), 품질, 프로필, 포스트 실측} 동시 실행
+    # 노출 키워드는 RSS 제목만, 프로필/포스트 실측은 RSS만 필요 → 노출 결과를 기다리지 않음
+    def _rss(_r: Dict[str, Any]) -> List[RSSPost]:
+        with t.phase("rss"):
+            posts = fetch_rss(blogger_id, db_path=db_path)
+        section("rss", {"blogger_id": blogger_id, "blog_url": blog_url, "analysis_mode": analysis_mode,
+                        "rss_available": len(posts) > 0})
+        return posts
+
+    def _content(r: Dict[str, Any]) -> Tuple[ActivityMetrics, ContentMetrics]:
+        checkpoint(cancel_token)
+        posts = r["rss"]
+        with t.phase("content"):
+            if posts:
+                metrics = analyze_activity(posts), analyze_content(
+                    posts,
+                    is_food_cat=is_food_cat,
+                    store_category=store_profile.category_text if store_profile else None,
+                )
+            else:
+                metrics = (
+                    ActivityMetrics(
+                        total_posts=0, days_since_last_post=None,
+                        avg_interval_days=None, interval_std_days=None,
+                        posting_trend="알 수 없음", score=0.0,
+                    ),
+                    ContentMetrics(
+                        food_bias_rate=0.0, sponsor_signal_rate=0.0,
+                        topic_diversity=0.0, dominant_topics=[],
+                        avg_description_length=0.0, category_fit_score=0.0, score=0.0,
+                    ),
+                )
+        section("activity", _activity_section(metrics[0]))
+        section("content", _content_section(metrics[1], posts))
+        return metrics
+
+    def _exposure(r: Dict[str, Any]) -> ExposureMetrics:
+        # 노출력 분석 — v7.2 전수 역검색 (standalone 모드)
+        checkpoint(cancel_token)
+        posts = r["rss"]
+        if store_profile:
+            keywords = build_exposure_keywords(store_profile)
+        elif posts:
+            # v7.2 전수 역검색: 15개 포스트 제목에서 15~25개 키워드 추출
+            keywords = extract_full_reverse_keywords(posts, max_posts=15)
+            if len(keywords) < 5:
+                # 포스트 부족 시 기존 빈도 기반 폴백
+                keywords = extract_search_keywords_from_posts(posts, max_keywords=7)
+            # 워커 스레드 메시지 전용 이벤트 (total=0 → 진행 막대 유지, 완료 수는 _on_complete만 보고)
+            emit({"stage": "exposure", "current": 0, "total": 0,
+                  "message": f"전수 역검색 중... ({len(keywords)}개 키워드)"})
+        else:
+            keywords = []
+        with t.phase("exposure"):
+            exposure = analyze_exposure(blogger_id, keywords, client, progress_cb, cancel_token,
+                                        on_keyword=lambda d: section("exposure_keyword", d))
+        section("exposure", _exposure_section(exposure))
+        return exposure
+
+    def _quality(r: Dict[str, Any]) -> QualityMetrics:
+        checkpoint(cancel_token)
+        with t.phase("quality"):
+            if r["rss"]:
+                quality = analyze_quality(r["rss"])
+            else:
+                quality = QualityMetrics(originality=0.0, compliance=0.0, richness=0.0, score=0.0)
+        section("quality", _quality_section(quality))
+        return quality
+
+    def _profile(r: Dict[str, Any]) -> Dict[str, Any]:
+        # v7.1: 프로필 + 미디어 + 등급 추정
+        checkpoint(cancel_token)
+        with t.phase("profile"):
+            return fetch_blog_profile(blogger_id, r["rss"], timeout=6.0,
+                                      cancel_token=cancel_token, deadline=deadline, db_path=db_path)
+
+    def _post_sample(r: Dict[str, Any]) -> Dict[str, float]:
+        # v7.2: 실제 블로그 포스트 샘플링 (RSS 잘림 보정)
+        # RSS description은 ~350자로 잘림 + 이미지 0-1개만 포함 → 실측 필요
+        checkpoint(cancel_token)
+        if not r["rss"]:
+            return {"avg_image_count": 0.0, "avg_content_length": 0.0}
+        with t.phase("post_sample"):
+            metrics = sample_actual_post_metrics(r["rss"], max_samples=POST_SAMPLE_SIZE, timeout=5.0,
+                                                 cancel_token=cancel_token, deadline=deadline, db_path=db_path)
+        logger.info("Post sample metrics: avg_img=%.1f, avg_len=%.0f",
+                    metrics["avg_image_count"], metrics["avg_content_length"])
+        return metrics
+
+    def _blog_power(r: Dict[str, Any]) -> Dict[str, Any]:
+        # 프로필 + 마지막 포스팅 경과일 → BlogPower (노출/실측을 기다리지 않고 먼저 전달)
+        info = _profile_section(r["profile"], r["content"][0])
+        section("profile", info)
+        return info
+
+    graph = StageGraph()
+    graph.add("rss", _rss)
+    graph.add("content", _content, deps=("rss",))
+    graph.add("exposure", _exposure, deps=("rss",))
+    graph.add("quality", _quality, deps=("rss",))
+    graph.add("profile", _profile, deps=("rss",))
+    graph.add("post_sample", _post_sample, deps=("rss",))
+    graph.add("blog_power", _blog_power, deps=("content", "profile"))
+
+    def _on_complete(name: str, done: int, total: int) -> None:
+        emit({"stage": name, "current": done, "total": total + 1, "message": _STAGE_MESSAGES[name]})
+
+    emit({"stage": "rss", "current": 0, "total": len(_STAGE_MESSAGES), "message": "RSS 피드 수집 중..."})
+    run = graph.run(on_complete=_on_complete)
+    posts: List[RSSPost] = run.results["rss"]
     rss_available = len(posts) > 0
+    activity, content = run.results["content"]
+    exposure: ExposureMetrics = run.results["exposure"]
+    quality: QualityMetrics = run.results["quality"]
+    profile_info: Dict[str, Any] = run.results["blog_power"]
+    actual_metrics: Dict[str, float] = run.results["post_sample"]
 
-    # 3. 콘텐츠 분석
-    emit({"stage": "content", "current": 2, "total": 5, "message": "콘텐츠 분석 중..."})
-    if rss_available:
-        activity = analyze_activity(posts)
-        content = analyze_content(
-            posts,
-            is_food_cat=is_food_cat,
-            store_category=store_profile.category_text if store_profile else None,
-        )
-    else:
-        activity = ActivityMetrics(
-            total_posts=0, days_since_last_post=None,
-            avg_interval_days=None, interval_std_days=None,
-            posting_trend="알 수 없음", score=0.0,
-        )
-        content = ContentMetrics(
-            food_bias_rate=0.0, sponsor_signal_rate=0.0,
-            topic_diversity=0.0, dominant_topics=[],
-            avg_description_length=0.0, category_fit_score=0.0, score=0.0,
-        )
-
-    # 4. 노출력 분석 — v7.2 전수 역검색 (standalone 모드)
-    emit({"stage": "exposure", "current": 3, "total": 5, "message": "검색 노출력 확인 중..."})
-    if store_profile:
-        keywords = build_exposure_keywords(store_profile)
-    elif rss_available:
-        # v7.2 전수 역검색: 15개 포스트 제목에서 15~25개 키워드 추출
-        keywords = extract_full_reverse_keywords(posts, max_posts=15)
-        if len(keywords) < 5:
-            # 포스트 부족 시 기존 빈도 기반 폴백
-            keywords = extract_search_keywords_from_posts(posts, max_keywords=7)
-        emit({"stage": "exposure", "current": 3, "total": 5,
-              "message": f"전수 역검색 중... ({len(keywords)}개 키워드)"})
-    else:
-        keywords = []
-
-    exposure = analyze_exposure(blogger_id, keywords, client, progress_cb)
-
-    # 5. 품질 검사
-    emit({"stage": "quality", "current": 4, "total": 5, "message": "콘텐츠 품질 검사 중..."})
-    if rss_available:
-        quality = analyze_quality(posts)
-    else:
-        quality = QualityMetrics(originality=0.0, compliance=0.0, richness=0.0, score=0.0)
+    checkpoint(cancel_token)
 
     # 6. BlogAnalysisScore 계산
-    emit({"stage": "scoring", "current": 5, "total": 5, "message": "BlogScore 계산 중..."})
+    emit({"stage": "scoring", "current": len(_STAGE_MESSAGES), "total": len(_STAGE_MESSAGES),
+          "message": "BlogScore 계산 중..."})
 
     # 매장 연계: RSS 포스트에서 keyword_match_ratio 계산
     ba_keyword_match = 0.0
@@ -1356,19 +2011,14 @@ def analyze_blog(
             )
             ba_keyword_match = match_count / max(1, len(posts))
 
-    # v7.1: 프로필 + 미디어 + 등급 추정
-    profile = fetch_blog_profile(blogger_id, posts if rss_available else [], timeout=6.0)
-    neighbor_count = profile.get("neighbor_count", 0)
-    blog_start = profile.get("blog_start_date")
-    blog_years = profile.get("blog_age_years", 0.0)
-    if not blog_years and blog_start:
-        blog_years = round((datetime.now() - blog_start).days / 365.25, 1)
+    neighbor_count = profile_info["neighbor_count"]
+    blog_years = profile_info["blog_years"]
 
     # v7.2 BlogPower: 프로필 확장 데이터
-    bp_total_posts = profile.get("total_posts", 0)
-    bp_total_visitors = profile.get("total_visitors", 0)
-    bp_total_subscribers = profile.get("total_subscribers", 0)
-    bp_ranking_percentile = profile.get("ranking_percentile", 100.0)
+    bp_total_posts = profile_info["total_posts"]
+    bp_total_visitors = profile_info["total_visitors"]
+    bp_total_subscribers = profile_info["total_subscribers"]
+    bp_ranking_percentile = profile_info["ranking_percentile"]
 
     img_ratio, vid_ratio = compute_image_video_ratio(posts) if rss_available else (0.0, 0.0)
     est_tier = compute_estimated_tier(
@@ -1376,89 +2026,86 @@ def analyze_blog(
         activity.avg_interval_days, activity.total_posts,
     ) if rss_available else "unknown"
 
-    # v7.2: 실제 블로그 포스트 샘플링 (RSS 잘림 보정)
-    # RSS description은 ~350자로 잘림 + 이미지 0-1개만 포함 → 실측 필요
-    actual_metrics = {"avg_image_count": 0.0, "avg_content_length": 0.0}
-    if rss_available and posts:
-        actual_metrics = sample_actual_post_metrics(posts, max_samples=3, timeout=5.0)
-        logger.info("Post sample metrics: avg_img=%.1f, avg_len=%.0f",
-                     actual_metrics["avg_image_count"], actual_metrics["avg_content_length"])
+    with t.phase("scoring"):
+        # v7.1: TF-IDF 토픽 유사도
+        tfidf_sim = 0.0
+        if rss_available and store_profile:
+            from backend.analyzer import _build_match_keywords
+            match_kws_tf = _build_match_keywords(
+                store_profile.category_text,
+                getattr(store_profile, 'topic', None) or "",
+            )
+            tfidf_sim = compute_tfidf_topic_similarity(posts, match_kws_tf)
 
-    # v7.1: TF-IDF 토픽 유사도
-    tfidf_sim = 0.0
-    if rss_available and store_profile:
-        from backend.analyzer import _build_match_keywords
-        match_kws_tf = _build_match_keywords(
-            store_profile.category_text,
-            getattr(store_profile, 'topic', None) or "",
+        # v7.1: SimHash/Bayesian 메트릭
+        from backend.scoring import (
+            compute_originality_v7, compute_diversity_smoothed,
+            compute_game_defense, compute_quality_floor,
+            compute_topic_focus, compute_topic_continuity,
+        )
+        rss_orig_v7 = 0.0
+        rss_div_sm = 0.0
+        gd_val = 0.0
+        qf_val = 0.0
+        tf_val = 0.0
+        tc_val = 0.0
+        if rss_available:
+            rss_orig_v7 = compute_originality_v7(posts)
+            rss_div_sm = compute_diversity_smoothed(posts)
+            from backend.dup_index import cross_blog_dup_rate
+            gd_val = compute_game_defense(posts, {
+                "interval_avg": activity.avg_interval_days,
+                "cross_blog_dup_rate": cross_blog_dup_rate(blogger_id, posts, db_path),
+            })
+            qf_val = compute_quality_floor(0.0, True, exposure.keywords_exposed, 0)
+            if store_profile:
+                from backend.analyzer import _build_match_keywords as _bmk
+                mk = _bmk(store_profile.category_text, getattr(store_profile, 'topic', None) or "")
+                tf_val = compute_topic_focus(posts, mk)
+                tc_val = compute_topic_continuity(posts, mk)
+
+        # RSS 잘림 보정: 실측 글 길이가 RSS보다 크면 실측값 사용
+        effective_richness = content.avg_description_length
+        if actual_metrics["avg_content_length"] > effective_richness:
+            effective_richness = actual_metrics["avg_content_length"]
+
+        total, breakdown, v72_result = blog_analysis_score(
+            interval_avg=activity.avg_interval_days,
+            originality_raw=quality.originality,
+            diversity_entropy=content.topic_diversity,
+            richness_avg_len=effective_richness,
+            sponsor_signal_rate=content.sponsor_signal_rate,
+            strength_sum=exposure.strength_sum,
+            exposed_keywords=exposure.keywords_exposed,
+            total_keywords=max(1, exposure.keywords_checked),
+            food_bias_rate=content.food_bias_rate,
+            weighted_strength=exposure.weighted_strength,
+            days_since_last_post=activity.days_since_last_post,
+            total_posts=activity.total_posts,
+            store_profile_present=store_profile is not None,
+            keyword_match_ratio=ba_keyword_match,
+            has_category=ba_has_category,
+            neighbor_count=neighbor_count,
+            blog_years=blog_years,
+            estimated_tier=est_tier,
+            image_ratio=img_ratio,
+            video_ratio=vid_ratio,
+            rss_originality_v7=rss_orig_v7,
+            rss_diversity_smoothed=rss_div_sm,
+            rss_posts=posts if rss_available else None,
+            game_defense=gd_val,
+            quality_floor=qf_val,
+            tfidf_sim=tfidf_sim,
+            topic_focus=tf_val,
+            topic_continuity=tc_val,
+            avg_image_count=actual_metrics["avg_image_count"],
+            # v7.2 BlogPower
+            total_posts_count=bp_total_posts,
+            total_visitors_count=bp_total_visitors,
+            total_subscribers_count=bp_total_subscribers,
+            ranking_percentile_val=bp_ranking_percentile,
+            blog_age_years_val=blog_years,
         )
-        tfidf_sim = compute_tfidf_topic_similarity(posts, match_kws_tf)
-
-    # v7.1: SimHash/Bayesian 메트릭
-    from backend.scoring import (
-        compute_originality_v7, compute_diversity_smoothed,
-        compute_game_defense, compute_quality_floor,
-        compute_topic_focus, compute_topic_continuity,
-    )
-    rss_orig_v7 = 0.0
-    rss_div_sm = 0.0
-    gd_val = 0.0
-    qf_val = 0.0
-    tf_val = 0.0
-    tc_val = 0.0
-    if rss_available:
-        rss_orig_v7 = compute_originality_v7(posts)
-        rss_div_sm = compute_diversity_smoothed(posts)
-        gd_val = compute_game_defense(posts, {"interval_avg": activity.avg_interval_days})
-        qf_val = compute_quality_floor(0.0, True, exposure.keywords_exposed, 0)
-        if store_profile:
-            from backend.analyzer import _build_match_keywords as _bmk
-            mk = _bmk(store_profile.category_text, getattr(store_profile, 'topic', None) or "")
-            tf_val = compute_topic_focus(posts, mk)
-            tc_val = compute_topic_continuity(posts, mk)
-
-    # RSS 잘림 보정: 실측 글 길이가 RSS보다 크면 실측값 사용
-    effective_richness = content.avg_description_length
-    if actual_metrics["avg_content_length"] > effective_richness:
-        effective_richness = actual_metrics["avg_content_length"]
-
-    total, breakdown, v72_result = blog_analysis_score(
-        interval_avg=activity.avg_interval_days,
-        originality_raw=quality.originality,
-        diversity_entropy=content.topic_diversity,
-        richness_avg_len=effective_richness,
-        sponsor_signal_rate=content.sponsor_signal_rate,
-        strength_sum=exposure.strength_sum,
-        exposed_keywords=exposure.keywords_exposed,
-        total_keywords=max(1, exposure.keywords_checked),
-        food_bias_rate=content.food_bias_rate,
-        weighted_strength=exposure.weighted_strength,
-        days_since_last_post=activity.days_since_last_post,
-        total_posts=activity.total_posts,
-        store_profile_present=store_profile is not None,
-        keyword_match_ratio=ba_keyword_match,
-        has_category=ba_has_category,
-        neighbor_count=neighbor_count,
-        blog_years=blog_years,
-        estimated_tier=est_tier,
-        image_ratio=img_ratio,
-        video_ratio=vid_ratio,
-        rss_originality_v7=rss_orig_v7,
-        rss_diversity_smoothed=rss_div_sm,
-        rss_posts=posts if rss_available else None,
-        game_defense=gd_val,
-        quality_floor=qf_val,
-        tfidf_sim=tfidf_sim,
-        topic_focus=tf_val,
-        topic_continuity=tc_val,
-        avg_image_count=actual_metrics["avg_image_count"],
-        # v7.2 BlogPower
-        total_posts_count=bp_total_posts,
-        total_visitors_count=bp_total_visitors,
-        total_subscribers_count=bp_total_subscribers,
-        ranking_percentile_val=bp_ranking_percentile,
-        blog_age_years_val=blog_years,
-    )
     grade = v72_result["grade"]
     grade_label = v72_result["grade_label"]
 
@@ -1466,63 +2113,41 @@ def analyze_blog(
         activity, content, exposure, quality, total,
     )
 
-    # 최근 포스트 (최대 10개)
-    recent_posts = []
-    for p in posts[:10]:
-        dt = _parse_rss_date(p.pub_date)
-        recent_posts.append({
-            "title": p.title,
-            "date": dt.strftime("%Y-%m-%d") if dt else "",
-            "link": p.link,
-            "category": p.category or "",
-        })
+    blog_score = {
+        "total": total,
+        "grade": grade,
+        "grade_label": grade_label,
+        "breakdown": breakdown,
+        # v7.2 확장
+        "base_score": v72_result["base_score"],
+        "category_bonus": v72_result["category_bonus"],
+        "final_score": v72_result["final_score"],
+        "base_breakdown": v72_result["base_breakdown"],
+        "bonus_breakdown": v72_result["bonus_breakdown"],
+    }
+    insights = {
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "recommendation": recommendation,
+    }
+    section("score", {"blog_score": blog_score, "insights": insights})
 
     return {
         "blogger_id": blogger_id,
         "blog_url": blog_url,
         "analysis_mode": analysis_mode,
         "rss_available": rss_available,
-        "blog_score": {
-            "total": total,
-            "grade": grade,
-            "grade_label": grade_label,
-            "breakdown": breakdown,
-            # v7.2 확장
-            "base_score": v72_result["base_score"],
-            "category_bonus": v72_result["category_bonus"],
-            "final_score": v72_result["final_score"],
-            "base_breakdown": v72_result["base_breakdown"],
-            "bonus_breakdown": v72_result["bonus_breakdown"],
-        },
-        "activity": {
-            "total_posts": activity.total_posts,
-            "days_since_last_post": activity.days_since_last_post,
-            "avg_interval_days": activity.avg_interval_days,
-            "posting_trend": activity.posting_trend,
-        },
-        "content": {
-            "food_bias_rate": content.food_bias_rate,
-            "sponsor_signal_rate": content.sponsor_signal_rate,
-            "topic_diversity": content.topic_diversity,
-            "dominant_topics": content.dominant_topics,
-            "recent_posts": recent_posts,
-        },
-        "exposure": {
-            "keywords_checked": exposure.keywords_checked,
-            "keywords_exposed": exposure.keywords_exposed,
-            "page1_count": exposure.page1_count,
-            "strength_sum": exposure.strength_sum,
-            "details": exposure.details,
-        },
-        "quality": {
-            "originality": quality.originality,
-            "compliance": quality.compliance,
-            "richness": quality.richness,
-            "score": quality.score,
-        },
-        "insights": {
-            "strengths": strengths,
-            "weaknesses": weaknesses,
-            "recommendation": recommendation,
+        "blog_score": blog_score,
+        "activity": _activity_section(activity),
+        "content": _content_section(content, posts),
+        "exposure": _exposure_section(exposure),
+        "quality": _quality_section(quality),
+        "profile": profile_info,
+        "insights": insights,
+        "meta": {
+            "timings": t.as_dict(),
+            "degraded": deadline.degraded,
+            # 단계 그래프 실제 소요 vs 같은 단계를 순차 실행했을 때의 합
+            "latency": run.latency(),
         },
     }
@@ -0,0 +1,272 @@
+"""
+블로그 일괄 분석 — 대행사/운영팀의 블로그 목록(50~500개) 검수용.
+
+블로그마다 /api/blog-analysis를 따로 호출하면 호출마다 클라이언트가 새로 생기고
+비슷한 블로그끼리 겹치는 역검색 키워드를 매번 다시 검색한다.
+여기서는 하나의 제한된 스레드풀(동시 분석 수)과 공유 검색 캐시로 처리:
+  1. 입력 URL/ID → blogger_id 정규화 + 중복 제거 (잘못된 항목은 즉시 error 줄)
+  2. 48시간 분석 이력(blog_analyses)이 있으면 재사용 (force_refresh 제외)
+  3. 나머지는 analyze_blog로 분석 — 검색은 SharedSearchClient가 배치 전체에서 1회만 호출
+  4. 블로거 하나가 끝날 때마다 on_item으로 결과 전달 (app은 NDJSON 한 줄로 스트리밍)
+
+CLI:
+    python -m backend.blog_batch blogs.txt [--store-id 3] [--workers 4] [--deadline-ms 30000]
+    blogs.txt = 한 줄에 블로그 URL 또는 ID 하나 → 표준 출력에 NDJSON
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.admin_db import log_phase_timings
+from backend.blog_analyzer import analyze_blog, extract_blogger_id
+from backend.cancellation import AnalysisCancelled, CancelToken, checkpoint
+from backend.db import DB_PATH, conn_ctx, get_latest_blog_analysis, init_db, insert_blog_analysis
+from backend.keywords import StoreProfile
+from backend.naver_client import NaverBlogSearchClient, get_env_client
+from backend.search_results import IndexedSearchResult, index_items
+
+logger = logging.getLogger(__name__)
+
+ItemCb = Callable[[dict], None]
+ProgressCb = Callable[[dict], None]
+
+MAX_BLOGS = 500
+
+
+class SharedSearchClient:
+    """배치 전체가 공유하는 검색 클라이언트 — 같은 쿼리는 1회만 호출 (동시 요청은 합침).
+
+    결과는 blogger_id 인덱스를 1회만 계산해 보관하고 호출마다 인덱스를 공유하는 복사본을 반환.
+    """
+
+    def __init__(self, client: NaverBlogSearchClient) -> None:
+        self._client = client
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[str, int, int, str], concurrent.futures.Future] = {}
+        self.requested = 0
+
+    def search_blog(self, query: str, display: int = 30, start: int = 1, sort: str = "sim") -> IndexedSearchResult:
+        key = (query, display, start, sort)
+        with self._lock:
+            self.requested += 1
+            fut = self._results.get(key)
+            owner = fut is None
+            if owner:
+                fut = concurrent.futures.Future()
+                self._results[key] = fut
+        if owner:
+            try:
+                fut.set_result(index_items(self._client.search_blog(query=query, display=display, start=start, sort=sort)))
+            except Exception as e:
+                # 실패한 쿼리는 다음 블로거가 다시 시도할 수 있게 제거
+                with self._lock:
+                    self._results.pop(key, None)
+                fut.set_exception(e)
+        return fut.result().copy()
+
+    @property
+    def unique(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+
+def load_store_profile(conn, store_id: Optional[int]) -> Optional[StoreProfile]:
+    """stores 행 → StoreProfile (없으면 None, _sync_blog_analysis와 동일)."""
+    if not store_id:
+        return None
+    row = conn.execute(
+        "SELECT region_text, category_text, store_name, address_text, place_url, topic FROM stores WHERE store_id=?",
+        (store_id,),
+    ).fetchone()
+    if not row:
+        return None
+    return StoreProfile(
+        region_text=row["region_text"],
+        category_text=row["category_text"],
+        topic=row["topic"],
+        store_name=row["store_name"],
+        address_text=row["address_text"],
+        place_url=row["place_url"],
+    )
+
+
+def analyze_and_store(
+    blogger_id: str,
+    client: SharedSearchClient,
+    store_profile: Optional[StoreProfile],
+    store_id: Optional[int],
+    force_refresh: bool,
+    cancel_token: Optional[CancelToken],
+    deadline_ms: Optional[int],
+    db_path: Path,
+) -> Dict[str, Any]:
+    """블로거 1명 분석 + blog_analyses 저장 (_sync_blog_analysis의 라이브 경로와 동일)."""
+    if not force_refresh:
+        try:
+            with conn_ctx(db_path) as conn:
+                cached = get_latest_blog_analysis(conn, blogger_id, store_id, ttl_hours=48)
+            if cached:
+                result = json.loads(cached["result_json"])
+                result["from_cache"] = True
+                result["cached_at"] = cached["created_at"]
+                return result
+        except Exception:
+            pass  # 캐시 실패 시 라이브 분석
+
+    checkpoint(cancel_token)
+    result = analyze_blog(
+        blog_url_or_id=blogger_id,
+        client=client,
+        store_profile=store_profile,
+        cancel_token=cancel_token,
+        deadline_ms=deadline_ms,
+        db_path=db_path,
+    )
+    with conn_ctx(db_path) as conn:
+        if not result["meta"]["degraded"]:
+            insert_blog_analysis(
+                conn,
+                blogger_id=result["blogger_id"],
+                blog_url=result["blog_url"],
+                analysis_mode=result["analysis_mode"],
+                store_id=store_id,
+                blog_score=result["blog_score"]["total"],
+                grade=result["blog_score"]["grade"],
+                result_json=json.dumps(result, ensure_ascii=False),
+            )
+        try:
+            log_phase_timings(conn, "blog_analysis", result.get("meta", {}).get("timings", {}))
+        except Exception:
+            pass
+    result["from_cache"] = False
+    return result
+
+
+def run_blog_batch(
+    blogs: List[str],
+    store_id: Optional[int] = None,
+    client: Optional[NaverBlogSearchClient] = None,
+    on_item: Optional[ItemCb] = None,
+    progress_cb: Optional[ProgressCb] = None,
+    max_workers: int = 4,
+    deadline_ms: Optional[int] = None,
+    force_refresh: bool = False,
+    cancel_token: Optional[CancelToken] = None,
+    db_path: Path = DB_PATH,
+) -> Dict[str, Any]:
+    """블로그 목록 일괄 분석. 블로거마다 끝나는 즉시 on_item 호출, 항목별 실패는 error 줄로 기록하고 계속.
+
+    on_item 메시지:
+        {"type": "result", "index", "input", "blogger_id", "elapsed_ms", "result"}
+        {"type": "error", "index", "input", "blogger_id", "error"}
+    반환(요약): {"total", "unique", "duplicates", "succeeded", "failed", "from_cache",
+                "searches_requested", "searches_unique", "elapsed_sec", "blogs_per_minute"}
+    """
+    emit_item = on_item or (lambda _: None)
+    emit = progress_cb or (lambda _: None)
+    shared = SharedSearchClient(client or get_env_client())
+    started = time.perf_counter()
+
+    # 입력 정규화 + 중복 제거 (같은 블로거는 첫 항목만 분석)
+    jobs: List[Tuple[int, str, str]] = []
+    seen: Dict[str, int] = {}
+    failed = duplicates = 0
+    for i, raw in enumerate(blogs):
+        text = (raw or "").strip()
+        bid = extract_blogger_id(text) if text else None
+        if not bid:
+            failed += 1
+            emit_item({"type": "error", "index": i, "input": text, "blogger_id": None,
+                       "error": "유효하지 않은 블로그 URL/ID입니다."})
+            continue
+        if bid in seen:
+            duplicates += 1
+            continue
+        seen[bid] = i
+        jobs.append((i, text, bid))
+
+    with conn_ctx(db_path) as conn:
+        store_profile = load_store_profile(conn, store_id)
+
+    succeeded = from_cache = 0
+    done = 0
+    emit({"stage": "bulk", "current": 0, "total": len(jobs), "message": f"블로그 {len(jobs)}개 분석 시작"})
+
+    def _run(job: Tuple[int, str, str]) -> Tuple[Tuple[int, str, str], Dict[str, Any], float]:
+        t0 = time.perf_counter()
+        result = analyze_and_store(job[2], shared, store_profile, store_id, force_refresh,
+                                   cancel_token, deadline_ms, db_path)
+        return job, result, (time.perf_counter() - t0) * 1000.0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {pool.submit(_run, job): job for job in jobs}
+        for fut in concurrent.futures.as_completed(futures):
+            i, text, bid = futures[fut]
+            done += 1
+            try:
+                _, result, elapsed_ms = fut.result()
+            except AnalysisCancelled:
+                continue
+            except Exception as e:
+                logger.warning("bulk blog analysis failed for %s: %s", bid, e)
+                failed += 1
+                emit_item({"type": "error", "index": i, "input": text, "blogger_id": bid, "error": str(e)})
+            else:
+                succeeded += 1
+                from_cache += 1 if result.get("from_cache") else 0
+                emit_item({"type": "result", "index": i, "input": text, "blogger_id": bid,
+                           "elapsed_ms": round(elapsed_ms, 1), "result": result})
+            emit({"stage": "bulk", "current": done, "total": len(jobs), "message": f"{bid} 완료"})
+
+    elapsed = time.perf_counter() - started
+    return {
+        "total": len(blogs),
+        "unique": len(jobs),
+        "duplicates": duplicates,
+        "succeeded": succeeded,
+        "failed": failed,
+        "from_cache": from_cache,
+        "searches_requested": shared.requested,
+        "searches_unique": shared.unique,
+        "elapsed_sec": round(elapsed, 1),
+        "blogs_per_minute": round(succeeded / max(elapsed / 60.0, 1e-9), 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="블로그 일괄 분석")
+    parser.add_argument("blogs_file", help="블로그 URL/ID 목록 (한 줄에 하나)")
+    parser.add_argument("--store-id", type=int, default=None, help="매장 연계 분석")
+    parser.add_argument("--workers", type=int, default=4, help="동시 분석 블로거 수")
+    parser.add_argument("--deadline-ms", type=int, default=None, help="블로거별 시간 예산")
+    parser.add_argument("--force-refresh", action="store_true", help="48시간 분석 이력 무시")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    with open(args.blogs_file, encoding="utf-8") as f:
+        blogs = [line.strip() for line in f if line.strip()]
+    with conn_ctx() as conn:
+        init_db(conn)
+
+    summary = run_blog_batch(
+        blogs,
+        store_id=args.store_id,
+        on_item=lambda item: print(json.dumps(item, ensure_ascii=False), flush=True),
+        max_workers=args.workers,
+        deadline_ms=args.deadline_ms,
+        force_refresh=args.force_refresh,
+    )
+    print(json.dumps({"type": "summary", **summary}, ensure_ascii=False))
+    return 0 if not summary["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
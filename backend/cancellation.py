@@ -0,0 +1,39 @@
+"""
+협력적 취소 — SSE 클라이언트 연결 종료 시 진행 중인 분석을 다음 체크포인트에서 중단.
+
+엔드포인트가 CancelToken을 만들어 BloggerAnalyzer / analyze_blog에 전달하고,
+request.is_disconnected()가 참이 되면 cancel()을 호출한다.
+이미 완료된 API 호출 결과(api_cache)와 프로필 캐시는 그대로 유지된다.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+
+class AnalysisCancelled(Exception):
+    """클라이언트 연결 종료로 분석이 취소됨."""
+
+
+class CancelToken:
+    """스레드 안전 취소 플래그."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise AnalysisCancelled("분석이 취소되었습니다 (클라이언트 연결 종료)")
+
+
+def checkpoint(token: Optional[CancelToken]) -> None:
+    """token이 있으면 취소 여부 확인 (None이면 no-op)."""
+    if token is not None:
+        token.raise_if_cancelled()
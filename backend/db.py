@@ -109,6 +109,25 @@ def init_db(conn: sqlite3.Connection) -> None:
     _safe_add_column(conn, "exposures", "post_link", "TEXT")
     _safe_add_column(conn, "exposures", "post_title", "TEXT")
 
+    # exposure_checks 테이블: 희소 저장 모드의 "확인했으나 미노출" 기록
+    # (store, keyword, date)당 1행 + 확인 대상 블로거 코호트(JSON 배열)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS exposure_checks (
+          store_id         INTEGER NOT NULL,
+          keyword          TEXT NOT NULL,
+          checked_date     TEXT NOT NULL,
+          checked_at       TEXT NOT NULL,
+          blogger_ids_json TEXT NOT NULL DEFAULT '[]',
+          PRIMARY KEY (store_id, keyword, checked_date),
+          FOREIGN KEY(store_id) REFERENCES stores(store_id) ON DELETE CASCADE
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_exposure_checks_store_date ON exposure_checks(store_id, checked_at)"
+    )
+
     # bloggers 테이블: base_score, tier_score, tier_grade
     _safe_add_column(conn, "bloggers", "base_score", "REAL")
     _safe_add_column(conn, "bloggers", "tier_score", "REAL")
@@ -334,6 +353,140 @@ def init_db(conn: sqlite3.Connection) -> None:
     )
     conn.execute("CREATE INDEX IF NOT EXISTS idx_blog_profiles_expires ON blog_profiles(expires_at)")
 
+    # profile_source_stats: 프로필 스크래핑 소스별 성공/지연/기여 통계 (적응형 소스 계획용)
+    # useful = 다른 소스가 주지 못한 필드를 채운 횟수. 시도 500회마다 절반으로 감쇠(최근 위주)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS profile_source_stats (
+          source     TEXT PRIMARY KEY,
+          attempts   REAL NOT NULL DEFAULT 0,
+          successes  REAL NOT NULL DEFAULT 0,
+          useful     REAL NOT NULL DEFAULT 0,
+          total_ms   REAL NOT NULL DEFAULT 0,
+          updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """
+    )
+
+    # rss_feeds 캐시 테이블: RSS 검증자(ETag/Last-Modified) + 파싱된 포스트 (마지막 검증 후 7일 보관)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rss_feeds (
+          blogger_id    TEXT PRIMARY KEY,
+          etag          TEXT,
+          last_modified TEXT,
+          posts_json    TEXT NOT NULL,
+          validated_at  TEXT NOT NULL DEFAULT (datetime('now')),
+          expires_at    TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rss_feeds_expires ON rss_feeds(expires_at)")
+
+    # post_samples: 포스트 페이지 실측 (이미지 수/본문 길이) — 발행된 글은 거의 바뀌지 않으므로 30일 보관
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS post_samples (
+          blog_id        TEXT NOT NULL,
+          log_no         TEXT NOT NULL,
+          image_count    INTEGER NOT NULL,
+          content_length INTEGER NOT NULL,
+          created_at     TEXT NOT NULL DEFAULT (datetime('now')),
+          expires_at     TEXT NOT NULL,
+          PRIMARY KEY (blog_id, log_no)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_post_samples_expires ON post_samples(expires_at)")
+
+    # post_simhashes: 수집한 RSS 포스트 description SimHash + LSH 밴드(16비트 × 4) — 블로거 간 근사 중복 탐지
+    # simhash/band는 부호 있는 64비트로 저장 (dup_index._to_signed). 마지막 수집 후 90일 보관
+    # first_seen_at: 최초 수집 시각(밀리초, 재수집해도 유지) — 원작자와 복제 블로거 구분용
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS post_simhashes (
+          link        TEXT PRIMARY KEY,
+          blogger_id  TEXT NOT NULL,
+          simhash     INTEGER NOT NULL,
+          band0       INTEGER NOT NULL,
+          band1       INTEGER NOT NULL,
+          band2       INTEGER NOT NULL,
+          band3       INTEGER NOT NULL,
+          indexed_at  TEXT NOT NULL DEFAULT (datetime('now')),
+          expires_at  TEXT NOT NULL,
+          first_seen_at TEXT
+        )
+        """
+    )
+    _safe_add_column(conn, "post_simhashes", "first_seen_at", "TEXT")
+    for i in range(4):
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_post_simhashes_band{i} ON post_simhashes(band{i})")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_post_simhashes_blogger ON post_simhashes(blogger_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_post_simhashes_expires ON post_simhashes(expires_at)")
+
+    # influencer_refresh_log: 인플루언서 점수 백그라운드 재분석 기록 (lag_hours = 재분석 시점의 last_analysis 경과 시간)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS influencer_refresh_log (
+          log_id       INTEGER PRIMARY KEY AUTOINCREMENT,
+          profile_id   INTEGER NOT NULL,
+          lag_hours    REAL NOT NULL,
+          ok           INTEGER NOT NULL,
+          score_delta  REAL NOT NULL DEFAULT 0,
+          refreshed_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_inf_refresh_at ON influencer_refresh_log(refreshed_at)")
+
+    # blogger_store_signals: 매장 키워드에 의존하는 블로거 신호 (매장 분석 tier 단계에서 계산, 리포트 GoldenScore 입력)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS blogger_store_signals (
+          store_id     INTEGER NOT NULL,
+          blogger_id   TEXT NOT NULL,
+          tfidf_sim    REAL NOT NULL DEFAULT 0,
+          computed_at  TEXT NOT NULL DEFAULT (datetime('now')),
+          PRIMARY KEY (store_id, blogger_id),
+          FOREIGN KEY(store_id) REFERENCES stores(store_id) ON DELETE CASCADE
+        )
+        """
+    )
+
+    # negative_cache: 없는/비공개/응답 없는 블로그 음성 결과 (kind = rss|profile, 사유별 짧은 TTL)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS negative_cache (
+          kind       TEXT NOT NULL,
+          blogger_id TEXT NOT NULL,
+          reason     TEXT NOT NULL,
+          created_at TEXT NOT NULL DEFAULT (datetime('now')),
+          expires_at TEXT NOT NULL,
+          PRIMARY KEY (kind, blogger_id)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_negative_cache_expires ON negative_cache(expires_at)")
+
+    # region_candidate_pools: 지역 공유 후보 풀 (region_power/broad 검색 결과 + 후보 RSS, TTL 24시간)
+    # pool_key = phase + 쿼리 목록 → 같은 지역·같은 카테고리 버킷의 매장이 공유
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS region_candidate_pools (
+          pool_key      TEXT PRIMARY KEY,
+          region_text   TEXT NOT NULL,
+          phase         TEXT NOT NULL,
+          queries_json  TEXT NOT NULL,
+          postings_json TEXT NOT NULL,
+          rss_json      TEXT NOT NULL DEFAULT '{}',
+          hit_count     INTEGER NOT NULL DEFAULT 0,
+          created_at    TEXT NOT NULL DEFAULT (datetime('now')),
+          expires_at    TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_region_pools_expires ON region_candidate_pools(expires_at)")
+
 
 def upsert_store(
     conn: sqlite3.Connection,
@@ -605,6 +758,53 @@ def insert_exposure_fact(
     )
 
 
+def insert_exposure_check(
+    conn: sqlite3.Connection,
+    store_id: int,
+    keyword: str,
+    checked_blogger_ids: List[str],
+    exposed_blogger_ids: List[str],
+) -> None:
+    """희소 저장 모드: 키워드 1개에 대한 노출 확인 기록 (일별 유니크).
+
+    순위 적중(hit)은 insert_exposure_fact로 저장하고, 여기서는
+    확인 대상 코호트만 남긴다. 같은 날 재검색에서 미노출로 바뀐 블로거의
+    기존 hit 행은 삭제 → 밀집 저장의 rank=NULL 덮어쓰기와 동일한 결과.
+    """
+    exposed = set(exposed_blogger_ids)
+    absent = [bid for bid in checked_blogger_ids if bid not in exposed]
+    if absent:
+        conn.execute(
+            """
+            DELETE FROM exposures
+            WHERE store_id = ? AND keyword = ? AND checked_date = date('now')
+              AND blogger_id IN (SELECT value FROM json_each(?))
+            """,
+            (store_id, keyword, json.dumps(absent, ensure_ascii=False)),
+        )
+
+    row = conn.execute(
+        """
+        SELECT blogger_ids_json FROM exposure_checks
+        WHERE store_id = ? AND keyword = ? AND checked_date = date('now')
+        """,
+        (store_id, keyword),
+    ).fetchone()
+    cohort = json.loads(row["blogger_ids_json"]) if row else []
+    seen = set(cohort)
+    cohort.extend(bid for bid in checked_blogger_ids if bid not in seen)
+
+    conn.execute(
+        """
+        INSERT INTO exposure_checks(store_id, keyword, checked_date, checked_at, blogger_ids_json)
+        VALUES (?, ?, date('now'), datetime('now'), ?)
+        ON CONFLICT(store_id, keyword, checked_date) DO UPDATE SET
+          blogger_ids_json=excluded.blogger_ids_json
+        """,
+        (store_id, keyword, json.dumps(cohort, ensure_ascii=False)),
+    )
+
+
 def insert_blog_analysis(
     conn: sqlite3.Connection,
     blogger_id: str,
@@ -762,12 +962,338 @@ def set_cached_profile(conn: sqlite3.Connection, blogger_id: str, profile_data:
     )
 
 
+def record_profile_source_stats(conn: sqlite3.Connection, samples: Dict[str, Dict[str, Any]]) -> None:
+    """프로필 1건의 소스별 결과 누적. samples = {source: {"ok": bool, "ms": float, "added": [필드]}}"""
+    for source, sample in samples.items():
+        conn.execute(
+            """
+            INSERT INTO profile_source_stats (source, attempts, successes, useful, total_ms)
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT(source) DO UPDATE SET
+              attempts  = CASE WHEN attempts >= 500 THEN attempts / 2 ELSE attempts END + 1,
+              successes = CASE WHEN attempts >= 500 THEN successes / 2 ELSE successes END + excluded.successes,
+              useful    = CASE WHEN attempts >= 500 THEN useful / 2 ELSE useful END + excluded.useful,
+              total_ms  = CASE WHEN attempts >= 500 THEN total_ms / 2 ELSE total_ms END + excluded.total_ms,
+              updated_at = datetime('now')
+            """,
+            (source, 1 if sample.get("ok") else 0, 1 if sample.get("added") else 0, float(sample.get("ms", 0.0))),
+        )
+
+
+def get_profile_source_stats(conn: sqlite3.Connection) -> Dict[str, Dict[str, float]]:
+    """{source: {"attempts", "success_rate", "yield_rate", "avg_ms"}}"""
+    rows = conn.execute("SELECT source, attempts, successes, useful, total_ms FROM profile_source_stats").fetchall()
+    return {
+        r["source"]: {
+            "attempts": r["attempts"],
+            "success_rate": round(r["successes"] / r["attempts"], 3) if r["attempts"] else 0.0,
+            "yield_rate": round(r["useful"] / r["attempts"], 3) if r["attempts"] else 0.0,
+            "avg_ms": round(r["total_ms"] / r["attempts"], 1) if r["attempts"] else 0.0,
+        }
+        for r in rows
+    }
+
+
+def get_cached_rss(conn: sqlite3.Connection, blogger_id: str) -> Optional[Dict[str, Any]]:
+    """캐시된 RSS 피드 (etag, last_modified, posts_json, age_seconds=마지막 검증 후 경과 초), 없으면 None."""
+    row = conn.execute(
+        """
+        SELECT etag, last_modified, posts_json,
+               (julianday('now') - julianday(validated_at)) * 86400.0 AS age_seconds
+        FROM rss_feeds
+        WHERE blogger_id=? AND expires_at > datetime('now')
+        """,
+        (blogger_id,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
+def set_cached_rss(
+    conn: sqlite3.Connection,
+    blogger_id: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    posts_json: str,
+) -> None:
+    """RSS 피드 캐시 저장 (200 응답 — 검증자 + 파싱 결과 교체)."""
+    conn.execute(
+        """
+        INSERT INTO rss_feeds (blogger_id, etag, last_modified, posts_json, expires_at)
+        VALUES (?, ?, ?, ?, datetime('now', '+7 days'))
+        ON CONFLICT(blogger_id) DO UPDATE SET
+          etag=excluded.etag,
+          last_modified=excluded.last_modified,
+          posts_json=excluded.posts_json,
+          validated_at=datetime('now'),
+          expires_at=excluded.expires_at
+        """,
+        (blogger_id, etag, last_modified, posts_json),
+    )
+
+
+def touch_cached_rss(conn: sqlite3.Connection, blogger_id: str) -> None:
+    """304 응답 — 파싱 결과는 유지하고 검증 시각/보관 기한만 갱신."""
+    conn.execute(
+        "UPDATE rss_feeds SET validated_at=datetime('now'), expires_at=datetime('now', '+7 days') WHERE blogger_id=?",
+        (blogger_id,),
+    )
+
+
+def get_post_samples(conn: sqlite3.Connection, keys: List[tuple]) -> Dict[tuple, Dict[str, int]]:
+    """캐시된 포스트 실측 {(blog_id, log_no): {"image_count", "content_length"}} (없는 키는 제외)."""
+    out: Dict[tuple, Dict[str, int]] = {}
+    for blog_id, log_no in keys:
+        row = conn.execute(
+            """
+            SELECT image_count, content_length FROM post_samples
+            WHERE blog_id=? AND log_no=? AND expires_at > datetime('now')
+            """,
+            (blog_id, log_no),
+        ).fetchone()
+        if row:
+            out[(blog_id, log_no)] = {"image_count": row["image_count"], "content_length": row["content_length"]}
+    return out
+
+
+def save_post_sample(
+    conn: sqlite3.Connection, blog_id: str, log_no: str, image_count: int, content_length: int,
+) -> None:
+    """포스트 실측 저장 (TTL 30일)."""
+    conn.execute(
+        """
+        INSERT INTO post_samples (blog_id, log_no, image_count, content_length, expires_at)
+        VALUES (?, ?, ?, ?, datetime('now', '+30 days'))
+        ON CONFLICT(blog_id, log_no) DO UPDATE SET
+          image_count=excluded.image_count,
+          content_length=excluded.content_length,
+          created_at=datetime('now'),
+          expires_at=excluded.expires_at
+        """,
+        (blog_id, log_no, image_count, content_length),
+    )
+
+
+def upsert_blogger_store_signals(conn: sqlite3.Connection, store_id: int, rows: List[tuple]) -> None:
+    """(매장, 블로거) 신호 저장 — rows: (blogger_id, tfidf_sim). 재분석 시 최신 값으로 교체."""
+    conn.executemany(
+        """
+        INSERT INTO blogger_store_signals (store_id, blogger_id, tfidf_sim)
+        VALUES (?, ?, ?)
+        ON CONFLICT(store_id, blogger_id) DO UPDATE SET
+          tfidf_sim=excluded.tfidf_sim,
+          computed_at=datetime('now')
+        """,
+        [(store_id, bid, tfidf) for bid, tfidf in rows],
+    )
+
+
+def upsert_post_simhashes(conn: sqlite3.Connection, rows: List[tuple], ttl_days: int = 90) -> None:
+    """포스트 SimHash 저장 — rows: (link, blogger_id, simhash, band0, band1, band2, band3), 재수집 시 보관 기한 연장.
+
+    first_seen_at은 처음 저장할 때만 기록 (재수집해도 덮어쓰지 않음).
+    """
+    conn.executemany(
+        """
+        INSERT INTO post_simhashes (link, blogger_id, simhash, band0, band1, band2, band3, expires_at, first_seen_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now', ?), strftime('%Y-%m-%d %H:%M:%f', 'now'))
+        ON CONFLICT(link) DO UPDATE SET
+          blogger_id=excluded.blogger_id,
+          simhash=excluded.simhash,
+          band0=excluded.band0, band1=excluded.band1, band2=excluded.band2, band3=excluded.band3,
+          indexed_at=datetime('now'),
+          expires_at=excluded.expires_at
+        """,
+        [(*r, f"+{ttl_days} days") for r in rows],
+    )
+
+
+def find_simhash_band_matches(
+    conn: sqlite3.Connection, bands: List[List[int]], exclude_blogger_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """밴드 i 값이 bands[i] 중 하나와 같은 포스트 (link, blogger_id, simhash, first_seen_at) — LSH 후보 (검증 전)."""
+    clauses, params = [], []
+    for i, values in enumerate(bands):
+        if values:
+            clauses.append(f"band{i} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+    if not clauses:
+        return []
+    sql = (
+        "SELECT link, blogger_id, simhash, COALESCE(first_seen_at, indexed_at) AS first_seen_at "
+        f"FROM post_simhashes WHERE ({' OR '.join(clauses)})"
+    )
+    if exclude_blogger_id is not None:
+        sql += " AND blogger_id != ?"
+        params.append(exclude_blogger_id)
+    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+
+
+def get_simhash_first_seen(conn: sqlite3.Connection, links: List[str]) -> Dict[str, str]:
+    """저장된 포스트의 최초 수집 시각 {link: first_seen_at} (없는 링크는 제외)."""
+    if not links:
+        return {}
+    rows = conn.execute(
+        f"SELECT link, COALESCE(first_seen_at, indexed_at) AS first_seen_at FROM post_simhashes "
+        f"WHERE link IN ({','.join('?' * len(links))})",
+        links,
+    ).fetchall()
+    return {r["link"]: r["first_seen_at"] for r in rows}
+
+
+def list_crowded_simhash_buckets(
+    conn: sqlite3.Connection, band: int, min_bloggers: int, limit: int,
+) -> List[Dict[str, Any]]:
+    """밴드 band에서 서로 다른 블로거 min_bloggers명 이상이 모인 버킷 (bucket, bloggers) — 많은 순."""
+    rows = conn.execute(
+        f"""
+        SELECT band{band} AS bucket, COUNT(DISTINCT blogger_id) AS bloggers
+        FROM post_simhashes
+        GROUP BY band{band}
+        HAVING bloggers >= ?
+        ORDER BY bloggers DESC
+        LIMIT ?
+        """,
+        (min_bloggers, limit),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def list_simhash_bucket(conn: sqlite3.Connection, band: int, bucket: int) -> List[Dict[str, Any]]:
+    """밴드 band 값이 bucket인 포스트 (link, blogger_id, simhash)."""
+    rows = conn.execute(
+        f"SELECT link, blogger_id, simhash FROM post_simhashes WHERE band{band}=?", (bucket,),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_negative_entries(conn: sqlite3.Connection, kind: str, blogger_ids: List[str]) -> Dict[str, str]:
+    """유효한 음성 항목 {blogger_id: reason} (없는 ID는 제외)."""
+    if not blogger_ids:
+        return {}
+    placeholders = ",".join("?" * len(blogger_ids))
+    rows = conn.execute(
+        f"""
+        SELECT blogger_id, reason FROM negative_cache
+        WHERE kind=? AND blogger_id IN ({placeholders}) AND expires_at > datetime('now')
+        """,
+        (kind, *blogger_ids),
+    ).fetchall()
+    return {r["blogger_id"]: r["reason"] for r in rows}
+
+
+def set_negative_entry(conn: sqlite3.Connection, kind: str, blogger_id: str, reason: str, ttl_seconds: int) -> None:
+    """음성 항목 저장/갱신 (사유와 만료 시각 교체)."""
+    conn.execute(
+        """
+        INSERT INTO negative_cache (kind, blogger_id, reason, expires_at)
+        VALUES (?, ?, ?, datetime('now', ?))
+        ON CONFLICT(kind, blogger_id) DO UPDATE SET
+          reason=excluded.reason,
+          created_at=datetime('now'),
+          expires_at=excluded.expires_at
+        """,
+        (kind, blogger_id, reason, f"+{int(ttl_seconds)} seconds"),
+    )
+
+
+def clear_negative_entry(conn: sqlite3.Connection, kind: str, blogger_id: str) -> None:
+    conn.execute("DELETE FROM negative_cache WHERE kind=? AND blogger_id=?", (kind, blogger_id))
+
+
+def negative_entry_exists(conn: sqlite3.Connection, kind: str, blogger_id: str) -> bool:
+    """만료 여부와 관계없이 행이 남아 있는지 (삭제 전 확인용 — 없으면 쓰기 트랜잭션 생략)."""
+    row = conn.execute("SELECT 1 FROM negative_cache WHERE kind=? AND blogger_id=?", (kind, blogger_id)).fetchone()
+    return row is not None
+
+
+def negative_cache_version(conn: sqlite3.Connection) -> tuple:
+    """(행 수, 최대 rowid, 최근 created_at) — 다른 프로세스의 기록/삭제/갱신 감지용."""
+    row = conn.execute("SELECT COUNT(*), MAX(rowid), MAX(created_at) FROM negative_cache").fetchone()
+    return tuple(row)
+
+
+def list_negative_keys(conn: sqlite3.Connection) -> List[tuple]:
+    """유효한 음성 항목의 (kind, blogger_id) 목록 — 블룸 필터 적재용."""
+    rows = conn.execute("SELECT kind, blogger_id FROM negative_cache WHERE expires_at > datetime('now')").fetchall()
+    return [(r["kind"], r["blogger_id"]) for r in rows]
+
+
+def get_region_pool(conn: sqlite3.Connection, pool_key: str) -> Optional[Dict[str, Any]]:
+    """유효한 지역 후보 풀 반환 (hit_count 증가), 없거나 만료 시 None."""
+    row = conn.execute(
+        """
+        SELECT pool_key, region_text, phase, queries_json, postings_json, rss_json, created_at
+        FROM region_candidate_pools
+        WHERE pool_key=? AND expires_at > datetime('now')
+        """,
+        (pool_key,),
+    ).fetchone()
+    if not row:
+        return None
+    conn.execute("UPDATE region_candidate_pools SET hit_count = hit_count + 1 WHERE pool_key=?", (pool_key,))
+    return dict(row)
+
+
+def save_region_pool(
+    conn: sqlite3.Connection,
+    pool_key: str,
+    region_text: str,
+    phase: str,
+    queries_json: str,
+    postings_json: str,
+    rss_json: str = "{}",
+    ttl_hours: int = 24,
+) -> None:
+    """지역 후보 풀 저장/갱신 (갱신 시 hit_count 유지)."""
+    expires = (datetime.utcnow() + timedelta(hours=ttl_hours)).strftime("%Y-%m-%d %H:%M:%S")
+    conn.execute(
+        """
+        INSERT INTO region_candidate_pools
+          (pool_key, region_text, phase, queries_json, postings_json, rss_json, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(pool_key) DO UPDATE SET
+          postings_json=excluded.postings_json,
+          rss_json=excluded.rss_json,
+          created_at=datetime('now'),
+          expires_at=excluded.expires_at
+        """,
+        (pool_key, region_text, phase, queries_json, postings_json, rss_json, expires),
+    )
+
+
+def update_region_pool_rss(conn: sqlite3.Connection, pool_key: str, rss_json: str) -> None:
+    """풀 후보의 RSS 결과만 갱신 (tier 분석 후 채움)."""
+    conn.execute("UPDATE region_candidate_pools SET rss_json=? WHERE pool_key=?", (rss_json, pool_key))
+
+
+def list_region_pools_due(conn: sqlite3.Connection, within_hours: int = 6, limit: int = 20) -> List[Dict[str, Any]]:
+    """곧 만료되는(within_hours 이내) 사용 중인 풀 — 정기 갱신 대상 (hit_count 높은 순)."""
+    rows = conn.execute(
+        """
+        SELECT pool_key, region_text, phase, queries_json, hit_count, expires_at
+        FROM region_candidate_pools
+        WHERE hit_count > 0 AND expires_at <= datetime('now', ?)
+        ORDER BY hit_count DESC
+        LIMIT ?
+        """,
+        (f"+{within_hours} hours", limit),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
 def cleanup_expired_cache(conn: sqlite3.Connection) -> Dict[str, int]:
-    """만료된 api_cache + search_snapshots + blog_profiles 일괄 삭제. 삭제 건수 반환."""
+    """만료된 api_cache + search_snapshots + blog_profiles + 지역 후보 풀 + RSS 캐시 + 음성 캐시 + 포스트 실측 + 포스트 SimHash 일괄 삭제. 삭제 건수 반환."""
     c1 = conn.execute("DELETE FROM api_cache WHERE expires_at <= datetime('now')").rowcount
     c2 = conn.execute("DELETE FROM search_snapshots WHERE expires_at <= datetime('now')").rowcount
     c3 = conn.execute("DELETE FROM blog_profiles WHERE expires_at <= datetime('now')").rowcount
-    return {"api_cache_deleted": c1, "snapshots_deleted": c2, "profiles_deleted": c3}
+    c4 = conn.execute("DELETE FROM region_candidate_pools WHERE expires_at <= datetime('now')").rowcount
+    c5 = conn.execute("DELETE FROM rss_feeds WHERE expires_at <= datetime('now')").rowcount
+    c6 = conn.execute("DELETE FROM negative_cache WHERE expires_at <= datetime('now')").rowcount
+    c7 = conn.execute("DELETE FROM post_samples WHERE expires_at <= datetime('now')").rowcount
+    c8 = conn.execute("DELETE FROM post_simhashes WHERE expires_at <= datetime('now')").rowcount
+    return {"api_cache_deleted": c1, "snapshots_deleted": c2, "profiles_deleted": c3,
+            "region_pools_deleted": c4, "rss_feeds_deleted": c5, "negative_deleted": c6,
+            "post_samples_deleted": c7, "post_simhashes_deleted": c8}
 
 
 # ============================
@@ -902,6 +1428,75 @@ def list_influencer_profiles(
     return [dict(r) for r in rows]
 
 
+def list_influencer_refresh_candidates(
+    conn: sqlite3.Connection, match_days: int = 14, failure_hours: int = 24,
+) -> List[Dict[str, Any]]:
+    """재분석 우선순위 입력: 프로필별 last_analysis 경과 시간(age_hours, 없으면 NULL) + 최근 매칭 수
+    + 최근 failure_hours시간 안의 마지막 성공 이후 실패 수(recent_failures)와 마지막 실패 경과 시간(last_failure_hours)."""
+    rows = conn.execute(
+        """
+        SELECT p.profile_id, p.user_mongo_id, p.blog_id, p.is_public, p.golden_score,
+               (julianday('now') - julianday(p.last_analysis)) * 24.0 AS age_hours,
+               (SELECT COUNT(*) FROM matches m
+                WHERE m.influencer_blog_id = p.blog_id AND m.requested_at >= datetime('now', ?)) AS recent_matches,
+               COALESCE(f.fails, 0) AS recent_failures,
+               (julianday('now') - julianday(f.last_failed_at)) * 24.0 AS last_failure_hours
+        FROM influencer_profiles p
+        LEFT JOIN (
+            SELECT l.profile_id, COUNT(*) AS fails, MAX(l.refreshed_at) AS last_failed_at
+            FROM influencer_refresh_log l
+            WHERE l.ok = 0 AND l.refreshed_at > datetime('now', ?)
+              AND l.log_id > COALESCE((SELECT MAX(s.log_id) FROM influencer_refresh_log s
+                                       WHERE s.profile_id = l.profile_id AND s.ok = 1), 0)
+            GROUP BY l.profile_id
+        ) f ON f.profile_id = p.profile_id
+        """,
+        (f"-{match_days} days", f"-{failure_hours} hours"),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def update_influencer_scores(conn: sqlite3.Connection, profile_id: int, scores: Dict[str, Any]) -> None:
+    """재분석 결과의 점수 컬럼만 갱신 + last_analysis 갱신 (희망 단가/소개 등 사용자 입력은 유지)."""
+    allowed = {
+        "golden_score", "grade", "grade_label", "base_score",
+        "bp_score", "ep_score", "ca_score", "rq_score", "fr_score", "sp_score",
+        "total_posts", "total_visitors", "total_subscribers",
+    }
+    sets = [f"{k}=?" for k in scores if k in allowed] + ["last_analysis=datetime('now')"]
+    vals = [v for k, v in scores.items() if k in allowed]
+    conn.execute(
+        f"UPDATE influencer_profiles SET {', '.join(sets)} WHERE profile_id=?",
+        (*vals, profile_id),
+    )
+
+
+def log_influencer_refresh(
+    conn: sqlite3.Connection, profile_id: int, lag_hours: float, ok: bool, score_delta: float = 0.0,
+) -> None:
+    conn.execute(
+        "INSERT INTO influencer_refresh_log (profile_id, lag_hours, ok, score_delta) VALUES (?, ?, ?, ?)",
+        (profile_id, lag_hours, 1 if ok else 0, score_delta),
+    )
+
+
+def count_influencer_refreshes(conn: sqlite3.Connection, hours: int = 1) -> int:
+    """최근 hours시간 재분석 시도 수 (시간당 할당량 계산용, 실패 포함)."""
+    return conn.execute(
+        "SELECT COUNT(*) AS cnt FROM influencer_refresh_log WHERE refreshed_at > datetime('now', ?)",
+        (f"-{hours} hours",),
+    ).fetchone()["cnt"]
+
+
+def list_influencer_refresh_lags(conn: sqlite3.Connection, days: int = 7) -> List[float]:
+    """최근 days일 성공한 재분석의 lag_hours 목록."""
+    rows = conn.execute(
+        "SELECT lag_hours FROM influencer_refresh_log WHERE ok=1 AND refreshed_at > datetime('now', ?)",
+        (f"-{days} days",),
+    ).fetchall()
+    return [r["lag_hours"] for r in rows]
+
+
 def count_influencer_profiles(conn: sqlite3.Connection, min_score: float = 0, specialty: str = "") -> int:
     sql = "SELECT COUNT(*) as cnt FROM influencer_profiles WHERE is_public=1 AND golden_score>=?"
     params: list = [min_score]
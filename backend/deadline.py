@@ -0,0 +1,66 @@
+"""
+데드라인 기반 예산 스케줄러 — 남은 시간이 부족하면 선택적 작업을 생략하고 기록.
+
+필수 단계(노출 검증, DB 저장)를 위한 예약 시간을 남겨두고,
+선택적 신호(포스트 샘플링, Blogdex, 데스크톱 프로필 폴백, 하위 RSS 후보)는
+예상 비용(ESTIMATED_COST_MS)이 남은 예산을 넘으면 건너뛴다.
+생략된 신호 이름은 degraded에 누적되어 결과 meta.degraded로 노출된다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 필수 단계(노출 검증 10회 + DB 저장)용 예약 시간
+MANDATORY_RESERVE_MS = 3000
+
+# 선택적 신호 이름 (meta.degraded 값)
+SIGNAL_POST_SAMPLE = "post_sample"
+SIGNAL_BLOGDEX = "blogdex"
+SIGNAL_DESKTOP_PROFILE = "desktop_profile"
+SIGNAL_RSS_TAIL = "rss_tail"
+
+# 선택적 작업 1회 예상 비용 (ms) — /admin/analytics/timings p95 기준 보수적 추정
+ESTIMATED_COST_MS: Dict[str, float] = {
+    SIGNAL_POST_SAMPLE: 1500,      # 포스트 페이지 1개
+    SIGNAL_BLOGDEX: 2000,          # Blogdex 1회
+    SIGNAL_DESKTOP_PROFILE: 1500,  # 데스크톱 블로그 메인 1회
+    SIGNAL_RSS_TAIL: 4000,         # 하위 RSS 후보 40명 (10 workers)
+}
+
+
+class Deadline:
+    """분석 1회의 시간 예산 (deadline_ms=None이면 무제한)."""
+
+    def __init__(self, deadline_ms: Optional[int] = None, reserve_ms: int = 0) -> None:
+        self._end = time.monotonic() + deadline_ms / 1000.0 if deadline_ms else None
+        self.reserve_ms = reserve_ms
+        self._lock = threading.Lock()
+        self._degraded: List[str] = []
+
+    def remaining_ms(self) -> float:
+        if self._end is None:
+            return float("inf")
+        return (self._end - time.monotonic()) * 1000.0
+
+    def allows(self, signal: str, cost_ms: Optional[float] = None) -> bool:
+        """선택적 작업 실행 가능 여부. 불가하면 signal을 degraded에 기록."""
+        if cost_ms is None:
+            cost_ms = ESTIMATED_COST_MS.get(signal, 0.0)
+        if self.remaining_ms() - self.reserve_ms >= cost_ms:
+            return True
+        with self._lock:
+            if signal not in self._degraded:
+                self._degraded.append(signal)
+        return False
+
+    @property
+    def degraded(self) -> List[str]:
+        with self._lock:
+            return list(self._degraded)
+
+
+def allows(deadline: Optional[Deadline], signal: str, cost_ms: Optional[float] = None) -> bool:
+    """deadline이 None이면 항상 허용."""
+    return deadline is None or deadline.allows(signal, cost_ms)
@@ -0,0 +1,214 @@
+"""
+블로거 간 근사 중복 인덱스 — 대행사 원고(템플릿)를 여러 블로거가 그대로 올리는 '템플릿 팜' 탐지.
+
+compute_near_duplicate_rate는 블로거 자신의 포스트끼리만(최근 5개 창) 비교하므로
+서로 다른 블로거 30명이 같은 원고를 올려도 잡지 못한다.
+여기서는 수집한 RSS description의 SimHash를 post_simhashes에 저장하고 LSH 밴드로 조회한다:
+  - 64비트 SimHash를 16비트 밴드 4개로 나눠 밴드별 인덱스에 저장
+  - 해밍 거리 ≤ NEAR_DUP_DISTANCE(3)인 두 해시는 다른 비트가 3개뿐이므로 4개 밴드 중
+    적어도 하나는 정확히 같다 (비둘기집) → 밴드가 일치하는 후보만 검증해도 누락 없음
+  - 조회 비용은 저장된 전체 포스트 수가 아니라 일치 버킷 크기에 비례
+
+수집 시점 저장(fetch_rss, 매장 분석 tier 단계) → cross_blog_duplicates가 블로거의 포스트 중
+다른 블로거 포스트와 근사 중복인 비율을 계산해 compute_game_defense의 cross_blog_dup_rate로 전달.
+원작자가 퍼가기 블로그 때문에 감점되지 않도록, 상대 포스트가 먼저 수집됐거나(first_seen_at)
+같은 원고가 TEMPLATE_MIN_BLOGGERS명 이상에 퍼진 경우만 중복으로 센다.
+
+운영 리포트 (여러 블로거에 걸친 근사 중복 묶음):
+    python -m backend.dup_index --clusters [--min-bloggers 5] [--limit 20]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from backend.db import (
+    DB_PATH, conn_ctx, find_simhash_band_matches, get_simhash_first_seen, init_db, list_crowded_simhash_buckets,
+    list_simhash_bucket, upsert_post_simhashes,
+)
+from backend.post_features import features
+from backend.scoring import hamming_distance
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUP_DISTANCE = 3          # compute_near_duplicate_rate와 같은 근사 중복 기준
+BANDS = 4                      # NEAR_DUP_DISTANCE + 1 — 누락 없는 최소 밴드 수
+BAND_BITS = 64 // BANDS
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+# 짧은 description("사진 포스트" 등)은 블로거와 무관하게 겹치므로 저장/비교 제외
+MIN_DESC_LEN = 80
+# 비교 포스트가 이보다 적으면 비율을 0으로 (표본 부족)
+MIN_POSTS_FOR_RATE = 3
+INDEX_TTL_DAYS = 90
+# 선후와 무관하게 템플릿으로 보는 묶음 크기 (자신 포함 블로거 수)
+TEMPLATE_MIN_BLOGGERS = 5
+
+
+def _to_signed(h: int) -> int:
+    """부호 없는 64비트 → SQLite INTEGER(부호 있는 64비트)."""
+    return h - (1 << 64) if h >= (1 << 63) else h
+
+
+def _from_signed(v: int) -> int:
+    return v + (1 << 64) if v < 0 else v
+
+
+def band_values(simhash: int) -> List[int]:
+    """SimHash → 밴드 값 BANDS개 (밴드 i = 비트 [i*BAND_BITS, (i+1)*BAND_BITS))."""
+    return [(simhash >> (i * BAND_BITS)) & _BAND_MASK for i in range(BANDS)]
+
+
+def _indexable(posts: Sequence[Any]) -> List[Tuple[str, int]]:
+    """(link, SimHash) — 링크가 있고 description이 MIN_DESC_LEN 이상인 포스트만."""
+    out: List[Tuple[str, int]] = []
+    for p in posts:
+        link = getattr(p, "link", None)
+        feat = features(p)
+        if link and feat.desc_len >= MIN_DESC_LEN:
+            out.append((link, feat.desc_simhash))
+    return out
+
+
+def index_posts(conn, blogger_id: str, posts: Sequence[Any]) -> int:
+    """포스트 SimHash + 밴드 저장 (link 기준 갱신). 저장한 포스트 수 반환."""
+    items = _indexable(posts)
+    if items:
+        upsert_post_simhashes(
+            conn,
+            [(link, blogger_id, _to_signed(h), *band_values(h)) for link, h in items],
+            ttl_days=INDEX_TTL_DAYS,
+        )
+    return len(items)
+
+
+@dataclass
+class CrossBlogDuplicates:
+    posts_checked: int
+    duplicated_posts: int
+    other_bloggers: List[str] = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        """다른 블로거 포스트를 복제한 것으로 본 포스트 비율 (0~1, 표본 부족 시 0)."""
+        if self.posts_checked < MIN_POSTS_FOR_RATE:
+            return 0.0
+        return round(self.duplicated_posts / self.posts_checked, 3)
+
+
+def cross_blog_duplicates(conn, blogger_id: str, posts: Sequence[Any]) -> CrossBlogDuplicates:
+    """blogger_id의 포스트 중 다른 블로거 포스트와 해밍 거리 ≤ NEAR_DUP_DISTANCE이면서 복제로 볼 수 있는 것.
+
+    상대 포스트가 내 포스트보다 먼저 수집됐거나(아직 저장 전인 내 포스트는 가장 늦은 것으로 간주)
+    같은 원고를 가진 블로거가 자신 포함 TEMPLATE_MIN_BLOGGERS명 이상일 때만 센다 — 원작자는 감점하지 않음.
+    """
+    items = _indexable(posts)
+    if not items:
+        return CrossBlogDuplicates(0, 0)
+    first_seen = get_simhash_first_seen(conn, [link for link, _ in items])
+
+    # (밴드 번호, 밴드 값) → 그 밴드를 가진 내 포스트 (link, 해시)
+    by_band: Dict[Tuple[int, int], List[Tuple[str, int]]] = {}
+    for link, h in items:
+        for i, v in enumerate(band_values(h)):
+            by_band.setdefault((i, v), []).append((link, h))
+    bands = [sorted({v for (i, v) in by_band if i == b}) for b in range(BANDS)]
+
+    # 내 포스트 link → {다른 블로거: 그 블로거 포스트가 먼저 수집됐는지}
+    matches: Dict[str, Dict[str, bool]] = {}
+    for row in find_simhash_band_matches(conn, bands, exclude_blogger_id=blogger_id):
+        other = _from_signed(row["simhash"])
+        for link, h in {m for i, v in enumerate(band_values(other)) for m in by_band.get((i, v), ())}:
+            if hamming_distance(h, other) > NEAR_DUP_DISTANCE:
+                continue
+            mine = first_seen.get(link)
+            earlier = mine is None or (row["first_seen_at"] or "") < mine
+            seen = matches.setdefault(link, {})
+            seen[row["blogger_id"]] = seen.get(row["blogger_id"], False) or earlier
+
+    dup_posts = 0
+    others: set = set()
+    for link, _ in items:
+        seen = matches.get(link, {})
+        if len(seen) + 1 >= TEMPLATE_MIN_BLOGGERS:
+            copied_from = set(seen)
+        else:
+            copied_from = {bid for bid, earlier in seen.items() if earlier}
+        if copied_from:
+            dup_posts += 1
+            others |= copied_from
+    return CrossBlogDuplicates(len(items), dup_posts, sorted(others))
+
+
+def cross_blog_dup_rate(blogger_id: str, posts: Sequence[Any], db_path: Optional[Path] = None) -> float:
+    """cross_blog_duplicates(...).rate — DB 실패 시 0.0 (감점 없이 분석 계속)."""
+    try:
+        with conn_ctx(db_path or DB_PATH) as conn:
+            return cross_blog_duplicates(conn, blogger_id, posts).rate
+    except Exception as e:
+        logger.debug("블로거 간 중복 조회 실패: %s", e)
+        return 0.0
+
+
+def template_clusters(conn, min_bloggers: int = TEMPLATE_MIN_BLOGGERS, limit: int = 20) -> List[Dict[str, Any]]:
+    """여러 블로거(min_bloggers명 이상)에 걸친 근사 중복 포스트 묶음 — 블로거 수 많은 순.
+
+    밴드별로 블로거가 많이 모인 버킷만 골라 그 안에서 가장 많은 블로거와 근사 중복인
+    포스트를 중심으로 묶는다. 버킷 집계는 밴드 인덱스 전체를 훑으므로 정기 리포트용.
+    """
+    clusters: List[Dict[str, Any]] = []
+    claimed: set = set()
+    for band in range(BANDS):
+        for bucket in list_crowded_simhash_buckets(conn, band, min_bloggers, limit):
+            rows = [
+                (r, _from_signed(r["simhash"]))
+                for r in list_simhash_bucket(conn, band, bucket["bucket"])
+                if r["link"] not in claimed
+            ]
+            best: Optional[Tuple[Dict[str, Any], int, List[Dict[str, Any]], set]] = None
+            for r, h in rows:
+                members = [x for x, hx in rows if hamming_distance(h, hx) <= NEAR_DUP_DISTANCE]
+                bloggers = {x["blogger_id"] for x in members}
+                if best is None or len(bloggers) > len(best[3]):
+                    best = (r, h, members, bloggers)
+            if best is None or len(best[3]) < min_bloggers:
+                continue
+            center, h, members, bloggers = best
+            claimed.update(m["link"] for m in members)
+            clusters.append({
+                "simhash": f"{h:016x}",
+                "bloggers": len(bloggers),
+                "posts": len(members),
+                "blogger_ids": sorted(bloggers)[:50],
+                "sample_link": center["link"],
+            })
+    clusters.sort(key=lambda c: (-c["bloggers"], -c["posts"]))
+    return clusters[:limit]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="블로거 간 근사 중복 인덱스")
+    parser.add_argument("--clusters", action="store_true", help="여러 블로거에 걸친 근사 중복 묶음 출력")
+    parser.add_argument("--min-bloggers", type=int, default=TEMPLATE_MIN_BLOGGERS)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if not args.clusters:
+        parser.print_help()
+        return 1
+
+    logging.basicConfig(level=logging.INFO)
+    with conn_ctx() as conn:
+        init_db(conn)
+        clusters = template_clusters(conn, min_bloggers=args.min_bloggers, limit=args.limit)
+    print(json.dumps(clusters, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,7 @@ from __future__ import annotations
 
 import logging
 import os
-import smtplib
 import threading
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 
 logger = logging.getLogger("naverblog.email")
 
@@ -29,6 +26,11 @@ def _send_smtp(to: str, subject: str, body_html: str) -> None:
     if not SMTP_EMAIL or not SMTP_PASSWORD:
         logger.warning("SMTP 미설정 — 이메일 미발송: to=%s, subject=%s", to, subject)
         return
+    # smtplib/email.mime는 발송 시점에 로드 (워커 시작 시간 단축)
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
     try:
         msg = MIMEMultipart("alternative")
         msg["From"] = SMTP_EMAIL
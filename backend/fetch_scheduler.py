@@ -0,0 +1,249 @@
+"""
+호스트별 요청 스케줄러 — 모든 외부 HTTP 요청의 동시성/간격/연결 풀/백오프를 한 곳에서 관리.
+
+스크래핑(rss.blog.naver.com, blog.naver.com, m.blog.naver.com, blogdex.space)과
+검색 API(openapi.naver.com)가 서로 조율 없이 요청하면 피크 때 차단/스로틀링되고
+타임아웃마다 4~8초를 잃는다. 여기서는 호스트마다:
+  - 최대 동시 요청 수 (세마포어)
+  - 요청 시작 간 최소 간격
+  - keep-alive 연결 풀 (호스트별 requests.Session)
+  - 최근 오류율(타임아웃/연결 오류/429/5xx)이 급증하면 일정 시간 즉시 실패(HostBackoffError)
+    → 호출자는 기존 RequestException 처리 경로로 빠르게 폴백
+"""
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostBackoffError(requests.exceptions.ConnectionError):
+    """호스트 오류율 급증으로 백오프 중 — 요청을 보내지 않고 즉시 실패."""
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    max_concurrency: int = 4
+    min_interval_sec: float = 0.1
+
+
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "rss.blog.naver.com": HostPolicy(max_concurrency=8, min_interval_sec=0.05),
+    "blog.naver.com": HostPolicy(max_concurrency=6, min_interval_sec=0.1),
+    "m.blog.naver.com": HostPolicy(max_concurrency=6, min_interval_sec=0.1),
+    "blogdex.space": HostPolicy(max_concurrency=2, min_interval_sec=0.5),
+    # 검색 API는 쿼터/재시도를 naver_client가 관리 → 간격 없이 동시성만 제한
+    "openapi.naver.com": HostPolicy(max_concurrency=10, min_interval_sec=0.0),
+}
+DEFAULT_POLICY = HostPolicy()
+
+# 오류율 백오프: 최근 ERROR_WINDOW개(ERROR_WINDOW_SEC 이내) 중 ERROR_MIN_SAMPLES개 이상이고
+# 오류율이 ERROR_RATE_TRIP 이상이면 BACKOFF_BASE_SEC × 2^(연속 발동-1) (최대 BACKOFF_MAX_SEC) 동안 차단
+ERROR_WINDOW = 20
+ERROR_WINDOW_SEC = 60.0
+ERROR_MIN_SAMPLES = 10
+ERROR_RATE_TRIP = 0.5
+BACKOFF_BASE_SEC = 5.0
+BACKOFF_MAX_SEC = 120.0
+
+_HOST_ERROR_STATUS = {429, 500, 502, 503, 504}
+
+
+def _default_session(policy: HostPolicy) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=policy.max_concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _HostState:
+    def __init__(self, policy: HostPolicy, session: Any) -> None:
+        self.policy = policy
+        self.session = session
+        self.slots = threading.BoundedSemaphore(policy.max_concurrency)
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+        self.outcomes: Deque[Tuple[float, bool]] = collections.deque(maxlen=ERROR_WINDOW)
+        self.backoff_until = 0.0
+        self.trips = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+
+
+class _StreamedResponse:
+    """stream=True 응답 — close(또는 with 종료)까지 호스트 슬롯을 잡아 본문 다운로드도 동시성 상한에 포함.
+
+    본문 읽기 중 타임아웃/연결 오류는 close 시 오류율에 반영. 나머지 속성은 원 응답에 위임.
+    """
+
+    def __init__(self, resp: Any, on_close: Callable[[bool], None]) -> None:
+        self._resp = resp
+        self._on_close = on_close
+        self._read_ok = True
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resp, name)
+
+    def __enter__(self) -> "_StreamedResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def iter_content(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        try:
+            yield from self._resp.iter_content(*args, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError):
+            self._read_ok = False
+            raise
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._resp.close()
+        finally:
+            self._on_close(self._read_ok)
+
+
+class FetchScheduler:
+    """호스트별 정책을 적용하는 GET 스케줄러 (스레드 안전).
+
+    stream=True 응답은 close할 때까지 슬롯을 점유하므로 호출자가 반드시 close (with 문 가능).
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        session_factory: Callable[[HostPolicy], Any] = _default_session,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policies = dict(HOST_POLICIES if policies is None else policies)
+        self._session_factory = session_factory
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                policy = self.policies.get(host, DEFAULT_POLICY)
+                state = _HostState(policy, self._session_factory(policy))
+                self._hosts[host] = state
+            return state
+
+    def _wait_turn(self, state: _HostState) -> None:
+        """최소 간격: 다음 시작 시각을 예약하고 그때까지 대기."""
+        with state.lock:
+            now = self._clock()
+            start_at = max(now, state.next_start)
+            state.next_start = start_at + state.policy.min_interval_sec
+        if start_at > now:
+            self._sleep(start_at - now)
+
+    def _record(self, state: _HostState, ok: bool) -> None:
+        with state.lock:
+            now = self._clock()
+            state.outcomes.append((now, ok))
+            if not ok:
+                state.errors += 1
+            recent = [o for t, o in state.outcomes if now - t <= ERROR_WINDOW_SEC]
+            if len(recent) >= ERROR_MIN_SAMPLES and recent.count(False) / len(recent) >= ERROR_RATE_TRIP:
+                state.trips += 1
+                state.backoff_until = now + min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * 2 ** (state.trips - 1))
+                state.outcomes.clear()
+            elif ok and not any(not o for o in recent):
+                state.trips = 0
+
+    def get(
+        self,
+        url: str,
+        timeout: float,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        host = urlsplit(url).hostname or ""
+        state = self._host(host)
+        if self._clock() < state.backoff_until:
+            raise HostBackoffError(f"{host} 백오프 중 ({state.backoff_until - self._clock():.1f}s 남음)")
+
+        state.slots.acquire()
+        try:
+            self._wait_turn(state)
+        except BaseException:
+            state.slots.release()
+            raise
+        with state.lock:
+            state.in_flight += 1
+            state.requests += 1
+        try:
+            resp = state.session.get(url, headers=headers, params=params, timeout=timeout, stream=stream)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            self._finish(state, ok=False)
+            raise
+        except BaseException:
+            self._finish(state, ok=None)
+            raise
+        status_ok = resp.status_code not in _HOST_ERROR_STATUS
+        if stream:
+            # 본문은 호출자가 읽음 → 슬롯 반납/결과 기록은 close 시점
+            return _StreamedResponse(resp, lambda read_ok: self._finish(state, ok=status_ok and read_ok))
+        self._finish(state, ok=status_ok)
+        return resp
+
+    def _finish(self, state: _HostState, ok: Optional[bool]) -> None:
+        """요청 종료: in_flight 감소 + 슬롯 반납, ok가 None이 아니면 오류율에 기록."""
+        with state.lock:
+            state.in_flight -= 1
+        state.slots.release()
+        if ok is not None:
+            self._record(state, ok=ok)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 {in_flight, requests, errors, backoff_remaining_sec, max_concurrency, min_interval_sec}"""
+        now = self._clock()
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {
+            host: {
+                "in_flight": st.in_flight,
+                "requests": st.requests,
+                "errors": st.errors,
+                "backoff_remaining_sec": round(max(0.0, st.backoff_until - now), 1),
+                "max_concurrency": st.policy.max_concurrency,
+                "min_interval_sec": st.policy.min_interval_sec,
+            }
+            for host, st in sorted(hosts.items())
+        }
+
+
+# 프로세스 공용 스케줄러
+scheduler = FetchScheduler()
+
+
+def polite_get(
+    url: str,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    stream: bool = False,
+) -> requests.Response:
+    """공용 스케줄러로 GET (호스트 정책 적용)."""
+    return scheduler.get(url, timeout=timeout, headers=headers, params=params, stream=stream)
@@ -0,0 +1,124 @@
+"""
+import 시간 프로파일 + 예산 검사 — API 워커 시작(콜드 스타트/워커 재시작) 시간 회귀 방지.
+
+gunicorn 워커는 시작할 때마다 backend.app을 새로 import한다. 새 프로세스에서
+`python -X importtime -c "import backend.app"`을 실행해 모듈별 self/누적 시간을 집계하고
+  - LAZY_MODULES: 워커 시작 시 로드되면 안 되는 모듈 (해당 API/기능 첫 사용 때 로드)
+      backend.scoring_legacy  이전 세대 GoldenScore (backend.scoring의 모듈 __getattr__)
+      backend.guide_generator 업종 가이드 템플릿 표 (가이드 API 안에서 import)
+      smtplib                 이메일 발송 시점에 로드 (email_sender)
+      uvicorn                 `python -m backend.app` 직접 실행 때만
+  - backend.* 모듈 self 시간 합 ≤ BACKEND_SELF_BUDGET_MS (FastAPI/pydantic 등 외부 패키지 제외)
+를 검사한다. 시간 측정은 잡음이 있어 runs회 실행 중 모듈별 최솟값을 쓴다.
+
+    python -m backend.import_profile [--module backend.app] [--runs 3] [--top 20] [--check]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+LAZY_MODULES = ("backend.scoring_legacy", "backend.guide_generator", "smtplib", "uvicorn")
+BACKEND_SELF_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "200"))
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """-X importtime 출력("import time: self | cumulative | 모듈") → ImportTiming 목록 (import 완료 순서)."""
+    out: List[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 헤더 줄 ("self [us] | cumulative | imported package")
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        out.append(ImportTiming(stripped, self_us, cum_us, (len(name) - len(stripped)) // 2))
+    return out
+
+
+def profile_imports(module: str = "backend.app", runs: int = 3) -> List[ImportTiming]:
+    """새 프로세스에서 module을 runs회 import — 모듈별 최솟값 (첫 실행 순서 유지)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(_ROOT), os.environ.get("PYTHONPATH")])))
+    best: Dict[str, ImportTiming] = {}
+    for _ in range(max(1, runs)):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=str(_ROOT), env=env, capture_output=True, text=True, timeout=120,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} 실패: {proc.stderr.strip().splitlines()[-1:]}")
+        for t in parse_importtime(proc.stderr):
+            prev = best.get(t.module)
+            if prev is None:
+                best[t.module] = t
+            else:
+                prev.self_us = min(prev.self_us, t.self_us)
+                prev.cumulative_us = min(prev.cumulative_us, t.cumulative_us)
+    return list(best.values())
+
+
+def import_report(module: str = "backend.app", runs: int = 3, top: int = 20) -> Dict[str, Any]:
+    """import 시간 요약 + 예산 검사 결과 (ok=False면 회귀)."""
+    timings = profile_imports(module, runs)
+    by_name = {t.module: t for t in timings}
+    root = by_name.get(module)
+    backend_self_us = sum(t.self_us for t in timings if t.module == "backend" or t.module.startswith("backend."))
+    eager = [m for m in LAZY_MODULES if m in by_name]
+    over_budget = backend_self_us / 1000.0 > BACKEND_SELF_BUDGET_MS
+    return {
+        "module": module,
+        "runs": runs,
+        "total_ms": round((root.cumulative_us if root else 0) / 1000.0, 1),
+        "backend_self_ms": round(backend_self_us / 1000.0, 1),
+        "budget_ms": BACKEND_SELF_BUDGET_MS,
+        "modules": len(timings),
+        "eager_lazy_modules": eager,
+        "ok": not eager and not over_budget,
+        "top_cumulative": [
+            {"module": t.module, "cumulative_ms": round(t.cumulative_us / 1000.0, 1),
+             "self_ms": round(t.self_us / 1000.0, 1)}
+            for t in sorted((t for t in timings if t.depth <= 1), key=lambda t: -t.cumulative_us)[:top]
+        ],
+        "top_backend_self": [
+            {"module": t.module, "self_ms": round(t.self_us / 1000.0, 1)}
+            for t in sorted((t for t in timings if t.module.startswith("backend")), key=lambda t: -t.self_us)[:top]
+        ],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="import 시간 프로파일 + 예산 검사")
+    parser.add_argument("--module", default="backend.app")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--check", action="store_true", help="예산 초과/지연 로드 모듈 선로드 시 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    report = import_report(args.module, args.runs, args.top)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 1 if args.check and not report["ok"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
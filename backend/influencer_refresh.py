@@ -0,0 +1,251 @@
+"""
+인플루언서 점수 정기 재분석 — 오래된 프로필부터 시간당 할당량 안에서 analyze_blog 재실행.
+
+influencer_profiles의 golden_score/축별 점수는 /api/influencer/register 시점에 한 번 저장되고
+이후 블로그 활동이 바뀌어도 그대로라 마켓플레이스 순위가 실제와 점점 어긋난다.
+여기서는 프로필마다 우선순위를 계산해 힙에서 가장 급한 프로필부터 재분석하고
+점수 컬럼만 갱신한다 (희망 단가/소개/전문 분야 등 사용자 입력은 유지).
+
+우선순위 = last_analysis 경과 시간 × 가중치
+  - 마켓플레이스 상위 노출(공개 + GoldenScore 상위 MARKETPLACE_TOP명) → +VISIBILITY_BOOST
+  - 최근 MATCH_WINDOW_DAYS일 매칭 요청 1건당 +MATCH_BOOST (최대 MATCH_BOOST_CAP건)
+  - 비공개 프로필 → ×PRIVATE_WEIGHT (노출되지 않으므로 뒤로)
+  - 최근 연속 실패(실패/부분 결과) n회 → ÷(1 + n)
+  - last_analysis가 없으면 NEVER_ANALYZED_AGE_HOURS로 간주, REFRESH_MIN_AGE_HOURS 미만은 제외
+
+실패해도 last_analysis는 그대로라 삭제/비공개 블로그가 매시 최우선으로 재시도되어 할당량을
+차지하지 않도록, 최근 FAILURE_WINDOW_HOURS시간 안의 마지막 성공 이후 실패가 n회면
+마지막 실패 후 FAILURE_BACKOFF_HOURS × 2^(n-1)시간 동안 대기열에서 제외한다.
+
+할당량은 influencer_refresh_log의 최근 1시간 시도 수(실패 포함)로 계산하므로
+cron 호출 간격/중복 호출과 무관하게 시간당 REFRESH_HOURLY_QUOTA건을 넘지 않는다.
+
+정기 실행 (cron, 매시):
+    python -m backend.influencer_refresh --run [--quota 30]
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.admin_db import _percentile
+from backend.blog_batch import SharedSearchClient, analyze_and_store
+from backend.db import (
+    DB_PATH, conn_ctx, count_influencer_refreshes, init_db, list_influencer_refresh_candidates,
+    list_influencer_refresh_lags, log_influencer_refresh, update_influencer_scores,
+)
+from backend.naver_client import NaverBlogSearchClient, get_env_client
+
+logger = logging.getLogger(__name__)
+
+REFRESH_HOURLY_QUOTA = int(os.environ.get("INFLUENCER_REFRESH_QUOTA", "30"))
+REFRESH_MIN_AGE_HOURS = 24.0
+NEVER_ANALYZED_AGE_HOURS = 24.0 * 30
+
+MARKETPLACE_TOP = 60        # 마켓플레이스 3페이지(20개씩)
+VISIBILITY_BOOST = 1.0
+MATCH_WINDOW_DAYS = 14
+MATCH_BOOST = 0.5
+MATCH_BOOST_CAP = 4
+PRIVATE_WEIGHT = 0.5
+FAILURE_WINDOW_HOURS = 24
+FAILURE_BACKOFF_HOURS = 1.0
+
+# 재분석 1건 시간 예산 (프로필 재분석은 사용자 대기 없음 → 검색 API와 스크래핑 여유 있게)
+REFRESH_DEADLINE_MS = 30_000
+
+AnalyzeFn = Callable[[str], Dict[str, Any]]
+
+
+def influencer_scores(result: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_blog 결과 → influencer_profiles 점수 컬럼 (등록/재분석 공용)."""
+    bs = result.get("blog_score", {})
+    base_bd = bs.get("base_breakdown", {})
+    profile = result.get("profile", {})
+
+    def _axis(key: str) -> float:
+        # v7.2 base_breakdown: {"blog_power": {"score", "max", "label"}, ...}
+        return (base_bd.get(key) or {}).get("score", 0)
+
+    return {
+        "golden_score": bs.get("total", 0),
+        "grade": bs.get("grade", "F"),
+        "grade_label": bs.get("grade_label", ""),
+        "base_score": bs.get("base_score", 0),
+        "bp_score": _axis("blog_power"),
+        "ep_score": _axis("exposure_power"),
+        "ca_score": _axis("content_authority"),
+        "rq_score": _axis("rss_quality"),
+        "fr_score": _axis("freshness"),
+        "sp_score": _axis("search_presence"),
+        "total_posts": profile.get("total_posts", 0),
+        "total_visitors": profile.get("total_visitors", 0),
+        "total_subscribers": profile.get("total_subscribers", 0),
+    }
+
+
+def refresh_priority(
+    age_hours: Optional[float], is_public: bool, marketplace_rank: Optional[int], recent_matches: int,
+    recent_failures: int = 0,
+) -> float:
+    """클수록 먼저 재분석. marketplace_rank는 공개 프로필의 GoldenScore 순위 (0부터, 비공개는 None)."""
+    age = NEVER_ANALYZED_AGE_HOURS if age_hours is None else max(0.0, age_hours)
+    weight = 1.0
+    if is_public and marketplace_rank is not None and marketplace_rank < MARKETPLACE_TOP:
+        weight += VISIBILITY_BOOST
+    weight += MATCH_BOOST * min(recent_matches, MATCH_BOOST_CAP)
+    if not is_public:
+        weight *= PRIVATE_WEIGHT
+    return age * weight / (1 + max(0, recent_failures))
+
+
+def in_failure_backoff(recent_failures: int, last_failure_hours: Optional[float]) -> bool:
+    """연속 실패 n회 → 마지막 실패 후 FAILURE_BACKOFF_HOURS × 2^(n-1)시간 동안 재시도 보류."""
+    if recent_failures <= 0 or last_failure_hours is None:
+        return False
+    return last_failure_hours < FAILURE_BACKOFF_HOURS * 2 ** (recent_failures - 1)
+
+
+def build_refresh_queue(conn, min_age_hours: float = REFRESH_MIN_AGE_HOURS) -> List[Tuple[float, int, Dict[str, Any]]]:
+    """(-우선순위, profile_id, 행) 최소 힙 — heappop 순서 = 재분석 순서."""
+    rows = list_influencer_refresh_candidates(conn, match_days=MATCH_WINDOW_DAYS, failure_hours=FAILURE_WINDOW_HOURS)
+    public = sorted((r for r in rows if r["is_public"]), key=lambda r: -(r["golden_score"] or 0))
+    rank = {r["profile_id"]: i for i, r in enumerate(public)}
+
+    heap: List[Tuple[float, int, Dict[str, Any]]] = []
+    for r in rows:
+        if r["age_hours"] is not None and r["age_hours"] < min_age_hours:
+            continue
+        if in_failure_backoff(r["recent_failures"], r["last_failure_hours"]):
+            continue
+        pri = refresh_priority(r["age_hours"], bool(r["is_public"]), rank.get(r["profile_id"]), r["recent_matches"],
+                               r["recent_failures"])
+        heap.append((-pri, r["profile_id"], r))
+    heapq.heapify(heap)
+    return heap
+
+
+def refresh_influencers(
+    quota: Optional[int] = None,
+    client: Optional[NaverBlogSearchClient] = None,
+    analyze: Optional[AnalyzeFn] = None,
+    db_path: Path = DB_PATH,
+) -> Dict[str, Any]:
+    """가장 급한 프로필부터 이번 시간 남은 할당량만큼 재분석.
+
+    analyze(blogger_id) → analyze_blog 결과 (기본: analyze_and_store, 테스트에서 교체).
+    반환: {"quota", "remaining", "candidates", "refreshed", "failed", "skipped_degraded", "items"}
+    """
+    quota = REFRESH_HOURLY_QUOTA if quota is None else quota
+    with conn_ctx(db_path) as conn:
+        used = count_influencer_refreshes(conn, hours=1)
+        heap = build_refresh_queue(conn)
+    remaining = max(0, quota - used)
+
+    if analyze is None:
+        shared = SharedSearchClient(client or get_env_client())
+
+        def analyze(bid: str) -> Dict[str, Any]:
+            return analyze_and_store(bid, shared, None, None, True, None, REFRESH_DEADLINE_MS, db_path)
+
+    summary: Dict[str, Any] = {
+        "quota": quota, "remaining": remaining, "candidates": len(heap),
+        "refreshed": 0, "failed": 0, "skipped_degraded": 0, "items": [],
+    }
+    while heap and remaining > 0:
+        neg_pri, profile_id, row = heapq.heappop(heap)
+        remaining -= 1
+        lag = row["age_hours"] if row["age_hours"] is not None else NEVER_ANALYZED_AGE_HOURS
+        item = {"profile_id": profile_id, "blog_id": row["blog_id"],
+                "priority": round(-neg_pri, 1), "lag_hours": round(lag, 1)}
+        try:
+            result = analyze(row["blog_id"])
+        except Exception as e:
+            logger.warning("influencer refresh failed for %s: %s", row["blog_id"], e)
+            with conn_ctx(db_path) as conn:
+                log_influencer_refresh(conn, profile_id, lag, ok=False)
+            summary["failed"] += 1
+            summary["items"].append({**item, "status": "failed", "error": str(e)})
+            continue
+
+        if result.get("meta", {}).get("degraded"):
+            # 부분 결과로 점수를 덮어쓰지 않음 — 다음 실행에서 다시 시도
+            with conn_ctx(db_path) as conn:
+                log_influencer_refresh(conn, profile_id, lag, ok=False)
+            summary["skipped_degraded"] += 1
+            summary["items"].append({**item, "status": "degraded"})
+            continue
+
+        scores = influencer_scores(result)
+        delta = round(scores["golden_score"] - (row["golden_score"] or 0), 1)
+        with conn_ctx(db_path) as conn:
+            update_influencer_scores(conn, profile_id, scores)
+            log_influencer_refresh(conn, profile_id, lag, ok=True, score_delta=delta)
+        summary["refreshed"] += 1
+        summary["items"].append({**item, "status": "refreshed", "golden_score": scores["golden_score"],
+                                 "score_delta": delta})
+
+    summary["remaining"] = remaining
+    return summary
+
+
+def refresh_lag_stats(conn, days: int = 7) -> Dict[str, Any]:
+    """재분석 지연 백분위.
+
+    staleness: 현재 전체 프로필의 last_analysis 경과 시간 (지금 얼마나 오래된 점수가 노출되는지)
+    refresh_lag: 최근 days일 재분석 시점의 경과 시간 (재분석이 얼마나 늦게 도는지)
+    """
+    rows = list_influencer_refresh_candidates(conn, match_days=MATCH_WINDOW_DAYS)
+    ages = sorted(NEVER_ANALYZED_AGE_HOURS if r["age_hours"] is None else r["age_hours"] for r in rows)
+    lags = sorted(list_influencer_refresh_lags(conn, days=days))
+
+    def _pcts(vals: List[float]) -> Dict[str, float]:
+        return {
+            "p50": round(_percentile(vals, 50), 1),
+            "p90": round(_percentile(vals, 90), 1),
+            "p99": round(_percentile(vals, 99), 1),
+            "max": round(vals[-1], 1) if vals else 0.0,
+        }
+
+    return {
+        "profiles": len(ages),
+        "stale": sum(1 for a in ages if a >= REFRESH_MIN_AGE_HOURS),
+        "staleness_hours": _pcts(ages),
+        "refreshes": len(lags),
+        "refresh_lag_hours": _pcts(lags),
+        "quota_per_hour": REFRESH_HOURLY_QUOTA,
+        "used_last_hour": count_influencer_refreshes(conn, hours=1),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="인플루언서 점수 정기 재분석")
+    parser.add_argument("--run", action="store_true", help="오래된 프로필 재분석 (시간당 할당량 내)")
+    parser.add_argument("--quota", type=int, default=None, help=f"시간당 재분석 수 (기본 {REFRESH_HOURLY_QUOTA})")
+    parser.add_argument("--stats", action="store_true", help="재분석 지연 백분위 출력")
+    args = parser.parse_args(argv)
+
+    if not (args.run or args.stats):
+        parser.print_help()
+        return 1
+
+    logging.basicConfig(level=logging.INFO)
+    with conn_ctx() as conn:
+        init_db(conn)
+    if args.run:
+        summary = refresh_influencers(quota=args.quota)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    if args.stats:
+        with conn_ctx() as conn:
+            print(json.dumps(refresh_lag_stats(conn), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,11 @@ def cleanup_exposures(conn: sqlite3.Connection, keep_days: int = 180) -> int:
         "DELETE FROM exposures WHERE checked_at < datetime('now', ?)",
         (f"-{keep_days} days",),
     )
+    # 희소 저장 모드의 확인 기록도 같은 보관 정책 적용
+    conn.execute(
+        "DELETE FROM exposure_checks WHERE checked_at < datetime('now', ?)",
+        (f"-{keep_days} days",),
+    )
     return cur.rowcount
 
 
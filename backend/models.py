@@ -38,6 +38,7 @@ class CandidateBlogger:
     queries_hit_ratio: float = 0.0  # seed 쿼리 출현 비율 (0~1)
     # v7.0 신규
     popularity_cross_score: float = 0.0   # Phase 1.5 DIA proxy (0~1)
+    tfidf_sim: float = 0.0                # TF-IDF 토픽 유사도 (0~1, 매장 키워드 기준 → blogger_store_signals)
     topic_focus: float = 0.0              # RSS 키워드 집중도 (0~1)
     topic_continuity: float = 0.0         # 최근 포스트 키워드 연속성 (0~1)
     game_defense: float = 0.0             # GameDefense (0 to -10)
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 import logging
 import os
 import time
@@ -8,7 +7,10 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from backend.fetch_scheduler import polite_get
 from backend.models import BlogPostItem
+from backend.search_results import dump_cached, index_items, load_cached
+from backend.timings import db_write, record_api_call, record_cache_hit
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,8 @@ class NaverBlogSearchClient:
         last_exc: Optional[Exception] = None
         for attempt in range(self.max_retries + 1):
             try:
-                r = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+                r = polite_get(url, timeout=self.timeout, headers=headers, params=params)
+                record_api_call(len(r.content or b""))
 
                 if r.status_code in _RETRYABLE_STATUS and attempt < self.max_retries:
                     delay = self.base_delay * (2 ** attempt)
@@ -139,8 +142,8 @@ class CachedNaverBlogSearchClient(NaverBlogSearchClient):
                 cached = get_cached_api_response(conn, cache_key)
                 if cached is not None:
                     self._hits += 1
-                    items_data = json.loads(cached)
-                    return [BlogPostItem(**d) for d in items_data]
+                    record_cache_hit()
+                    return load_cached(cached)
             finally:
                 conn.close()
         except Exception:
@@ -148,26 +151,17 @@ class CachedNaverBlogSearchClient(NaverBlogSearchClient):
 
         # 캐시 미스 → 실제 API 호출
         self._misses += 1
-        items = super().search_blog(query, display, start, sort)
+        items = index_items(super().search_blog(query, display, start, sort))
 
-        # 결과를 캐시에 저장
+        # 결과를 캐시에 저장 (순위별 blogger_id/제목 인덱스 포함)
         try:
             from backend.db import get_conn, set_cached_api_response
             conn = get_conn(self._db_path)
             try:
-                items_json = json.dumps([
-                    {
-                        "title": it.title,
-                        "description": it.description,
-                        "link": it.link,
-                        "postdate": it.postdate,
-                        "bloggerlink": it.bloggerlink,
-                        "bloggername": it.bloggername,
-                    }
-                    for it in items
-                ], ensure_ascii=False)
-                set_cached_api_response(conn, cache_key, query, items_json, len(items), self._cache_ttl_hours)
-                conn.commit()
+                items_json = dump_cached(items)
+                with db_write():
+                    set_cached_api_response(conn, cache_key, query, items_json, len(items), self._cache_ttl_hours)
+                    conn.commit()
             finally:
                 conn.close()
         except Exception as e:
@@ -0,0 +1,177 @@
+"""
+음성 결과 캐시 — 없는/비공개/응답 없는 블로그를 짧은 TTL 동안 기억.
+
+fetch_rss가 404/파싱 오류를 받거나 프로필 스크래핑이 빈 결과로 끝나도 아무것도 남지 않아
+같은 블로거가 다음 검색에 다시 나오면 5초(RSS) / 4초(프로필) 타임아웃을 또 기다린다.
+여기서는 (종류, blogger_id) → 사유를 negative_cache 테이블에 사유별 TTL로 저장하고,
+_parallel_fetch_rss / fetch_blog_profile이 요청 전에 확인한다.
+
+핫 패스: 대부분의 블로거는 음성 항목이 없으므로 프로세스 메모리의 블룸 필터로 먼저 거른다.
+필터에 없으면 DB 조회 없이 "음성 아님", 있으면 DB에서 사유/만료 확인.
+만료된 항목은 필터에 남아 DB 조회 1회만 더 들 뿐이며, 용량을 넘으면 DB에서 다시 만든다.
+
+gunicorn 워커와 배치/크론 CLI가 같은 DB를 쓰므로 다른 프로세스가 기록한 항목도 봐야 한다:
+BLOOM_REFRESH_SEC마다 negative_cache_version(행 수/최대 rowid/최근 created_at)을 확인해
+바뀌었으면 필터를 다시 만든다 (다른 프로세스 기록은 최대 BLOOM_REFRESH_SEC 뒤 반영).
+clear는 로컬 필터와 무관하게 DB 행 존재를 확인해 삭제한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from backend.db import (
+    DB_PATH, clear_negative_entry, conn_ctx, get_negative_entries, list_negative_keys, negative_cache_version,
+    negative_entry_exists, set_negative_entry,
+)
+from backend.timings import db_write
+
+logger = logging.getLogger(__name__)
+
+# 종류
+KIND_RSS = "rss"
+KIND_PROFILE = "profile"
+
+# 사유 → TTL(초). 일시적인 실패일수록 짧게
+NEG_NOT_FOUND = "not_found"      # 404 — 삭제/없는 블로그
+NEG_PRIVATE = "private"          # 403 또는 페이지는 열리지만 공개 정보 없음
+NEG_TIMEOUT = "timeout"          # 타임아웃 (호스트 백오프는 블로거 문제가 아니므로 제외)
+NEG_PARSE_ERROR = "parse_error"  # RSS XML 파싱 실패
+
+NEGATIVE_TTL_SEC: Dict[str, int] = {
+    NEG_NOT_FOUND: 24 * 3600,
+    NEG_PRIVATE: 6 * 3600,
+    NEG_TIMEOUT: 10 * 60,
+    NEG_PARSE_ERROR: 3600,
+}
+
+BLOOM_CAPACITY = 50_000
+BLOOM_FP_RATE = 0.01
+BLOOM_REFRESH_SEC = 5.0
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 블룸 필터 (blake2b 이중 해싱)."""
+
+    def __init__(self, capacity: int = BLOOM_CAPACITY, fp_rate: float = BLOOM_FP_RATE) -> None:
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def _key(kind: str, blogger_id: str) -> str:
+    return f"{kind}:{blogger_id}"
+
+
+class NegativeCache:
+    """DB(negative_cache) + 블룸 필터. 필터는 DB의 유효 항목으로 채우고 DB가 바뀌면 다시 만든다."""
+
+    def __init__(self, db_path: Path = DB_PATH, capacity: int = BLOOM_CAPACITY,
+                 refresh_sec: float = BLOOM_REFRESH_SEC) -> None:
+        self.db_path = db_path
+        self.capacity = capacity
+        self.refresh_sec = refresh_sec
+        self._bloom: Optional[BloomFilter] = None
+        self._version: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _filter(self) -> BloomFilter:
+        with self._lock:
+            now = time.monotonic()
+            if (self._bloom is not None and self._bloom.count <= self.capacity
+                    and now - self._checked_at < self.refresh_sec):
+                return self._bloom
+            self._checked_at = now
+            if not Path(self.db_path).exists():
+                if self._bloom is None:
+                    self._bloom = BloomFilter(self.capacity)
+                return self._bloom
+            try:
+                with conn_ctx(self.db_path) as conn:
+                    version = negative_cache_version(conn)
+                    if self._bloom is None or self._bloom.count > self.capacity or version != self._version:
+                        bloom = BloomFilter(self.capacity)
+                        for kind, bid in list_negative_keys(conn):
+                            bloom.add(_key(kind, bid))
+                        self._bloom, self._version = bloom, version
+            except Exception as e:
+                logger.debug("음성 캐시 필터 적재 실패: %s", e)
+                if self._bloom is None:
+                    self._bloom = BloomFilter(self.capacity)
+            return self._bloom
+
+    def lookup_many(self, kind: str, blogger_ids: List[str]) -> Dict[str, str]:
+        """{blogger_id: 사유} — 유효한 음성 항목이 있는 블로거만. 필터에 없는 ID는 DB 조회 생략."""
+        bloom = self._filter()
+        maybe = [bid for bid in blogger_ids if _key(kind, bid) in bloom]
+        if not maybe:
+            return {}
+        try:
+            with conn_ctx(self.db_path) as conn:
+                return get_negative_entries(conn, kind, maybe)
+        except Exception as e:
+            logger.debug("음성 캐시 조회 실패: %s", e)
+            return {}
+
+    def lookup(self, kind: str, blogger_id: str) -> Optional[str]:
+        return self.lookup_many(kind, [blogger_id]).get(blogger_id)
+
+    def record(self, kind: str, blogger_id: str, reason: str) -> None:
+        ttl = NEGATIVE_TTL_SEC.get(reason)
+        if ttl is None:
+            return
+        try:
+            with db_write(), conn_ctx(self.db_path) as conn:
+                set_negative_entry(conn, kind, blogger_id, reason, ttl)
+        except Exception as e:
+            logger.debug("음성 캐시 저장 실패: %s", e)
+            return
+        bloom = self._filter()
+        with self._lock:
+            bloom.add(_key(kind, blogger_id))
+
+    def clear(self, kind: str, blogger_id: str) -> None:
+        """성공한 fetch — 남아 있는 음성 항목 삭제 (다른 프로세스가 기록했을 수 있어 DB에서 확인, 없으면 쓰기 생략)."""
+        try:
+            with conn_ctx(self.db_path) as conn:
+                if negative_entry_exists(conn, kind, blogger_id):
+                    with db_write():
+                        clear_negative_entry(conn, kind, blogger_id)
+        except Exception as e:
+            logger.debug("음성 캐시 삭제 실패: %s", e)
+
+
+_caches: Dict[Path, NegativeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_negative_cache(db_path: Optional[Path] = None) -> NegativeCache:
+    """DB 경로별 공용 인스턴스."""
+    path = db_path or DB_PATH
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = NegativeCache(path)
+        return cache
@@ -0,0 +1,100 @@
+"""
+RSSPost 파생 특성 캐시 — 포스트마다 토큰화/날짜 파싱/SimHash를 1회만 계산.
+
+블로거 1명 분석에서 같은 제목/본문을 여러 지표 함수가 각자 다시 처리한다:
+  - 제목 한글 토큰 re.findall([가-힣]{2,}): analyze_content, compute_diversity_smoothed,
+    compute_game_defense, compute_tfidf_topic_similarity, 키워드 추출 함수들
+  - pubDate strptime(최대 5개 형식): analyze_activity, _parse_rss_pub_date를 쓰는 v7.2 하위 신호들
+  - 본문 SimHash(3-gram마다 md5): analyze_quality, compute_originality_v7, compute_game_defense
+여기서는 features(post)가 포스트 객체에 PostFeatures를 붙여 두고, 각 특성은 첫 접근 때 계산해 보관한다.
+
+전제: RSSPost는 수집 후 title/description/pub_date를 바꾸지 않는다
+(dataclasses.replace / copy로 만든 새 객체는 새로 계산).
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from functools import cached_property
+from typing import Any, List, Optional
+
+_HANGUL_TOKEN = re.compile(r"[가-힣]{2,}")
+_HANGUL_TOKEN_2_6 = re.compile(r"[가-힣]{2,6}")
+
+# RFC 822: "Sun, 15 Feb 2026 09:00:00 +0900" (네이버 RSS 기본) 우선
+_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%a, %d %b %Y %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d",
+)
+
+_ATTR = "_post_features"
+
+
+def parse_pub_date(date_str: Optional[str]) -> Optional[datetime]:
+    """RSS pubDate 문자열 → naive datetime. 실패 시 None."""
+    if not date_str:
+        return None
+    text = date_str.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=None)
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+class PostFeatures:
+    """포스트 1개의 파생 특성 (속성 첫 접근 시 계산)."""
+
+    def __init__(self, post: Any) -> None:
+        self._post = post
+
+    @cached_property
+    def title(self) -> str:
+        return getattr(self._post, "title", "") or ""
+
+    @cached_property
+    def title_lower(self) -> str:
+        return self.title.lower()
+
+    @cached_property
+    def description(self) -> str:
+        return getattr(self._post, "description", "") or ""
+
+    @cached_property
+    def desc_len(self) -> int:
+        return len(self.description)
+
+    @cached_property
+    def pub_dt(self) -> Optional[datetime]:
+        return parse_pub_date(getattr(self._post, "pub_date", None))
+
+    @cached_property
+    def title_tokens(self) -> List[str]:
+        """제목 한글 2글자 이상 토큰 (re.findall([가-힣]{2,}) 결과와 동일, 순서 유지)."""
+        return _HANGUL_TOKEN.findall(self.title)
+
+    @cached_property
+    def title_tokens_2_6(self) -> List[str]:
+        """제목 한글 2~6글자 토큰 (v7.2 ContentAuthority 키워드용)."""
+        return _HANGUL_TOKEN_2_6.findall(self.title)
+
+    @cached_property
+    def desc_simhash(self) -> int:
+        from backend.scoring import compute_simhash
+        return compute_simhash(self.description)
+
+
+def features(post: Any) -> PostFeatures:
+    """post의 특성 캐시 (없으면 만들어 post에 붙임). __dict__가 없는 객체는 매번 새로 계산."""
+    attrs = getattr(post, "__dict__", None)
+    if attrs is None:
+        return PostFeatures(post)
+    feat = attrs.get(_ATTR)
+    if feat is None or feat._post is not post:
+        feat = PostFeatures(post)
+        attrs[_ATTR] = feat
+    return feat
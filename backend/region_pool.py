@@ -0,0 +1,166 @@
+"""
+지역 공유 후보 풀 — region_power/broad 검색 결과를 같은 지역의 매장끼리 공유.
+
+build_region_power_queries / build_broad_queries는 지역 + 카테고리 버킷에만 의존하므로
+같은 지역의 매장 분석은 매번 같은 8개 쿼리를 다시 검색한다.
+여기서는 쿼리별 상위 포스팅(top-k)과 해당 블로거의 RSS를 region_candidate_pools에 저장해
+collect_region_power_candidates / collect_broad_candidates가 검색 대신 풀에서 병합하도록 한다.
+매장별로 달라지는 local_hits(주소 토큰)는 풀이 아니라 병합 시점에 계산한다.
+
+정기 갱신:
+    python -m backend.region_pool --refresh [--within-hours 6] [--limit 20]
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import logging
+import sys
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.blog_analyzer import fetch_rss
+from backend.db import (
+    conn_ctx, get_region_pool, init_db, list_region_pools_due, save_region_pool, update_region_pool_rss,
+)
+from backend.models import BlogPostItem, RSSPost
+from backend.naver_client import NaverBlogSearchClient, get_env_client
+from backend.search_results import index_items
+
+logger = logging.getLogger(__name__)
+
+PHASE_REGION_POWER = "region_power"
+PHASE_BROAD = "broad"
+
+# 단계별 수집 순위 상한 (analyzer의 기존 top-k와 동일)
+POOL_TOP_K: Dict[str, int] = {PHASE_REGION_POWER: 10, PHASE_BROAD: 15}
+
+POOL_TTL_HOURS = 24
+
+# {query: [BlogPostItem, ...]} — 쿼리별 상위 top-k 포스팅 (순위 순서)
+Postings = Dict[str, List[BlogPostItem]]
+
+
+def pool_key(phase: str, queries: List[str]) -> str:
+    """phase + 쿼리 목록 → 풀 키 (지역·카테고리 버킷이 같으면 동일)."""
+    raw = phase + "\n" + "\n".join(queries)
+    return f"{phase}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _dump_postings(postings: Postings) -> str:
+    return json.dumps({q: [asdict(it) for it in items] for q, items in postings.items()}, ensure_ascii=False)
+
+
+def _load_postings(raw: str) -> Postings:
+    return {q: [BlogPostItem(**it) for it in items] for q, items in json.loads(raw).items()}
+
+
+def dump_rss(rss_map: Dict[str, List[RSSPost]]) -> str:
+    return json.dumps({bid: [asdict(p) for p in posts] for bid, posts in rss_map.items()}, ensure_ascii=False)
+
+
+def _load_rss(raw: str) -> Dict[str, List[RSSPost]]:
+    return {bid: [RSSPost(**p) for p in posts] for bid, posts in json.loads(raw or "{}").items()}
+
+
+def load_pool(conn, key: str) -> Optional[Tuple[Postings, Dict[str, List[RSSPost]]]]:
+    """유효한 풀의 (postings, rss_map). 없거나 만료/손상 시 None."""
+    row = get_region_pool(conn, key)
+    if row is None:
+        return None
+    try:
+        return _load_postings(row["postings_json"]), _load_rss(row["rss_json"])
+    except (ValueError, TypeError) as e:
+        logger.warning("region pool %s 손상, 재수집: %s", key, e)
+        return None
+
+
+def save_pool(
+    conn, key: str, region_text: str, phase: str, queries: List[str],
+    postings: Postings, rss_map: Optional[Dict[str, List[RSSPost]]] = None,
+) -> None:
+    save_region_pool(
+        conn, key, region_text, phase,
+        json.dumps(queries, ensure_ascii=False), _dump_postings(postings),
+        dump_rss(rss_map or {}), ttl_hours=POOL_TTL_HOURS,
+    )
+
+
+def update_pool_rss(conn, key: str, rss_map: Dict[str, List[RSSPost]]) -> None:
+    update_region_pool_rss(conn, key, dump_rss(rss_map))
+
+
+def pool_blogger_ids(postings: Postings) -> List[str]:
+    """풀 포스팅에 등장하는 블로거 ID (등장 순서 유지)."""
+    seen: Dict[str, None] = {}
+    for items in postings.values():
+        for bid in index_items(items).blogger_ids:
+            if bid:
+                seen.setdefault(bid, None)
+    return list(seen)
+
+
+def refresh_region_pools(
+    conn,
+    client: Optional[NaverBlogSearchClient] = None,
+    within_hours: int = 6,
+    limit: int = 20,
+    max_workers: int = 10,
+) -> Dict[str, Any]:
+    """곧 만료되는 사용 중 풀을 재검색 + 후보 RSS 재수집으로 갱신.
+
+    반환: {"refreshed": n, "failed": n, "api_calls": n, "rss_fetched": n}
+    """
+    client = client or get_env_client()
+    due = list_region_pools_due(conn, within_hours=within_hours, limit=limit)
+    refreshed = failed = api_calls = rss_fetched = 0
+
+    for row in due:
+        phase = row["phase"]
+        try:
+            queries = json.loads(row["queries_json"])
+            top_k = POOL_TOP_K.get(phase, 10)
+            postings: Postings = {}
+            for q in queries:
+                postings[q] = client.search_blog(query=q, display=30)[:top_k]
+                api_calls += 1
+
+            bids = pool_blogger_ids(postings)
+            rss_map: Dict[str, List[RSSPost]] = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for bid, posts in zip(bids, pool.map(lambda b: fetch_rss(b, timeout=5.0), bids)):
+                    rss_map[bid] = posts
+            rss_fetched += len(rss_map)
+
+            save_pool(conn, row["pool_key"], row["region_text"], phase, queries, postings, rss_map)
+            refreshed += 1
+        except Exception as e:
+            logger.warning("region pool refresh failed (%s): %s", row["pool_key"], e)
+            failed += 1
+
+    return {"refreshed": refreshed, "failed": failed, "api_calls": api_calls, "rss_fetched": rss_fetched}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="지역 공유 후보 풀 갱신")
+    parser.add_argument("--refresh", action="store_true", help="곧 만료되는 풀 갱신")
+    parser.add_argument("--within-hours", type=int, default=6, help="만료까지 남은 시간 기준")
+    parser.add_argument("--limit", type=int, default=20, help="갱신할 최대 풀 수")
+    args = parser.parse_args(argv)
+
+    if not args.refresh:
+        parser.print_help()
+        return 1
+
+    logging.basicConfig(level=logging.INFO)
+    with conn_ctx() as conn:
+        init_db(conn)
+        summary = refresh_region_pools(conn, within_hours=args.within_hours, limit=args.limit)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,74 @@ import sqlite3
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 
-from backend.scoring import performance_score, golden_score, golden_score_v4, golden_score_v5, golden_score_v7, golden_score_v71, golden_score_v72, is_food_category, keyword_weight_for_suffix, compute_authority_grade
+from backend.scoring import performance_score, golden_score_v72_batch, is_food_category, keyword_weight_for_suffix, compute_authority_grade
 from backend.analyzer import detect_self_blog
 from backend.blog_analyzer import compute_grade
 from backend.models import CandidateBlogger, BlogPostItem
 
 
+def _v72_columns(
+    rows: List[sqlite3.Row],
+    total_keywords: int,
+    has_category: bool,
+    exp_detail_map: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, List[Any]]:
+    """블로거 집계 행 → golden_score_v72_batch 입력 열.
+
+    파이프라인에서는 개별 ranks/RSS 포스트를 보존하지 않으므로 ContentAuthority/SearchPresence는
+    tier 단계 사전 계산 값을 쓴다.
+    """
+    def c(key: str, default: Any = 0.0) -> List[Any]:
+        return [r[key] or default for r in rows]
+
+    # 키워드 가중치 적용: 핵심 키워드(추천/후기/가격) 노출에 더 높은 점수
+    weighted_strength = [
+        sum(
+            ed["strength_points"] * keyword_weight_for_suffix(ed["keyword"])
+            for ed in exp_detail_map.get(r["blogger_id"], [])
+        )
+        for r in rows
+    ]
+    exposed = [r["exposed_keywords_30d"] for r in rows]
+    n = len(rows)
+    return {
+        "queries_hit_count": exposed,
+        "total_query_count": [max(1, total_keywords)] * n,
+        "popularity_cross_score": c("popularity_cross_score"),
+        "broad_query_hits": c("broad_query_hits", 0),
+        "region_power_hits": c("region_power_hits", 0),
+        "content_authority_precomputed": c("content_authority"),
+        "richness_avg_len": c("rss_richness"),
+        "rss_originality_v7": c("rss_originality_v7"),
+        "rss_diversity_smoothed": c("rss_diversity_smoothed"),
+        "image_ratio": c("image_ratio"),
+        "video_ratio": c("video_ratio"),
+        "days_since_last_post": [r["days_since_last_post"] for r in rows],
+        "search_presence_precomputed": c("search_presence"),
+        "game_defense": c("game_defense"),
+        "quality_floor": c("quality_floor"),
+        "has_category": [has_category] * n,
+        "keyword_match_ratio": c("keyword_match_ratio"),
+        "exposure_ratio": [e / max(1, total_keywords) for e in exposed],
+        "queries_hit_ratio": c("queries_hit_ratio"),
+        "topic_focus": c("topic_focus"),
+        "topic_continuity": c("topic_continuity"),
+        "tfidf_sim": c("tfidf_sim"),  # tier 단계에서 매장별 저장 (blogger_store_signals)
+        "cat_strength": [r["strength_sum"] for r in rows],
+        "cat_exposed": exposed,
+        "total_keywords": [max(1, total_keywords)] * n,
+        "weighted_strength": weighted_strength,
+        "sponsor_signal_rate": c("sponsor_signal_rate"),
+        "avg_image_count": c("avg_image_count"),
+        # v7.2 BlogPower
+        "total_posts": c("total_posts", 0),
+        "total_visitors": c("total_visitors", 0),
+        "total_subscribers": c("total_subscribers", 0),
+        "ranking_percentile": c("ranking_percentile", 100.0),
+        "blog_age_years": c("blog_years"),
+    }
+
+
 def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30, category_text: str = "") -> Dict[str, Any]:
     """Top20 강한 추천 + Pool40 운영 풀 (GoldenScore 기반)"""
 
@@ -27,15 +89,21 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
     days = int(days)
     days_expr = f"-{days} days"
 
-    # 해당 store의 총 키워드 수 조회
+    # 해당 store의 총 키워드 수 조회 (밀집 행 + 희소 모드 확인 기록)
     kw_row = conn.execute(
         """
-        SELECT COUNT(DISTINCT keyword) AS total_keywords
-        FROM exposures
-        WHERE store_id = ?
-          AND checked_at >= datetime('now', ?)
+        SELECT COUNT(*) AS total_keywords
+        FROM (
+          SELECT keyword FROM exposures
+          WHERE store_id = ?
+            AND checked_at >= datetime('now', ?)
+          UNION
+          SELECT keyword FROM exposure_checks
+          WHERE store_id = ?
+            AND checked_at >= datetime('now', ?)
+        )
         """,
-        (store_id, days_expr),
+        (store_id, days_expr, store_id, days_expr),
     ).fetchone()
     total_keywords = kw_row["total_keywords"] if kw_row else 0
 
@@ -48,6 +116,7 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
     store_cat = store_row["category_text"] if store_row else category_text
 
     # 블로거 집계 (넓게 뽑기)
+    # 희소 모드의 미노출 블로거는 exposure_checks 코호트에서 0점 행으로 복원
     rows = conn.execute(
         """
         WITH recent AS (
@@ -56,6 +125,12 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
           WHERE store_id = ?
             AND checked_at >= datetime('now', ?)
         ),
+        checked AS (
+          SELECT DISTINCT j.value AS blogger_id
+          FROM exposure_checks c, json_each(c.blogger_ids_json) j
+          WHERE c.store_id = ?
+            AND c.checked_at >= datetime('now', ?)
+        ),
         agg AS (
           SELECT
             blogger_id,
@@ -67,6 +142,10 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
             MIN(CASE WHEN rank IS NOT NULL THEN rank ELSE 999 END) AS best_rank
           FROM recent
           GROUP BY blogger_id
+          UNION ALL
+          SELECT blogger_id, 0, 0, 0, 0, 0, 999
+          FROM checked
+          WHERE blogger_id NOT IN (SELECT blogger_id FROM recent)
         )
         SELECT
           a.*,
@@ -106,13 +185,15 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
           b.total_visitors,
           b.total_subscribers,
           b.ranking_percentile,
-          b.blog_power
+          b.blog_power,
+          COALESCE(s.tfidf_sim, 0) AS tfidf_sim
         FROM agg a
         JOIN bloggers b ON b.blogger_id = a.blogger_id
-        ORDER BY a.strength_sum DESC, a.page1_keywords_30d DESC, a.exposed_keywords_30d DESC, a.best_rank ASC
+        LEFT JOIN blogger_store_signals s ON s.store_id = ? AND s.blogger_id = a.blogger_id
+        ORDER BY a.strength_sum DESC, a.page1_keywords_30d DESC, a.exposed_keywords_30d DESC, a.best_rank ASC, a.blogger_id ASC
         LIMIT 200;
         """,
-        (store_id, days_expr),
+        (store_id, days_expr, store_id, days_expr, store_id),
     ).fetchall()
 
     if not rows:
@@ -176,7 +257,10 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
     all_bloggers: List[Dict[str, Any]] = []
     competition: List[Dict[str, Any]] = []
 
-    for r in rows:
+    # v7.2: 2단계 점수 (Base + Category Bonus) — 전체 행을 열 단위로 한 번에 계산
+    v72_results = golden_score_v72_batch(_v72_columns(rows, total_keywords, has_category, exp_detail_map))
+
+    for r, v72_result in zip(rows, v72_results):
         best_rank = r["best_rank"]
         best_kw = best_rank_map.get(r["blogger_id"]) if best_rank and best_rank != 999 else None
         exposure_details = exp_detail_map.get(r["blogger_id"], [])
@@ -186,86 +270,7 @@ def get_top20_and_pool40(conn: sqlite3.Connection, store_id: int, days: int = 30
         bs = r["base_score"] or 0.0
         ts = r["tier_score"] or 0.0
         tg = r["tier_grade"] or "D"
-        rp_hits = r["region_power_hits"] or 0
-        bq_hits = r["broad_query_hits"] or 0
-        rss_ia = r["rss_interval_avg"]
-        rss_orig = r["rss_originality"] or 0.0
-        rss_div = r["rss_diversity"] or 0.0
-        rss_rich = r["rss_richness"] or 0.0
-        kw_match = r["keyword_match_ratio"] or 0.0
-        q_hit = r["queries_hit_ratio"] or 0.0
-        # v7.0 신규 필드
-        pop_cross = r["popularity_cross_score"] or 0.0
-        tf = r["topic_focus"] or 0.0
-        tc = r["topic_continuity"] or 0.0
-        gd = r["game_defense"] or 0.0
-        qfl = r["quality_floor"] or 0.0
-        dslp = r["days_since_last_post"]
-        rss_orig_v7 = r["rss_originality_v7"] or 0.0
-        rss_div_sm = r["rss_diversity_smoothed"] or 0.0
-        # v7.1 신규 필드
-        nc = r["neighbor_count"] or 0
-        by = r["blog_years"] or 0.0
-        et = r["estimated_tier"] or "unknown"
-        ir = r["image_ratio"] or 0.0
-        vr = r["video_ratio"] or 0.0
-        ep = r["exposure_power"] or 0.0
-        # v7.2 신규 필드
-        ca = r["content_authority"] or 0.0
-        sp = r["search_presence"] or 0.0
-        aic = r["avg_image_count"] or 0.0
-        # v7.2 BlogPower 신규 필드
-        tp = r["total_posts"] or 0
-        tv = r["total_visitors"] or 0
-        ts_ = r["total_subscribers"] or 0
-        rpct = r["ranking_percentile"] or 100.0
-        bpwr = r["blog_power"] or 0.0
-
-        # 키워드 가중치 적용: 핵심 키워드(추천/후기/가격) 노출에 더 높은 점수
-        weighted_strength = sum(
-            ed["strength_points"] * keyword_weight_for_suffix(ed["keyword"])
-            for ed in exposure_details
-        )
 
-        # v7.2: 2단계 점수 (Base + Category Bonus)
-        v72_result = golden_score_v72(
-            queries_hit_count=r["exposed_keywords_30d"],
-            total_query_count=max(1, total_keywords),
-            ranks=None,  # 파이프라인에서는 개별 ranks 미보존
-            popularity_cross_score=pop_cross,
-            broad_query_hits=bq_hits,
-            region_power_hits=rp_hits,
-            rss_posts=None,
-            content_authority_precomputed=ca,
-            richness_avg_len=rss_rich,
-            rss_originality_v7=rss_orig_v7,
-            rss_diversity_smoothed=rss_div_sm,
-            image_ratio=ir,
-            video_ratio=vr,
-            days_since_last_post=dslp,
-            search_presence_precomputed=sp,
-            game_defense=gd,
-            quality_floor=qfl,
-            has_category=has_category,
-            keyword_match_ratio=kw_match,
-            exposure_ratio=r["exposed_keywords_30d"] / max(1, total_keywords),
-            queries_hit_ratio=q_hit,
-            topic_focus=tf,
-            topic_continuity=tc,
-            tfidf_sim=0.0,  # 파이프라인에서는 TF-IDF 미계산 (RSS 미보존)
-            cat_strength=r["strength_sum"],
-            cat_exposed=r["exposed_keywords_30d"],
-            total_keywords=max(1, total_keywords),
-            weighted_strength=weighted_strength,
-            sponsor_signal_rate=sr,
-            avg_image_count=aic,
-            # v7.2 BlogPower
-            total_posts=tp,
-            total_visitors=tv,
-            total_subscribers=ts_,
-            ranking_percentile=rpct,
-            blog_age_years=by,
-        )
         perf = v72_result["final_score"]
 
         _v72_grade = v72_result["grade"]
@@ -3,11 +3,29 @@ import hashlib
 import math
 import re
 import statistics as _statistics
+from bisect import bisect_left, bisect_right
 from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from backend.models import CandidateBlogger, BlogPostItem
+from backend.post_features import features
+
+# 이전 세대 GoldenScore(v3/v4/v5/v7.0/v7.1)는 backend.scoring_legacy — 첫 접근 때 로드
+_LEGACY_NAMES = frozenset({
+    "golden_score", "golden_score_v4", "golden_score_v5", "golden_score_v7", "golden_score_v71",
+    "_diversity_steep", "_richness_score", "_sponsor_balance", "_sponsor_fit", "_freshness_time_based",
+    "_recent_activity_score", "_richness_expanded", "_post_volume_score", "_richness_store",
+    "_sponsor_balance_store", "compute_blog_authority_v71", "compute_rss_quality_v71", "compute_freshness_v71",
+    "compute_top_exposure_proxy_v71", "compute_sponsor_fit_v71", "assign_grade_v71",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LEGACY_NAMES:
+        from backend import scoring_legacy
+        return getattr(scoring_legacy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 FOOD_WORDS = ["맛집", "메뉴", "웨이팅", "내돈내산", "재방문", "런치", "디너", "맛있", "먹방", "식당"]
@@ -215,119 +233,6 @@ def is_food_category(category_text: str) -> bool:
     return any(kw in cat for kw in FOOD_CATEGORY_KEYWORDS)
 
 
-def golden_score(
-    base_score_val: float,
-    strength_sum: int,
-    exposed_keywords: int,
-    total_keywords: int,
-    food_bias_rate: float,
-    sponsor_signal_rate: float,
-    is_food_cat: Optional[bool] = None,
-    weighted_strength: float = 0.0,
-    page1_keywords: int = 0,
-    unique_exposed_posts: int = 0,
-    unique_page1_posts: int = 0,
-    keyword_match_ratio: float = 0.0,
-    queries_hit_ratio: float = 0.0,
-    has_category: bool = False,
-) -> float:
-    """
-    GoldenScore v3.0 (0~100) = 5축 통합 × 노출 신뢰 계수
-    1. BlogPower (0~15): 정규화된 base_score
-    2. Exposure (0~30): 가중 노출 강도 + 커버리지 × post_diversity_factor
-    3. Page1Authority (0~15): 1페이지 노출 빈도 = 블로그 지수 핵심 프록시
-    4. CategoryFit (0~20): 업종 적합도
-    5. Recruitability (0~10): 섭외 가능성/효과
-
-    exposure_confidence (page1 기반):
-    - page1_ratio >= 0.3 → 1.0 (3+ page1)
-    - page1_ratio >= 0.1 → 0.8 (1-2 page1)
-    - exposure_ratio >= 0.3 → 0.55 (노출은 있지만 page1 없음)
-    - exposure_ratio > 0 → 0.35 (하위권 노출만)
-    - else → 0.2 (미노출)
-
-    post_diversity_factor:
-    - 고유 포스트 수 / 노출 키워드 수 → 다양한 포스트일수록 높은 점수
-    - 5키워드 5포스트 = 1.0 (이상적), 5키워드 1포스트 = 0.52 (감점)
-    """
-    # 1. BlogPower (base_score 0~80 → 0~15)
-    blog_power = (base_score_val / 80.0) * 15.0
-
-    # 2. Exposure (가중 strength 우선 사용, 현실적 분모 적용)
-    effective_strength = weighted_strength if weighted_strength > 0 else float(strength_sum)
-    max_strength = total_keywords * 3
-    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 18.0
-    coverage_part = min(1.0, exposed_keywords / max(1, total_keywords * 0.5)) * 12.0
-
-    # post_diversity_factor: 고유 포스트 / 노출 키워드 수
-    # 5키워드 5포스트 = 1.0 (이상적), 5키워드 1포스트 = 0.52 (감점)
-    if exposed_keywords > 0 and unique_exposed_posts > 0:
-        diversity_ratio = unique_exposed_posts / exposed_keywords
-        diversity_factor = 0.4 + 0.6 * diversity_ratio  # 최소 0.4 ~ 최대 1.0
-    else:
-        diversity_factor = 1.0  # unique_exposed_posts 정보 없으면 패널티 없음
-
-    exposure = (strength_part + coverage_part) * diversity_factor
-
-    # 3. Page1Authority (1페이지 노출 빈도 = 블로그 지수 핵심 프록시)
-    # unique_page1_posts 가용 시 고유 포스트 기준 사용
-    effective_page1 = unique_page1_posts if unique_page1_posts > 0 else page1_keywords
-    page1_ratio = effective_page1 / max(1, total_keywords)
-    if page1_ratio >= 0.5:
-        page1_authority = 15.0
-    elif page1_ratio >= 0.3:
-        page1_authority = 12.0
-    elif page1_ratio >= 0.2:
-        page1_authority = 8.0
-    elif page1_ratio >= 0.1:
-        page1_authority = 4.0
-    else:
-        page1_authority = 0.0
-
-    # 4. CategoryFit (키워드 기반 추가 보너스, 0~20)
-    if not has_category:
-        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
-    else:
-        exposure_ratio = exposed_keywords / max(1, total_keywords)
-        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
-        category_fit = fit * 20.0
-
-    # 5. Recruitability (sweet spot: 10~30% sponsor rate)
-    if sponsor_signal_rate >= 0.60:
-        recruit = 1.5
-    elif sponsor_signal_rate >= 0.45:
-        recruit = 3.0
-    elif sponsor_signal_rate >= 0.30:
-        recruit = 7.0
-    elif sponsor_signal_rate >= 0.15:
-        recruit = 10.0
-    elif sponsor_signal_rate >= 0.05:
-        recruit = 8.0
-    else:
-        recruit = 5.0
-
-    raw_score = blog_power + exposure + page1_authority + category_fit + recruit
-
-    # 노출 신뢰 계수 (page1 기반 exposure_confidence)
-    # unique 포스트 가용 시 고유 포스트 기준 사용
-    effective_page1_for_conf = unique_page1_posts if unique_page1_posts > 0 else page1_keywords
-    effective_exposed_for_conf = unique_exposed_posts if unique_exposed_posts > 0 else exposed_keywords
-    effective_page1_ratio = effective_page1_for_conf / max(1, total_keywords)
-    effective_exposure_ratio = effective_exposed_for_conf / max(1, total_keywords)
-    if effective_page1_ratio >= 0.3:
-        confidence = 1.0
-    elif effective_page1_ratio >= 0.1:
-        confidence = 0.8
-    elif effective_exposure_ratio >= 0.3:
-        confidence = 0.55
-    elif effective_exposure_ratio > 0:
-        confidence = 0.35
-    else:
-        confidence = 0.2
-
-    return round(raw_score * confidence, 1)
-
-
 def compute_tier_grade(tier_score: float) -> str:
     """TierScore → TierGrade 변환."""
     if tier_score >= 35:
@@ -380,48 +285,6 @@ def _originality_steep(originality_raw: float) -> float:
         return 0.0
 
 
-def _diversity_steep(entropy: float) -> float:
-    """주제 다양성 (0~10): 가파른 단계형 (entropy 0~1)."""
-    if entropy >= 0.97:
-        return 10.0
-    elif entropy >= 0.95:
-        return 8.0
-    elif entropy >= 0.92:
-        return 6.0
-    elif entropy >= 0.88:
-        return 4.0
-    elif entropy >= 0.85:
-        return 2.0
-    else:
-        return 0.0
-
-
-def _richness_score(avg_desc_len: float) -> float:
-    """충실도 (0~5): description 평균 길이."""
-    if avg_desc_len >= 300:
-        return 5.0
-    elif avg_desc_len >= 200:
-        return 4.0
-    elif avg_desc_len >= 100:
-        return 2.5
-    else:
-        return 1.0
-
-
-def _sponsor_balance(sponsor_rate: float) -> float:
-    """협찬 균형 (0~5)."""
-    if 0.10 <= sponsor_rate <= 0.30:
-        return 5.0
-    elif (0.05 <= sponsor_rate < 0.10) or (0.30 < sponsor_rate <= 0.45):
-        return 3.0
-    elif sponsor_rate < 0.05:
-        return 2.5
-    elif 0.45 < sponsor_rate <= 0.60:
-        return 1.5
-    else:
-        return 0.5
-
-
 def compute_authority_grade(authority_score: float) -> str:
     """BlogAuthority (0~30) → AuthorityGrade 변환."""
     if authority_score >= 25:
@@ -436,105 +299,63 @@ def compute_authority_grade(authority_score: float) -> str:
         return "D"
 
 
-def golden_score_v5(
-    region_power_hits: int,
-    broad_query_hits: int,
-    interval_avg: Optional[float],
-    originality_raw: float,
-    diversity_entropy: float,
-    richness_avg_len: float,
-    sponsor_signal_rate: float,
-    cat_strength: int,
-    cat_exposed: int,
-    total_keywords: int,
-    food_bias_rate: float = 0.0,
-    is_food_cat: Optional[bool] = None,
-    base_score_val: float = 0.0,
-    weighted_strength: float = 0.0,
-    keyword_match_ratio: float = 0.0,
-    queries_hit_ratio: float = 0.0,
-    has_category: bool = False,
-) -> float:
-    """
-    GoldenScore v5.0 (0~100) = BlogAuthority(30) + CategoryExposure(25)
-    + CategoryFit(15) + Freshness(10) + RSSQuality(20)
-    """
-    # 1. BlogAuthority (0~30)
-    # CrossCatAuthority (0~15)
-    if region_power_hits >= 3:
-        cross_rp = 10.0
-    elif region_power_hits >= 2:
-        cross_rp = 7.0
-    elif region_power_hits >= 1:
-        cross_rp = 4.0
-    else:
-        cross_rp = 0.0
-
-    if broad_query_hits >= 3:
-        cross_broad = 5.0
-    elif broad_query_hits >= 2:
-        cross_broad = 3.0
-    elif broad_query_hits >= 1:
-        cross_broad = 1.5
-    else:
-        cross_broad = 0.0
-
-    cross_cat_authority = min(15.0, cross_rp + cross_broad)
-    posting_intensity = _posting_intensity(interval_avg)
-    originality = _originality_steep(originality_raw)
-    blog_authority = min(30.0, cross_cat_authority + posting_intensity + originality)
-
-    # 2. CategoryExposure (0~25)
-    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
-    max_strength = total_keywords * 3
-    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 15.0
-    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 10.0
-    cat_exposure = strength_part + coverage_part
-
-    # 3. CategoryFit (키워드 기반 추가 보너스, 0~15)
-    if not has_category:
-        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
-    else:
-        exposure_ratio = cat_exposed / max(1, total_keywords)
-        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
-        category_fit = fit * 15.0
+# ===========================
+# GoldenScore v7.0 함수
+# ===========================
 
-    # 4. Freshness (0~10)
-    freshness = (base_score_val / 80.0) * 10.0
+# SimHash 3-gram → md5 하위 64비트(8바이트, big-endian) 캐시. 같은 블로거의 반복 문구/
+# 블로거 간 공통 어구가 많아 히트율이 높다. 상한을 넘으면 비우고 다시 채운다.
+_SIMHASH_TOKEN_CACHE: Dict[str, bytes] = {}
+_SIMHASH_TOKEN_CACHE_MAX = 200_000
+# 바이트 값 → k번째 비트(0/1) 변환표. bytes.translate + count로 비트 투표를 C 루프에서 집계
+_SIMHASH_BIT_TABLES = [bytes((b >> k) & 1 for b in range(256)) for k in range(8)]
 
-    # 5. RSSQuality (0~20)
-    diversity = _diversity_steep(diversity_entropy)
-    richness = _richness_score(richness_avg_len)
-    sponsor_bal = _sponsor_balance(sponsor_signal_rate)
-    rss_quality = diversity + richness + sponsor_bal
 
-    raw_score = blog_authority + cat_exposure + category_fit + freshness + rss_quality
-    return round(min(100.0, max(0.0, raw_score)), 1)
+def _simhash_token_digests(tokens: List[str]) -> bytes:
+    """토큰별 md5 하위 8바이트를 이어 붙인 바이트열 (토큰 i → [8i, 8i+8))."""
+    cache = _SIMHASH_TOKEN_CACHE
+    if len(cache) > _SIMHASH_TOKEN_CACHE_MAX:
+        cache.clear()
+    parts = []
+    for token in tokens:
+        d = cache.get(token)
+        if d is None:
+            d = hashlib.md5(token.encode("utf-8", errors="replace")).digest()[8:]
+            cache[token] = d
+        parts.append(d)
+    return b"".join(parts)
 
 
-# ===========================
-# GoldenScore v7.0 함수
-# ===========================
+def compute_simhash_batch(texts: List[str]) -> List[int]:
+    """텍스트 여러 개의 64비트 SimHash (compute_simhash와 비트 단위 동일).
+
+    토큰 해시는 캐시하고, 비트 투표는 토큰마다 64회 파이썬 루프 대신
+    바이트 열(열마다 토큰 수만큼)을 비트 변환표로 translate한 뒤 1의 개수를 센다.
+    """
+    results: List[int] = []
+    for text in texts:
+        if not text:
+            results.append(0)
+            continue
+        # 3-gram 추출
+        tokens = [text[i:i+3] for i in range(max(1, len(text) - 2))]
+        buf = _simhash_token_digests(tokens)
+        n = len(tokens)
+        fingerprint = 0
+        for col in range(8):
+            # md5 digest[8 + col] = 정수 비트 (7 - col) * 8 ~ +7
+            column = buf[col::8]
+            shift = (7 - col) * 8
+            for k in range(8):
+                if 2 * column.translate(_SIMHASH_BIT_TABLES[k]).count(1) > n:
+                    fingerprint |= 1 << (shift + k)
+        results.append(fingerprint)
+    return results
+
 
 def compute_simhash(text: str) -> int:
     """64비트 SimHash 핑거프린트 (한국어 3-gram 기반)."""
-    if not text:
-        return 0
-    # 3-gram 추출
-    tokens = [text[i:i+3] for i in range(max(1, len(text) - 2))]
-    v = [0] * 64
-    for token in tokens:
-        h = int(hashlib.md5(token.encode("utf-8", errors="replace")).hexdigest(), 16)
-        for i in range(64):
-            if h & (1 << i):
-                v[i] += 1
-            else:
-                v[i] -= 1
-    fingerprint = 0
-    for i in range(64):
-        if v[i] > 0:
-            fingerprint |= (1 << i)
-    return fingerprint
+    return compute_simhash_batch([text])[0]
 
 
 def hamming_distance(h1: int, h2: int) -> int:
@@ -547,8 +368,7 @@ def compute_near_duplicate_rate(rss_posts: List[Any]) -> float:
     """SimHash 기반 근사 중복률 (0~1). 해밍 거리 ≤ 3이면 근사 중복."""
     if len(rss_posts) < 2:
         return 0.0
-    descriptions = [getattr(p, "description", "") or "" for p in rss_posts]
-    hashes = [compute_simhash(d) for d in descriptions[:20]]
+    hashes = [features(p).desc_simhash for p in rss_posts[:20]]
     total_pairs = 0
     dup_pairs = 0
     for i in range(len(hashes)):
@@ -574,9 +394,7 @@ def compute_diversity_smoothed(rss_posts: List[Any]) -> float:
 
     words: List[str] = []
     for p in rss_posts:
-        title = getattr(p, "title", "") or ""
-        tokens = re.findall(r"[가-힣]{2,}", title)
-        words.extend(tokens)
+        words.extend(features(p).title_tokens)
 
     if not words:
         return 0.0
@@ -631,15 +449,18 @@ def compute_topic_continuity(rss_posts: List[Any], match_keywords: List[str]) ->
 
 
 def compute_game_defense(rss_posts: List[Any], rss_data: dict = None) -> float:
-    """GameDefense (0 to -10): Thin content/키워드스터핑/템플릿 남용 감점."""
+    """GameDefense (0 to -10): Thin content/키워드스터핑/템플릿 남용 감점.
+
+    rss_data: {"interval_avg": 평균 포스팅 간격(일), "cross_blog_dup_rate": 먼저 수집된 다른 블로거 포스트
+    (또는 대규모 템플릿 묶음)와 근사 중복인 포스트 비율 (dup_index.cross_blog_duplicates, 없으면 0)}
+    """
     if not rss_posts:
         return 0.0
 
     penalty = 0.0
 
     # 1. Thin content (-4): 평균 description 길이 < 500 + 포스팅 간격 < 0.5일
-    descriptions = [getattr(p, "description", "") or "" for p in rss_posts]
-    avg_len = sum(len(d) for d in descriptions) / max(1, len(descriptions))
+    avg_len = sum(features(p).desc_len for p in rss_posts) / max(1, len(rss_posts))
     interval = (rss_data or {}).get("interval_avg")
     if avg_len < 500 and interval is not None and interval < 0.5:
         penalty -= 4.0
@@ -647,8 +468,7 @@ def compute_game_defense(rss_posts: List[Any], rss_data: dict = None) -> float:
     # 2. 키워드 스터핑 (-3): 제목 내 동일 단어 3회+ 반복 비율 ≥ 30%
     stuffing_count = 0
     for p in rss_posts:
-        title = getattr(p, "title", "") or ""
-        words = re.findall(r"[가-힣]{2,}", title)
+        words = features(p).title_tokens
         if words:
             counter = Counter(words)
             most_common_count = counter.most_common(1)[0][1]
@@ -662,6 +482,11 @@ def compute_game_defense(rss_posts: List[Any], rss_data: dict = None) -> float:
     if dup_rate >= 0.50:
         penalty -= 3.0
 
+    # 4. 블로거 간 템플릿 (-3): 다른 블로거 원고를 복제한 비율 ≥ 30% (대행사 템플릿 팜, 원작자 제외)
+    cross_rate = (rss_data or {}).get("cross_blog_dup_rate") or 0.0
+    if cross_rate >= 0.30:
+        penalty -= 3.0
+
     return max(-10.0, penalty)
 
 
@@ -682,286 +507,10 @@ def compute_quality_floor(
     return min(5.0, bonus)
 
 
-def _sponsor_fit(rate: float) -> float:
-    """SponsorFit (0~5): 협찬률 적합도 (sweet spot 10-30%)."""
-    if 0.10 <= rate <= 0.30:
-        return 5.0
-    elif (0.05 <= rate < 0.10) or (0.30 < rate <= 0.45):
-        return 3.0
-    elif rate < 0.05:
-        return 2.5
-    elif 0.45 < rate <= 0.60:
-        return 1.5
-    else:
-        return 0.5
-
-
-def _freshness_time_based(days: Optional[int]) -> float:
-    """시간 기반 Freshness (0~10): days_since_last_post."""
-    if days is None:
-        return 0.0
-    if days <= 3:
-        return 10.0
-    elif days <= 7:
-        return 8.0
-    elif days <= 14:
-        return 6.0
-    elif days <= 30:
-        return 4.0
-    elif days <= 60:
-        return 2.0
-    else:
-        return 0.0
-
-
-def golden_score_v7(
-    region_power_hits: int,
-    broad_query_hits: int,
-    interval_avg: Optional[float],
-    originality_raw: float,
-    diversity_entropy: float,
-    richness_avg_len: float,
-    sponsor_signal_rate: float,
-    cat_strength: int,
-    cat_exposed: int,
-    total_keywords: int,
-    food_bias_rate: float = 0.0,
-    is_food_cat: Optional[bool] = None,
-    base_score_val: float = 0.0,
-    weighted_strength: float = 0.0,
-    keyword_match_ratio: float = 0.0,
-    queries_hit_ratio: float = 0.0,
-    has_category: bool = False,
-    popularity_cross_score: float = 0.0,
-    page1_keywords: int = 0,
-    topic_focus: float = 0.0,
-    topic_continuity: float = 0.0,
-    days_since_last_post: Optional[int] = None,
-    rss_originality_v7: float = 0.0,
-    rss_diversity_smoothed: float = 0.0,
-    game_defense: float = 0.0,
-    quality_floor: float = 0.0,
-) -> float:
-    """
-    GoldenScore v7.0 (0~100) = 9축 통합
-    BlogAuthority(22) + CategoryExposure(18) + TopExposureProxy(12) + CategoryFit(15)
-    + Freshness(10) + RSSQuality(13) + SponsorFit(5) + GameDefense(-10) + QualityFloor(+5)
-    """
-    # 1. BlogAuthority (0~22): CrossCat(0~12) + PostingIntensity(0~6) + Originality(0~4)
-    if region_power_hits >= 3:
-        cross_rp = 8.0
-    elif region_power_hits >= 2:
-        cross_rp = 5.5
-    elif region_power_hits >= 1:
-        cross_rp = 3.0
-    else:
-        cross_rp = 0.0
-
-    if broad_query_hits >= 3:
-        cross_broad = 4.0
-    elif broad_query_hits >= 2:
-        cross_broad = 2.5
-    elif broad_query_hits >= 1:
-        cross_broad = 1.0
-    else:
-        cross_broad = 0.0
-
-    cross_cat = min(12.0, cross_rp + cross_broad)
-    posting_i = _posting_intensity(interval_avg)
-    posting_part = posting_i * 0.6  # 0~6
-    orig_part = _originality_steep(originality_raw) * 0.8  # 0~4
-    blog_authority = min(22.0, cross_cat + posting_part + orig_part)
-
-    # 2. CategoryExposure (0~18): Strength(0~11) + Coverage(0~7)
-    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
-    max_strength = total_keywords * 3
-    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 11.0
-    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 7.0
-    cat_exposure = strength_part + coverage_part
-
-    # 3. TopExposureProxy (0~12): popularity_cross(0~8) + page1_ratio(0~4)
-    pop_cross = popularity_cross_score * 8.0  # 0~8
-    page1_ratio = page1_keywords / max(1, total_keywords)
-    if page1_ratio >= 0.3:
-        page1_part = 4.0
-    elif page1_ratio >= 0.2:
-        page1_part = 3.0
-    elif page1_ratio >= 0.1:
-        page1_part = 2.0
-    elif page1_ratio > 0:
-        page1_part = 1.0
-    else:
-        page1_part = 0.0
-    top_exp_proxy = min(12.0, pop_cross + page1_part)
-
-    # 4. CategoryFit (0~15): 5-signal 가중평균 × 15
-    if not has_category:
-        category_fit = 0.0
-    else:
-        exposure_ratio = cat_exposed / max(1, total_keywords)
-        qh_ratio = queries_hit_ratio
-        # 5-signal: kw_match(0.20) + exposure_ratio(0.20) + qh_ratio(0.15) + topic_focus(0.25) + topic_continuity(0.20)
-        fit = (keyword_match_ratio * 0.20
-               + exposure_ratio * 0.20
-               + qh_ratio * 0.15
-               + topic_focus * 0.25
-               + topic_continuity * 0.20)
-        category_fit = fit * 15.0
-
-    # 5. Freshness (0~10): 시간 기반
-    freshness = _freshness_time_based(days_since_last_post)
-
-    # 6. RSSQuality (0~13): Diversity(0~6) + Richness(0~4) + Originality bonus(0~3)
-    div_score = rss_diversity_smoothed * 6.0  # 0~6
-    if richness_avg_len >= 300:
-        rich_score = 4.0
-    elif richness_avg_len >= 200:
-        rich_score = 3.0
-    elif richness_avg_len >= 100:
-        rich_score = 2.0
-    else:
-        rich_score = 1.0
-    orig_bonus = min(3.0, rss_originality_v7 / 8.0 * 3.0)  # 0~3
-    rss_quality = min(13.0, div_score + rich_score + orig_bonus)
-
-    # 7. SponsorFit (0~5)
-    sponsor_fit = _sponsor_fit(sponsor_signal_rate)
-
-    # 8. GameDefense (0 to -10)
-    gd = max(-10.0, min(0.0, game_defense))
-
-    # 9. QualityFloor (0 to +5)
-    qf = max(0.0, min(5.0, quality_floor))
-
-    raw = blog_authority + cat_exposure + top_exp_proxy + category_fit + freshness + rss_quality + sponsor_fit + gd + qf
-    return round(max(0.0, min(100.0, raw)), 1)
-
-
-def golden_score_v4(
-    tier_score: float,
-    cat_strength: int,
-    cat_exposed: int,
-    total_keywords: int,
-    food_bias_rate: float = 0.0,
-    is_food_cat: Optional[bool] = None,
-    base_score_val: float = 0.0,
-    weighted_strength: float = 0.0,
-    keyword_match_ratio: float = 0.0,
-    queries_hit_ratio: float = 0.0,
-    has_category: bool = False,
-) -> float:
-    """
-    GoldenScore v4.0 (0~100) = TierScore(40) + CategoryExposure(35) + CategoryFit(15) + Freshness(10)
-
-    - TierScore: RSS 기반 순수체급 (이미 계산되어 전달됨, 0~40)
-    - CategoryExposure: 업종 키워드 노출 강도 + 커버리지 (0~35)
-    - CategoryFit: 업종 적합도 (0~15)
-    - Freshness: 최근활동/SERP 순위/빈도 반영 (0~10)
-    - Recruitability 제거 (태그만 유지)
-    """
-    # 1. TierScore (0~40, 이미 계산됨)
-    tier = min(40.0, max(0.0, tier_score))
-
-    # 2. CategoryExposure (0~35): strength(20) + coverage(15)
-    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
-    max_strength = total_keywords * 3
-    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 20.0
-    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 15.0
-    cat_exposure = strength_part + coverage_part
-
-    # 3. CategoryFit (키워드 기반 추가 보너스, 0~15)
-    if not has_category:
-        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
-    else:
-        exposure_ratio = cat_exposed / max(1, total_keywords)
-        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
-        category_fit = fit * 15.0
-
-    # 4. Freshness (0~10): base_score 기반
-    freshness = (base_score_val / 80.0) * 10.0
-
-    raw_score = tier + cat_exposure + category_fit + freshness
-    return round(min(100.0, max(0.0, raw_score)), 1)
-
-
 # ===========================
 # 블로그 단독 분석 전용 스코어링
 # ===========================
 
-def _recent_activity_score(days_since: Optional[int]) -> float:
-    """최근 활동 점수 (0~15): 30일 기준 step curve."""
-    if days_since is None:
-        return 0.0
-    if days_since <= 3:
-        return 15.0
-    elif days_since <= 7:
-        return 12.0
-    elif days_since <= 14:
-        return 9.0
-    elif days_since <= 30:
-        return 6.0
-    elif days_since <= 60:
-        return 3.0
-    else:
-        return 0.0
-
-
-def _richness_expanded(avg_len: float) -> float:
-    """콘텐츠 충실도 확장 (0~12): description 평균 길이."""
-    if avg_len >= 400:
-        return 12.0
-    elif avg_len >= 300:
-        return 10.0
-    elif avg_len >= 200:
-        return 7.0
-    elif avg_len >= 100:
-        return 4.0
-    else:
-        return 1.0
-
-
-def _post_volume_score(total_posts: int) -> float:
-    """포스트 수량 점수 (0~8)."""
-    if total_posts >= 40:
-        return 8.0
-    elif total_posts >= 25:
-        return 6.0
-    elif total_posts >= 15:
-        return 4.0
-    elif total_posts >= 5:
-        return 2.0
-    else:
-        return 0.0
-
-
-def _richness_store(avg_len: float) -> float:
-    """RSS 품질 충실도 (0~8): 매장 연계용."""
-    if avg_len >= 400:
-        return 8.0
-    elif avg_len >= 300:
-        return 7.0
-    elif avg_len >= 200:
-        return 5.0
-    elif avg_len >= 100:
-        return 3.0
-    else:
-        return 1.0
-
-
-def _sponsor_balance_store(rate: float) -> float:
-    """협찬 균형 확장 (0~7): 매장 연계용."""
-    if 0.10 <= rate <= 0.30:
-        return 7.0
-    elif (0.05 <= rate < 0.10) or (0.30 < rate <= 0.45):
-        return 4.5
-    elif rate < 0.05:
-        return 3.5
-    elif 0.45 < rate <= 0.60:
-        return 2.0
-    else:
-        return 1.0
-
-
 def blog_analysis_score(
     *,
     interval_avg: Optional[float],
@@ -1135,6 +684,71 @@ def compute_exposure_power(
     return round(min(30.0, max(0.0, total)), 1)
 
 
+# ===========================
+# v7.2 구간표 — 스칼라 함수와 golden_score_v72_batch가 같은 표를 쓴다 (임계값은 여기서만 수정)
+# ===========================
+
+_POSITIVE = math.nextafter(0.0, 1.0)  # "x > 0" 구간 = x >= 가장 작은 양수
+
+
+def _steps_ge(thresholds: Tuple[float, ...], values: Tuple[Any, ...], below: Any):
+    """if x >= t[-1]: v[-1] elif ... else below 사다리 → 구간표 조회 함수 (thresholds 오름차순)."""
+    table = (below,) + tuple(values)
+    ts = tuple(thresholds)
+    return lambda x: table[bisect_right(ts, x)]
+
+
+def _steps_le(thresholds: Tuple[float, ...], values: Tuple[Any, ...], above: Any):
+    """if x <= t[0]: v[0] elif ... else above 사다리 → 구간표 조회 함수 (thresholds 오름차순)."""
+    table = tuple(values) + (above,)
+    ts = tuple(thresholds)
+    return lambda x: table[bisect_left(ts, x)]
+
+
+# compute_blog_power / blog_power_influence
+_BP_POSTS = _steps_ge((30, 100, 300, 700, 1500, 3000), (1.5, 3, 4, 5, 6, 7), 0)
+_BP_VISITORS = _steps_ge((10000, 50000, 200000, 500000, 1000000, 3000000), (2, 3, 4, 5, 6, 7), 0)
+_BP_SUBSCRIBERS = _steps_ge((30, 100, 300, 1000, 3000), (1, 2, 3, 4, 5), 0.0)
+_BP_RANKING = _steps_le((0.5, 2, 5, 15, 30), (5, 4, 3, 2, 1), 0.0)
+_BP_AGE_ACTIVE = _steps_ge((1, 3, 5, 10), (2, 3.5, 5, 6), 0)
+_BP_AGE_INACTIVE = _steps_ge((1, 5, 10), (1, 2.5, 4), 0)
+# compute_exposure_power_v72 SERP 등장 빈도 / 검색 유형 다양성, apply_ep_inference 하한
+_EP_SERP = _steps_ge((_POSITIVE, 0.05, 0.1, 0.2, 0.35, 0.5), (1.0, 2.0, 3.0, 4.0, 5.0, 6.0), 0.0)
+_EP_DIVERSITY = _steps_ge((1, 2, 3), (1.0, 1.5, 2.0), 0.0)
+_EP_FLOOR = _steps_ge((8, 14, 18, 22), (3.0, 6.0, 10.0, 16.0), 0.0)
+# compute_rss_quality_v72 충실도 / 미디어, golden_score_v72 소규모 블로그 보정
+_RQ_RICHNESS = _steps_ge((_POSITIVE, 600, 1000, 1500, 2200, 3000), (1.5, 3.0, 4.0, 5.0, 6.0, 7.0), 0.0)
+_RQ_MEDIA = _steps_ge((_POSITIVE, 0.5, 0.8), (1.0, 2.0, 3.0), 0.0)
+_RQ_SMALL_BLOG = _steps_ge((10000, 30000), (0.85, 0.9), 0.75)
+# compute_freshness_v72 최신 글 발행일 (0~8)
+_FR_RECENT_DAYS = (1, 3, 7, 14, 30, 60, 90)
+_FR_RECENT_POINTS = (8.0, 7.0, 6.0, 4.0, 3.0, 2.0, 1.0)
+_FR_RECENT_RAW = _steps_le(_FR_RECENT_DAYS, _FR_RECENT_POINTS, 0.0)
+# 일괄 계산(RSS 없음)용: 10점 환산까지 미리 계산
+_FR_RECENT_V72 = tuple(round(min(10.0, v / 18.0 * 10.0), 1) for v in _FR_RECENT_POINTS + (0.0,))
+_FR_RECENT = _steps_le(_FR_RECENT_DAYS, _FR_RECENT_V72[:-1], _FR_RECENT_V72[-1])
+# compute_category_fit_bonus_v722
+_CF_FOCUS = _steps_ge((_POSITIVE, 0.15, 0.3, 0.5, 0.7), (0.5, 1.5, 2.0, 2.5, 3.0), 0.0)
+_CF_EXPOSED = _steps_ge((1, 3, 5), (1.0, 1.5, 2.0), 0.0)
+# compute_sponsor_bonus_v72 글 퀄리티 조합 (이미지 보정 길이)
+_SB_COMBO = _steps_ge((400, 800, 1500), (1.0, 1.5, 2.0), 0.5)
+# assign_grade_v72
+_GRADE_V72 = _steps_ge((30, 40, 50, 60, 70, 80, 90), ("D", "C", "B", "B+", "A", "S", "S+"), "F")
+
+
+def _sponsor_exp_v72(s_rate: float) -> float:
+    """체험단/협찬 경험 (0~3) — 경계 포함 여부가 구간마다 달라 구간표 대신 직접 비교."""
+    if s_rate < 0.05:
+        return 1.5
+    if s_rate < 0.10:
+        return 2.0
+    if s_rate <= 0.40:
+        return 3.0
+    if s_rate <= 0.60:
+        return 2.0
+    return 1.0
+
+
 def compute_exposure_power_v72(
     queries_hit_count: int,
     total_query_count: int,
@@ -1160,21 +774,7 @@ def compute_exposure_power_v72(
     seed_rate = seed_appeared / max(1, seed_total) if seed_total > 0 else 0.0
     reverse_rate = reverse_appeared / max(1, reverse_total) if reverse_total > 0 else 0.0
     effective_rate = max(seed_rate, reverse_rate)
-
-    if effective_rate >= 0.5:
-        serp_freq = 6.0
-    elif effective_rate >= 0.35:
-        serp_freq = 5.0
-    elif effective_rate >= 0.2:
-        serp_freq = 4.0
-    elif effective_rate >= 0.1:
-        serp_freq = 3.0
-    elif effective_rate >= 0.05:
-        serp_freq = 2.0
-    elif effective_rate > 0:
-        serp_freq = 1.0
-    else:
-        serp_freq = 0.0
+    serp_freq = _EP_SERP(effective_rate)
 
     # 2. 순위 분포 (0~6)
     if ranks:
@@ -1243,304 +843,12 @@ def compute_exposure_power_v72(
         diversity_count += 1  # reverse
     if region_power_hits > 0:
         diversity_count += 1  # region_power
-    diversity_part = 0.0
-    if diversity_count >= 3:
-        diversity_part = 2.0
-    elif diversity_count >= 2:
-        diversity_part = 1.5
-    elif diversity_count >= 1:
-        diversity_part = 1.0
-
-    diversity_total = min(4.0, pop_part + diversity_part)
+    diversity_total = min(4.0, pop_part + _EP_DIVERSITY(diversity_count))
 
     total = serp_freq + rank_score + scale_score + diversity_total
     return round(min(22.0, max(0.0, total)), 1)
 
 
-def compute_blog_authority_v71(
-    estimated_tier: str,
-    neighbor_count: int,
-    blog_years: float,
-    interval_avg: Optional[float],
-) -> float:
-    """BlogAuthority v7.1 (0~22): 4개 하위 항목.
-
-    1. 블로그 등급 추정 (0~10)
-    2. 이웃 수 기반 영향력 (0~5)
-    3. 블로그 운영 기간 (0~4)
-    4. 포스팅 꾸준함 (0~3)
-    """
-    # 1. 블로그 등급 추정 (0~10)
-    tier_map = {"power": 10.0, "premium": 8.0, "gold": 6.0, "silver": 4.0, "normal": 2.0, "unknown": 1.0}
-    tier_score = tier_map.get(estimated_tier, 1.0)
-
-    # 2. 이웃 수 기반 영향력 (0~5)
-    if neighbor_count >= 5000:
-        neighbor_score = 5.0
-    elif neighbor_count >= 2000:
-        neighbor_score = 4.0
-    elif neighbor_count >= 1000:
-        neighbor_score = 3.0
-    elif neighbor_count >= 500:
-        neighbor_score = 2.0
-    elif neighbor_count >= 100:
-        neighbor_score = 1.0
-    else:
-        neighbor_score = 0.0
-
-    # 3. 블로그 운영 기간 (0~4)
-    if blog_years >= 5:
-        years_score = 4.0
-    elif blog_years >= 3:
-        years_score = 3.0
-    elif blog_years >= 2:
-        years_score = 2.0
-    elif blog_years >= 1:
-        years_score = 1.0
-    else:
-        years_score = 0.0
-
-    # 4. 포스팅 꾸준함 (0~3)
-    if interval_avg is None:
-        posting_score = 0.0
-    elif interval_avg <= 2:
-        posting_score = 3.0
-    elif interval_avg <= 5:
-        posting_score = 2.0
-    elif interval_avg <= 10:
-        posting_score = 1.0
-    else:
-        posting_score = 0.0
-
-    total = tier_score + neighbor_score + years_score + posting_score
-    return round(min(22.0, max(0.0, total)), 1)
-
-
-def compute_rss_quality_v71(
-    richness_avg_len: float,
-    rss_originality_v7: float,
-    rss_diversity_smoothed: float,
-    image_ratio: float,
-    video_ratio: float,
-) -> float:
-    """RSSQuality v7.1 (0~18): 4개 하위 항목.
-
-    1. 글 길이/충실도 (0~5)
-    2. Originality (0~4)
-    3. Diversity (0~5)
-    4. 미디어 활용도 (0~4)
-    """
-    # 1. 글 길이/충실도 (0~5)
-    if richness_avg_len >= 3000:
-        richness = 5.0
-    elif richness_avg_len >= 2000:
-        richness = 4.0
-    elif richness_avg_len >= 1000:
-        richness = 3.0
-    elif richness_avg_len >= 500:
-        richness = 2.0
-    elif richness_avg_len >= 200:
-        richness = 1.0
-    else:
-        richness = 0.0
-
-    # 2. Originality (0~4): SimHash 기반 (0~8 → 0~4 스케일)
-    orig = min(4.0, rss_originality_v7 / 8.0 * 4.0)
-
-    # 3. Diversity (0~5): Bayesian smoothed (0~1 → 0~5)
-    div = min(5.0, rss_diversity_smoothed * 5.0)
-
-    # 4. 미디어 활용도 (0~4)
-    media = 0.0
-    if image_ratio >= 0.8:
-        media += 3.0
-    elif image_ratio >= 0.5:
-        media += 2.0
-    elif image_ratio >= 0.2:
-        media += 1.0
-    if video_ratio >= 0.1:
-        media += 1.0
-    media = min(4.0, media)
-
-    total = richness + orig + div + media
-    return round(min(18.0, max(0.0, total)), 1)
-
-
-def compute_freshness_v71(
-    days_since_last_post: Optional[int],
-    rss_posts: Optional[List[Any]] = None,
-) -> float:
-    """Freshness v7.1 (0~12): 3개 하위 항목.
-
-    1. 최신 글 발행일 (0~6)
-    2. 최근 30일 발행 빈도 (0~4)
-    3. 발행 연속성 (0~2): 최근 3개월 매월 1건 이상
-    """
-    # 1. 최신 글 발행일 (0~6)
-    if days_since_last_post is None:
-        recent = 0.0
-    elif days_since_last_post <= 3:
-        recent = 6.0
-    elif days_since_last_post <= 7:
-        recent = 5.0
-    elif days_since_last_post <= 14:
-        recent = 4.0
-    elif days_since_last_post <= 30:
-        recent = 3.0
-    elif days_since_last_post <= 60:
-        recent = 1.0
-    else:
-        recent = 0.0
-
-    # 2. 최근 30일 발행 빈도 (0~4)
-    freq = 0.0
-    if rss_posts:
-        now = datetime.now()
-        recent_30d = 0
-        for p in rss_posts:
-            pub = None
-            pub_str = getattr(p, "pub_date", None)
-            if pub_str:
-                for fmt in (
-                    "%a, %d %b %Y %H:%M:%S %z",
-                    "%a, %d %b %Y %H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S%z",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%d",
-                ):
-                    try:
-                        pub = datetime.strptime(pub_str.strip(), fmt).replace(tzinfo=None)
-                        break
-                    except (ValueError, TypeError):
-                        continue
-            if pub and (now - pub).days <= 30:
-                recent_30d += 1
-        if recent_30d >= 10:
-            freq = 4.0
-        elif recent_30d >= 6:
-            freq = 3.0
-        elif recent_30d >= 3:
-            freq = 2.0
-        elif recent_30d >= 1:
-            freq = 1.0
-
-    # 3. 발행 연속성 (0~2): 최근 3개월 매월 1건 이상
-    continuity = 0.0
-    if rss_posts:
-        now = datetime.now()
-        months_with_post = set()
-        for p in rss_posts:
-            pub = None
-            pub_str = getattr(p, "pub_date", None)
-            if pub_str:
-                for fmt in (
-                    "%a, %d %b %Y %H:%M:%S %z",
-                    "%a, %d %b %Y %H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S%z",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%d",
-                ):
-                    try:
-                        pub = datetime.strptime(pub_str.strip(), fmt).replace(tzinfo=None)
-                        break
-                    except (ValueError, TypeError):
-                        continue
-            if pub and (now - pub).days <= 90:
-                months_with_post.add((pub.year, pub.month))
-        if len(months_with_post) >= 3:
-            continuity = 2.0
-        elif len(months_with_post) >= 2:
-            continuity = 1.0
-
-    return round(min(12.0, recent + freq + continuity), 1)
-
-
-def compute_top_exposure_proxy_v71(
-    popularity_cross_score: float,
-    neighbor_count: int,
-    base_score_val: float,
-    ranks: Optional[List[int]] = None,
-) -> float:
-    """TopExposureProxy v7.1 (0~10): 3개 하위 항목.
-
-    1. 인기순 교차검색 등장 (0~5)
-    2. 이웃수×base_score 복합 (0~3)
-    3. 관련도순 상위 노출 빈도 (0~2)
-    """
-    # 1. 인기순 교차검색 등장 (0~5)
-    pop = popularity_cross_score * 5.0
-
-    # 2. 이웃수×base_score 복합 (0~3)
-    # 이웃 500+이면서 base 40+ → 상위 블로그 지수 추정
-    composite = 0.0
-    if neighbor_count >= 2000 and base_score_val >= 50:
-        composite = 3.0
-    elif neighbor_count >= 1000 and base_score_val >= 40:
-        composite = 2.0
-    elif neighbor_count >= 500 and base_score_val >= 30:
-        composite = 1.0
-
-    # 3. 관련도순 상위 노출 빈도 (0~2)
-    top3 = 0.0
-    if ranks:
-        top3_count = sum(1 for r in ranks if r <= 3)
-        if top3_count >= 3:
-            top3 = 2.0
-        elif top3_count >= 1:
-            top3 = 1.0
-
-    return round(min(10.0, pop + composite + top3), 1)
-
-
-def compute_sponsor_fit_v71(
-    sponsor_signal_rate: float,
-    rss_posts: Optional[List[Any]] = None,
-    richness_avg_len: float = 0.0,
-) -> float:
-    """SponsorFit v7.1 (0~8): 3개 하위 항목.
-
-    1. 체험단/협찬 경험 (0~3)
-    2. 글 퀄리티×체험단 조합 (0~3)
-    3. 내돈내산 vs 협찬 비율 (0~2)
-    """
-    from backend.blog_analyzer import _SPONSORED_TITLE_SIGNALS
-
-    # 1. 체험단/협찬 경험 (0~3)
-    sponsor_count = 0
-    if rss_posts:
-        for p in rss_posts:
-            title = getattr(p, "title", "") or ""
-            if any(sig in title for sig in _SPONSORED_TITLE_SIGNALS):
-                sponsor_count += 1
-    if sponsor_count >= 5:
-        exp_score = 3.0
-    elif sponsor_count >= 3:
-        exp_score = 2.0
-    elif sponsor_count >= 1:
-        exp_score = 1.0
-    else:
-        exp_score = 0.0
-
-    # 2. 글 퀄리티×체험단 조합 (0~3)
-    combo = 0.0
-    if sponsor_count >= 1 and richness_avg_len >= 1000:
-        combo = 3.0
-    elif sponsor_count >= 1 and richness_avg_len >= 500:
-        combo = 2.0
-    elif sponsor_count >= 1:
-        combo = 1.0
-
-    # 3. 내돈내산 vs 협찬 비율 (0~2): 균형이 가장 좋음
-    if 0.10 <= sponsor_signal_rate <= 0.30:
-        balance = 2.0
-    elif 0.05 <= sponsor_signal_rate < 0.10 or 0.30 < sponsor_signal_rate <= 0.45:
-        balance = 1.0
-    else:
-        balance = 0.0
-
-    return round(min(8.0, exp_score + combo + balance), 1)
-
-
 def compute_category_fit_bonus(
     keyword_match_ratio: float,
     exposure_ratio: float,
@@ -1576,159 +884,6 @@ def compute_category_exposure_bonus(
     return round(min(10.0, max(0.0, raw * 10.0)), 1)
 
 
-def golden_score_v71(
-    # ExposurePower 입력
-    queries_hit_count: int = 0,
-    total_query_count: int = 0,
-    ranks: Optional[List[int]] = None,
-    popularity_cross_score: float = 0.0,
-    broad_query_hits: int = 0,
-    region_power_hits: int = 0,
-    # BlogAuthority 입력
-    estimated_tier: str = "unknown",
-    neighbor_count: int = 0,
-    blog_years: float = 0.0,
-    interval_avg: Optional[float] = None,
-    # RSSQuality 입력
-    richness_avg_len: float = 0.0,
-    rss_originality_v7: float = 0.0,
-    rss_diversity_smoothed: float = 0.0,
-    image_ratio: float = 0.0,
-    video_ratio: float = 0.0,
-    # Freshness 입력
-    days_since_last_post: Optional[int] = None,
-    rss_posts: Optional[List[Any]] = None,
-    # TopExposureProxy 입력
-    base_score_val: float = 0.0,
-    # SponsorFit 입력
-    sponsor_signal_rate: float = 0.0,
-    # GameDefense & QualityFloor (기존 v7.0 그대로)
-    game_defense: float = 0.0,
-    quality_floor: float = 0.0,
-    # CategoryBonus 입력 (모드C 전용)
-    has_category: bool = False,
-    keyword_match_ratio: float = 0.0,
-    exposure_ratio: float = 0.0,
-    queries_hit_ratio: float = 0.0,
-    topic_focus: float = 0.0,
-    topic_continuity: float = 0.0,
-    tfidf_sim: float = 0.0,
-    cat_strength: int = 0,
-    cat_exposed: int = 0,
-    total_keywords: int = 0,
-    weighted_strength: float = 0.0,
-) -> dict:
-    """
-    GoldenScore v7.1 (Base 0~100 + Category Bonus 0~25)
-
-    Base Score 8축:
-    - ExposurePower (0~30)
-    - BlogAuthority (0~22)
-    - RSSQuality (0~18)
-    - Freshness (0~12)
-    - TopExposureProxy (0~10)
-    - SponsorFit (0~8)
-    - GameDefense (0 to -10)
-    - QualityFloor (0 to +5)
-    → Raw 합산 후 0~100 정규화 (max raw = 105)
-
-    Category Bonus (모드C):
-    - CategoryFit (0~15)
-    - CategoryExposure (0~10)
-    → 0~25
-
-    Returns dict with base_score, category_bonus, final_score, breakdowns, mode, grade.
-    """
-    # Base Score 8축
-    ep = compute_exposure_power(
-        queries_hit_count, total_query_count, ranks or [],
-        popularity_cross_score, broad_query_hits, region_power_hits,
-    )
-    ba = compute_blog_authority_v71(estimated_tier, neighbor_count, blog_years, interval_avg)
-    rq = compute_rss_quality_v71(richness_avg_len, rss_originality_v7, rss_diversity_smoothed, image_ratio, video_ratio)
-    fr = compute_freshness_v71(days_since_last_post, rss_posts)
-    te = compute_top_exposure_proxy_v71(popularity_cross_score, neighbor_count, base_score_val, ranks)
-    sf = compute_sponsor_fit_v71(sponsor_signal_rate, rss_posts, richness_avg_len)
-    gd = max(-10.0, min(0.0, game_defense))
-    qf = max(0.0, min(5.0, quality_floor))
-
-    raw_base = ep + ba + rq + fr + te + sf + gd + qf
-    # 정규화: max raw = 30+22+18+12+10+8+0+5 = 105 → 0~100
-    base_score_val_v71 = round(max(0.0, min(100.0, raw_base / 105.0 * 100.0)), 1)
-
-    base_breakdown = {
-        "exposure_power": {"score": ep, "max": 30, "label": "검색 노출력"},
-        "blog_authority": {"score": ba, "max": 22, "label": "블로그 권위"},
-        "rss_quality": {"score": rq, "max": 18, "label": "RSS 품질"},
-        "freshness": {"score": fr, "max": 12, "label": "최신성"},
-        "top_exposure_proxy": {"score": te, "max": 10, "label": "상위노출 지수"},
-        "sponsor_fit": {"score": sf, "max": 8, "label": "체험단 적합도"},
-        "game_defense": {"score": gd, "max": 0, "label": "어뷰징 감점"},
-        "quality_floor": {"score": qf, "max": 5, "label": "품질 보정"},
-    }
-
-    # Category Bonus (모드C)
-    category_bonus = None
-    bonus_breakdown = None
-    analysis_mode = "region"
-
-    if has_category:
-        analysis_mode = "category"
-        cf = compute_category_fit_bonus(
-            keyword_match_ratio, exposure_ratio, queries_hit_ratio,
-            topic_focus, topic_continuity, tfidf_sim,
-        )
-
-        # CategoryExposure: exposure_rate + strength_avg
-        if total_keywords > 0:
-            exp_rate = cat_exposed / max(1, total_keywords)
-            eff_str = weighted_strength if weighted_strength > 0 else float(cat_strength)
-            str_avg = eff_str / max(1, cat_exposed) if cat_exposed > 0 else 0.0
-        else:
-            exp_rate = 0.0
-            str_avg = 0.0
-        ce = compute_category_exposure_bonus(exp_rate, str_avg)
-
-        category_bonus = round(cf + ce, 1)
-        bonus_breakdown = {
-            "category_fit": {"score": cf, "max": 15, "label": "업종 적합도"},
-            "category_exposure": {"score": ce, "max": 10, "label": "업종 노출"},
-        }
-
-    # Final Score
-    if category_bonus is not None:
-        final_score = round(base_score_val_v71 + category_bonus, 1)
-    else:
-        final_score = base_score_val_v71
-
-    grade = assign_grade_v71(base_score_val_v71)
-
-    return {
-        "base_score": base_score_val_v71,
-        "category_bonus": category_bonus,
-        "final_score": final_score,
-        "base_breakdown": base_breakdown,
-        "bonus_breakdown": bonus_breakdown,
-        "analysis_mode": analysis_mode,
-        "grade": grade,
-        "grade_label": _grade_label_v71(grade),
-    }
-
-
-def assign_grade_v71(base_score_val: float) -> str:
-    """v7.1 등급 판정 (항상 Base Score 기준)."""
-    if base_score_val >= 80:
-        return "S"
-    elif base_score_val >= 65:
-        return "A"
-    elif base_score_val >= 50:
-        return "B"
-    elif base_score_val >= 35:
-        return "C"
-    else:
-        return "D"
-
-
 def _grade_label_v71(grade: str) -> str:
     labels = {
         "S+": "탁월", "S": "우수", "A": "양호", "B+": "보통이상",
@@ -1753,22 +908,8 @@ def performance_score(strength_sum: int, exposed_keywords: int, total_keywords:
 # ===========================
 
 def _parse_rss_pub_date(rss_post: Any) -> Optional[datetime]:
-    """RSSPost pub_date 문자열 → datetime. 실패 시 None."""
-    pub_str = getattr(rss_post, "pub_date", None) or ""
-    if not pub_str:
-        return None
-    for fmt in (
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
-    ):
-        try:
-            return datetime.strptime(pub_str.strip(), fmt).replace(tzinfo=None)
-        except (ValueError, TypeError):
-            continue
-    return None
+    """RSSPost pub_date 문자열 → datetime. 실패 시 None (포스트별 특성 캐시)."""
+    return features(rss_post).pub_dt
 
 
 _CA_STOPWORDS = frozenset({
@@ -1778,10 +919,9 @@ _CA_STOPWORDS = frozenset({
 })
 
 
-def _extract_title_keywords(title: str) -> List[str]:
-    """제목에서 2~6글자 한글 키워드 추출 (불용어 제거)."""
-    words = re.findall(r"[가-힣]{2,6}", title)
-    return [w for w in words if w not in _CA_STOPWORDS]
+def _post_title_keywords(rss_post: Any) -> List[str]:
+    """포스트 제목에서 2~6글자 한글 키워드 추출 (불용어 제거, 토큰은 포스트별 특성 캐시)."""
+    return [w for w in features(rss_post).title_tokens_2_6 if w not in _CA_STOPWORDS]
 
 
 # ── ContentAuthority v7.2 하위 신호 ──
@@ -1881,12 +1021,9 @@ def _compute_topic_expertise_accumulation(rss_posts: List[Any]) -> float:
     if not rss_posts or len(rss_posts) < 5:
         return 0.0
     sample = rss_posts[:30]
-    titles: List[str] = []
     keyword_counts: Dict[str, int] = {}
     for p in sample:
-        title = getattr(p, "title", "") or ""
-        titles.append(title)
-        words = _extract_title_keywords(title)
+        words = _post_title_keywords(p)
         for w in words:
             keyword_counts[w] = keyword_counts.get(w, 0) + 1
     if not keyword_counts:
@@ -1915,11 +1052,10 @@ def _compute_topic_expertise_accumulation(rss_posts: List[Any]) -> float:
     # B. 전체 포스팅 대비 주제화된 글 비율 (0~2)
     themed_keywords = {k for k, v in keyword_counts.items() if v >= 3}
     themed_post_count = 0
-    for title in titles:
-        words = _extract_title_keywords(title)
-        if any(w in themed_keywords for w in words):
+    for p in sample:
+        if any(w in themed_keywords for w in _post_title_keywords(p)):
             themed_post_count += 1
-    themed_ratio = themed_post_count / len(titles) if titles else 0
+    themed_ratio = themed_post_count / len(sample) if sample else 0
 
     if themed_ratio >= 0.7:
         ratio_score = 2.0
@@ -2061,7 +1197,7 @@ def _compute_search_friendly_titles(rss_posts: List[Any]) -> float:
         special_chars = len(re.findall(r"[♥♡★☆●◆◇■□▶►▷▼△▲♠♣♦]", title))
         if special_chars >= 3:
             is_good = False
-        keywords = re.findall(r"[가-힣]{2,}", title)
+        keywords = features(p).title_tokens
         if len(keywords) < 2:
             is_good = False
         if is_good:
@@ -2119,9 +1255,7 @@ def _compute_keyword_coverage_v72(rss_posts: List[Any]) -> float:
         return 0.0
     all_keywords: set = set()
     for p in rss_posts[:30]:
-        title = getattr(p, "title", "") or ""
-        kws = _extract_title_keywords(title)
-        all_keywords.update(kws)
+        all_keywords.update(_post_title_keywords(p))
     unique_count = len(all_keywords)
     if unique_count >= 50:
         return 5.0
@@ -2171,35 +1305,13 @@ def compute_rss_quality_v72(
     이미지 1장 = 약 300자 정보량으로 환산.
     """
     # 1. 콘텐츠 충실도 (0~7) [v7.1: 5] — 이미지 보정 추가
-    adjusted_len = richness_avg_len + (avg_image_count * 300)
-    if adjusted_len >= 3000:
-        richness = 7.0
-    elif adjusted_len >= 2200:
-        richness = 6.0
-    elif adjusted_len >= 1500:
-        richness = 5.0
-    elif adjusted_len >= 1000:
-        richness = 4.0
-    elif adjusted_len >= 600:
-        richness = 3.0
-    elif adjusted_len > 0:
-        richness = 1.5
-    else:
-        richness = 0.0
+    richness = _RQ_RICHNESS(richness_avg_len + (avg_image_count * 300))
     # 2. Originality (0~6): SimHash 기반 [v7.1: 4] — 독창성 높은 블로그에 더 큰 보상
     orig = min(6.0, rss_originality_v7 / 8.0 * 6.0)
     # 3. Diversity (0~5): Bayesian smoothed [유지]
     div = min(5.0, rss_diversity_smoothed * 5.0)
     # 4. 미디어 활용도 (0~4) [유지]
-    media = 0.0
-    if image_ratio >= 0.8 and video_ratio >= 0.1:
-        media = 4.0
-    elif image_ratio >= 0.8:
-        media = 3.0
-    elif image_ratio >= 0.5:
-        media = 2.0
-    elif image_ratio > 0:
-        media = 1.0
+    media = 4.0 if image_ratio >= 0.8 and video_ratio >= 0.1 else _RQ_MEDIA(image_ratio)
     total = richness + orig + div + media
     return round(min(22.0, max(0.0, total)), 1)
 
@@ -2210,24 +1322,7 @@ def compute_freshness_v72(
 ) -> float:
     """Freshness v7.2 (0~18). v7.1(12) → v7.2(18): EP축소+SponsorFit제거분 흡수."""
     # 1. 최신 글 발행일 (0~8) [v7.1: 6]
-    if days_since_last_post is None:
-        recent = 0.0
-    elif days_since_last_post <= 1:
-        recent = 8.0
-    elif days_since_last_post <= 3:
-        recent = 7.0
-    elif days_since_last_post <= 7:
-        recent = 6.0
-    elif days_since_last_post <= 14:
-        recent = 4.0
-    elif days_since_last_post <= 30:
-        recent = 3.0
-    elif days_since_last_post <= 60:
-        recent = 2.0
-    elif days_since_last_post <= 90:
-        recent = 1.0
-    else:
-        recent = 0.0
+    recent = 0.0 if days_since_last_post is None else _FR_RECENT_RAW(days_since_last_post)
 
     # 2. 최근 30일 발행 빈도 (0~5) [v7.1: 4 → v7.2: 5]
     freq = 0.0
@@ -2312,29 +1407,11 @@ def compute_sponsor_bonus_v72(
         s_rate = sponsor_signal_rate
         sponsor_count = int(s_rate * 20)  # 추정
 
-    # 1. 체험단/협찬 경험 (0~3)
-    if s_rate < 0.05:
-        # v7.2.2: 비협찬 = 순수 콘텐츠 → 1.5점 (0점이 아님)
-        exp_score = 1.5
-    elif 0.05 <= s_rate < 0.10:
-        exp_score = 2.0
-    elif 0.10 <= s_rate <= 0.40:
-        exp_score = 3.0  # sweet spot
-    elif 0.40 < s_rate <= 0.60:
-        exp_score = 2.0
-    else:
-        exp_score = 1.0  # 과다 협찬
-
-    # 2. 글 퀄리티 × 체험단 조합 (0~3) — v7.2.2: 이미지 보정 + 최소 0.5 보장
-    adj_len = richness_avg_len + (avg_image_count * 300)
-    if adj_len >= 1500:
-        combo = 2.0
-    elif adj_len >= 800:
-        combo = 1.5
-    elif adj_len >= 400:
-        combo = 1.0
-    else:
-        combo = 0.5  # v7.2.2: 최소 0.5 (기존: 0)
+    # 1. 체험단/협찬 경험 (0~3) — v7.2.2: 비협찬 = 순수 콘텐츠 → 1.5점, 10~40% sweet spot, 과다 협찬 1점
+    exp_score = _sponsor_exp_v72(s_rate)
+
+    # 2. 글 퀄리티 × 체험단 조합 (0~3) — v7.2.2: 이미지 보정 + 최소 0.5 보장 (기존: 0)
+    combo = _SB_COMBO(richness_avg_len + (avg_image_count * 300))
 
     # 본인 구매 리뷰 보너스 (0~1)
     own_purchase = sum(1 for t in titles if "내돈내산" in t or "솔직" in t)
@@ -2367,29 +1444,17 @@ def compute_category_fit_bonus_v722(
     1. 주제 일치도 (0~3): topic_focus (= topic_match_rate)
     2. 해당 주제 검색 노출 실적 (0~2): cat_exposed (= search_keyword_exposures)
     """
-    score = 0.0
+    # 1. 주제 일치도 (0~3, 70%+ = 전문 블로그) + 2. 해당 주제 검색 노출 실적 (0~2)
+    score = 0.0 + _CF_FOCUS(topic_focus) + _CF_EXPOSED(cat_exposed)
+    return round(min(5.0, score), 1)
 
-    # 1. 주제 일치도 (0~3)
-    if topic_focus >= 0.7:
-        score += 3.0  # 전문 블로그 (70%+)
-    elif topic_focus >= 0.5:
-        score += 2.5
-    elif topic_focus >= 0.3:
-        score += 2.0
-    elif topic_focus >= 0.15:
-        score += 1.5
-    elif topic_focus > 0:
-        score += 0.5
 
-    # 2. 해당 주제 검색 노출 실적 (0~2)
-    if cat_exposed >= 5:
-        score += 2.0
-    elif cat_exposed >= 3:
-        score += 1.5
-    elif cat_exposed >= 1:
-        score += 1.0
+def blog_power_influence(total_subscribers: int = 0, ranking_percentile: float = 100.0) -> Tuple[float, float]:
+    """BlogPower 영향력 하위 점수 (구독자 점수, 랭킹 점수) — 최종 반영은 max(둘).
 
-    return round(min(5.0, score), 1)
+    구독자 점수가 이미 5점이면 랭킹(Blogdex)은 BlogPower를 바꾸지 못한다.
+    """
+    return _BP_SUBSCRIBERS(total_subscribers), _BP_RANKING(ranking_percentile)
 
 
 def compute_blog_power(
@@ -2409,78 +1474,17 @@ def compute_blog_power(
     4. 운영 지속성 (0~6): blog_age_years + active 여부
     """
     score = 0.0
-    active = last_post_days_ago <= 180
-
-    # 1. 포스팅 규모 (0~7)
-    if total_posts >= 3000:
-        score += 7
-    elif total_posts >= 1500:
-        score += 6
-    elif total_posts >= 700:
-        score += 5
-    elif total_posts >= 300:
-        score += 4
-    elif total_posts >= 100:
-        score += 3
-    elif total_posts >= 30:
-        score += 1.5
-
-    # 2. 방문자 규모 (0~7)
-    if total_visitors >= 3000000:
-        score += 7
-    elif total_visitors >= 1000000:
-        score += 6
-    elif total_visitors >= 500000:
-        score += 5
-    elif total_visitors >= 200000:
-        score += 4
-    elif total_visitors >= 50000:
-        score += 3
-    elif total_visitors >= 10000:
-        score += 2
+    # 1. 포스팅 규모 (0~7) + 2. 방문자 규모 (0~7)
+    score += _BP_POSTS(total_posts)
+    score += _BP_VISITORS(total_visitors)
 
     # 3. 영향력 (0~5): max(subscribers, ranking)
-    sub_s = 0.0
-    if total_subscribers >= 3000:
-        sub_s = 5
-    elif total_subscribers >= 1000:
-        sub_s = 4
-    elif total_subscribers >= 300:
-        sub_s = 3
-    elif total_subscribers >= 100:
-        sub_s = 2
-    elif total_subscribers >= 30:
-        sub_s = 1
-
-    rk_s = 0.0
-    if ranking_percentile <= 0.5:
-        rk_s = 5
-    elif ranking_percentile <= 2:
-        rk_s = 4
-    elif ranking_percentile <= 5:
-        rk_s = 3
-    elif ranking_percentile <= 15:
-        rk_s = 2
-    elif ranking_percentile <= 30:
-        rk_s = 1
-
+    sub_s, rk_s = blog_power_influence(total_subscribers, ranking_percentile)
     score += max(sub_s, rk_s)
 
-    # 4. 운영 지속성 (0~6)
-    if blog_age_years >= 10 and active:
-        score += 6
-    elif blog_age_years >= 5 and active:
-        score += 5
-    elif blog_age_years >= 10:
-        score += 4
-    elif blog_age_years >= 3 and active:
-        score += 3.5
-    elif blog_age_years >= 5:
-        score += 2.5
-    elif blog_age_years >= 1 and active:
-        score += 2
-    elif blog_age_years >= 1:
-        score += 1
+    # 4. 운영 지속성 (0~6): 최근 180일 내 포스팅 여부에 따라 다른 사다리
+    active = last_post_days_ago <= 180
+    score += _BP_AGE_ACTIVE(blog_age_years) if active else _BP_AGE_INACTIVE(blog_age_years)
 
     return round(min(25.0, score), 1)
 
@@ -2490,16 +1494,7 @@ def apply_ep_inference(ep_score: float, blog_power_score: float) -> float:
 
     큰 블로그인데 검색 샘플에서 우연히 안 잡힌 경우를 보정.
     """
-    floor = 0.0
-    if blog_power_score >= 22:
-        floor = 16.0
-    elif blog_power_score >= 18:
-        floor = 10.0
-    elif blog_power_score >= 14:
-        floor = 6.0
-    elif blog_power_score >= 8:
-        floor = 3.0
-    return max(ep_score, floor)
+    return max(ep_score, _EP_FLOOR(blog_power_score))
 
 
 def golden_score_v72(
@@ -2606,16 +1601,8 @@ def golden_score_v72(
 
     # v7.2.1: 블로그 규모 보정 — BP < 10 & 방문자 < 50K → "시장 미검증 품질" 보정
     # BP ≥ 10 (최적 블로그): 보정 없음 → 점수 하락 없음
-    rq_scale_factor = 1.0
     if bp < 10 and total_visitors < 50000:
-        if total_visitors >= 30000:
-            rq_scale_factor = 0.9
-        elif total_visitors >= 10000:
-            rq_scale_factor = 0.85
-        else:
-            rq_scale_factor = 0.75
-    if rq_scale_factor < 1.0:
-        rq = round(min(14.0, rq * rq_scale_factor), 1)
+        rq = round(min(14.0, rq * _RQ_SMALL_BLOG(total_visitors)), 1)
 
     # 5. Freshness (0~10) — 18→10 축소
     fr_raw = compute_freshness_v72(days_since_last_post, rss_posts)
@@ -2727,19 +1714,192 @@ def assign_grade_v72(base_score_val: float) -> str:
     - 등급명이 실제 노출력 수준을 정확히 반영
     - 이 함수 한 곳에서만 등급 계산 (UI 중복 방지)
     """
-    if base_score_val >= 90:
-        return "S+"
-    elif base_score_val >= 80:
-        return "S"
-    elif base_score_val >= 70:
-        return "A"
-    elif base_score_val >= 60:
-        return "B+"
-    elif base_score_val >= 50:
-        return "B"
-    elif base_score_val >= 40:
-        return "C"
-    elif base_score_val >= 30:
-        return "D"
-    else:
-        return "F"
+    return _GRADE_V72(base_score_val)
+
+
+# ===========================
+# GoldenScore v7.2 열 단위 일괄 계산 (리포트용)
+# ===========================
+
+# 구간표(_BP_*, _EP_*, _RQ_*, _FR_*, _CF_*, _SB_*, _GRADE_V72)는 스칼라 함수와 공용 — "v7.2 구간표" 절
+_GRADE_LABEL_V72 = {g: _grade_label_v71(g) for g in ("F", "D", "C", "B", "B+", "A", "S", "S+")}
+
+_V72_DEFAULTS: Dict[str, Any] = {
+    "queries_hit_count": 0, "total_query_count": 0, "ranks": None, "popularity_cross_score": 0.0,
+    "broad_query_hits": 0, "region_power_hits": 0, "rss_posts": None, "content_authority_precomputed": None,
+    "richness_avg_len": 0.0, "rss_originality_v7": 0.0, "rss_diversity_smoothed": 0.0,
+    "image_ratio": 0.0, "video_ratio": 0.0, "days_since_last_post": None, "search_presence_precomputed": None,
+    "game_defense": 0.0, "quality_floor": 0.0, "has_category": False, "keyword_match_ratio": 0.0,
+    "exposure_ratio": 0.0, "queries_hit_ratio": 0.0, "topic_focus": 0.0, "topic_continuity": 0.0,
+    "tfidf_sim": 0.0, "cat_strength": 0, "cat_exposed": 0, "total_keywords": 0, "weighted_strength": 0.0,
+    "sponsor_signal_rate": 0.0, "reverse_appeared": 0, "reverse_total": 0, "avg_image_count": 0.0,
+    "total_posts": 0, "total_visitors": 0, "total_subscribers": 0, "ranking_percentile": 100.0,
+    "blog_age_years": 0.0, "is_standalone": False,
+}
+
+
+def golden_score_v72_batch(columns: Dict[str, Sequence[Any]]) -> List[dict]:
+    """golden_score_v72를 여러 행에 한 번에 적용 — 행별 결과는 스칼라 호출과 동일.
+
+    columns: {golden_score_v72 인자명: 행별 값 리스트} (없는 열은 기본값).
+    리포트 경로(ranks/rss_posts 없음, ContentAuthority/SearchPresence 사전 계산)는 축마다
+    열 전체를 구간표(bisect)로 한 번에 계산하고, 그 밖의 행은 golden_score_v72로 계산한다.
+    """
+    unknown = set(columns) - set(_V72_DEFAULTS)
+    if unknown:
+        raise TypeError(f"golden_score_v72_batch: 알 수 없는 열 {sorted(unknown)}")
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("golden_score_v72_batch: 열 길이가 다릅니다")
+    n = lengths.pop() if lengths else 0
+
+    def col(name: str) -> Sequence[Any]:
+        vals = columns.get(name)
+        return vals if vals is not None else [_V72_DEFAULTS[name]] * n
+
+    ranks, posts = col("ranks"), col("rss_posts")
+    ca_pre, sp_pre = col("content_authority_precomputed"), col("search_presence_precomputed")
+    scalar_rows = [
+        i for i in range(n)
+        if ranks[i] or posts[i] or ca_pre[i] is None or sp_pre[i] is None
+    ]
+    if scalar_rows:
+        out: List[Optional[dict]] = [None] * n
+        for i in scalar_rows:
+            out[i] = golden_score_v72(**{k: v[i] for k, v in columns.items()})
+        rest = [i for i in range(n) if out[i] is None]
+        for i, res in zip(rest, golden_score_v72_batch({k: [v[j] for j in rest] for k, v in columns.items()})):
+            out[i] = res
+        return out  # type: ignore[return-value]
+
+    dslp = col("days_since_last_post")
+    tv = col("total_visitors")
+    topic_focus = col("topic_focus")
+    cat_exposed = col("cat_exposed")
+    standalone = col("is_standalone")
+
+    # 구간 점수는 모두 0.5 단위 정확값이고 합이 축 상한을 넘지 않는 곳은
+    # 스칼라 경로의 round/min이 값을 바꾸지 않으므로 생략 (TC-191이 동일성 검증)
+
+    # 1. BlogPower (최대 7+7+5+6=25)
+    bp = [
+        0.0 + _BP_POSTS(p) + _BP_VISITORS(v) + max(_BP_SUBSCRIBERS(s), _BP_RANKING(rk))
+        + (_BP_AGE_ACTIVE(a) if (999 if d is None else d) <= 180 else _BP_AGE_INACTIVE(a))
+        for p, v, s, rk, a, d in zip(col("total_posts"), tv, col("total_subscribers"),
+                                     col("ranking_percentile"), col("blog_age_years"), dslp)
+    ]
+
+    # 2. ExposurePower (ranks 없음 → 순위 분포/노출 규모 0, 최대 6+4=10) + EP Inference
+    ep: List[float] = []
+    for qh, tq, pcs, bq, rp, ra, rt, b in zip(
+        col("queries_hit_count"), col("total_query_count"), col("popularity_cross_score"),
+        col("broad_query_hits"), col("region_power_hits"), col("reverse_appeared"), col("reverse_total"), bp,
+    ):
+        seed_appeared = qh - ra
+        seed_total = tq - rt
+        seed_rate = seed_appeared / max(1, seed_total) if seed_total > 0 else 0.0
+        reverse_rate = ra / max(1, rt) if rt > 0 else 0.0
+        pop_part = (2.0 if pcs >= 0.5 else 1.0 + pcs) if pcs > 0 else 0.0
+        diversity = (
+            ((seed_appeared > 0) or (qh > 0 and rt == 0)) + (pcs > 0) + (bq > 0) + (ra > 0) + (rp > 0)
+        )
+        total = _EP_SERP(max(seed_rate, reverse_rate)) + 0.0 + 0.0 + min(4.0, pop_part + _EP_DIVERSITY(diversity))
+        ep.append(max(round(total, 1), _EP_FLOOR(b)))
+
+    # 3. ContentAuthority (사전 계산)
+    ca = [round(max(0.0, min(16.0, c / 22.0 * 16.0)), 1) for c in ca_pre]
+
+    # 4. RSSQuality + 소규모 블로그 보정
+    rq: List[float] = []
+    for rich, orig, div, ir, vr, aic, b, v in zip(
+        col("richness_avg_len"), col("rss_originality_v7"), col("rss_diversity_smoothed"),
+        col("image_ratio"), col("video_ratio"), col("avg_image_count"), bp, tv,
+    ):
+        media = 4.0 if ir >= 0.8 and vr >= 0.1 else _RQ_MEDIA(ir)
+        total = _RQ_RICHNESS(rich + (aic * 300)) + min(6.0, orig / 8.0 * 6.0) + min(5.0, div * 5.0) + media
+        q = round(min(14.0, round(min(22.0, max(0.0, total)), 1) / 22.0 * 14.0), 1)
+        if b < 10 and v < 50000:
+            q = round(min(14.0, q * _RQ_SMALL_BLOG(v)), 1)
+        rq.append(q)
+
+    # 5. Freshness (RSS 없음 → 최신 글 발행일만)
+    fr = [
+        _FR_RECENT_V72[-1] if d is None else _FR_RECENT(d)
+        for d in dslp
+    ]
+
+    # 6. SearchPresence (사전 계산) + BlogPower 기반 상한
+    sp = [
+        min(17.0 if b >= 10 else (12.0 if b >= 5 else 9.0), round(max(0.0, min(17.0, s / 16.0 * 17.0)), 1))
+        for s, b in zip(sp_pre, bp)
+    ]
+
+    gd = [max(-10.0, min(0.0, g)) for g in col("game_defense")]
+    qf = [max(0.0, min(5.0, q)) for q in col("quality_floor")]
+    cf_v722 = [
+        0.0 if alone else 0.0 + _CF_FOCUS(tf) + _CF_EXPOSED(ce)
+        for tf, ce, alone in zip(topic_focus, cat_exposed, standalone)
+    ]
+
+    has_category = col("has_category")
+    cat_cols = zip(
+        col("keyword_match_ratio"), col("exposure_ratio"), col("queries_hit_ratio"), topic_focus,
+        col("topic_continuity"), col("tfidf_sim"), col("cat_strength"), cat_exposed, col("total_keywords"),
+        col("weighted_strength"), col("sponsor_signal_rate"), col("richness_avg_len"), col("avg_image_count"),
+    )
+
+    results: List[dict] = []
+    for i, cat in enumerate(cat_cols):
+        e, c, q, f, s, b, g, qfl, cfv = ep[i], ca[i], rq[i], fr[i], sp[i], bp[i], gd[i], qf[i], cf_v722[i]
+        base = round(max(0.0, min(100.0, e + c + q + f + s + b + g + qfl + cfv)), 1)
+
+        base_breakdown: Dict[str, Any] = {
+            "exposure_power": {"score": e, "max": 18, "label": "검색 노출력"},
+            "content_authority": {"score": c, "max": 16, "label": "콘텐츠 권위"},
+            "rss_quality": {"score": q, "max": 14, "label": "RSS 품질"},
+            "freshness": {"score": f, "max": 10, "label": "최신성"},
+            "search_presence": {"score": s, "max": 17, "label": "검색 존재감"},
+            "blog_power": {"score": b, "max": 25, "label": "블로그 파워"},
+        }
+        if g < 0:
+            base_breakdown["game_defense"] = {"score": g, "max": 0, "label": "어뷰징 감점"}
+        if qfl > 0:
+            base_breakdown["quality_floor"] = {"score": qfl, "max": 5, "label": "품질 보정"}
+        if cfv > 0:
+            base_breakdown["category_fit"] = {"score": round(cfv, 1), "max": 5, "label": "업종 추천도"}
+
+        category_bonus = None
+        bonus_breakdown = None
+        analysis_mode = "standalone" if standalone[i] else "region"
+        if has_category[i]:
+            analysis_mode = "category"
+            kmr, er, qhr, tf, tc, tfidf, cs, ce_n, tk, ws, ssr, rich, aic = cat
+            cf = compute_category_fit_bonus(kmr, er, qhr, tf, tc, tfidf)
+            if tk > 0:
+                exp_rate = ce_n / max(1, tk)
+                eff_str = ws if ws > 0 else float(cs)
+                str_avg = eff_str / max(1, ce_n) if ce_n > 0 else 0.0
+            else:
+                exp_rate = 0.0
+                str_avg = 0.0
+            ce = compute_category_exposure_bonus(exp_rate, str_avg)
+            sb = _sponsor_exp_v72(ssr) + _SB_COMBO(rich + (aic * 300)) + 0.0
+            category_bonus = round(cf + ce + sb, 1)
+            bonus_breakdown = {
+                "category_fit": {"score": cf, "max": 15, "label": "업종 적합도"},
+                "category_exposure": {"score": ce, "max": 10, "label": "업종 노출"},
+                "sponsor_bonus": {"score": sb, "max": 8, "label": "체험단 적합도"},
+            }
+
+        grade = _GRADE_V72(base)
+        results.append({
+            "base_score": base,
+            "category_bonus": category_bonus,
+            "final_score": round(base + category_bonus, 1) if category_bonus is not None else base,
+            "base_breakdown": base_breakdown,
+            "bonus_breakdown": bonus_breakdown,
+            "analysis_mode": analysis_mode,
+            "grade": grade,
+            "grade_label": _GRADE_LABEL_V72[grade],
+        })
+    return results
@@ -0,0 +1,982 @@
+"""
+이전 세대 GoldenScore (v3 / v4 / v5 / v7.0 / v7.1) — 현재 리포트·블로그 분석은 v7.2만 사용.
+
+점수 회귀 비교와 테스트에서만 쓰므로 API 워커 시작 시 로드하지 않는다.
+backend.scoring의 기존 이름(golden_score_v5 등)으로 import하면 첫 접근 때 이 모듈을 불러온다.
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, List, Optional
+
+from backend.scoring import (
+    _grade_label_v71, _originality_steep, _posting_intensity, compute_category_exposure_bonus,
+    compute_category_fit_bonus, compute_exposure_power,
+)
+
+
+# ===========================
+# GoldenScore v3 (기존 리포트 점수)
+# ===========================
+
+def golden_score(
+    base_score_val: float,
+    strength_sum: int,
+    exposed_keywords: int,
+    total_keywords: int,
+    food_bias_rate: float,
+    sponsor_signal_rate: float,
+    is_food_cat: Optional[bool] = None,
+    weighted_strength: float = 0.0,
+    page1_keywords: int = 0,
+    unique_exposed_posts: int = 0,
+    unique_page1_posts: int = 0,
+    keyword_match_ratio: float = 0.0,
+    queries_hit_ratio: float = 0.0,
+    has_category: bool = False,
+) -> float:
+    """
+    GoldenScore v3.0 (0~100) = 5축 통합 × 노출 신뢰 계수
+    1. BlogPower (0~15): 정규화된 base_score
+    2. Exposure (0~30): 가중 노출 강도 + 커버리지 × post_diversity_factor
+    3. Page1Authority (0~15): 1페이지 노출 빈도 = 블로그 지수 핵심 프록시
+    4. CategoryFit (0~20): 업종 적합도
+    5. Recruitability (0~10): 섭외 가능성/효과
+
+    exposure_confidence (page1 기반):
+    - page1_ratio >= 0.3 → 1.0 (3+ page1)
+    - page1_ratio >= 0.1 → 0.8 (1-2 page1)
+    - exposure_ratio >= 0.3 → 0.55 (노출은 있지만 page1 없음)
+    - exposure_ratio > 0 → 0.35 (하위권 노출만)
+    - else → 0.2 (미노출)
+
+    post_diversity_factor:
+    - 고유 포스트 수 / 노출 키워드 수 → 다양한 포스트일수록 높은 점수
+    - 5키워드 5포스트 = 1.0 (이상적), 5키워드 1포스트 = 0.52 (감점)
+    """
+    # 1. BlogPower (base_score 0~80 → 0~15)
+    blog_power = (base_score_val / 80.0) * 15.0
+
+    # 2. Exposure (가중 strength 우선 사용, 현실적 분모 적용)
+    effective_strength = weighted_strength if weighted_strength > 0 else float(strength_sum)
+    max_strength = total_keywords * 3
+    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 18.0
+    coverage_part = min(1.0, exposed_keywords / max(1, total_keywords * 0.5)) * 12.0
+
+    # post_diversity_factor: 고유 포스트 / 노출 키워드 수
+    # 5키워드 5포스트 = 1.0 (이상적), 5키워드 1포스트 = 0.52 (감점)
+    if exposed_keywords > 0 and unique_exposed_posts > 0:
+        diversity_ratio = unique_exposed_posts / exposed_keywords
+        diversity_factor = 0.4 + 0.6 * diversity_ratio  # 최소 0.4 ~ 최대 1.0
+    else:
+        diversity_factor = 1.0  # unique_exposed_posts 정보 없으면 패널티 없음
+
+    exposure = (strength_part + coverage_part) * diversity_factor
+
+    # 3. Page1Authority (1페이지 노출 빈도 = 블로그 지수 핵심 프록시)
+    # unique_page1_posts 가용 시 고유 포스트 기준 사용
+    effective_page1 = unique_page1_posts if unique_page1_posts > 0 else page1_keywords
+    page1_ratio = effective_page1 / max(1, total_keywords)
+    if page1_ratio >= 0.5:
+        page1_authority = 15.0
+    elif page1_ratio >= 0.3:
+        page1_authority = 12.0
+    elif page1_ratio >= 0.2:
+        page1_authority = 8.0
+    elif page1_ratio >= 0.1:
+        page1_authority = 4.0
+    else:
+        page1_authority = 0.0
+
+    # 4. CategoryFit (키워드 기반 추가 보너스, 0~20)
+    if not has_category:
+        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
+    else:
+        exposure_ratio = exposed_keywords / max(1, total_keywords)
+        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
+        category_fit = fit * 20.0
+
+    # 5. Recruitability (sweet spot: 10~30% sponsor rate)
+    if sponsor_signal_rate >= 0.60:
+        recruit = 1.5
+    elif sponsor_signal_rate >= 0.45:
+        recruit = 3.0
+    elif sponsor_signal_rate >= 0.30:
+        recruit = 7.0
+    elif sponsor_signal_rate >= 0.15:
+        recruit = 10.0
+    elif sponsor_signal_rate >= 0.05:
+        recruit = 8.0
+    else:
+        recruit = 5.0
+
+    raw_score = blog_power + exposure + page1_authority + category_fit + recruit
+
+    # 노출 신뢰 계수 (page1 기반 exposure_confidence)
+    # unique 포스트 가용 시 고유 포스트 기준 사용
+    effective_page1_for_conf = unique_page1_posts if unique_page1_posts > 0 else page1_keywords
+    effective_exposed_for_conf = unique_exposed_posts if unique_exposed_posts > 0 else exposed_keywords
+    effective_page1_ratio = effective_page1_for_conf / max(1, total_keywords)
+    effective_exposure_ratio = effective_exposed_for_conf / max(1, total_keywords)
+    if effective_page1_ratio >= 0.3:
+        confidence = 1.0
+    elif effective_page1_ratio >= 0.1:
+        confidence = 0.8
+    elif effective_exposure_ratio >= 0.3:
+        confidence = 0.55
+    elif effective_exposure_ratio > 0:
+        confidence = 0.35
+    else:
+        confidence = 0.2
+
+    return round(raw_score * confidence, 1)
+
+
+# ===========================
+# GoldenScore v5.0
+# ===========================
+
+def _diversity_steep(entropy: float) -> float:
+    """주제 다양성 (0~10): 가파른 단계형 (entropy 0~1)."""
+    if entropy >= 0.97:
+        return 10.0
+    elif entropy >= 0.95:
+        return 8.0
+    elif entropy >= 0.92:
+        return 6.0
+    elif entropy >= 0.88:
+        return 4.0
+    elif entropy >= 0.85:
+        return 2.0
+    else:
+        return 0.0
+
+
+def _richness_score(avg_desc_len: float) -> float:
+    """충실도 (0~5): description 평균 길이."""
+    if avg_desc_len >= 300:
+        return 5.0
+    elif avg_desc_len >= 200:
+        return 4.0
+    elif avg_desc_len >= 100:
+        return 2.5
+    else:
+        return 1.0
+
+
+def _sponsor_balance(sponsor_rate: float) -> float:
+    """협찬 균형 (0~5)."""
+    if 0.10 <= sponsor_rate <= 0.30:
+        return 5.0
+    elif (0.05 <= sponsor_rate < 0.10) or (0.30 < sponsor_rate <= 0.45):
+        return 3.0
+    elif sponsor_rate < 0.05:
+        return 2.5
+    elif 0.45 < sponsor_rate <= 0.60:
+        return 1.5
+    else:
+        return 0.5
+
+
+def golden_score_v5(
+    region_power_hits: int,
+    broad_query_hits: int,
+    interval_avg: Optional[float],
+    originality_raw: float,
+    diversity_entropy: float,
+    richness_avg_len: float,
+    sponsor_signal_rate: float,
+    cat_strength: int,
+    cat_exposed: int,
+    total_keywords: int,
+    food_bias_rate: float = 0.0,
+    is_food_cat: Optional[bool] = None,
+    base_score_val: float = 0.0,
+    weighted_strength: float = 0.0,
+    keyword_match_ratio: float = 0.0,
+    queries_hit_ratio: float = 0.0,
+    has_category: bool = False,
+) -> float:
+    """
+    GoldenScore v5.0 (0~100) = BlogAuthority(30) + CategoryExposure(25)
+    + CategoryFit(15) + Freshness(10) + RSSQuality(20)
+    """
+    # 1. BlogAuthority (0~30)
+    # CrossCatAuthority (0~15)
+    if region_power_hits >= 3:
+        cross_rp = 10.0
+    elif region_power_hits >= 2:
+        cross_rp = 7.0
+    elif region_power_hits >= 1:
+        cross_rp = 4.0
+    else:
+        cross_rp = 0.0
+
+    if broad_query_hits >= 3:
+        cross_broad = 5.0
+    elif broad_query_hits >= 2:
+        cross_broad = 3.0
+    elif broad_query_hits >= 1:
+        cross_broad = 1.5
+    else:
+        cross_broad = 0.0
+
+    cross_cat_authority = min(15.0, cross_rp + cross_broad)
+    posting_intensity = _posting_intensity(interval_avg)
+    originality = _originality_steep(originality_raw)
+    blog_authority = min(30.0, cross_cat_authority + posting_intensity + originality)
+
+    # 2. CategoryExposure (0~25)
+    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
+    max_strength = total_keywords * 3
+    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 15.0
+    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 10.0
+    cat_exposure = strength_part + coverage_part
+
+    # 3. CategoryFit (키워드 기반 추가 보너스, 0~15)
+    if not has_category:
+        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
+    else:
+        exposure_ratio = cat_exposed / max(1, total_keywords)
+        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
+        category_fit = fit * 15.0
+
+    # 4. Freshness (0~10)
+    freshness = (base_score_val / 80.0) * 10.0
+
+    # 5. RSSQuality (0~20)
+    diversity = _diversity_steep(diversity_entropy)
+    richness = _richness_score(richness_avg_len)
+    sponsor_bal = _sponsor_balance(sponsor_signal_rate)
+    rss_quality = diversity + richness + sponsor_bal
+
+    raw_score = blog_authority + cat_exposure + category_fit + freshness + rss_quality
+    return round(min(100.0, max(0.0, raw_score)), 1)
+
+
+# ===========================
+# GoldenScore v7.0
+# ===========================
+
+def _sponsor_fit(rate: float) -> float:
+    """SponsorFit (0~5): 협찬률 적합도 (sweet spot 10-30%)."""
+    if 0.10 <= rate <= 0.30:
+        return 5.0
+    elif (0.05 <= rate < 0.10) or (0.30 < rate <= 0.45):
+        return 3.0
+    elif rate < 0.05:
+        return 2.5
+    elif 0.45 < rate <= 0.60:
+        return 1.5
+    else:
+        return 0.5
+
+
+def _freshness_time_based(days: Optional[int]) -> float:
+    """시간 기반 Freshness (0~10): days_since_last_post."""
+    if days is None:
+        return 0.0
+    if days <= 3:
+        return 10.0
+    elif days <= 7:
+        return 8.0
+    elif days <= 14:
+        return 6.0
+    elif days <= 30:
+        return 4.0
+    elif days <= 60:
+        return 2.0
+    else:
+        return 0.0
+
+
+def golden_score_v7(
+    region_power_hits: int,
+    broad_query_hits: int,
+    interval_avg: Optional[float],
+    originality_raw: float,
+    diversity_entropy: float,
+    richness_avg_len: float,
+    sponsor_signal_rate: float,
+    cat_strength: int,
+    cat_exposed: int,
+    total_keywords: int,
+    food_bias_rate: float = 0.0,
+    is_food_cat: Optional[bool] = None,
+    base_score_val: float = 0.0,
+    weighted_strength: float = 0.0,
+    keyword_match_ratio: float = 0.0,
+    queries_hit_ratio: float = 0.0,
+    has_category: bool = False,
+    popularity_cross_score: float = 0.0,
+    page1_keywords: int = 0,
+    topic_focus: float = 0.0,
+    topic_continuity: float = 0.0,
+    days_since_last_post: Optional[int] = None,
+    rss_originality_v7: float = 0.0,
+    rss_diversity_smoothed: float = 0.0,
+    game_defense: float = 0.0,
+    quality_floor: float = 0.0,
+) -> float:
+    """
+    GoldenScore v7.0 (0~100) = 9축 통합
+    BlogAuthority(22) + CategoryExposure(18) + TopExposureProxy(12) + CategoryFit(15)
+    + Freshness(10) + RSSQuality(13) + SponsorFit(5) + GameDefense(-10) + QualityFloor(+5)
+    """
+    # 1. BlogAuthority (0~22): CrossCat(0~12) + PostingIntensity(0~6) + Originality(0~4)
+    if region_power_hits >= 3:
+        cross_rp = 8.0
+    elif region_power_hits >= 2:
+        cross_rp = 5.5
+    elif region_power_hits >= 1:
+        cross_rp = 3.0
+    else:
+        cross_rp = 0.0
+
+    if broad_query_hits >= 3:
+        cross_broad = 4.0
+    elif broad_query_hits >= 2:
+        cross_broad = 2.5
+    elif broad_query_hits >= 1:
+        cross_broad = 1.0
+    else:
+        cross_broad = 0.0
+
+    cross_cat = min(12.0, cross_rp + cross_broad)
+    posting_i = _posting_intensity(interval_avg)
+    posting_part = posting_i * 0.6  # 0~6
+    orig_part = _originality_steep(originality_raw) * 0.8  # 0~4
+    blog_authority = min(22.0, cross_cat + posting_part + orig_part)
+
+    # 2. CategoryExposure (0~18): Strength(0~11) + Coverage(0~7)
+    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
+    max_strength = total_keywords * 3
+    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 11.0
+    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 7.0
+    cat_exposure = strength_part + coverage_part
+
+    # 3. TopExposureProxy (0~12): popularity_cross(0~8) + page1_ratio(0~4)
+    pop_cross = popularity_cross_score * 8.0  # 0~8
+    page1_ratio = page1_keywords / max(1, total_keywords)
+    if page1_ratio >= 0.3:
+        page1_part = 4.0
+    elif page1_ratio >= 0.2:
+        page1_part = 3.0
+    elif page1_ratio >= 0.1:
+        page1_part = 2.0
+    elif page1_ratio > 0:
+        page1_part = 1.0
+    else:
+        page1_part = 0.0
+    top_exp_proxy = min(12.0, pop_cross + page1_part)
+
+    # 4. CategoryFit (0~15): 5-signal 가중평균 × 15
+    if not has_category:
+        category_fit = 0.0
+    else:
+        exposure_ratio = cat_exposed / max(1, total_keywords)
+        qh_ratio = queries_hit_ratio
+        # 5-signal: kw_match(0.20) + exposure_ratio(0.20) + qh_ratio(0.15) + topic_focus(0.25) + topic_continuity(0.20)
+        fit = (keyword_match_ratio * 0.20
+               + exposure_ratio * 0.20
+               + qh_ratio * 0.15
+               + topic_focus * 0.25
+               + topic_continuity * 0.20)
+        category_fit = fit * 15.0
+
+    # 5. Freshness (0~10): 시간 기반
+    freshness = _freshness_time_based(days_since_last_post)
+
+    # 6. RSSQuality (0~13): Diversity(0~6) + Richness(0~4) + Originality bonus(0~3)
+    div_score = rss_diversity_smoothed * 6.0  # 0~6
+    if richness_avg_len >= 300:
+        rich_score = 4.0
+    elif richness_avg_len >= 200:
+        rich_score = 3.0
+    elif richness_avg_len >= 100:
+        rich_score = 2.0
+    else:
+        rich_score = 1.0
+    orig_bonus = min(3.0, rss_originality_v7 / 8.0 * 3.0)  # 0~3
+    rss_quality = min(13.0, div_score + rich_score + orig_bonus)
+
+    # 7. SponsorFit (0~5)
+    sponsor_fit = _sponsor_fit(sponsor_signal_rate)
+
+    # 8. GameDefense (0 to -10)
+    gd = max(-10.0, min(0.0, game_defense))
+
+    # 9. QualityFloor (0 to +5)
+    qf = max(0.0, min(5.0, quality_floor))
+
+    raw = blog_authority + cat_exposure + top_exp_proxy + category_fit + freshness + rss_quality + sponsor_fit + gd + qf
+    return round(max(0.0, min(100.0, raw)), 1)
+
+
+# ===========================
+# GoldenScore v4
+# ===========================
+
+def golden_score_v4(
+    tier_score: float,
+    cat_strength: int,
+    cat_exposed: int,
+    total_keywords: int,
+    food_bias_rate: float = 0.0,
+    is_food_cat: Optional[bool] = None,
+    base_score_val: float = 0.0,
+    weighted_strength: float = 0.0,
+    keyword_match_ratio: float = 0.0,
+    queries_hit_ratio: float = 0.0,
+    has_category: bool = False,
+) -> float:
+    """
+    GoldenScore v4.0 (0~100) = TierScore(40) + CategoryExposure(35) + CategoryFit(15) + Freshness(10)
+
+    - TierScore: RSS 기반 순수체급 (이미 계산되어 전달됨, 0~40)
+    - CategoryExposure: 업종 키워드 노출 강도 + 커버리지 (0~35)
+    - CategoryFit: 업종 적합도 (0~15)
+    - Freshness: 최근활동/SERP 순위/빈도 반영 (0~10)
+    - Recruitability 제거 (태그만 유지)
+    """
+    # 1. TierScore (0~40, 이미 계산됨)
+    tier = min(40.0, max(0.0, tier_score))
+
+    # 2. CategoryExposure (0~35): strength(20) + coverage(15)
+    effective_strength = weighted_strength if weighted_strength > 0 else float(cat_strength)
+    max_strength = total_keywords * 3
+    strength_part = min(1.0, effective_strength / max(1, max_strength)) * 20.0
+    coverage_part = min(1.0, cat_exposed / max(1, total_keywords * 0.5)) * 15.0
+    cat_exposure = strength_part + coverage_part
+
+    # 3. CategoryFit (키워드 기반 추가 보너스, 0~15)
+    if not has_category:
+        category_fit = 0.0  # 카테고리 없음: 순수 블로그 지수만 비교
+    else:
+        exposure_ratio = cat_exposed / max(1, total_keywords)
+        fit = keyword_match_ratio * 0.4 + exposure_ratio * 0.3 + queries_hit_ratio * 0.3
+        category_fit = fit * 15.0
+
+    # 4. Freshness (0~10): base_score 기반
+    freshness = (base_score_val / 80.0) * 10.0
+
+    raw_score = tier + cat_exposure + category_fit + freshness
+    return round(min(100.0, max(0.0, raw_score)), 1)
+
+
+# ===========================
+# 블로그 단독 분석 (v7.2 이전)
+# ===========================
+
+def _recent_activity_score(days_since: Optional[int]) -> float:
+    """최근 활동 점수 (0~15): 30일 기준 step curve."""
+    if days_since is None:
+        return 0.0
+    if days_since <= 3:
+        return 15.0
+    elif days_since <= 7:
+        return 12.0
+    elif days_since <= 14:
+        return 9.0
+    elif days_since <= 30:
+        return 6.0
+    elif days_since <= 60:
+        return 3.0
+    else:
+        return 0.0
+
+
+def _richness_expanded(avg_len: float) -> float:
+    """콘텐츠 충실도 확장 (0~12): description 평균 길이."""
+    if avg_len >= 400:
+        return 12.0
+    elif avg_len >= 300:
+        return 10.0
+    elif avg_len >= 200:
+        return 7.0
+    elif avg_len >= 100:
+        return 4.0
+    else:
+        return 1.0
+
+
+def _post_volume_score(total_posts: int) -> float:
+    """포스트 수량 점수 (0~8)."""
+    if total_posts >= 40:
+        return 8.0
+    elif total_posts >= 25:
+        return 6.0
+    elif total_posts >= 15:
+        return 4.0
+    elif total_posts >= 5:
+        return 2.0
+    else:
+        return 0.0
+
+
+def _richness_store(avg_len: float) -> float:
+    """RSS 품질 충실도 (0~8): 매장 연계용."""
+    if avg_len >= 400:
+        return 8.0
+    elif avg_len >= 300:
+        return 7.0
+    elif avg_len >= 200:
+        return 5.0
+    elif avg_len >= 100:
+        return 3.0
+    else:
+        return 1.0
+
+
+def _sponsor_balance_store(rate: float) -> float:
+    """협찬 균형 확장 (0~7): 매장 연계용."""
+    if 0.10 <= rate <= 0.30:
+        return 7.0
+    elif (0.05 <= rate < 0.10) or (0.30 < rate <= 0.45):
+        return 4.5
+    elif rate < 0.05:
+        return 3.5
+    elif 0.45 < rate <= 0.60:
+        return 2.0
+    else:
+        return 1.0
+
+
+# ===========================
+# GoldenScore v7.1
+# ===========================
+
+def compute_blog_authority_v71(
+    estimated_tier: str,
+    neighbor_count: int,
+    blog_years: float,
+    interval_avg: Optional[float],
+) -> float:
+    """BlogAuthority v7.1 (0~22): 4개 하위 항목.
+
+    1. 블로그 등급 추정 (0~10)
+    2. 이웃 수 기반 영향력 (0~5)
+    3. 블로그 운영 기간 (0~4)
+    4. 포스팅 꾸준함 (0~3)
+    """
+    # 1. 블로그 등급 추정 (0~10)
+    tier_map = {"power": 10.0, "premium": 8.0, "gold": 6.0, "silver": 4.0, "normal": 2.0, "unknown": 1.0}
+    tier_score = tier_map.get(estimated_tier, 1.0)
+
+    # 2. 이웃 수 기반 영향력 (0~5)
+    if neighbor_count >= 5000:
+        neighbor_score = 5.0
+    elif neighbor_count >= 2000:
+        neighbor_score = 4.0
+    elif neighbor_count >= 1000:
+        neighbor_score = 3.0
+    elif neighbor_count >= 500:
+        neighbor_score = 2.0
+    elif neighbor_count >= 100:
+        neighbor_score = 1.0
+    else:
+        neighbor_score = 0.0
+
+    # 3. 블로그 운영 기간 (0~4)
+    if blog_years >= 5:
+        years_score = 4.0
+    elif blog_years >= 3:
+        years_score = 3.0
+    elif blog_years >= 2:
+        years_score = 2.0
+    elif blog_years >= 1:
+        years_score = 1.0
+    else:
+        years_score = 0.0
+
+    # 4. 포스팅 꾸준함 (0~3)
+    if interval_avg is None:
+        posting_score = 0.0
+    elif interval_avg <= 2:
+        posting_score = 3.0
+    elif interval_avg <= 5:
+        posting_score = 2.0
+    elif interval_avg <= 10:
+        posting_score = 1.0
+    else:
+        posting_score = 0.0
+
+    total = tier_score + neighbor_score + years_score + posting_score
+    return round(min(22.0, max(0.0, total)), 1)
+
+
+def compute_rss_quality_v71(
+    richness_avg_len: float,
+    rss_originality_v7: float,
+    rss_diversity_smoothed: float,
+    image_ratio: float,
+    video_ratio: float,
+) -> float:
+    """RSSQuality v7.1 (0~18): 4개 하위 항목.
+
+    1. 글 길이/충실도 (0~5)
+    2. Originality (0~4)
+    3. Diversity (0~5)
+    4. 미디어 활용도 (0~4)
+    """
+    # 1. 글 길이/충실도 (0~5)
+    if richness_avg_len >= 3000:
+        richness = 5.0
+    elif richness_avg_len >= 2000:
+        richness = 4.0
+    elif richness_avg_len >= 1000:
+        richness = 3.0
+    elif richness_avg_len >= 500:
+        richness = 2.0
+    elif richness_avg_len >= 200:
+        richness = 1.0
+    else:
+        richness = 0.0
+
+    # 2. Originality (0~4): SimHash 기반 (0~8 → 0~4 스케일)
+    orig = min(4.0, rss_originality_v7 / 8.0 * 4.0)
+
+    # 3. Diversity (0~5): Bayesian smoothed (0~1 → 0~5)
+    div = min(5.0, rss_diversity_smoothed * 5.0)
+
+    # 4. 미디어 활용도 (0~4)
+    media = 0.0
+    if image_ratio >= 0.8:
+        media += 3.0
+    elif image_ratio >= 0.5:
+        media += 2.0
+    elif image_ratio >= 0.2:
+        media += 1.0
+    if video_ratio >= 0.1:
+        media += 1.0
+    media = min(4.0, media)
+
+    total = richness + orig + div + media
+    return round(min(18.0, max(0.0, total)), 1)
+
+
+def compute_freshness_v71(
+    days_since_last_post: Optional[int],
+    rss_posts: Optional[List[Any]] = None,
+) -> float:
+    """Freshness v7.1 (0~12): 3개 하위 항목.
+
+    1. 최신 글 발행일 (0~6)
+    2. 최근 30일 발행 빈도 (0~4)
+    3. 발행 연속성 (0~2): 최근 3개월 매월 1건 이상
+    """
+    # 1. 최신 글 발행일 (0~6)
+    if days_since_last_post is None:
+        recent = 0.0
+    elif days_since_last_post <= 3:
+        recent = 6.0
+    elif days_since_last_post <= 7:
+        recent = 5.0
+    elif days_since_last_post <= 14:
+        recent = 4.0
+    elif days_since_last_post <= 30:
+        recent = 3.0
+    elif days_since_last_post <= 60:
+        recent = 1.0
+    else:
+        recent = 0.0
+
+    # 2. 최근 30일 발행 빈도 (0~4)
+    freq = 0.0
+    if rss_posts:
+        now = datetime.now()
+        recent_30d = 0
+        for p in rss_posts:
+            pub = None
+            pub_str = getattr(p, "pub_date", None)
+            if pub_str:
+                for fmt in (
+                    "%a, %d %b %Y %H:%M:%S %z",
+                    "%a, %d %b %Y %H:%M:%S",
+                    "%Y-%m-%dT%H:%M:%S%z",
+                    "%Y-%m-%dT%H:%M:%S",
+                    "%Y-%m-%d",
+                ):
+                    try:
+                        pub = datetime.strptime(pub_str.strip(), fmt).replace(tzinfo=None)
+                        break
+                    except (ValueError, TypeError):
+                        continue
+            if pub and (now - pub).days <= 30:
+                recent_30d += 1
+        if recent_30d >= 10:
+            freq = 4.0
+        elif recent_30d >= 6:
+            freq = 3.0
+        elif recent_30d >= 3:
+            freq = 2.0
+        elif recent_30d >= 1:
+            freq = 1.0
+
+    # 3. 발행 연속성 (0~2): 최근 3개월 매월 1건 이상
+    continuity = 0.0
+    if rss_posts:
+        now = datetime.now()
+        months_with_post = set()
+        for p in rss_posts:
+            pub = None
+            pub_str = getattr(p, "pub_date", None)
+            if pub_str:
+                for fmt in (
+                    "%a, %d %b %Y %H:%M:%S %z",
+                    "%a, %d %b %Y %H:%M:%S",
+                    "%Y-%m-%dT%H:%M:%S%z",
+                    "%Y-%m-%dT%H:%M:%S",
+                    "%Y-%m-%d",
+                ):
+                    try:
+                        pub = datetime.strptime(pub_str.strip(), fmt).replace(tzinfo=None)
+                        break
+                    except (ValueError, TypeError):
+                        continue
+            if pub and (now - pub).days <= 90:
+                months_with_post.add((pub.year, pub.month))
+        if len(months_with_post) >= 3:
+            continuity = 2.0
+        elif len(months_with_post) >= 2:
+            continuity = 1.0
+
+    return round(min(12.0, recent + freq + continuity), 1)
+
+
+def compute_top_exposure_proxy_v71(
+    popularity_cross_score: float,
+    neighbor_count: int,
+    base_score_val: float,
+    ranks: Optional[List[int]] = None,
+) -> float:
+    """TopExposureProxy v7.1 (0~10): 3개 하위 항목.
+
+    1. 인기순 교차검색 등장 (0~5)
+    2. 이웃수×base_score 복합 (0~3)
+    3. 관련도순 상위 노출 빈도 (0~2)
+    """
+    # 1. 인기순 교차검색 등장 (0~5)
+    pop = popularity_cross_score * 5.0
+
+    # 2. 이웃수×base_score 복합 (0~3)
+    # 이웃 500+이면서 base 40+ → 상위 블로그 지수 추정
+    composite = 0.0
+    if neighbor_count >= 2000 and base_score_val >= 50:
+        composite = 3.0
+    elif neighbor_count >= 1000 and base_score_val >= 40:
+        composite = 2.0
+    elif neighbor_count >= 500 and base_score_val >= 30:
+        composite = 1.0
+
+    # 3. 관련도순 상위 노출 빈도 (0~2)
+    top3 = 0.0
+    if ranks:
+        top3_count = sum(1 for r in ranks if r <= 3)
+        if top3_count >= 3:
+            top3 = 2.0
+        elif top3_count >= 1:
+            top3 = 1.0
+
+    return round(min(10.0, pop + composite + top3), 1)
+
+
+def compute_sponsor_fit_v71(
+    sponsor_signal_rate: float,
+    rss_posts: Optional[List[Any]] = None,
+    richness_avg_len: float = 0.0,
+) -> float:
+    """SponsorFit v7.1 (0~8): 3개 하위 항목.
+
+    1. 체험단/협찬 경험 (0~3)
+    2. 글 퀄리티×체험단 조합 (0~3)
+    3. 내돈내산 vs 협찬 비율 (0~2)
+    """
+    from backend.blog_analyzer import _SPONSORED_TITLE_SIGNALS
+
+    # 1. 체험단/협찬 경험 (0~3)
+    sponsor_count = 0
+    if rss_posts:
+        for p in rss_posts:
+            title = getattr(p, "title", "") or ""
+            if any(sig in title for sig in _SPONSORED_TITLE_SIGNALS):
+                sponsor_count += 1
+    if sponsor_count >= 5:
+        exp_score = 3.0
+    elif sponsor_count >= 3:
+        exp_score = 2.0
+    elif sponsor_count >= 1:
+        exp_score = 1.0
+    else:
+        exp_score = 0.0
+
+    # 2. 글 퀄리티×체험단 조합 (0~3)
+    combo = 0.0
+    if sponsor_count >= 1 and richness_avg_len >= 1000:
+        combo = 3.0
+    elif sponsor_count >= 1 and richness_avg_len >= 500:
+        combo = 2.0
+    elif sponsor_count >= 1:
+        combo = 1.0
+
+    # 3. 내돈내산 vs 협찬 비율 (0~2): 균형이 가장 좋음
+    if 0.10 <= sponsor_signal_rate <= 0.30:
+        balance = 2.0
+    elif 0.05 <= sponsor_signal_rate < 0.10 or 0.30 < sponsor_signal_rate <= 0.45:
+        balance = 1.0
+    else:
+        balance = 0.0
+
+    return round(min(8.0, exp_score + combo + balance), 1)
+
+
+def golden_score_v71(
+    # ExposurePower 입력
+    queries_hit_count: int = 0,
+    total_query_count: int = 0,
+    ranks: Optional[List[int]] = None,
+    popularity_cross_score: float = 0.0,
+    broad_query_hits: int = 0,
+    region_power_hits: int = 0,
+    # BlogAuthority 입력
+    estimated_tier: str = "unknown",
+    neighbor_count: int = 0,
+    blog_years: float = 0.0,
+    interval_avg: Optional[float] = None,
+    # RSSQuality 입력
+    richness_avg_len: float = 0.0,
+    rss_originality_v7: float = 0.0,
+    rss_diversity_smoothed: float = 0.0,
+    image_ratio: float = 0.0,
+    video_ratio: float = 0.0,
+    # Freshness 입력
+    days_since_last_post: Optional[int] = None,
+    rss_posts: Optional[List[Any]] = None,
+    # TopExposureProxy 입력
+    base_score_val: float = 0.0,
+    # SponsorFit 입력
+    sponsor_signal_rate: float = 0.0,
+    # GameDefense & QualityFloor (기존 v7.0 그대로)
+    game_defense: float = 0.0,
+    quality_floor: float = 0.0,
+    # CategoryBonus 입력 (모드C 전용)
+    has_category: bool = False,
+    keyword_match_ratio: float = 0.0,
+    exposure_ratio: float = 0.0,
+    queries_hit_ratio: float = 0.0,
+    topic_focus: float = 0.0,
+    topic_continuity: float = 0.0,
+    tfidf_sim: float = 0.0,
+    cat_strength: int = 0,
+    cat_exposed: int = 0,
+    total_keywords: int = 0,
+    weighted_strength: float = 0.0,
+) -> dict:
+    """
+    GoldenScore v7.1 (Base 0~100 + Category Bonus 0~25)
+
+    Base Score 8축:
+    - ExposurePower (0~30)
+    - BlogAuthority (0~22)
+    - RSSQuality (0~18)
+    - Freshness (0~12)
+    - TopExposureProxy (0~10)
+    - SponsorFit (0~8)
+    - GameDefense (0 to -10)
+    - QualityFloor (0 to +5)
+    → Raw 합산 후 0~100 정규화 (max raw = 105)
+
+    Category Bonus (모드C):
+    - CategoryFit (0~15)
+    - CategoryExposure (0~10)
+    → 0~25
+
+    Returns dict with base_score, category_bonus, final_score, breakdowns, mode, grade.
+    """
+    # Base Score 8축
+    ep = compute_exposure_power(
+        queries_hit_count, total_query_count, ranks or [],
+        popularity_cross_score, broad_query_hits, region_power_hits,
+    )
+    ba = compute_blog_authority_v71(estimated_tier, neighbor_count, blog_years, interval_avg)
+    rq = compute_rss_quality_v71(richness_avg_len, rss_originality_v7, rss_diversity_smoothed, image_ratio, video_ratio)
+    fr = compute_freshness_v71(days_since_last_post, rss_posts)
+    te = compute_top_exposure_proxy_v71(popularity_cross_score, neighbor_count, base_score_val, ranks)
+    sf = compute_sponsor_fit_v71(sponsor_signal_rate, rss_posts, richness_avg_len)
+    gd = max(-10.0, min(0.0, game_defense))
+    qf = max(0.0, min(5.0, quality_floor))
+
+    raw_base = ep + ba + rq + fr + te + sf + gd + qf
+    # 정규화: max raw = 30+22+18+12+10+8+0+5 = 105 → 0~100
+    base_score_val_v71 = round(max(0.0, min(100.0, raw_base / 105.0 * 100.0)), 1)
+
+    base_breakdown = {
+        "exposure_power": {"score": ep, "max": 30, "label": "검색 노출력"},
+        "blog_authority": {"score": ba, "max": 22, "label": "블로그 권위"},
+        "rss_quality": {"score": rq, "max": 18, "label": "RSS 품질"},
+        "freshness": {"score": fr, "max": 12, "label": "최신성"},
+        "top_exposure_proxy": {"score": te, "max": 10, "label": "상위노출 지수"},
+        "sponsor_fit": {"score": sf, "max": 8, "label": "체험단 적합도"},
+        "game_defense": {"score": gd, "max": 0, "label": "어뷰징 감점"},
+        "quality_floor": {"score": qf, "max": 5, "label": "품질 보정"},
+    }
+
+    # Category Bonus (모드C)
+    category_bonus = None
+    bonus_breakdown = None
+    analysis_mode = "region"
+
+    if has_category:
+        analysis_mode = "category"
+        cf = compute_category_fit_bonus(
+            keyword_match_ratio, exposure_ratio, queries_hit_ratio,
+            topic_focus, topic_continuity, tfidf_sim,
+        )
+
+        # CategoryExposure: exposure_rate + strength_avg
+        if total_keywords > 0:
+            exp_rate = cat_exposed / max(1, total_keywords)
+            eff_str = weighted_strength if weighted_strength > 0 else float(cat_strength)
+            str_avg = eff_str / max(1, cat_exposed) if cat_exposed > 0 else 0.0
+        else:
+            exp_rate = 0.0
+            str_avg = 0.0
+        ce = compute_category_exposure_bonus(exp_rate, str_avg)
+
+        category_bonus = round(cf + ce, 1)
+        bonus_breakdown = {
+            "category_fit": {"score": cf, "max": 15, "label": "업종 적합도"},
+            "category_exposure": {"score": ce, "max": 10, "label": "업종 노출"},
+        }
+
+    # Final Score
+    if category_bonus is not None:
+        final_score = round(base_score_val_v71 + category_bonus, 1)
+    else:
+        final_score = base_score_val_v71
+
+    grade = assign_grade_v71(base_score_val_v71)
+
+    return {
+        "base_score": base_score_val_v71,
+        "category_bonus": category_bonus,
+        "final_score": final_score,
+        "base_breakdown": base_breakdown,
+        "bonus_breakdown": bonus_breakdown,
+        "analysis_mode": analysis_mode,
+        "grade": grade,
+        "grade_label": _grade_label_v71(grade),
+    }
+
+
+def assign_grade_v71(base_score_val: float) -> str:
+    """v7.1 등급 판정 (항상 Base Score 기준)."""
+    if base_score_val >= 80:
+        return "S"
+    elif base_score_val >= 65:
+        return "A"
+    elif base_score_val >= 50:
+        return "B"
+    elif base_score_val >= 35:
+        return "C"
+    else:
+        return "D"
@@ -0,0 +1,135 @@
+"""
+블로거 인덱스가 붙은 검색 결과 — 캐시 항목마다 순위별 blogger_id/태그 제거 제목을 함께 보관.
+
+검색 결과를 쓰는 곳마다 URL에서 blogger_id를 다시 뽑는다:
+  - collect_candidates / _merge_postings / collect_popularity_cross / exposure_mapping:
+    canonical_blogger_id_from_item (항목마다 정규식 최대 4회, 인기순 교차검색은 후보 블로거마다 반복)
+  - analyze_exposure: 키워드 × 항목마다 정규식 3회로 대상 블로거 매칭
+여기서는 검색 결과를 IndexedSearchResult(list 하위 클래스, 기존처럼 BlogPostItem 순회 가능)로 감싸
+blogger_ids[i] / titles[i]를 한 번만 계산하고 rank_of(blogger_id)를 dict 조회로 처리한다.
+api_cache에는 items와 함께 blogger_ids/titles를 저장해 캐시 히트 시 재계산하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from backend.models import BlogPostItem
+
+_BLOG_ID_PARAM = re.compile(r"(?:blogId|blogid)=([A-Za-z0-9._-]+)")
+_BLOG_PATH = re.compile(r"(?:m\.)?blog\.naver\.com/([A-Za-z0-9._-]+)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+_SYSTEM_PATHS = frozenset({
+    "postview", "postlist", "bloglist", "prologue",
+    "postview.naver", "postlist.naver",
+    "postview.nhn", "postlist.nhn",
+})
+
+
+def canonical_blogger_id_from_item(item: BlogPostItem) -> Optional[str]:
+    urls = [item.bloggerlink, item.link]
+    for u in urls:
+        if not u:
+            continue
+        # 1순위: blogId 쿼리 파라미터 (PostView.naver?blogId=abc 대응)
+        m = _BLOG_ID_PARAM.search(u)
+        if m:
+            return m.group(1).lower()
+        # 2순위: blog.naver.com/{id} 경로 기반
+        m = _BLOG_PATH.search(u)
+        if m:
+            bid = m.group(1).lower()
+            if bid not in _SYSTEM_PATHS:
+                return bid
+    return None
+
+
+def strip_title(text: Optional[str]) -> str:
+    """검색 API 제목의 <b> 등 태그 제거."""
+    return _HTML_TAG.sub("", text or "").strip()
+
+
+class IndexedSearchResult(List[BlogPostItem]):
+    """순위 순서 BlogPostItem 목록 + 순위별 blogger_id(없으면 None)/태그 제거 제목.
+
+    list 연산(순회/len/인덱싱)은 기존 List[BlogPostItem]과 같고, 슬라이스도 인덱스가 유지된 IndexedSearchResult.
+    항목을 추가/수정하지 않는 읽기 전용 결과로 취급한다.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[BlogPostItem] = (),
+        blogger_ids: Optional[List[Optional[str]]] = None,
+        titles: Optional[List[str]] = None,
+    ) -> None:
+        super().__init__(items)
+        if blogger_ids is None or len(blogger_ids) != len(self):
+            blogger_ids = [canonical_blogger_id_from_item(it) for it in self]
+        if titles is None or len(titles) != len(self):
+            titles = [strip_title(it.title) for it in self]
+        self.blogger_ids: List[Optional[str]] = blogger_ids
+        self.titles: List[str] = titles
+        # blogger_id → 최고 순위(1부터)
+        self._rank: Dict[str, int] = {}
+        for rank0, bid in enumerate(blogger_ids):
+            if bid and bid not in self._rank:
+                self._rank[bid] = rank0 + 1
+
+    def rank_of(self, blogger_id: str) -> Optional[int]:
+        """blogger_id의 최고 순위 (1부터, 미노출이면 None)."""
+        return self._rank.get(blogger_id)
+
+    def hit(self, blogger_id: str) -> Optional[Tuple[int, str, str]]:
+        """(순위, 포스트 링크, 태그 제거 제목) — 미노출이면 None."""
+        rank = self._rank.get(blogger_id)
+        if rank is None:
+            return None
+        return rank, self[rank - 1].link, self.titles[rank - 1]
+
+    def ranked(self) -> Iterator[Tuple[int, str, BlogPostItem]]:
+        """(순위, blogger_id, 항목) — blogger_id를 알 수 없는 항목은 건너뜀."""
+        for rank0, (bid, it) in enumerate(zip(self.blogger_ids, self)):
+            if bid:
+                yield rank0 + 1, bid, it
+
+    def __getitem__(self, index):
+        # 슬라이스(상위 top-k 등)도 인덱스 유지
+        if isinstance(index, slice):
+            return IndexedSearchResult(
+                super().__getitem__(index), self.blogger_ids[index], self.titles[index],
+            )
+        return super().__getitem__(index)
+
+    def copy(self) -> "IndexedSearchResult":
+        return IndexedSearchResult(self, self.blogger_ids, self.titles)
+
+
+def index_items(items: Optional[Iterable[BlogPostItem]]) -> IndexedSearchResult:
+    """검색 결과 → IndexedSearchResult (이미 인덱스가 있으면 그대로)."""
+    if isinstance(items, IndexedSearchResult):
+        return items
+    return IndexedSearchResult(items or ())
+
+
+def dump_cached(result: IndexedSearchResult) -> str:
+    """api_cache.response_json 형식: {"items": [...], "blogger_ids": [...], "titles": [...]}"""
+    return json.dumps({
+        "items": [asdict(it) for it in result],
+        "blogger_ids": result.blogger_ids,
+        "titles": result.titles,
+    }, ensure_ascii=False)
+
+
+def load_cached(raw: str) -> IndexedSearchResult:
+    """dump_cached 결과 → IndexedSearchResult. 인덱스 없는 이전 형식(항목 배열)은 로드 시 계산."""
+    data = json.loads(raw)
+    if isinstance(data, list):
+        return IndexedSearchResult(BlogPostItem(**d) for d in data)
+    return IndexedSearchResult(
+        (BlogPostItem(**d) for d in data.get("items", [])),
+        data.get("blogger_ids"),
+        data.get("titles"),
+    )
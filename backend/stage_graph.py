@@ -0,0 +1,113 @@
+"""
+단계 의존성 그래프 실행기 — 독립 단계를 동시에 실행.
+
+analyze_blog의 단계(RSS → 콘텐츠/키워드/품질/프로필/포스트 실측 → 노출 → 점수)는
+대부분 RSS에만 의존하므로 순차 실행하면 프로필 스크래핑·노출 검색·포스트 실측 시간이 더해진다.
+여기서는 단계를 (이름, 함수, 선행 단계)로 등록하고 선행 단계가 모두 끝난 단계부터 스레드풀에 제출한다.
+
+    graph = StageGraph()
+    graph.add("rss", lambda r: fetch_rss(bid))
+    graph.add("profile", lambda r: fetch_blog_profile(bid, r["rss"]), deps=("rss",))
+    run = graph.run(on_complete=lambda name, done, total: ...)
+    run.results["profile"], run.wall_ms, run.sequential_ms
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.timings import submit_in_context
+
+# fn(results) — results는 완료된 단계 결과 {이름: 값} (선행 단계 결과는 항상 포함)
+StageFn = Callable[[Dict[str, Any]], Any]
+CompleteCb = Callable[[str, int, int], None]
+
+
+@dataclass
+class _Stage:
+    name: str
+    fn: StageFn
+    deps: Tuple[str, ...]
+
+
+@dataclass
+class GraphRun:
+    """그래프 1회 실행 결과. sequential_ms = 단계 시간 합 (같은 단계를 순차 실행했을 때의 기준선)."""
+    results: Dict[str, Any]
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    wall_ms: float = 0.0
+
+    @property
+    def sequential_ms(self) -> float:
+        return round(sum(self.stage_ms.values()), 1)
+
+    def latency(self) -> Dict[str, Any]:
+        """meta.latency 직렬화 형태."""
+        return {
+            "wall_ms": round(self.wall_ms, 1),
+            "sequential_ms": self.sequential_ms,
+            "stages": {name: round(ms, 1) for name, ms in self.stage_ms.items()},
+        }
+
+
+class StageGraph:
+    """단계 등록 순서 = 위상 순서 (선행 단계는 먼저 등록되어 있어야 함)."""
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, _Stage] = {}
+
+    def add(self, name: str, fn: StageFn, deps: Tuple[str, ...] = ()) -> None:
+        if name in self._stages:
+            raise ValueError(f"중복 단계: {name}")
+        unknown = [d for d in deps if d not in self._stages]
+        if unknown:
+            raise ValueError(f"{name}: 등록되지 않은 선행 단계 {unknown}")
+        self._stages[name] = _Stage(name, fn, tuple(deps))
+
+    def run(self, max_workers: Optional[int] = None, on_complete: Optional[CompleteCb] = None) -> GraphRun:
+        """선행 단계가 끝난 단계부터 동시 실행. 단계가 예외를 던지면 새 단계 제출을 멈추고
+        실행 중인 단계가 끝난 뒤 그 예외를 다시 던진다 (AnalysisCancelled 포함).
+
+        on_complete(name, 완료 수, 전체 수)는 단계가 끝날 때마다 run을 호출한 스레드에서 호출.
+        """
+        run = GraphRun(results={})
+        pending = dict(self._stages)
+        started = time.perf_counter()
+
+        def _timed(stage: _Stage, inputs: Dict[str, Any]) -> Tuple[Any, float]:
+            t0 = time.perf_counter()
+            value = stage.fn(inputs)
+            return value, (time.perf_counter() - t0) * 1000.0
+
+        workers = max_workers or max(1, len(self._stages))
+        error: Optional[BaseException] = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            running: Dict[concurrent.futures.Future, str] = {}
+            while pending or running:
+                if error is None:
+                    for name, stage in list(pending.items()):
+                        if all(d in run.results for d in stage.deps):
+                            inputs = dict(run.results)
+                            running[submit_in_context(pool, _timed, stage, inputs)] = name
+                            del pending[name]
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    try:
+                        value, ms = fut.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+                        continue
+                    run.results[name] = value
+                    run.stage_ms[name] = ms
+                    if on_complete is not None and error is None:
+                        on_complete(name, len(run.results), len(self._stages))
+        run.wall_ms = (time.perf_counter() - started) * 1000.0
+        if error is not None:
+            raise error
+        return run
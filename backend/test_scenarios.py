@@ -4468,6 +4468,1653 @@ def test_tc167_blog_analysis_score_standalone():
            f"standalone_cf={'N' if ok2 else 'Y'}, linked_cf={'Y' if ok4 else 'N'}")
 
 
+# ==================== TC-168: 희소 노출 저장 ====================
+
+def _save_exposure_run(conn, store_id, sparse, bloggers, keywords, exposure_map):
+    from backend.analyzer import BloggerAnalyzer
+    profile = StoreProfile(region_text="희소지역", category_text="안경원")
+    analyzer = BloggerAnalyzer(client=None, profile=profile, store_id=store_id,
+                               sparse_exposures=sparse)
+    analyzer.save_to_db(conn, bloggers, keywords, exposure_map)
+    conn.commit()
+
+
+def test_tc168_sparse_exposure_equivalence():
+    """TC-168: 희소 저장(hit만 + exposure_checks) 리포트 결과 == 밀집 저장 결과."""
+    from backend.models import CandidateBlogger
+
+    conn = get_conn(TEST_DB)
+    sid_dense = upsert_store(conn, "희소지역", "안경원", None, "밀집매장", None)
+    sid_sparse = upsert_store(conn, "희소지역", "안경원", None, "희소매장", None)
+    conn.commit()
+
+    def _make(i, name=""):
+        b = CandidateBlogger(
+            blogger_id=f"sparse_b{i:02d}", blog_url=f"https://blog.naver.com/sparse_b{i:02d}",
+            ranks=[], queries_hit=set(),
+            posts=[BlogPostItem(title="t", description="d", link=f"https://blog.naver.com/sparse_b{i:02d}/1",
+                                bloggername=name or f"블로거{i}")],
+        )
+        b.tier_score = 10.0 + i
+        b.tier_grade = compute_authority_grade(b.tier_score)
+        b.food_bias_rate = 0.7 if i % 4 == 0 else 0.2
+        return b
+
+    bloggers = [_make(i) for i in range(12)]
+    bloggers.append(_make(12, name="스타벅스 역삼점"))  # 미노출 경쟁사 → competition에만 등장
+    keywords = [f"희소키워드{k}" for k in range(10)]
+
+    # 1차 검색: 일부 블로거만 일부 키워드에서 순위 적중
+    run1 = {kw: {} for kw in keywords}
+    for i in range(8):
+        for k in range(i % 5 + 1):
+            run1[keywords[k]][f"sparse_b{i:02d}"] = (
+                (i * 3 + k) % 30 + 1, f"https://blog.naver.com/sparse_b{i:02d}/{k}", f"포스트{k}")
+    # 2차 검색(같은 날): b00의 키워드0 노출이 사라짐 → 밀집 모드는 rank=NULL로 덮어씀
+    run2 = {kw: dict(mp) for kw, mp in run1.items()}
+    run2[keywords[0]].pop("sparse_b00", None)
+
+    for sid, sparse in ((sid_dense, False), (sid_sparse, True)):
+        _save_exposure_run(conn, sid, sparse, bloggers, keywords, run1)
+        _save_exposure_run(conn, sid, sparse, bloggers, keywords, run2)
+
+    dense_rows = conn.execute("SELECT COUNT(*) AS c FROM exposures WHERE store_id=?", (sid_dense,)).fetchone()["c"]
+    sparse_rows = conn.execute("SELECT COUNT(*) AS c FROM exposures WHERE store_id=?", (sid_sparse,)).fetchone()["c"]
+    sparse_nulls = conn.execute(
+        "SELECT COUNT(*) AS c FROM exposures WHERE store_id=? AND rank IS NULL", (sid_sparse,)
+    ).fetchone()["c"]
+
+    dense = get_top20_and_pool40(conn, sid_dense, days=30, category_text="안경원")
+    sparse = get_top20_and_pool40(conn, sid_sparse, days=30, category_text="안경원")
+
+    ok1 = dense_rows == len(bloggers) * len(keywords)
+    ok2 = sparse_nulls == 0 and sparse_rows < dense_rows
+    ok3 = json.dumps(dense, sort_keys=True, ensure_ascii=False) == json.dumps(sparse, sort_keys=True, ensure_ascii=False)
+    ok4 = any(c["blogger_id"] == "sparse_b12" for c in sparse.get("competition", []))
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-168", "희소 노출 저장 == 밀집 저장 리포트 결과", ok,
+           f"dense_rows={dense_rows}, sparse_rows={sparse_rows}, nulls={sparse_nulls}, "
+           f"identical={ok3}, competitor_kept={ok4}")
+    conn.close()
+
+
+# ==================== TC-169~170: 단계별 계측 ====================
+
+def test_tc169_phase_timings_thread_propagation():
+    """TC-169: 스레드풀 작업의 API/캐시/HTTP 카운트가 현재 단계에 누적, 중첩 단계 시간은 제외."""
+    import concurrent.futures
+    from backend.timings import (
+        PhaseTimings, db_write, record_api_call, record_cache_hit, record_http_fetch, submit_in_context,
+    )
+
+    t = PhaseTimings()
+
+    def _work(i):
+        record_api_call(100)
+        if i % 2 == 0:
+            record_cache_hit()
+        record_http_fetch(50)
+        return i
+
+    with t.phase("seed"):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda f: f.result(), [submit_in_context(pool, _work, i) for i in range(6)]))
+    with t.phase("tier_scoring"):
+        with t.phase("tier_rss"):
+            time.sleep(0.02)
+    with t.phase("save"), db_write():
+        time.sleep(0.005)
+    record_api_call(999)  # 단계 밖 호출은 무시
+
+    d = t.as_dict()
+    seed = d["phases"]["seed"]
+    ok1 = (seed["api_calls"] == 6 and seed["cache_hits"] == 3
+           and seed["http_fetches"] == 6 and seed["bytes_downloaded"] == 900)
+    ok2 = d["phases"]["tier_rss"]["wall_ms"] >= 15 and d["phases"]["tier_scoring"]["wall_ms"] < 15
+    ok3 = d["phases"]["save"]["db_write_ms"] > 0
+    ok4 = abs(d["total_ms"] - sum(p["wall_ms"] for p in d["phases"].values())) < 0.5
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-169", "단계 계측 스레드 전파 + 중첩 제외", ok,
+           f"seed={seed}, tier_rss={d['phases']['tier_rss']['wall_ms']}, "
+           f"tier_scoring={d['phases']['tier_scoring']['wall_ms']}")
+
+
+def test_tc170_phase_timing_percentiles():
+    """TC-170: phase_timings 기록 → 단계별 p50/p95 집계."""
+    from backend.admin_db import init_admin_db, log_phase_timings, get_phase_timing_stats
+
+    conn = get_conn(TEST_DB)
+    init_admin_db(conn)
+    for i in range(1, 21):
+        log_phase_timings(conn, "search", {"total_ms": i * 11.0, "phases": {
+            "seed": {"wall_ms": float(i * 10), "api_calls": 7, "cache_hits": i % 3,
+                     "http_fetches": 0, "bytes_downloaded": 1000, "db_write_ms": 0.0},
+            "save": {"wall_ms": float(i), "api_calls": 0, "cache_hits": 0,
+                     "http_fetches": 0, "bytes_downloaded": 0, "db_write_ms": float(i)},
+        }})
+    log_phase_timings(conn, "blog_analysis", {"total_ms": 5.0, "phases": {"rss": {"wall_ms": 5.0}}})
+
+    stats = get_phase_timing_stats(conn, "search", days=1)
+    by_phase = {p["phase"]: p for p in stats["phases"]}
+    seed = by_phase.get("seed", {})
+    ok1 = set(by_phase) == {"seed", "save"}
+    ok2 = seed.get("count") == 20 and seed["wall_ms"] == {"p50": 100.0, "p95": 190.0}
+    ok3 = seed["api_calls"]["p95"] == 7 and by_phase["save"]["db_write_ms"]["p50"] == 10.0
+
+    ok = ok1 and ok2 and ok3
+    report("TC-170", "단계별 p50/p95 집계", ok,
+           f"phases={sorted(by_phase)}, seed_wall={seed.get('wall_ms')}")
+    conn.close()
+
+
+# ==================== TC-171: 협력적 취소 ====================
+
+def test_tc171_cancel_token_stops_analysis():
+    """TC-171: 취소 토큰 → 대기 중 쿼리 미호출, 완료 결과는 캐시 유지, DB 미저장."""
+    import threading
+    from backend.analyzer import BloggerAnalyzer
+    from backend.cancellation import AnalysisCancelled, CancelToken
+
+    token = CancelToken()
+
+    class _CancellingClient:
+        def __init__(self):
+            self.calls = 0
+            self._lock = threading.Lock()
+
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            with self._lock:
+                self.calls += 1
+                if self.calls == 2:
+                    token.cancel()
+            time.sleep(0.01)
+            return []
+
+    conn = get_conn(TEST_DB)
+    sid = upsert_store(conn, "취소구", "안경원", None, "취소매장", None)
+    conn.commit()
+
+    client = _CancellingClient()
+    profile = StoreProfile(region_text="취소구", category_text="안경원")
+    analyzer = BloggerAnalyzer(client=client, profile=profile, store_id=sid, cancel_token=token)
+    seed_total = len(build_seed_queries(profile))
+
+    raised = False
+    try:
+        analyzer.analyze(conn, top_n=50)
+    except AnalysisCancelled:
+        raised = True
+
+    rows = conn.execute("SELECT COUNT(*) AS c FROM exposures WHERE store_id=?", (sid,)).fetchone()["c"]
+    ok1 = raised
+    ok2 = client.calls < seed_total
+    ok3 = len(analyzer.cache) == client.calls  # 완료된 호출 결과만 캐시
+    ok4 = rows == 0
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-171", "취소 토큰 → 분석 중단 + 완료 결과 캐시 유지", ok,
+           f"raised={raised}, calls={client.calls}/{seed_total}, cached={len(analyzer.cache)}, rows={rows}")
+    conn.close()
+
+
+# ==================== TC-172: 데드라인 기반 신호 생략 ====================
+
+def test_tc172_deadline_degrades_optional_signals():
+    """TC-172: 예산 부족 → 선택적 신호 생략 + degraded 기록, 무제한이면 항상 허용."""
+    from backend.blog_analyzer import sample_actual_post_metrics
+    from backend.deadline import Deadline, SIGNAL_BLOGDEX, SIGNAL_POST_SAMPLE
+
+    unlimited = Deadline(None)
+    ok1 = unlimited.allows(SIGNAL_BLOGDEX) and unlimited.degraded == []
+
+    tight = Deadline(2000, reserve_ms=3000)
+    ok2 = not tight.allows(SIGNAL_BLOGDEX) and not tight.allows(SIGNAL_BLOGDEX)
+    ok3 = tight.degraded == [SIGNAL_BLOGDEX]  # 중복 기록 없음
+
+    posts = []
+    for i in range(3):
+        p = _FakeRSSPost(title=f"포스트{i}")
+        p.link = f"https://blog.naver.com/deadline_test/{1000 + i}"
+        posts.append(p)
+    start = time.perf_counter()
+    metrics = sample_actual_post_metrics(posts, max_samples=3, timeout=5.0, deadline=tight, db_path=TEST_DB)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    ok4 = metrics == {"avg_image_count": 0.0, "avg_content_length": 0.0} and elapsed_ms < 500
+    ok5 = tight.degraded == [SIGNAL_BLOGDEX, SIGNAL_POST_SAMPLE]
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5
+    report("TC-172", "데드라인 부족 → 선택적 신호 생략 + degraded 기록", ok,
+           f"degraded={tight.degraded}, sample={metrics}, elapsed={elapsed_ms:.0f}ms")
+
+
+# ==================== TC-173: 다매장 일괄 분석 ====================
+
+def test_tc173_batch_dedup_queries():
+    """TC-173: 같은 지역 매장 일괄 분석 → 중복 쿼리 1회만 호출 + 매장별 스냅샷 저장."""
+    import threading
+    from backend.admin_db import init_admin_db
+    from backend.batch import build_query_plan, profile_from_dict, run_batch
+
+    class _CountingClient:
+        def __init__(self):
+            self.calls = []
+            self._lock = threading.Lock()
+
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            with self._lock:
+                self.calls.append((query, display, sort))
+            return [BlogPostItem(title=f"{query} 후기", description="d", link="", postdate="20260101")]
+
+    conn = get_conn(TEST_DB)
+    init_admin_db(conn)
+    conn.close()
+
+    stores = [
+        {"region": "일괄구", "keyword": "카페", "store_name": "일괄카페"},
+        {"region": "일괄구", "keyword": "안경원", "store_name": "일괄안경원"},
+        {"region": "", "keyword": "카페"},  # 지역 누락 → errors
+    ]
+    plan, total = build_query_plan([profile_from_dict(d) for d in stores[:2]])
+    client = _CountingClient()
+    summary = run_batch(stores, client=client, max_workers=4, db_path=TEST_DB)
+
+    conn = get_conn(TEST_DB)
+    snaps = conn.execute(
+        "SELECT COUNT(*) AS c FROM search_snapshots WHERE store_id IN (?, ?)",
+        tuple(e["store_id"] for e in summary["stores"]) if len(summary["stores"]) == 2 else (-1, -1),
+    ).fetchone()["c"]
+    conn.close()
+
+    ok1 = len(plan) < total and summary["queries_unique"] == len(plan)
+    ok2 = len(client.calls) == len(set(client.calls)) == len(plan)  # 매장 분석 중 추가 호출 없음
+    ok3 = len(summary["stores"]) == 2 and len(summary["errors"]) == 1 and snaps == 2
+    ok4 = summary["stores_per_minute"] > 0
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-173", "일괄 분석 쿼리 중복 제거 + 매장별 스냅샷", ok,
+           f"total={total}, unique={len(plan)}, calls={len(client.calls)}, "
+           f"stores={len(summary['stores'])}, errors={len(summary['errors'])}, snaps={snaps}")
+
+
+# ==================== TC-174: 지역 공유 후보 풀 ====================
+
+def test_tc174_region_candidate_pool():
+    """TC-174: 같은 지역 두 번째 매장 → region_power/broad 검색 없이 풀에서 동일 후보 + RSS 재사용."""
+    from backend.analyzer import BloggerAnalyzer
+    from backend.keywords import build_broad_queries, build_region_power_queries
+    from backend.models import RSSPost
+
+    class _PoolClient:
+        def __init__(self):
+            self.calls = []
+
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            self.calls.append(query)
+            return [
+                BlogPostItem(title=f"카페 후기 {i}", description="풀역로 근처 방문",
+                             link=f"https://blog.naver.com/pool{i % 7}/{abs(hash(query)) % 10000}{i}",
+                             postdate="20260101", bloggerlink=f"https://blog.naver.com/pool{i % 7}")
+                for i in range(20)
+            ]
+
+    def _collect(client, profile, store_id, conn):
+        a = BloggerAnalyzer(client=client, profile=profile, store_id=store_id, use_region_pool=True)
+        found = a.collect_region_power_candidates({}, conn)
+        found = a.collect_broad_candidates(found, conn)
+        return a, found
+
+    conn = get_conn(TEST_DB)
+    init_db(conn)
+    p1 = StoreProfile(region_text="풀구", category_text="카페", store_name="풀카페1")
+    p2 = StoreProfile(region_text="풀구", category_text="카페", store_name="풀카페2", address_text="풀구 풀역로 1")
+    sid1 = upsert_store(conn, "풀구", "카페", None, "풀카페1", None)
+    sid2 = upsert_store(conn, "풀구", "카페", None, "풀카페2", "풀구 풀역로 1")
+
+    c1 = _PoolClient()
+    a1, first = _collect(c1, p1, sid1, conn)
+    # tier 단계에서 수집된 RSS를 풀에 기록
+    a1.rss_cache = {bid: [RSSPost(title="t", link=f"https://blog.naver.com/{bid}/1")] for bid in first}
+    a1._update_region_pool_rss(conn)
+    conn.commit()
+
+    c2 = _PoolClient()
+    a2, second = _collect(c2, p2, sid2, conn)
+    pools = conn.execute("SELECT COUNT(*) AS c, SUM(hit_count) AS h FROM region_candidate_pools WHERE region_text=?", ("풀구",)).fetchone()
+    conn.close()
+
+    n_queries = len(build_region_power_queries(p1)) + len(build_broad_queries(p1))
+    ok1 = len(c1.calls) == n_queries and a1.seed_api_calls == n_queries
+    ok2 = c2.calls == [] and a2.seed_api_calls == 0
+    ok3 = set(first) == set(second) and all(
+        sorted(first[b].ranks) == sorted(second[b].ranks)
+        and first[b].region_power_hits == second[b].region_power_hits
+        and first[b].broad_query_hits == second[b].broad_query_hits
+        for b in first
+    )
+    ok4 = a2.rss_cache is not None and set(a2.rss_cache) == set(first)
+    ok5 = pools["c"] == 2 and pools["h"] == 2
+    # local_hits는 매장 주소 토큰 기준 (두 번째 매장만 "풀역로" 토큰 보유 → 더 많음)
+    ok6 = all(second[b].local_hits >= first[b].local_hits for b in first) and \
+        sum(b.local_hits for b in second.values()) > sum(b.local_hits for b in first.values())
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6
+    report("TC-174", "지역 공유 후보 풀 재사용 (API 0회 + RSS 공유)", ok,
+           f"calls1={len(c1.calls)}, calls2={len(c2.calls)}, bloggers={len(first)}, "
+           f"rss={len(a2.rss_cache or {})}, pools={pools['c']}, hits={pools['h']}")
+
+
+# ==================== TC-175: RSS 조건부 GET 캐시 ====================
+
+def test_tc175_rss_conditional_cache():
+    """TC-175: RSS 캐시 — 신선하면 HTTP 생략, 이후 ETag 조건부 GET(304) + 동시 요청 1회로 합치기."""
+    import threading
+    import backend.blog_analyzer as ba
+
+    feed = (
+        "<rss><channel>"
+        "<item><title>캐시 포스트</title><link>https://blog.naver.com/rsscache/1</link>"
+        "<pubDate>Mon, 05 Jan 2026 10:00:00 +0900</pubDate>"
+        "<description><![CDATA[<p>본문</p><img src='a.jpg'>]]></description></item>"
+        "</channel></rss>"
+    ).encode("utf-8")
+
+    class _Resp:
+        def __init__(self, status, content=b"", headers=None):
+            self.status_code = status
+            self.content = content
+            self.headers = headers or {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise ba.requests.HTTPError(str(self.status_code))
+
+        def iter_content(self, chunk_size=1):
+            for i in range(0, len(self.content), chunk_size):
+                yield self.content[i:i + chunk_size]
+
+        def close(self):
+            pass
+
+    calls = []
+
+    def _fake_get(url, timeout, headers, stream=False):
+        calls.append(dict(headers))
+        time.sleep(0.1)
+        if headers.get("If-None-Match") == '"v1"':
+            return _Resp(304)
+        return _Resp(200, feed, {"ETag": '"v1"', "Last-Modified": "Mon, 05 Jan 2026 01:00:00 GMT"})
+
+    orig_get = ba._http_get
+    ba._http_get = _fake_get
+    try:
+        p1 = ba.fetch_rss("rsscache", db_path=TEST_DB)
+        n_first = len(calls)
+        p2 = ba.fetch_rss("rsscache", db_path=TEST_DB)
+        n_fresh = len(calls)
+
+        # 신선 기간 경과 → 조건부 GET
+        conn = get_conn(TEST_DB)
+        conn.execute("UPDATE rss_feeds SET validated_at=datetime('now', '-1 hours') WHERE blogger_id='rsscache'")
+        conn.commit()
+        conn.close()
+        p3 = ba.fetch_rss("rsscache", db_path=TEST_DB)
+        revalidate = calls[-1]
+
+        # 동시 요청 합치기 (캐시 없는 블로거)
+        before = len(calls)
+        out = []
+        threads = [threading.Thread(target=lambda: out.append(ba.fetch_rss("rsscoalesce", db_path=TEST_DB)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        coalesced = len(calls) - before
+    finally:
+        ba._http_get = orig_get
+
+    ok1 = n_first == 1 and len(p1) == 1 and p1[0].image_count == 1 and p1[0].description == "본문"
+    ok2 = n_fresh == 1 and p2 == p1
+    ok3 = revalidate.get("If-None-Match") == '"v1"' and "If-Modified-Since" in revalidate and p3 == p1
+    ok4 = coalesced == 1 and len(out) == 5 and all(len(o) == 1 for o in out)
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-175", "RSS 조건부 GET 캐시 + 동시 요청 합치기", ok,
+           f"first={n_first}, fresh={n_fresh}, total={len(calls)}, coalesced={coalesced}")
+
+
+# ==================== TC-176: 스트리밍 RSS 파서 ====================
+
+def test_tc176_streaming_rss_parser():
+    """TC-176: 스트리밍 파서 == 기존 전체 파싱 결과 + item 상한 + 손상 XML → None."""
+    from backend.benchmarks import _legacy_parse_rss, make_rss_feed
+    from backend.blog_analyzer import _parse_rss
+
+    def _chunks(data, size=1000):
+        return (data[i:i + size] for i in range(0, len(data), size))
+
+    small = make_rss_feed(30)
+    big = make_rss_feed(500)
+    streamed = _parse_rss(_chunks(small), "bench", max_items=50)
+    capped = _parse_rss(_chunks(big), "bench", max_items=20)
+    broken = _parse_rss(_chunks(b"<rss><channel><item><title>x</titl"), "bench")
+
+    ok1 = streamed == _legacy_parse_rss(small)
+    ok2 = len(capped) == 20 and capped == _legacy_parse_rss(big)[:20]
+    ok3 = streamed[0].image_count == 3 and streamed[0].video_count == 2 and "<" not in streamed[0].description
+    ok4 = broken is None
+
+    # description 1회 스캔 == 기존 정규식 3회 — ~350자에서 잘려 닫히지 않은 태그 포함
+    import random
+    from backend.benchmarks import _legacy_scan_description
+    from backend.blog_analyzer import _scan_description
+
+    truncated = _scan_description('점심 <img src="a.jpg" alt="')
+    rng = random.Random(33)
+    pieces = ["<", ">", "<img", "<IMG ", "<iframe", "<video", "youtube.com", "youtu.be", "<b>", '"', "점심 ", "x>", "<<img"]
+    samples = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 20))) for _ in range(3000)]
+    mismatches = [t for t in samples if _scan_description(t) != _legacy_scan_description(t)]
+    ok5 = truncated == ('점심 <img src="a.jpg" alt="', 1, 0) and not mismatches
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5
+    report("TC-176", "스트리밍 RSS 파서 (기존 결과 동일 + 상한 + 잘린 태그)", ok,
+           f"streamed={len(streamed)}, capped={len(capped)}, media=({streamed[0].image_count},"
+           f"{streamed[0].video_count}), broken={broken}, truncated={truncated[1:]}, mismatches={mismatches[:3]}")
+
+
+# ==================== TC-177: 프로필 페이지 1회 스캔 추출기 ====================
+
+def test_tc177_single_pass_profile_extractor():
+    """TC-177: parse_mobile_profile / parse_blogdex_page == 기존 필드별 정규식 결과 (fixture + 변형)."""
+    from backend.benchmarks import (
+        _legacy_parse_blogdex, _legacy_parse_mobile, make_blogdex_page, make_mobile_profile_page,
+    )
+    from backend.blog_analyzer import parse_blogdex_page, parse_mobile_profile
+
+    mobile_pages = [
+        make_mobile_profile_page(4),
+        '{"countPost":12,"buddyCount":7}',                       # 폴백 필드만
+        '{"postCount":0,"countPost":5,"subscriberCount":0}',      # 0 값도 우선순위 유지
+        'var buddyCnt = 33; 게시글 1,204',                         # JSON 없음 → 텍스트 폴백
+        '<span>이웃 2,150</span>"blogDirectoryOpenDate":"20191301"',  # 잘못된 날짜
+        "",
+    ]
+    blogdex_pages = [
+        make_blogdex_page(4),
+        "최적4+ 최적4 일반 총 포스팅 10 총 포스팅 20",              # 우선순위 + 첫 출현
+        "준최3 주제 랭킹 10등 상위 9.5% 전체 랭킹 99등 상위 2.1%",
+        "블로그 생성일 2020-13-01 블로그 생성일 2020-01-01",       # 첫 생성일이 잘못되면 무시
+        "",
+    ]
+    mismatch = [p[:40] for p in mobile_pages if parse_mobile_profile(p) != _legacy_parse_mobile(p)]
+    mismatch += [p[:40] for p in blogdex_pages if parse_blogdex_page(p) != _legacy_parse_blogdex(p)]
+
+    mob = parse_mobile_profile(make_mobile_profile_page(4))
+    bdx = parse_blogdex_page(make_blogdex_page(4))
+    ok1 = not mismatch
+    ok2 = mob["total_posts"] == 1532 and mob["neighbor_count"] == 5120 and mob["blog_start_date"] is not None
+    ok3 = bdx.get("blogdex_grade") == "준최5" and bdx.get("ranking_percentile") == 3.2 and bdx.get("total_visitors") == 2841234
+
+    ok = ok1 and ok2 and ok3
+    report("TC-177", "프로필 페이지 1회 스캔 추출 == 기존 결과", ok,
+           f"mismatch={mismatch}, posts={mob['total_posts']}, grade={bdx.get('blogdex_grade')}")
+
+
+# ==================== TC-178: 적응형 프로필 소스 계획 ====================
+
+def test_tc178_adaptive_profile_sources():
+    """TC-178: 소스 통계 → Blogdex 지연/생략 + RSS로 PTL 생략, 필드가 다 차면 추가 요청 없음."""
+    import backend.blog_analyzer as ba
+
+    def _stats(**yields):
+        return {src: {"attempts": 100, "success_rate": 0.9, "yield_rate": y, "avg_ms": 800.0}
+                for src, y in yields.items()}
+
+    cold = ba.plan_profile_sources({}, rng=lambda: 1.0)
+    deferred = ba.plan_profile_sources(_stats(blogdex=0.3), rng=lambda: 1.0)
+    dead = ba.plan_profile_sources(_stats(blogdex=0.01, desktop=0.05), rng=lambda: 1.0)
+    explore = ba.plan_profile_sources(_stats(blogdex=0.01, desktop=0.05), rng=lambda: 0.0)
+
+    class _Resp:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+    mobile_page = ('{"postCount":1532,"totalVisitorCount":2841234,"subscriberCount":5120,'
+                   '"blogDirectoryOpenDate":"20150311"}')
+    urls = []
+
+    def _fake_get(url, timeout, headers, stream=False):
+        urls.append(url)
+        if url.startswith("https://m.blog.naver.com/"):
+            return _Resp(mobile_page)
+        return _Resp("")
+
+    rss = [ba.RSSPost(title="t", link="l", pub_date=(datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d"))]
+    orig_get = ba._http_get
+    ba._http_get = _fake_get
+    try:
+        adaptive = ba._fetch_blog_profile_impl("adaptive", rss, source_stats=_stats(blogdex=0.3))
+        adaptive_urls = list(urls)
+        urls.clear()
+        baseline = ba._fetch_blog_profile_impl("adaptive", [], source_stats={})
+        baseline_urls = list(urls)
+        # 개설 10일 블로그: blog_age_years 0.0이어도 모바일 개설일 사용 (RSS 가장 오래된 포스트로 대체 안 함)
+        opened = datetime.now() - timedelta(days=10)
+        mobile_page = '{"postCount":12,"blogDirectoryOpenDate":"%s"}' % opened.strftime("%Y%m%d")
+        old_rss = [ba.RSSPost(title="t", link="l", pub_date=(datetime.now() - timedelta(days=d)).strftime("%Y-%m-%d"))
+                   for d in (2, 200)]
+        young = ba._fetch_blog_profile_impl("young", old_rss, source_stats={})
+    finally:
+        ba._http_get = orig_get
+
+    ok1 = cold["blogdex_parallel"] and cold["fallbacks"] == ["ptl_last", "desktop"] and not cold["skipped"]
+    ok2 = not deferred["blogdex_parallel"] and "blogdex" in deferred["fallbacks"]
+    ok3 = set(dead["skipped"]) == {"blogdex", "desktop"} and dead["fallbacks"] == ["ptl_last"]
+    ok4 = not explore["skipped"]
+    # 구독자 5,120(영향력 만점) + RSS 최근 포스팅 → 모바일 1회만
+    ok5 = len(adaptive_urls) == 1 and len(baseline_urls) == 3
+    ok6 = (adaptive["total_posts"] == 1532 and adaptive["last_post_days_ago"] == 3
+           and adaptive["sources"]["mobile"]["added"] and "blogdex" not in adaptive["sources"])
+
+    ok7 = (young["blog_age_years"] == 0.0 and young["blog_start_date"] is not None
+           and young["blog_start_date"].date() == opened.date()
+           and "blog_age_years" in young["sources"]["mobile"]["added"])
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6 and ok7
+    report("TC-178", "적응형 프로필 소스 계획 (요청 수 감소)", ok,
+           f"adaptive_reqs={len(adaptive_urls)}, baseline_reqs={len(baseline_urls)}, "
+           f"deferred={deferred['fallbacks']}, skipped={dead['skipped']}, young_start={young['blog_start_date']}")
+
+
+# ==================== TC-179: 호스트별 요청 스케줄러 ====================
+
+def test_tc179_host_fetch_scheduler():
+    """TC-179: 호스트별 동시성 상한 + 최소 간격 + 오류율 급증 시 백오프(즉시 실패)."""
+    import threading
+    from backend.fetch_scheduler import FetchScheduler, HostBackoffError, HostPolicy
+
+    class _Resp:
+        def __init__(self, status):
+            self.status_code = status
+
+    class _Session:
+        def __init__(self, status=200, delay=0.03):
+            self.status = status
+            self.delay = delay
+            self.calls = []
+            self.active = 0
+            self.max_active = 0
+            self._lock = threading.Lock()
+
+        def get(self, url, headers=None, params=None, timeout=None, stream=False):
+            with self._lock:
+                self.calls.append(time.monotonic())
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(self.delay)
+            with self._lock:
+                self.active -= 1
+            return _Resp(self.status)
+
+    sessions = {}
+
+    def _factory(policy):
+        sess = _Session(status=503 if policy.max_concurrency == 1 else 200)
+        sessions[policy.max_concurrency] = sess
+        return sess
+
+    sched = FetchScheduler(
+        policies={"ok.test": HostPolicy(max_concurrency=2, min_interval_sec=0.02),
+                  "bad.test": HostPolicy(max_concurrency=1, min_interval_sec=0.0)},
+        session_factory=_factory,
+    )
+    threads = [threading.Thread(target=lambda: sched.get("https://ok.test/x", timeout=1)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ok_sess = sessions[2]
+    gaps = [b - a for a, b in zip(ok_sess.calls, ok_sess.calls[1:])]
+
+    statuses = [sched.get("https://bad.test/x", timeout=1).status_code for _ in range(10)]
+    try:
+        sched.get("https://bad.test/x", timeout=1)
+        backed_off = False
+    except HostBackoffError:
+        backed_off = True
+    stats = sched.stats()
+
+    ok1 = len(ok_sess.calls) == 8 and ok_sess.max_active <= 2
+    ok2 = min(gaps) >= 0.015
+    ok3 = statuses == [503] * 10 and backed_off and len(sessions[1].calls) == 10
+    ok4 = stats["bad.test"]["backoff_remaining_sec"] > 0 and stats["ok.test"]["errors"] == 0
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-179", "호스트별 요청 스케줄러 (동시성/간격/백오프)", ok,
+           f"max_active={ok_sess.max_active}, min_gap={min(gaps):.3f}, backed_off={backed_off}, "
+           f"bad_calls={len(sessions[1].calls)}")
+
+
+# ==================== TC-180: 음성 결과 캐시 ====================
+
+def test_tc180_negative_cache():
+    """TC-180: 404/파싱 오류/빈 프로필 → 사유별 음성 캐시, _parallel_fetch_rss는 요청 생략."""
+    import backend.blog_analyzer as ba
+    import backend.analyzer as an
+    import backend.negative_cache as nc
+    from backend.analyzer import BloggerAnalyzer
+
+    # 블룸 필터: 거짓 음성 없음 + 거짓 양성 ~1%
+    bloom = nc.BloomFilter(capacity=1000, fp_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"rss:in{i}")
+    no_false_neg = all(f"rss:in{i}" in bloom for i in range(1000))
+    fp = sum(f"rss:out{i}" in bloom for i in range(10000)) / 10000.0
+
+    class _Resp:
+        def __init__(self, status, content=b"", text=""):
+            self.status_code = status
+            self.content = content
+            self.text = text
+            self.headers = {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise ba.requests.HTTPError(str(self.status_code))
+
+        def iter_content(self, chunk_size=1):
+            yield self.content
+
+        def close(self):
+            pass
+
+    def _fake_get(url, timeout, headers, stream=False):
+        if "neg404" in url:
+            return _Resp(404)
+        if "negbroken" in url:
+            return _Resp(200, b"<rss><channel><item><title>x</ti")
+        if "negslow" in url:
+            raise ba.requests.Timeout("read timeout")
+        if "negbusy" in url:
+            return _Resp(503)
+        return _Resp(200, text="<html>비공개 블로그입니다</html>")
+
+    orig_get = ba._http_get
+    ba._http_get = _fake_get
+    try:
+        for bid in ("neg404", "negbroken", "negslow", "negbusy"):
+            ba.fetch_rss(bid, db_path=TEST_DB)
+        cache = nc.get_negative_cache(TEST_DB)
+        reasons = cache.lookup_many(nc.KIND_RSS, ["neg404", "negbroken", "negslow", "negbusy", "negnone"])
+
+        private = ba._fetch_blog_profile_impl("negprivate", [], source_stats={})
+        missing = ba._fetch_blog_profile_impl("neg404", [], source_stats={})
+    finally:
+        ba._http_get = orig_get
+
+    conn = get_conn(TEST_DB)
+    ttl_rows = {r["blogger_id"]: r["ttl"] for r in conn.execute(
+        "SELECT blogger_id, CAST(round((julianday(expires_at) - julianday(created_at)) * 86400) AS INTEGER) AS ttl "
+        "FROM negative_cache WHERE kind='rss'")}
+    conn.close()
+
+    # _parallel_fetch_rss: 음성 항목은 요청 없이 빈 목록
+    fetched = []
+
+    def _fake_fetch_rss(bid, timeout=5.0):
+        fetched.append(bid)
+        return [ba.RSSPost(title="t", link="l")]
+
+    orig_fetch, orig_path = an.fetch_rss, nc.DB_PATH
+    an.fetch_rss, nc.DB_PATH = _fake_fetch_rss, TEST_DB
+    try:
+        a = BloggerAnalyzer(client=None, profile=StoreProfile(region_text="음성", category_text="카페"), store_id=0)
+        rss_map = a._parallel_fetch_rss(["neg404", "negbroken", "negok"])
+    finally:
+        an.fetch_rss, nc.DB_PATH = orig_fetch, orig_path
+
+    # 다른 프로세스(워커 A/B): A의 필터가 먼저 적재된 뒤 B가 기록한 항목도 보이고,
+    # B가 기록한 항목을 A가 clear하면 (A의 필터에 없어도) DB에서 삭제
+    worker_a = nc.NegativeCache(TEST_DB, refresh_sec=0.0)
+    worker_b = nc.NegativeCache(TEST_DB, refresh_sec=0.0)
+    seen_before = worker_a.lookup(nc.KIND_RSS, "negother")
+    worker_b.record(nc.KIND_RSS, "negother", nc.NEG_NOT_FOUND)
+    seen_after = worker_a.lookup(nc.KIND_RSS, "negother")
+    worker_c = nc.NegativeCache(TEST_DB, refresh_sec=3600.0)
+    worker_c.lookup(nc.KIND_RSS, "negother")  # 필터 적재 (이후 1시간 갱신 안 함)
+    worker_b.record(nc.KIND_RSS, "negrecovered", nc.NEG_NOT_FOUND)
+    worker_c.clear(nc.KIND_RSS, "negrecovered")
+    cleared = worker_b.lookup(nc.KIND_RSS, "negrecovered") is None
+
+    # 단독 fetch_rss(analyze_blog 경로)도 음성 항목이면 요청 생략
+    requested = []
+
+    def _counting_get(url, timeout, headers, stream=False):
+        requested.append(url)
+        return _Resp(404)
+
+    nc.get_negative_cache(TEST_DB).record(nc.KIND_RSS, "negstandalone", nc.NEG_PRIVATE)
+    ba._http_get = _counting_get
+    try:
+        skipped = ba.fetch_rss("negstandalone", db_path=TEST_DB) == [] and not requested
+    finally:
+        ba._http_get = orig_get
+    ok6 = seen_before is None and seen_after == "not_found" and cleared and skipped
+
+    ok1 = no_false_neg and fp < 0.03
+    ok2 = reasons == {"neg404": "not_found", "negbroken": "parse_error", "negslow": "timeout"}
+    ok3 = ttl_rows.get("neg404") == 86400 and ttl_rows.get("negslow") == 600
+    ok4 = private.get("negative") == "private" and missing.get("negative") == "not_found"
+    ok5 = fetched == ["negok"] and rss_map["neg404"] == [] and rss_map["negbroken"] == [] and len(rss_map["negok"]) == 1
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6
+    report("TC-180", "음성 결과 캐시 (사유별 TTL + 블룸 필터 + 프로세스 간 공유)", ok,
+           f"fp={fp:.3f}, reasons={reasons}, ttl={ttl_rows}, profile={private.get('negative')}/{missing.get('negative')}, "
+           f"fetched={fetched}, cross_process={seen_after}/{cleared}/{skipped}")
+
+
+# ==================== TC-181: 포스트 실측 병렬 + 캐시 ====================
+
+def test_tc181_parallel_cached_post_sampling():
+    """TC-181: 포스트 페이지 병렬 fetch + (blogId, logNo) 캐시 + 예산 초과 샘플 제외."""
+    import backend.blog_analyzer as ba
+
+    body = "<p>" + "본문 내용입니다 " * 50 + "</p>"
+    se_page = ('<html><img src="profile.png"><div class="se-main-container">'
+               + '<img class="se-image-resource" src="a.jpg">' * 4 + body
+               + '</div><div class="post_footer"><img class="se-image-resource" src="ad.jpg"></div></html>')
+
+    class _Resp:
+        status_code = 200
+
+        def __init__(self, text):
+            self.text = text
+
+    calls = []
+
+    def _fake_get(url, timeout, headers, stream=False):
+        calls.append(url)
+        time.sleep(1.0 if "logNo=9" in url else 0.3)
+        return _Resp(se_page)
+
+    posts = []
+    for n in (1, 2, 3, 9):
+        p = _FakeRSSPost(title=f"포스트{n}")
+        p.link = f"https://blog.naver.com/sampler/{n}?fromRss=true"
+        posts.append(p)
+
+    parsed = ba.parse_post_view(se_page)
+    orig_get = ba._http_get
+    ba._http_get = _fake_get
+    try:
+        start = time.perf_counter()
+        first = ba.sample_actual_post_metrics(posts[:3], max_samples=3, db_path=TEST_DB)
+        parallel_ms = (time.perf_counter() - start) * 1000
+        n_first = len(calls)
+        start = time.perf_counter()
+        cached = ba.sample_actual_post_metrics(posts[:3], max_samples=3, db_path=TEST_DB)
+        cached_ms = (time.perf_counter() - start) * 1000
+        n_cached = len(calls) - n_first
+        # 예산 300ms: 캐시된 1~3번 + 1초 걸리는 9번은 제외
+        start = time.perf_counter()
+        budgeted = ba.sample_actual_post_metrics(posts, max_samples=4, budget_ms=300, db_path=TEST_DB)
+        budget_ms = (time.perf_counter() - start) * 1000
+    finally:
+        time.sleep(1.0)  # 백그라운드 fetch 종료 대기
+        ba._http_get = orig_get
+
+    ok1 = parsed["image_count"] == 4 and 300 < parsed["content_length"] < 500
+    ok2 = n_first == 3 and parallel_ms < 800 and first["avg_image_count"] == 4.0
+    ok3 = n_cached == 0 and cached == first and cached_ms < 200
+    ok4 = budget_ms < 700 and budgeted == first
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-181", "포스트 실측 병렬 fetch + 캐시 + 예산", ok,
+           f"parsed={parsed}, parallel={parallel_ms:.0f}ms, cached_calls={n_cached}, budget={budget_ms:.0f}ms, "
+           f"first={first}, budgeted={budgeted}")
+
+
+# ==================== TC-182: analyze_blog 단계 그래프 ====================
+
+def test_tc182_analyze_blog_stage_graph():
+    """TC-182: 프로필/노출/포스트 실측 동시 실행 → wall < 순차 합 + 단계 완료마다 진행 이벤트."""
+    import backend.blog_analyzer as ba
+    from backend.models import ExposureMetrics, RSSPost
+    from backend.stage_graph import StageGraph
+
+    # 그래프 단위: 선행 단계 결과 전달 + 예외 전파
+    g = StageGraph()
+    g.add("a", lambda r: 1)
+    g.add("b", lambda r: r["a"] + 1, deps=("a",))
+    g.add("c", lambda r: r["a"] + 2, deps=("a",))
+    g.add("d", lambda r: r["b"] + r["c"], deps=("b", "c"))
+    unit = g.run()
+    try:
+        StageGraph().add("x", lambda r: 0, deps=("missing",))
+        bad_dep = False
+    except ValueError:
+        bad_dep = True
+    g2 = StageGraph()
+    g2.add("boom", lambda r: 1 / 0)
+    g2.add("after", lambda r: 1, deps=("boom",))
+    try:
+        g2.run()
+        raised = False
+    except ZeroDivisionError:
+        raised = True
+
+    posts = [RSSPost(title=f"강남 카페 후기 {i}", link=f"https://blog.naver.com/graph/{i}",
+                     pub_date=(datetime.now() - timedelta(days=i * 3)).strftime("%a, %d %b %Y 10:00:00 +0900"),
+                     description="커피 맛집 후기 " * 10)
+             for i in range(12)]
+
+    def _fake_rss(bid, *a, **kw):
+        return posts
+
+    def _fake_profile(bid, rss_posts=None, **kw):
+        time.sleep(0.4)
+        return dict(ba._PROFILE_DEFAULTS, blog_start_date=None, total_subscribers=300)
+
+    def _fake_sample(p, **kw):
+        time.sleep(0.4)
+        return {"avg_image_count": 6.0, "avg_content_length": 1500.0}
+
+    def _fake_exposure(bid, keywords, client, progress_cb=None, cancel_token=None, on_keyword=None):
+        time.sleep(0.4)
+        return ExposureMetrics(keywords_checked=len(keywords), keywords_exposed=1, page1_count=1,
+                               strength_sum=5, weighted_strength=5.0, details=[],
+                               sponsored_rank_count=0, sponsored_page1_count=0, score=10.0)
+
+    events = []
+    originals = (ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics, ba.analyze_exposure)
+    ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics, ba.analyze_exposure = (
+        _fake_rss, _fake_profile, _fake_sample, _fake_exposure)
+    try:
+        start = time.perf_counter()
+        result = ba.analyze_blog("graph", client=None, progress_cb=events.append, db_path=TEST_DB)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    finally:
+        ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics, ba.analyze_exposure = originals
+
+    latency = result["meta"]["latency"]
+    stages = [e["stage"] for e in events]
+    ok1 = unit.results["d"] == 5 and bad_dep and raised
+    ok2 = elapsed_ms < 1000 and latency["sequential_ms"] >= 1200 and latency["wall_ms"] < latency["sequential_ms"]
+    ok3 = all(st in stages for st in ("rss", "content", "exposure", "quality", "profile", "post_sample", "scoring"))
+    ok4 = stages.index("profile") > stages.index("rss") and stages[-1] == "scoring"
+    ok5 = result["blog_score"]["total"] > 0 and result["exposure"]["keywords_exposed"] == 1
+    # 진행 막대는 뒤로 가지 않음 — 워커 스레드의 단계 중간 안내는 메시지 전용(total=0)
+    ratios = [e["current"] / e["total"] for e in events if e["total"] > 0]
+    mid = [e for e in events if e["stage"] == "exposure" and "역검색 중" in e["message"]]
+    ok6 = ratios == sorted(ratios) and mid and all(e["total"] == 0 for e in mid)
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6
+    report("TC-182", "analyze_blog 단계 그래프 (동시 실행 + 진행 이벤트)", ok,
+           f"elapsed={elapsed_ms:.0f}ms, latency={latency['wall_ms']}/{latency['sequential_ms']}ms, stages={stages}")
+
+
+# ==================== TC-183: 블로그 일괄 분석 ====================
+
+def test_tc183_bulk_blog_analysis():
+    """TC-183: 블로그 목록 일괄 분석 → 블로거별 즉시 결과 줄 + 공유 검색 캐시 + 이력 재사용."""
+    import threading
+    import backend.blog_analyzer as ba
+    from backend.blog_batch import run_blog_batch
+    from backend.models import RSSPost
+
+    class _CountingClient:
+        def __init__(self):
+            self.calls = []
+            self._lock = threading.Lock()
+
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            with self._lock:
+                self.calls.append(query)
+            time.sleep(0.02)
+            return []
+
+    titles = ["성수동 카페 추천 후기", "성수동 브런치 맛집 방문", "서울숲 산책 코스 정리",
+              "성수동 베이커리 빵 맛집", "서울숲 카페 디저트 후기", "성수동 팝업 스토어 방문기"]
+
+    def _fake_rss(bid, *a, **kw):
+        return [RSSPost(title=t, link=f"https://blog.naver.com/{bid}/{i}",
+                        pub_date=(datetime.now() - timedelta(days=i * 2)).strftime("%a, %d %b %Y 10:00:00 +0900"))
+                for i, t in enumerate(titles)]
+
+    def _fake_profile(bid, rss_posts=None, **kw):
+        return dict(ba._PROFILE_DEFAULTS, blog_start_date=None)
+
+    def _fake_sample(p, **kw):
+        return {"avg_image_count": 0.0, "avg_content_length": 0.0}
+
+    blogs = ["https://blog.naver.com/bulkone", "bulktwo", "https://example.com/nope", "bulkone", "bulkthree"]
+    client = _CountingClient()
+    lines = []
+    originals = (ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics)
+    ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics = _fake_rss, _fake_profile, _fake_sample
+    try:
+        summary = run_blog_batch(blogs, client=client, on_item=lines.append, max_workers=3, db_path=TEST_DB)
+        api_calls = len(client.calls)
+        rerun_lines = []
+        rerun = run_blog_batch(blogs[:2], client=client, on_item=rerun_lines.append, db_path=TEST_DB)
+        rerun_calls = len(client.calls) - api_calls
+    finally:
+        ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics = originals
+
+    results = [ln for ln in lines if ln["type"] == "result"]
+    errors = [ln for ln in lines if ln["type"] == "error"]
+    ok1 = sorted(r["blogger_id"] for r in results) == ["bulkone", "bulkthree", "bulktwo"]
+    ok2 = len(errors) == 1 and errors[0]["index"] == 2 and summary["duplicates"] == 1
+    ok3 = (summary["searches_unique"] == api_calls and summary["searches_requested"] == 3 * api_calls
+           and api_calls > 0)
+    ok4 = rerun["from_cache"] == 2 and rerun_calls == 0 and all(ln["result"]["from_cache"] for ln in rerun_lines)
+    ok5 = summary["succeeded"] == 3 and summary["failed"] == 1 and summary["blogs_per_minute"] > 0
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5
+    report("TC-183", "블로그 일괄 분석 (공유 검색 캐시 + 이력 재사용)", ok,
+           f"api_calls={api_calls}, requested={summary['searches_requested']}, rerun_calls={rerun_calls}, "
+           f"summary={summary}")
+
+
+# ==================== TC-184: 인플루언서 점수 정기 재분석 ====================
+
+def test_tc184_influencer_refresh():
+    """TC-184: 오래된/매칭 많은 프로필부터 시간당 할당량 내 재분석 → 점수 컬럼만 갱신 + 지연 백분위."""
+    from backend.db import create_match, upsert_influencer_profile
+    from backend.influencer_refresh import (
+        build_refresh_queue, in_failure_backoff, refresh_influencers, refresh_lag_stats, refresh_priority,
+    )
+
+    # (user, blog, 공개, GoldenScore, last_analysis 경과 시간, 최근 매칭 수)
+    specs = [
+        ("refresh_a", "refa", 1, 90.0, 48, 0),   # 48 × 2 = 96
+        ("refresh_b", "refb", 1, 40.0, 72, 0),   # 72 × 2 = 144
+        ("refresh_c", "refc", 0, 70.0, 200, 0),  # 200 × 0.5 = 100 (비공개)
+        ("refresh_d", "refd", 1, 60.0, 10, 0),   # 24시간 미만 → 제외
+        ("refresh_e", "refe", 1, 50.0, 30, 4),   # 30 × (2 + 2) = 120
+    ]
+    with conn_ctx(TEST_DB) as conn:
+        init_db(conn)
+        conn.execute("DELETE FROM influencer_refresh_log")
+        conn.execute("UPDATE influencer_profiles SET last_analysis=datetime('now')")
+        for user, blog, public, score, age, matches in specs:
+            upsert_influencer_profile(conn, user_mongo_id=user, blog_id=blog, golden_score=score,
+                                      is_public=public, bio=f"{blog} 소개", desired_rate=100000)
+            conn.execute("UPDATE influencer_profiles SET last_analysis=datetime('now', ?) WHERE user_mongo_id=?",
+                         (f"-{age} hours", user))
+            for _ in range(matches):
+                create_match(conn, "owner_x", "사장님", user, blog)
+
+    analyzed = []
+
+    def _fake_analyze(bid):
+        analyzed.append(bid)
+        if bid == "refc":
+            raise RuntimeError("RSS 실패")
+        return {"blog_score": {"total": 77.5, "grade": "A", "grade_label": "우수", "base_score": 70.0,
+                               "base_breakdown": {"blog_power": {"score": 20, "max": 25, "label": "블로그 파워"},
+                                                  "exposure_power": {"score": 15, "max": 18, "label": "검색 노출력"}}},
+                "meta": {"degraded": False}}
+
+    first = refresh_influencers(quota=3, analyze=_fake_analyze, db_path=TEST_DB)
+    second = refresh_influencers(quota=3, analyze=_fake_analyze, db_path=TEST_DB)
+
+    with conn_ctx(TEST_DB) as conn:
+        rows = {r["blog_id"]: dict(r) for r in conn.execute(
+            """SELECT blog_id, golden_score, bp_score, bio, desired_rate,
+                      (julianday('now') - julianday(last_analysis)) * 24.0 AS age_hours
+               FROM influencer_profiles WHERE user_mongo_id LIKE 'refresh_%'""")}
+        stats = refresh_lag_stats(conn)
+
+    ok1 = analyzed == ["refb", "refe", "refc"]
+    ok2 = first["refreshed"] == 2 and first["failed"] == 1 and first["remaining"] == 0
+    ok3 = second["remaining"] == 0 and second["refreshed"] == 0 and len(analyzed) == 3
+    ok4 = (rows["refb"]["golden_score"] == 77.5 and rows["refb"]["bp_score"] == 20
+           and rows["refb"]["bio"] == "refb 소개" and rows["refb"]["desired_rate"] == 100000
+           and rows["refb"]["age_hours"] < 1 and rows["refa"]["golden_score"] == 90.0
+           and rows["refc"]["age_hours"] > 199)
+    ok5 = (stats["refreshes"] == 2 and 29 <= stats["refresh_lag_hours"]["p50"] <= 31
+           and 71 <= stats["refresh_lag_hours"]["max"] <= 73 and stats["used_last_hour"] == 3)
+    ok6 = refresh_priority(None, True, 0, 0) > refresh_priority(100, True, 0, 0) > refresh_priority(100, False, None, 0)
+
+    # 실패 백오프: 삭제/비공개 블로그가 매시 최우선으로 할당량을 차지하지 않음
+    #   refc: 방금 1회 실패 → 1시간 보류 / refa: 3회 연속 실패(마지막 2시간 전) → 4시간 보류
+    #   refb: 1회 실패(2시간 전) → 보류 끝, 우선순위 ÷2 / refe: 실패 후 성공 → 실패 무시
+    with conn_ctx(TEST_DB) as conn:
+        ids = {r["blog_id"]: r["profile_id"] for r in conn.execute(
+            "SELECT blog_id, profile_id FROM influencer_profiles WHERE user_mongo_id LIKE 'refresh_%'")}
+        conn.execute("UPDATE influencer_profiles SET last_analysis=datetime('now', '-100 hours') "
+                     "WHERE user_mongo_id IN ('refresh_a', 'refresh_b', 'refresh_e')")
+        log = [("refa", 0, 5), ("refa", 0, 3), ("refa", 0, 2), ("refb", 0, 2), ("refe", 0, 3), ("refe", 1, 2)]
+        for blog, ok_flag, hours_ago in log:
+            conn.execute("INSERT INTO influencer_refresh_log (profile_id, lag_hours, ok, refreshed_at) "
+                         "VALUES (?, 100, ?, datetime('now', ?))", (ids[blog], ok_flag, f"-{hours_ago} hours"))
+        queue = build_refresh_queue(conn)
+    order = [row["blog_id"] for _, _, row in sorted(queue) if row["blog_id"].startswith("ref")]
+    pri = {row["blog_id"]: -neg for neg, _, row in queue}
+    ok7 = (order == ["refe", "refb"] and abs(pri["refb"] - refresh_priority(100, True, 0, 0, recent_failures=1)) < 1.0
+           and in_failure_backoff(3, 3.9) and not in_failure_backoff(3, 4.1) and not in_failure_backoff(0, None))
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6 and ok7
+    report("TC-184", "인플루언서 점수 정기 재분석 (우선순위 + 시간당 할당량 + 실패 백오프)", ok,
+           f"analyzed={analyzed}, first={ {k: first[k] for k in ('refreshed', 'failed', 'remaining')} }, "
+           f"lag={stats['refresh_lag_hours']}, backoff_order={order}")
+
+
+# ==================== TC-185: 블로그 분석 부분 결과 섹션 ====================
+
+def test_tc185_blog_analysis_sections():
+    """TC-185: section_cb → RSS 직후 활동/콘텐츠, 키워드별 노출, BlogPower, 점수 순으로 전달 + 최종 결과와 동일."""
+    import threading
+    import backend.blog_analyzer as ba
+    from backend.models import RSSPost
+
+    posts = [RSSPost(title=f"성수동 카페 디저트 후기 {i}", link=f"https://blog.naver.com/sectest/{i}",
+                     pub_date=(datetime.now() - timedelta(days=i * 2)).strftime("%a, %d %b %Y 10:00:00 +0900"),
+                     description="성수동 카페 디저트 후기 " * 10)
+             for i in range(10)]
+
+    class _SlowClient:
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            time.sleep(0.1)
+            if "카페" in query:
+                return [BlogPostItem(title=query, description="", link="https://blog.naver.com/sectest/1",
+                                     bloggerlink="https://blog.naver.com/sectest")]
+            return []
+
+    def _fake_profile(bid, rss_posts=None, **kw):
+        time.sleep(0.3)
+        return dict(ba._PROFILE_DEFAULTS, blog_start_date=None, total_posts=800, total_visitors=250000,
+                    blog_age_years=6.0)
+
+    def _fake_sample(p, **kw):
+        return {"avg_image_count": 5.0, "avg_content_length": 1200.0}
+
+    events = []
+    lock = threading.Lock()
+    started = time.perf_counter()
+
+    def _section(name, data):
+        with lock:
+            events.append((name, data, (time.perf_counter() - started) * 1000))
+
+    originals = (ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics)
+    ba.fetch_rss = lambda bid, *a, **kw: posts
+    ba.fetch_blog_profile, ba.sample_actual_post_metrics = _fake_profile, _fake_sample
+    try:
+        result = ba.analyze_blog("sectest", client=_SlowClient(), section_cb=_section, db_path=TEST_DB)
+        total_ms = (time.perf_counter() - started) * 1000
+    finally:
+        ba.fetch_rss, ba.fetch_blog_profile, ba.sample_actual_post_metrics = originals
+
+    names = [n for n, _, _ in events]
+    by_name = {n: d for n, d, _ in events}
+    at = {n: ms for n, _, ms in events}
+    kw_events = [d for n, d, _ in events if n == "exposure_keyword"]
+
+    ok1 = names[0] == "rss" and names[-1] == "score" and by_name["rss"]["rss_available"]
+    ok2 = at["content"] < at["exposure"] and at["content"] < total_ms / 2
+    ok3 = (len(kw_events) == result["exposure"]["keywords_checked"] > 0
+           and sorted(d["done"] for d in kw_events) == list(range(1, len(kw_events) + 1))
+           and [d for d in kw_events if d["rank"]] and all(d["rank"] is None for d in kw_events if "카페" not in d["keyword"]))
+    ok4 = all(by_name[k] == result[k] for k in ("activity", "content", "exposure", "quality", "profile"))
+    ok5 = (by_name["score"]["blog_score"] == result["blog_score"] and by_name["score"]["insights"] == result["insights"]
+           and by_name["profile"]["blog_power"] == result["blog_score"]["base_breakdown"]["blog_power"]["score"] > 0)
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5
+    report("TC-185", "블로그 분석 부분 결과 섹션 (최종 결과와 동일)", ok,
+           f"sections={[(n, round(ms)) for n, _, ms in events if n != 'exposure_keyword']}, "
+           f"keywords={len(kw_events)}, total={total_ms:.0f}ms")
+
+
+# ==================== TC-186: 포스트 특성 캐시 ====================
+
+def test_tc186_post_feature_cache():
+    """TC-186: 포스트별 특성 1회 계산 (SimHash/토큰/날짜) → 지표 결과는 캐시 공유 여부와 무관하게 동일."""
+    import dataclasses
+    import backend.scoring as sc
+    from backend.benchmarks import _METRIC_FNS, make_blog_posts
+    import re
+    from backend.post_features import features, parse_pub_date
+
+    posts = make_blog_posts(20)
+    fresh_results = [fn([dataclasses.replace(p) for p in posts]) for fn in _METRIC_FNS]
+
+    calls = []
+    original = sc.compute_simhash
+
+    def _counting(text):
+        calls.append(text)
+        return original(text)
+
+    sc.compute_simhash = _counting
+    try:
+        shared_results = [fn(posts) for fn in _METRIC_FNS]
+    finally:
+        sc.compute_simhash = original
+
+    f0 = features(posts[0])
+    copied = dataclasses.replace(posts[0], title="완전히 다른 제목 입니다")
+
+    ok1 = shared_results == fresh_results
+    ok2 = len(calls) == 20  # analyze_quality + originality_v7 + game_defense → 포스트당 1회
+    ok3 = features(posts[0]) is f0 and f0.title_tokens == re.findall(r"[가-힣]{2,}", posts[0].title)
+    ok4 = features(copied).title_tokens == ["완전히", "다른", "제목", "입니다"]
+    ok5 = "_post_features" not in dataclasses.asdict(posts[0]) and posts[0] == dataclasses.replace(posts[0])
+    ok6 = (parse_pub_date("Sun, 15 Feb 2026 09:00:00 +0900") == datetime(2026, 2, 15, 9, 0)
+           and parse_pub_date("2026-02-15") == datetime(2026, 2, 15) and parse_pub_date("bad") is None
+           and f0.pub_dt == parse_pub_date(posts[0].pub_date))
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6
+    report("TC-186", "포스트 특성 캐시 (1회 계산 + 지표 결과 동일)", ok,
+           f"simhash_calls={len(calls)}, same={ok1}")
+
+
+# ==================== TC-187: 블로거 인덱스 검색 결과 캐시 ====================
+
+def test_tc187_indexed_search_results():
+    """TC-187: 검색 결과 캐시에 순위별 blogger_id/제목 저장 → 히트 시 rank_of O(1) 조회, 노출 매칭 동일."""
+    import backend.search_results as sr
+    from backend.blog_analyzer import analyze_exposure
+    from backend.naver_client import CachedNaverBlogSearchClient, NaverBlogSearchClient
+
+    items = [
+        BlogPostItem(title="<b>강남</b> 맛집", description="", link="https://blog.naver.com/alpha/1",
+                     bloggerlink="https://blog.naver.com/alpha"),
+        BlogPostItem(title="카페 <b>후기</b>", description="",
+                     link="https://blog.naver.com/PostView.naver?blogId=Beta&logNo=2", bloggerlink=None),
+        BlogPostItem(title="외부 글", description="", link="https://example.com/x", bloggerlink=None),
+        BlogPostItem(title="알파 두번째", description="", link="https://blog.naver.com/alpha/3",
+                     bloggerlink="https://blog.naver.com/alpha"),
+    ]
+    res = sr.index_items(items)
+    ok1 = (res.blogger_ids == [canonical_blogger_id_from_item(it) for it in items]
+           and res.rank_of("alpha") == 1 and res.rank_of("beta") == 2 and res.rank_of("gamma") is None
+           and res.hit("beta") == (2, items[1].link, "카페 후기")
+           and [(r, b) for r, b, _ in res.ranked()] == [(1, "alpha"), (2, "beta"), (4, "alpha")])
+    top = res[:2]
+    ok2 = isinstance(top, sr.IndexedSearchResult) and top.blogger_ids == ["alpha", "beta"] and sr.index_items(res) is res
+
+    # api_cache 저장 → 히트 시 blogger_id 재계산 없음 (이전 형식은 로드 시 계산)
+    calls = []
+    original_canon = sr.canonical_blogger_id_from_item
+    original_search = NaverBlogSearchClient.search_blog
+
+    def _counting(it):
+        calls.append(it)
+        return original_canon(it)
+
+    api_calls = []
+
+    def _fake_search(self, query, display=30, start=1, sort="sim"):
+        api_calls.append(query)
+        return list(items)
+
+    with conn_ctx(TEST_DB) as conn:
+        init_db(conn)
+        conn.execute("DELETE FROM api_cache")
+    NaverBlogSearchClient.search_blog = _fake_search
+    try:
+        client = CachedNaverBlogSearchClient("id", "secret", db_path=TEST_DB)
+        first = client.search_blog("강남 맛집")
+        sr.canonical_blogger_id_from_item = _counting
+        second = client.search_blog("강남 맛집")
+        legacy = sr.load_cached(json.dumps([{"title": "t", "description": "", "link": "https://blog.naver.com/old/1"}]))
+    finally:
+        NaverBlogSearchClient.search_blog = original_search
+        sr.canonical_blogger_id_from_item = original_canon
+    ok3 = (len(api_calls) == 1 and isinstance(second, sr.IndexedSearchResult)
+           and second == first and second.blogger_ids == first.blogger_ids and second.titles == first.titles
+           and second.rank_of("beta") == 2)
+    ok4 = len(calls) == 1 and legacy.rank_of("old") == 1
+
+    # analyze_exposure: 평범한 list 결과여도 인덱스 매칭 (blogId 쿼리 파라미터 포함)
+    class _ListClient:
+        def search_blog(self, query, display=30, start=1, sort="sim"):
+            return list(items) if query == "강남 맛집" else list(reversed(items))
+
+    exp = analyze_exposure("beta", ["강남 맛집", "강남 카페"], _ListClient())
+    ranks = {d["keyword"]: (d["rank"], d["post_title"]) for d in exp.details}
+    ok5 = ranks == {"강남 맛집": (2, "카페 후기"), "강남 카페": (3, "카페 후기")}
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5
+    report("TC-187", "블로거 인덱스 검색 결과 캐시 (rank_of + 히트 시 재계산 없음)", ok,
+           f"index={ok1}, slice={ok2}, cache_hit={ok3}, recompute={len(calls)}, exposure={ranks}")
+
+
+# ==================== TC-188: SimHash 배치 ====================
+
+def test_tc188_simhash_batch():
+    """TC-188: compute_simhash_batch == 기존 SimHash (비트 단위 동일) + 토큰 해시 캐시."""
+    import random
+    import backend.scoring as sc
+    from backend.benchmarks import _legacy_compute_simhash, make_search_descriptions
+
+    rng = random.Random(188)
+    alphabet = "가나다라마바사아자차카타파하 abcXYZ0123.,!😀"
+    texts = ["", "a", "가나", "가나다", "\ud800깨진 서로게이트", "성수동 카페 추천 " * 30]
+    texts += ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 400))) for _ in range(60)]
+    texts += make_search_descriptions(3, 5)
+
+    expected = [_legacy_compute_simhash(t) for t in texts]
+    sc._SIMHASH_TOKEN_CACHE.clear()
+    batch = sc.compute_simhash_batch(texts)
+    cached_tokens = len(sc._SIMHASH_TOKEN_CACHE)
+    again = sc.compute_simhash_batch(texts)
+    single = [sc.compute_simhash(t) for t in texts]
+
+    ok1 = batch == expected and single == expected
+    ok2 = again == expected and cached_tokens > 0 and len(sc._SIMHASH_TOKEN_CACHE) == cached_tokens
+    ok3 = sc.hamming_distance(batch[-1], batch[-2]) <= 64 and batch[0] == 0
+    ok = ok1 and ok2 and ok3
+    mismatches = sum(1 for a, b in zip(batch, expected) if a != b)
+    report("TC-188", "SimHash 배치 == 기존 SimHash (비트 단위 동일)", ok,
+           f"texts={len(texts)}, mismatches={mismatches}, cached_tokens={cached_tokens}")
+
+
+# ==================== TC-189: 블로거 간 근사 중복 인덱스 ====================
+
+def test_tc189_cross_blog_duplicate_index():
+    """TC-189: SimHash LSH 인덱스 — 블로거 간 같은 원고 탐지 → GameDefense 감점 + 템플릿 묶음 리포트."""
+    import random
+    from backend import dup_index
+    from backend.models import RSSPost
+
+    # 비둘기집: 3비트 이하 차이는 밴드 하나 이상 일치
+    rng = random.Random(189)
+    ok1 = True
+    for _ in range(300):
+        h = rng.getrandbits(64)
+        other = h
+        for bit in rng.sample(range(64), rng.randint(0, 3)):
+            other ^= 1 << bit
+        if not set(enumerate(dup_index.band_values(h))) & set(enumerate(dup_index.band_values(other))):
+            ok1 = False
+    top = (1 << 64) - 5
+    ok1 = ok1 and dup_index._from_signed(dup_index._to_signed(top)) == top and dup_index._to_signed(top) < 0
+
+    template = ("성수동 신상 카페 방문 후기입니다. 넓은 창가 자리와 시그니처 라떼가 유명하고 "
+                "디저트 메뉴도 다양해요. 주차는 건물 뒤편 공영주차장을 이용하면 편리합니다. " * 2)
+
+    def _posts(bid, n_template, n_own):
+        posts = [RSSPost(title=f"카페 후기 {i}", link=f"https://blog.naver.com/{bid}/t{i}",
+                         description=template + ("!" if i % 2 else ""))
+                 for i in range(n_template)]
+        posts += [RSSPost(title=f"일상 {i}", link=f"https://blog.naver.com/{bid}/o{i}",
+                          description=f"{bid} 의 {i}번째 개인 일상 기록 " + "".join(rng.choice("가나다라마바사아자차") for _ in range(150)))
+                  for i in range(n_own)]
+        posts.append(RSSPost(title="짧은 글", link=f"https://blog.naver.com/{bid}/s", description="사진 포스트"))
+        return posts
+
+    farm = {f"farm{i}": _posts(f"farm{i}", 3, 2) for i in range(6)}
+    solo = _posts("solo", 0, 5)
+    with conn_ctx(TEST_DB) as conn:
+        init_db(conn)
+        conn.execute("DELETE FROM post_simhashes")
+        stored = sum(dup_index.index_posts(conn, bid, ps) for bid, ps in farm.items())
+        stored += dup_index.index_posts(conn, "solo", solo)
+        farm_dup = dup_index.cross_blog_duplicates(conn, "farm0", farm["farm0"])
+        solo_dup = dup_index.cross_blog_duplicates(conn, "solo", solo)
+        clusters = dup_index.template_clusters(conn, min_bloggers=5)
+    ok2 = stored == 6 * 5 + 5  # 짧은 description 제외
+    ok3 = (farm_dup.posts_checked == 5 and farm_dup.duplicated_posts == 3 and farm_dup.rate == 0.6
+           and farm_dup.other_bloggers == [f"farm{i}" for i in range(1, 6)]
+           and solo_dup.duplicated_posts == 0 and solo_dup.rate == 0.0)
+    ok4 = len(clusters) == 1 and clusters[0]["bloggers"] == 6 and clusters[0]["posts"] == 18
+
+    base = compute_game_defense(farm["farm0"], {"interval_avg": 2.0})
+    flagged = compute_game_defense(farm["farm0"], {"interval_avg": 2.0, "cross_blog_dup_rate": farm_dup.rate})
+    ok5 = flagged == base - 3.0
+
+    # 원작자 A가 먼저 올리고 B가 복제 → B만 감점 (A 재수집해도 최초 수집 시각 유지)
+    orig = _posts("orig", 3, 2)
+    copier = [RSSPost(title=p.title, link=p.link.replace("/orig/", "/copier/"), description=p.description)
+              for p in orig]
+    with conn_ctx(TEST_DB) as conn:
+        conn.execute("DELETE FROM post_simhashes")
+        dup_index.index_posts(conn, "orig", orig)
+        conn.execute("UPDATE post_simhashes SET first_seen_at = datetime('now', '-1 day') WHERE blogger_id = 'orig'")
+        dup_index.index_posts(conn, "copier", copier)
+        dup_index.index_posts(conn, "orig", orig)
+        orig_dup = dup_index.cross_blog_duplicates(conn, "orig", orig)
+        copier_dup = dup_index.cross_blog_duplicates(conn, "copier", copier)
+        unindexed = dup_index.cross_blog_duplicates(conn, "late", [
+            RSSPost(title=p.title, link=p.link.replace("/orig/", "/late/"), description=p.description) for p in orig])
+    ok6 = (orig_dup.duplicated_posts == 0 and orig_dup.other_bloggers == []
+           and copier_dup.duplicated_posts == 5 and copier_dup.other_bloggers == ["orig"]
+           and unindexed.duplicated_posts == 5 and unindexed.other_bloggers == ["copier", "orig"])
+    ok6 = ok6 and (compute_game_defense(orig, {"cross_blog_dup_rate": orig_dup.rate})
+                   - compute_game_defense(copier, {"cross_blog_dup_rate": copier_dup.rate}) == 3.0)
+
+    ok = ok1 and ok2 and ok3 and ok4 and ok5 and ok6
+    report("TC-189", "블로거 간 근사 중복 인덱스 (LSH 밴드 + GameDefense 감점)", ok,
+           f"stored={stored}, farm_rate={farm_dup.rate}, others={len(farm_dup.other_bloggers)}, "
+           f"clusters={[(c['bloggers'], c['posts']) for c in clusters]}, gd={base}->{flagged}, "
+           f"orig/copier={orig_dup.duplicated_posts}/{copier_dup.duplicated_posts}")
+
+
+# ==================== TC-190: TF-IDF 토픽 유사도 일괄 계산 + 매장별 저장 ====================
+
+def test_tc190_tfidf_batch_and_store_signals():
+    """TC-190: tier 단계 TF-IDF 일괄 계산 == 블로거별 계산, 매장별 저장 값이 리포트 GoldenScore에 반영."""
+    from backend.blog_analyzer import compute_tfidf_topic_similarity, compute_tfidf_topic_similarity_batch
+    from backend.db import upsert_blogger_store_signals
+    from backend.models import CandidateBlogger, RSSPost
+
+    titles = ["강남 안경원 방문 후기", "누진 렌즈 맞춤 안경 후기", "오늘의 일상 기록",
+              "강남역 맛집 추천", "안경테 고르는 법 안경원 추천", "주말 여행 사진"]
+    posts_by = {
+        f"tfidf_b{i}": [RSSPost(title=t, link=f"https://blog.naver.com/tfidf_b{i}/{j}")
+                        for j, t in enumerate(titles[i:] + titles[:i])]
+        for i in range(5)
+    }
+    posts_by["tfidf_empty"] = []
+    kws = ["강남 안경원", "누진 렌즈"]
+    batch = compute_tfidf_topic_similarity_batch(posts_by, kws)
+    ok1 = all(batch[bid] == compute_tfidf_topic_similarity(ps, kws) for bid, ps in posts_by.items())
+    ok1 = ok1 and batch["tfidf_empty"] == 0.0 and max(batch.values()) > 0
+    ok2 = compute_tfidf_topic_similarity_batch(posts_by, []) == {bid: 0.0 for bid in posts_by}
+
+    conn = get_conn(TEST_DB)
+    sid_plain = upsert_store(conn, "희소지역", "안경원", None, "TFIDF미저장", None)
+    sid_sig = upsert_store(conn, "희소지역", "안경원", None, "TFIDF저장", None)
+    conn.commit()
+
+    def _make(i, tfidf):
+        b = CandidateBlogger(
+            blogger_id=f"tfidf_b{i}", blog_url=f"https://blog.naver.com/tfidf_b{i}",
+            ranks=[], queries_hit=set(),
+            posts=[BlogPostItem(title="t", description="d", link=f"https://blog.naver.com/tfidf_b{i}/0")],
+        )
+        b.tier_score = 20.0 + i
+        b.tier_grade = compute_authority_grade(b.tier_score)
+        b.tfidf_sim = tfidf
+        return b
+
+    keywords = ["희소키워드0", "희소키워드1"]
+    exposure = {kw: {f"tfidf_b{i}": (i + 1, f"https://blog.naver.com/tfidf_b{i}/0", "포스트") for i in range(3)}
+                for kw in keywords}
+    _save_exposure_run(conn, sid_plain, True, [_make(i, 0.0) for i in range(3)], keywords, exposure)
+    _save_exposure_run(conn, sid_sig, True, [_make(i, 0.0) for i in range(3)], keywords, exposure)
+    # 재분석: tier 단계에서 계산된 값으로 교체
+    _save_exposure_run(conn, sid_sig, True, [_make(i, 0.9 if i == 0 else 0.0) for i in range(3)], keywords, exposure)
+
+    stored = {r["blogger_id"]: r["tfidf_sim"] for r in conn.execute(
+        "SELECT blogger_id, tfidf_sim FROM blogger_store_signals WHERE store_id=?", (sid_sig,))}
+    ok3 = stored == {"tfidf_b0": 0.9, "tfidf_b1": 0.0, "tfidf_b2": 0.0}
+    upsert_blogger_store_signals(conn, sid_sig, [("tfidf_b1", 0.5)])
+    conn.commit()
+    ok3 = ok3 and conn.execute(
+        "SELECT tfidf_sim FROM blogger_store_signals WHERE store_id=? AND blogger_id='tfidf_b1'", (sid_sig,)
+    ).fetchone()["tfidf_sim"] == 0.5
+
+    def _scores(sid):
+        res = get_top20_and_pool40(conn, sid, days=30, category_text="안경원")
+        return {e["blogger_id"]: e["golden_score"] for e in res["top20"] + res["pool40"]}
+
+    plain, sig = _scores(sid_plain), _scores(sid_sig)
+    ok4 = sig["tfidf_b0"] > plain["tfidf_b0"] and sig["tfidf_b2"] == plain["tfidf_b2"]
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-190", "TF-IDF 일괄 계산 == 개별 계산 + 매장별 저장 값 리포트 반영", ok,
+           f"batch={batch}, stored={stored}, b0={plain.get('tfidf_b0')}->{sig.get('tfidf_b0')}")
+    conn.close()
+
+
+# ==================== TC-191: GoldenScore v7.2 열 단위 일괄 계산 ====================
+
+def test_tc191_golden_score_v72_batch_equivalence():
+    """TC-191: golden_score_v72_batch 행별 결과 == golden_score_v72 (구간 경계값 포함 무작위 입력)."""
+    import random
+    from backend.models import RSSPost
+    from backend.scoring import golden_score_v72_batch
+
+    rng = random.Random(191)
+
+    def _pick(*edges):
+        # 구간 경계값 또는 연속값
+        return rng.choice(edges + (rng.uniform(min(edges), max(edges)),))
+
+    def _row():
+        return dict(
+            queries_hit_count=rng.randint(0, 15), total_query_count=rng.randint(0, 20),
+            popularity_cross_score=_pick(0.0, 0.2, 0.5, 1.0),
+            broad_query_hits=rng.randint(0, 2), region_power_hits=rng.randint(0, 2),
+            content_authority_precomputed=_pick(0.0, 22.0),
+            richness_avg_len=_pick(0.0, 400, 600, 800, 1000, 1500, 2200, 3000, 4000),
+            rss_originality_v7=_pick(0.0, 8.0), rss_diversity_smoothed=_pick(0.0, 1.0),
+            image_ratio=_pick(0.0, 0.5, 0.8, 1.0), video_ratio=_pick(0.0, 0.1, 0.2),
+            days_since_last_post=rng.choice([None, 0, 1, 2, 3, 7, 14, 30, 60, 90, 91, 180, 181, 400]),
+            search_presence_precomputed=_pick(0.0, 16.0),
+            game_defense=_pick(-12.0, -10.0, -3.0, 0.0), quality_floor=_pick(0.0, 1.0, 5.0, 6.0),
+            has_category=rng.random() < 0.7,
+            keyword_match_ratio=rng.random(), exposure_ratio=rng.random(), queries_hit_ratio=rng.random(),
+            topic_focus=_pick(0.0, 0.15, 0.3, 0.5, 0.7, 1.0), topic_continuity=rng.random(), tfidf_sim=rng.random(),
+            cat_strength=rng.randint(0, 30), cat_exposed=rng.randint(0, 8), total_keywords=rng.randint(0, 12),
+            weighted_strength=_pick(0.0, 40.0),
+            sponsor_signal_rate=_pick(0.0, 0.05, 0.1, 0.4, 0.6, 1.0),
+            reverse_appeared=rng.randint(0, 3), reverse_total=rng.randint(0, 5), avg_image_count=_pick(0.0, 10.0),
+            total_posts=rng.choice([0, 30, 100, 300, 700, 1500, 3000, rng.randint(0, 5000)]),
+            total_visitors=rng.choice([0, 10000, 30000, 50000, 200000, 500000, 1000000, 3000000,
+                                       rng.randint(0, 4000000)]),
+            total_subscribers=rng.choice([0, 30, 100, 300, 1000, 3000, rng.randint(0, 5000)]),
+            ranking_percentile=_pick(0.5, 2, 5, 15, 30, 100.0),
+            blog_age_years=_pick(0.0, 1, 3, 5, 10, 15),
+            is_standalone=rng.random() < 0.1,
+        )
+
+    rows = [_row() for _ in range(3000)]
+    # 일괄 경로 밖의 행(ranks/RSS 있음, 사전 계산 없음)은 스칼라로 계산해 같은 위치에 반환
+    posts = [RSSPost(title="강남 안경원 내돈내산 후기", link="https://blog.naver.com/x/1",
+                     description="설명" * 300, pub_date="2026-01-05")]
+    for i in range(0, len(rows), 97):
+        rows[i]["ranks"] = [1, 4, 12]
+    for i in range(5, len(rows), 89):
+        rows[i]["rss_posts"] = posts
+        rows[i]["content_authority_precomputed"] = None
+    for r in rows:
+        r.setdefault("ranks", None)
+        r.setdefault("rss_posts", None)
+
+    columns = {k: [r[k] for r in rows] for k in rows[0]}
+    batch = golden_score_v72_batch(columns)
+    mismatches = [
+        i for i, (r, b) in enumerate(zip(rows, batch))
+        if json.dumps(golden_score_v72(**r), sort_keys=True) != json.dumps(b, sort_keys=True)
+    ]
+    ok1 = len(batch) == len(rows) and not mismatches
+
+    # 없는 열은 기본값, 빈 입력은 빈 결과, 잘못된 열 이름/길이는 오류
+    ok2 = golden_score_v72_batch({"total_posts": [3000]}) == [golden_score_v72(total_posts=3000)]
+    ok2 = ok2 and golden_score_v72_batch({}) == []
+    errors = 0
+    for bad in ({"total_post": [1]}, {"total_posts": [1, 2], "total_visitors": [1]}):
+        try:
+            golden_score_v72_batch(bad)
+        except (TypeError, ValueError):
+            errors += 1
+    ok3 = errors == 2
+
+    ok = ok1 and ok2 and ok3
+    report("TC-191", "GoldenScore v7.2 일괄 계산 == 행별 계산", ok,
+           f"rows={len(rows)}, mismatches={mismatches[:5]}, defaults={ok2}, errors={errors}")
+
+
+# ==================== TC-192: import 시간 예산 ====================
+
+def test_tc192_import_time_budget():
+    """TC-192: backend.app import 시 지연 로드 모듈 미로드 + backend 모듈 self 시간 예산 이내."""
+    from backend import import_profile, scoring
+
+    sample = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     backend.deadline\n"
+        "import time:      1500 |       1620 |   backend.analyzer\n"
+        "import time:     50000 |      51620 | backend.app\n"
+    )
+    parsed = import_profile.parse_importtime(sample)
+    ok1 = [(t.module, t.self_us, t.cumulative_us, t.depth) for t in parsed] == [
+        ("backend.deadline", 120, 120, 2), ("backend.analyzer", 1500, 1620, 1), ("backend.app", 50000, 51620, 0),
+    ]
+
+    rep = import_profile.import_report("backend.app", runs=2, top=10)
+    ok2 = rep["eager_lazy_modules"] == [] and rep["modules"] > 0 and rep["total_ms"] > 0
+    ok3 = rep["backend_self_ms"] <= rep["budget_ms"] and rep["ok"]
+
+    # 이전 세대 GoldenScore는 기존 이름으로 계속 접근 가능
+    from backend import scoring_legacy
+    from backend.scoring import golden_score_v5 as v5
+    ok4 = v5 is scoring_legacy.golden_score_v5 and scoring.golden_score_v71 is scoring_legacy.golden_score_v71
+    try:
+        scoring.no_such_score  # noqa: B018
+        ok4 = False
+    except AttributeError:
+        pass
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-192", "import 시간 예산 (지연 로드 + backend self 시간)", ok,
+           f"total={rep['total_ms']}ms, backend_self={rep['backend_self_ms']}ms/{rep['budget_ms']}ms, "
+           f"eager={rep['eager_lazy_modules']}, legacy_lazy={ok4}")
+
+
+# ==================== TC-193: 지표 함수 벤치마크 스위트 ====================
+
+def test_tc193_benchmark_suite():
+    """TC-193: 합성 코퍼스 스위트가 전 케이스를 측정하고, 기준선 비교가 회귀를 잡는다."""
+    import copy
+    from backend import benchmarks
+
+    c1 = benchmarks.make_corpus(5, 12, seed=7)
+    c2 = benchmarks.make_corpus(5, 12, seed=7)
+    ok1 = (len(c1) == 5 and all(len(ps) == 12 for ps in c1)
+           and [(p.title, p.description) for ps in c1 for p in ps] == [(p.title, p.description) for ps in c2 for p in ps])
+
+    res = benchmarks.run_suite(n_bloggers=5, n_posts=12, repeat=1, seed=7)
+    cases = res["cases"]
+    ok2 = set(cases) == set(benchmarks.SUITE_CASES) and all(
+        c["ops"] > 0 and c["ops_per_sec"] > 0 and c["cpu_ms"] >= 0 and c["peak_kb"] >= 0 for c in cases.values()
+    )
+
+    # 같은 결과 → 회귀 없음 / 기준선이 훨씬 빨랐으면 회귀 / 코퍼스 설정이 다르면 비교 불가
+    same = benchmarks.compare_suite(res, res)
+    faster = copy.deepcopy(res)
+    faster["cases"]["golden_score_v72"]["cpu_ms"] = 1.0
+    res_slow = copy.deepcopy(res)
+    res_slow["cases"]["golden_score_v72"]["cpu_ms"] = 10.0
+    slow = benchmarks.compare_suite(res_slow, faster)
+    other = copy.deepcopy(res)
+    other["config"]["bloggers"] = 6
+    ok3 = (same["ok"] and not same["regressions"]
+           and not slow["ok"] and [r["case"] for r in slow["regressions"]] == ["golden_score_v72"]
+           and not benchmarks.compare_suite(res, other)["comparable"])
+
+    # 저장된 기준선이 현재 케이스 목록과 맞아야 --check가 전 케이스를 본다
+    baseline = benchmarks.load_baseline()
+    ok4 = baseline is not None and set(baseline["cases"]) == set(benchmarks.SUITE_CASES)
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-193", "지표 함수 벤치마크 스위트 (코퍼스 재현성 + 기준선 회귀 검출)", ok,
+           f"cases={len(cases)}, deterministic={ok1}, regression={[r['case'] for r in slow['regressions']]}, "
+           f"baseline_synced={ok4}")
+
+
+# ==================== TC-194: 스트리밍 응답 슬롯 점유 ====================
+
+def test_tc194_streamed_body_holds_host_slot():
+    """TC-194: stream=True 본문 다운로드까지 호스트 동시성 상한 적용 + 본문 읽기 오류는 오류율에 반영."""
+    import threading
+    import requests
+    from backend.fetch_scheduler import FetchScheduler, HostPolicy
+
+    readers = {"active": 0, "max": 0, "in_flight_max": 0}
+    lock = threading.Lock()
+    holder = {}
+
+    class _SlowResp:
+        status_code = 200
+        headers = {}
+
+        def __init__(self, fail):
+            self.fail = fail
+            self.closed = False
+
+        def iter_content(self, chunk_size=1):
+            with lock:
+                readers["active"] += 1
+                readers["max"] = max(readers["max"], readers["active"])
+            try:
+                for _ in range(3):
+                    time.sleep(0.02)
+                    in_flight = holder["sched"].stats()["slow.test"]["in_flight"]
+                    with lock:
+                        readers["in_flight_max"] = max(readers["in_flight_max"], in_flight)
+                    if self.fail:
+                        raise requests.exceptions.ConnectionError("read timed out")
+                    yield b"<rss/>"
+            finally:
+                with lock:
+                    readers["active"] -= 1
+
+        def close(self):
+            self.closed = True
+
+    class _Session:
+        def __init__(self):
+            self.fail = False
+
+        def get(self, url, headers=None, params=None, timeout=None, stream=False):
+            return _SlowResp(self.fail)
+
+    sessions = []
+
+    def _factory(policy):
+        sessions.append(_Session())
+        return sessions[-1]
+
+    sched = FetchScheduler(policies={"slow.test": HostPolicy(max_concurrency=2, min_interval_sec=0.0)},
+                           session_factory=_factory)
+    holder["sched"] = sched
+    bodies = []
+
+    def _fetch():
+        with sched.get("https://slow.test/x.xml", timeout=1, stream=True) as resp:
+            bodies.append(b"".join(resp.iter_content(chunk_size=1024)))
+
+    threads = [threading.Thread(target=_fetch) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    after_ok = sched.stats()["slow.test"]
+
+    # 본문 읽기 중 연결 오류 → 슬롯 반납 + 오류 기록
+    sessions[0].fail = True
+    resp = sched.get("https://slow.test/x.xml", timeout=1, stream=True)
+    try:
+        list(resp.iter_content(chunk_size=1024))
+        read_failed = False
+    except requests.exceptions.ConnectionError:
+        read_failed = True
+    finally:
+        resp.close()
+    resp.close()  # 중복 close는 무시
+    after_fail = sched.stats()["slow.test"]
+
+    ok1 = len(bodies) == 6 and readers["max"] <= 2 and readers["in_flight_max"] <= 2
+    ok2 = after_ok["in_flight"] == 0 and after_ok["errors"] == 0 and after_ok["requests"] == 6
+    ok3 = read_failed and after_fail["errors"] == 1 and after_fail["in_flight"] == 0
+    ok4 = sched._hosts["slow.test"].slots.acquire(blocking=False) and sched._hosts["slow.test"].slots.acquire(blocking=False)
+
+    ok = ok1 and ok2 and ok3 and ok4
+    report("TC-194", "스트리밍 응답 본문까지 호스트 슬롯 점유 + 읽기 오류 기록", ok,
+           f"max_readers={readers['max']}, max_in_flight={readers['in_flight_max']}, "
+           f"errors={after_fail['errors']}, in_flight={after_fail['in_flight']}")
+
+
 # ==================== MAIN ====================
 
 def main():
@@ -4715,6 +6362,85 @@ def main():
     test_tc166_golden_score_v722_cf_in_base()
     test_tc167_blog_analysis_score_standalone()
 
+    print("\n[희소 노출 저장 TC-168]")
+    test_tc168_sparse_exposure_equivalence()
+
+    print("\n[단계별 계측 TC-169~170]")
+    test_tc169_phase_timings_thread_propagation()
+    test_tc170_phase_timing_percentiles()
+
+    print("\n[협력적 취소 TC-171]")
+    test_tc171_cancel_token_stops_analysis()
+
+    print("\n[데드라인 TC-172]")
+    test_tc172_deadline_degrades_optional_signals()
+
+    print("\n[다매장 일괄 분석 TC-173]")
+    test_tc173_batch_dedup_queries()
+
+    print("\n[지역 공유 후보 풀 TC-174]")
+    test_tc174_region_candidate_pool()
+
+    print("\n[RSS 조건부 GET 캐시 TC-175]")
+    test_tc175_rss_conditional_cache()
+
+    print("\n[스트리밍 RSS 파서 TC-176]")
+    test_tc176_streaming_rss_parser()
+
+    print("\n[프로필 1회 스캔 추출 TC-177]")
+    test_tc177_single_pass_profile_extractor()
+
+    print("\n[적응형 프로필 소스 계획 TC-178]")
+    test_tc178_adaptive_profile_sources()
+
+    print("\n[호스트별 요청 스케줄러 TC-179]")
+    test_tc179_host_fetch_scheduler()
+
+    print("\n[음성 결과 캐시 TC-180]")
+    test_tc180_negative_cache()
+
+    print("\n[포스트 실측 병렬 + 캐시 TC-181]")
+    test_tc181_parallel_cached_post_sampling()
+
+    print("\n[analyze_blog 단계 그래프 TC-182]")
+    test_tc182_analyze_blog_stage_graph()
+
+    print("\n[블로그 일괄 분석 TC-183]")
+    test_tc183_bulk_blog_analysis()
+
+    print("\n[인플루언서 점수 정기 재분석 TC-184]")
+    test_tc184_influencer_refresh()
+
+    print("\n[블로그 분석 부분 결과 섹션 TC-185]")
+    test_tc185_blog_analysis_sections()
+
+    print("\n[포스트 특성 캐시 TC-186]")
+    test_tc186_post_feature_cache()
+
+    print("\n[블로거 인덱스 검색 결과 TC-187]")
+    test_tc187_indexed_search_results()
+
+    print("\n[SimHash 배치 TC-188]")
+    test_tc188_simhash_batch()
+
+    print("\n[블로거 간 근사 중복 인덱스 TC-189]")
+    test_tc189_cross_blog_duplicate_index()
+
+    print("\n[TF-IDF 토픽 유사도 일괄 계산 TC-190]")
+    test_tc190_tfidf_batch_and_store_signals()
+
+    print("\n[GoldenScore v7.2 일괄 계산 TC-191]")
+    test_tc191_golden_score_v72_batch_equivalence()
+
+    print("\n[import 시간 예산 TC-192]")
+    test_tc192_import_time_budget()
+
+    print("\n[지표 함수 벤치마크 스위트 TC-193]")
+    test_tc193_benchmark_suite()
+
+    print("\n[스트리밍 응답 슬롯 점유 TC-194]")
+    test_tc194_streamed_body_holds_host_slot()
+
     # 정리
     if TEST_DB.exists():
         TEST_DB.unlink()
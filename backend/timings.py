@@ -0,0 +1,114 @@
+"""
+분석 단계별 계측 — 벽시계 시간 / API 호출 / 캐시 히트 / HTTP fetch / 다운로드 바이트 / DB 쓰기 시간.
+
+BloggerAnalyzer.analyze, analyze_blog가 단계마다 `timings.phase(name)`으로 감싸고,
+네트워크/DB 호출 지점은 record_* 함수로 "현재 단계"에 누적한다.
+현재 단계는 ContextVar로 전달되므로 스레드풀 작업은 submit_in_context()로 제출한다.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+PHASE_FIELDS = ("wall_ms", "api_calls", "cache_hits", "http_fetches", "bytes_downloaded", "db_write_ms")
+
+_current: contextvars.ContextVar[Optional[Tuple["PhaseTimings", Dict[str, float]]]] = (
+    contextvars.ContextVar("naverblog_phase", default=None)
+)
+
+
+class PhaseTimings:
+    """단계별 비용 누적기 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.phases: Dict[str, Dict[str, float]] = {}
+
+    def _stats(self, name: str) -> Dict[str, float]:
+        with self._lock:
+            if name not in self.phases:
+                self.phases[name] = {f: 0 for f in PHASE_FIELDS}
+            return self.phases[name]
+
+    def _add(self, stats: Dict[str, float], field: str, value: float) -> None:
+        with self._lock:
+            stats[field] += value
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Dict[str, float]]:
+        """단계 구간 측정. 같은 이름으로 여러 번 진입하면 누적된다.
+
+        중첩 단계의 시간은 바깥 단계에서 제외되어(exclusive) total_ms가 중복 집계되지 않는다.
+        """
+        stats = self._stats(name)
+        parent = _current.get()
+        token = _current.set((self, stats))
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self._add(stats, "wall_ms", elapsed)
+            if parent is not None and parent[0] is self and parent[1] is not stats:
+                self._add(parent[1], "wall_ms", -elapsed)
+            _current.reset(token)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """meta.timings 직렬화 형태: {"total_ms", "phases": {name: {field: value}}}"""
+        with self._lock:
+            phases = {
+                name: {
+                    f: round(v, 1) if f in ("wall_ms", "db_write_ms") else int(v)
+                    for f, v in stats.items()
+                }
+                for name, stats in self.phases.items()
+            }
+        total = round(sum(p["wall_ms"] for p in phases.values()), 1)
+        return {"total_ms": total, "phases": phases}
+
+
+def _record(field: str, value: float) -> None:
+    cur = _current.get()
+    if cur is not None:
+        recorder, stats = cur
+        recorder._add(stats, field, value)
+
+
+def record_api_call(nbytes: int = 0) -> None:
+    """네이버 검색 API 실호출 1회 (캐시 미스)."""
+    _record("api_calls", 1)
+    if nbytes:
+        _record("bytes_downloaded", nbytes)
+
+
+def record_cache_hit() -> None:
+    """캐시 히트 1회 (검색 결과 인메모리/api_cache, RSS 피드 rss_feeds)."""
+    _record("cache_hits", 1)
+
+
+def record_http_fetch(nbytes: int = 0) -> None:
+    """스크래핑 HTTP 요청 1회 (RSS/프로필/Blogdex/포스트 페이지)."""
+    _record("http_fetches", 1)
+    if nbytes:
+        _record("bytes_downloaded", nbytes)
+
+
+@contextmanager
+def db_write() -> Iterator[None]:
+    """DB 쓰기 구간 시간을 현재 단계의 db_write_ms에 누적."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record("db_write_ms", (time.perf_counter() - start) * 1000.0)
+
+
+def submit_in_context(
+    pool: concurrent.futures.Executor, fn: Callable[..., Any], *args: Any,
+) -> concurrent.futures.Future:
+    """현재 ContextVar(계측 단계)를 워커 스레드로 전달하여 제출."""
+    return pool.submit(contextvars.copy_context().run, fn, *args)
@@ -67,6 +67,9 @@ const BA_STAGE_LABELS = {
   content: "콘텐츠 분석",
   exposure: "노출 검색",
   quality: "품질 검사",
+  profile: "프로필 수집",
+  post_sample: "포스트 실측",
+  blog_power: "BlogPower 계산",
   scoring: "점수 계산",
   done: "완료",
   waiting: "분석 중",
@@ -140,6 +143,11 @@ blogAnalysisBtn.addEventListener("click", async () => {
     }
   });
 
+  eventSource.addEventListener("section", (e) => {
+    const msg = JSON.parse(e.data);
+    renderBlogAnalysisSection(msg.section, msg.data);
+  });
+
   eventSource.addEventListener("result", (e) => {
     const result = JSON.parse(e.data);
     eventSource.close();
@@ -147,6 +155,8 @@ blogAnalysisBtn.addEventListener("click", async () => {
     blogAnalysisBtn.disabled = false;
 
     if (result.error) {
+      // 부분 결과가 그려졌어도 최종 결과가 없으면 숨김
+      blogAnalysisResult.classList.add("hidden");
       alert("분석 오류: " + result.error);
       return;
     }
@@ -192,17 +202,85 @@ async function fallbackBlogAnalysis(blogUrl, storeId) {
 function renderBlogAnalysis(result) {
   blogAnalysisResult.classList.remove("hidden");
 
-  const score = result.blog_score;
-  const gradeColor = GRADE_COLORS[score.grade] || "#999";
+  renderBaHeader(result);
+  renderBaScore(result.blog_score, result.insights);
+  renderBaActivity(result.activity);
+  renderBaContent(result.content);
+  renderBaExposure(result.exposure);
+  renderBaQuality(result.quality || {});
+
+  // 결과 영역으로 스크롤
+  blogAnalysisResult.scrollIntoView({ behavior: "smooth", block: "start" });
+}
+
+// SSE 부분 결과 — 섹션이 도착하는 대로 해당 영역만 먼저 렌더링 (최종 result가 전체를 다시 그림)
+let baLiveExposure = [];
+
+function renderBlogAnalysisSection(name, data) {
+  switch (name) {
+    case "rss":
+      baLiveExposure = [];
+      blogAnalysisResult.classList.remove("hidden");
+      renderBaHeader(data);
+      getElement("ba-grade").textContent = "…";
+      getElement("ba-grade").style.background = "#999";
+      getElement("ba-grade-label").textContent = "분석 중";
+      getElement("ba-total-score").textContent = "-";
+      getElement("ba-bars-container").innerHTML = "";
+      ["ba-activity-details", "ba-content-details", "ba-exposure-details", "ba-quality-details"].forEach((id) => {
+        getElement(id).innerHTML = '<p class="empty-text">분석 중...</p>';
+      });
+      break;
+    case "activity":
+      renderBaActivity(data);
+      break;
+    case "content":
+      renderBaContent(data);
+      break;
+    case "exposure_keyword":
+      if (data.rank) baLiveExposure.push(data);
+      renderBaExposure({
+        keywords_checked: data.total,
+        keywords_exposed: baLiveExposure.length,
+        page1_count: baLiveExposure.filter((ed) => ed.is_page1).length,
+        strength_sum: baLiveExposure.reduce((sum, ed) => sum + ed.strength, 0),
+        details: [...baLiveExposure].sort((a, b) => a.rank - b.rank),
+      }, `${data.done}/${data.total} 키워드 확인`);
+      break;
+    case "exposure":
+      renderBaExposure(data);
+      break;
+    case "quality":
+      renderBaQuality(data);
+      break;
+    case "profile":
+      // BlogPower는 최종 점수 전에 먼저 표시
+      getElement("ba-bars-container").innerHTML = `
+        <div class="ba-bar-row">
+          <span class="ba-bar-label">블로그 파워</span>
+          <div class="ba-bar-track"><div id="ba-bar-live-bp" class="ba-bar-fill"></div></div>
+          <span id="ba-bar-live-bp-val" class="ba-bar-value"></span>
+        </div>
+      `;
+      _setBar("ba-bar-live-bp", "ba-bar-live-bp-val", data.blog_power, 25);
+      break;
+    case "score":
+      renderBaScore(data.blog_score, data.insights);
+      break;
+    default:
+      break;
+  }
+}
 
+function renderBaHeader(info) {
   // 헤더
-  getElement("ba-blogger-id").textContent = result.blogger_id;
+  getElement("ba-blogger-id").textContent = info.blogger_id;
   const blogLink = getElement("ba-blog-link");
-  blogLink.textContent = result.blog_url;
-  blogLink.href = result.blog_url;
+  blogLink.textContent = info.blog_url;
+  blogLink.href = info.blog_url;
 
   const modeBadge = getElement("ba-mode-badge");
-  if (result.analysis_mode === "store_linked") {
+  if (info.analysis_mode === "store_linked") {
     modeBadge.textContent = "매장 연계";
     modeBadge.className = "ba-mode-badge ba-mode-linked";
   } else {
@@ -212,11 +290,15 @@ function renderBlogAnalysis(result) {
 
   // RSS 비활성 안내
   const rssWarning = getElement("ba-rss-warning");
-  if (!result.rss_available) {
+  if (!info.rss_available) {
     rssWarning.classList.remove("hidden");
   } else {
     rssWarning.classList.add("hidden");
   }
+}
+
+function renderBaScore(score, insights) {
+  const gradeColor = GRADE_COLORS[score.grade] || "#999";
 
   // 등급
   const gradeEl = getElement("ba-grade");
@@ -293,7 +375,6 @@ function renderBlogAnalysis(result) {
   // 강점/약점
   const strengthsList = getElement("ba-strengths-list");
   const weaknessesList = getElement("ba-weaknesses-list");
-  const insights = result.insights;
 
   strengthsList.innerHTML = insights.strengths.length > 0
     ? insights.strengths.map((s) => `<li>${escapeHtml(s)}</li>`).join("")
@@ -302,18 +383,20 @@ function renderBlogAnalysis(result) {
     ? insights.weaknesses.map((w) => `<li>${escapeHtml(w)}</li>`).join("")
     : "<li>-</li>";
   getElement("ba-recommendation").textContent = insights.recommendation;
+}
 
+function renderBaActivity(act) {
   // 활동 상세
-  const act = result.activity;
   getElement("ba-activity-details").innerHTML = `
     <div class="ba-detail-item"><span>분석 포스트 (RSS)</span><strong>${act.total_posts}개</strong></div>
     <div class="ba-detail-item"><span>마지막 포스팅</span><strong>${act.days_since_last_post !== null ? act.days_since_last_post + '일 전' : '-'}</strong></div>
     <div class="ba-detail-item"><span>평균 포스팅 간격</span><strong>${act.avg_interval_days !== null ? act.avg_interval_days + '일' : '-'}</strong></div>
     <div class="ba-detail-item"><span>활동 등급</span><strong>${escapeHtml(act.posting_trend)}</strong></div>
   `;
+}
 
+function renderBaContent(cnt) {
   // 콘텐츠 분석
-  const cnt = result.content;
   let topicsHtml = cnt.dominant_topics.length > 0
     ? cnt.dominant_topics.map((t) => `<span class="keyword-chip keyword-chip-a">${escapeHtml(t)}</span>`).join("")
     : "<span>-</span>";
@@ -334,9 +417,10 @@ function renderBlogAnalysis(result) {
     <div class="ba-topics"><h4>주요 키워드</h4><div class="keyword-list">${topicsHtml}</div></div>
     ${postsHtml}
   `;
+}
 
+function renderBaExposure(exp, liveStatus = "") {
   // 노출 현황
-  const exp = result.exposure;
   let exposureListHtml = "";
   if (exp.details && exp.details.length > 0) {
     exposureListHtml = exp.details.map((ed) => {
@@ -350,9 +434,13 @@ function renderBlogAnalysis(result) {
         ${postHtml}
       </div>`;
     }).join("");
-  } else {
+  } else if (!liveStatus) {
     exposureListHtml = '<p class="empty-text">검색 노출 데이터가 없습니다.</p>';
   }
+  if (liveStatus) {
+    // 키워드별 검색 진행 중 (exposure_keyword 섹션)
+    exposureListHtml += `<p class="empty-text">검색 중... ${escapeHtml(liveStatus)}</p>`;
+  }
 
   getElement("ba-exposure-details").innerHTML = `
     <div class="ba-detail-grid">
@@ -363,9 +451,10 @@ function renderBlogAnalysis(result) {
     </div>
     <div class="ba-exposure-list">${exposureListHtml}</div>
   `;
+}
 
+function renderBaQuality(qual) {
   // 품질 검사
-  const qual = result.quality || {};
   getElement("ba-quality-details").innerHTML = `
     <div class="ba-detail-grid">
       <div class="ba-detail-item"><span>독창성</span><strong>${qual.originality ?? '-'}/8</strong></div>
@@ -373,9 +462,6 @@ function renderBlogAnalysis(result) {
       <div class="ba-detail-item"><span>품질 점수</span><strong>${qual.score ?? '-'}/15</strong></div>
     </div>
   `;
-
-  // 결과 영역으로 스크롤
-  blogAnalysisResult.scrollIntoView({ behavior: "smooth", block: "start" });
 }
 
 function _setBar(barId, valId, score, max) {